@@ -17,6 +17,11 @@ class NotifConfig:
 
     # TELEGRAM
     TELEGRAM_TOKEN = os.environ.get("TELEGRAM_TOKEN")
+    # the bot serves a webhook instead of polling when its public URL is set
+    TELEGRAM_WEBHOOK_URL = os.environ.get("TELEGRAM_WEBHOOK_URL")
+    TELEGRAM_WEBHOOK_SECRET = os.environ.get("TELEGRAM_WEBHOOK_SECRET") or None
+    TELEGRAM_WEBHOOK_LISTEN = os.environ.get("TELEGRAM_WEBHOOK_LISTEN", "127.0.0.1")
+    TELEGRAM_WEBHOOK_PORT = int(os.environ.get("TELEGRAM_WEBHOOK_PORT", 8443))
 
     # EMAIL
     SMTP_SERVER = os.environ.get("SMTP_SERVER")
@@ -29,3 +34,10 @@ class NotifConfig:
     DB_USER = os.environ.get("DB_USER")
     DB_PASS = os.environ.get("DB_PASS")
     POSTGRES_DB_URL = os.environ.get("POSTGRES_DB_URL")
+    DB_ECHO = os.environ.get("DB_ECHO", "false").lower() == "true"
+    DB_POOL_SIZE = int(os.environ.get("DB_POOL_SIZE", 5))
+    DB_MAX_OVERFLOW = int(os.environ.get("DB_MAX_OVERFLOW", 5))
+    DB_POOL_TIMEOUT = int(os.environ.get("DB_POOL_TIMEOUT", 30))
+    DB_POOL_RECYCLE = int(os.environ.get("DB_POOL_RECYCLE", 1800))
+    # milliseconds a statement may run, none if 0 (the bot sets it, jobs don't)
+    DB_STATEMENT_TIMEOUT = int(os.environ.get("DB_STATEMENT_TIMEOUT", 0))
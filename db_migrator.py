@@ -0,0 +1,9 @@
+from src.db.db_manager import NotifierDBManager
+from src.db.migrations import run_migrations
+from src.notifier_logger import get_logger
+
+logger = get_logger(__name__)
+
+if __name__ == "__main__":
+    logger.info("Migrating database...")
+    run_migrations(NotifierDBManager())
@@ -1,4 +1,3 @@
-import time
 from datetime import date, datetime, timedelta
 from typing import List
 
@@ -9,9 +8,7 @@ from src.notifier_logger import get_logger
 from src.utils.fixtures_utils import convert_fixtures_response_to_db
 
 FIXTURES_DB_MANAGER = FixturesDBManager()
-FIXTURES_CLIENT = FixturesClient(
-    share_session=True, raise_for_status=True, perform_retries=True
-)
+FIXTURES_CLIENT = FixturesClient(raise_for_status=True, perform_retries=True)
 
 logger = get_logger(__name__)
 
@@ -50,9 +47,10 @@ def populate_single_league_fixture(
     )
 
     if "response" in league_fixtures.as_dict:
-        FIXTURES_DB_MANAGER.save_fixtures(
+        upsert_counts = FIXTURES_DB_MANAGER.save_fixtures(
             convert_fixtures_response_to_db(league_fixtures.as_dict["response"])
         )
+        logger.info(f"League {league_id} fixtures saved - {upsert_counts}")
 
 
 def get_leagues_to_update():
@@ -71,14 +69,21 @@ def populate_league_fixtures() -> None:
 
     leagues = get_leagues_to_update()
 
+    key_scheduler = FIXTURES_CLIENT.key_scheduler
+
     for league in leagues:
+        # requests are throttled by the keys scheduler, which waits for per minute
+        # quota when needed, so it is only checked that there's daily quota left.
+        if key_scheduler and not key_scheduler.can_afford(1):
+            logger.warning(
+                f"Not enough API quota left, stopping before league {league.name}"
+            )
+            break
+
         logger.info(f"Saving fixtures for league {league.name}")
 
         populate_single_league_fixture(league.id, str(current_year), between_dates)
 
-        # to avoid reaching rate limit at API calls.
-        time.sleep(2.5)
-
 
 def populate_data() -> None:
     populate_league_fixtures()
@@ -0,0 +1,4 @@
+cd /usr/football_api
+/usr/local/bin/python -m poetry shell
+
+/usr/local/bin/python -m poetry run python /usr/football_api/entities_benchmark.py "$@"
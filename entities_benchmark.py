@@ -0,0 +1,149 @@
+import argparse
+import gc
+import timeit
+import tracemalloc
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, List, Tuple
+
+from src.db.notif_sql_models import Event as DBEvent
+from src.db.notif_sql_models import Fixture as DBFixture
+from src.db.notif_sql_models import Player as DBPlayer
+from src.db.notif_sql_models import Team as DBTeam
+from src.entities import Event
+from src.utils.fixture_store import get_fixture_record
+from src.utils.fixtures_utils import convert_db_event
+
+TEAMS = 600
+LEAGUES = 40
+
+
+def get_fixture_rows(number_of_fixtures: int) -> List[Tuple]:
+    """
+    Rows as the database driver returns them, with their own string objects.
+    """
+    first_kickoff = datetime(2023, 1, 1, tzinfo=timezone.utc)
+    rows = []
+
+    for fixture_id in range(number_of_fixtures):
+        kickoff = first_kickoff + timedelta(hours=3 * (fixture_id // 10))
+        home_team = fixture_id % TEAMS
+        rows.append(
+            (
+                fixture_id,
+                kickoff.isoformat(),
+                kickoff,
+                fixture_id % LEAGUES,
+                f"Regular Season - {fixture_id // 200 + 1}",
+                home_team,
+                (fixture_id * 7 + 1) % TEAMS,
+                f"Stadium {home_team}",
+                "".join(["Match ", "Finished"]),
+                f"Referee {fixture_id % 150}",
+                fixture_id % 4,
+                fixture_id % 3,
+                None,
+                None,
+            )
+        )
+
+    return rows
+
+
+def get_db_fixture(row: Tuple) -> DBFixture:
+    (
+        fixture_id,
+        utc_date,
+        kickoff,
+        league,
+        round,
+        home_team,
+        away_team,
+        venue,
+        match_status,
+        referee,
+        home_score,
+        away_score,
+        *_,
+    ) = row
+
+    return DBFixture(
+        id=fixture_id,
+        utc_date=utc_date,
+        bsas_date=utc_date[:-6],
+        kickoff=kickoff,
+        league=league,
+        round=round,
+        home_team=home_team,
+        away_team=away_team,
+        venue=venue,
+        match_status=match_status,
+        referee=referee,
+        home_score=home_score,
+        away_score=away_score,
+    )
+
+
+def get_memory_per_item(factory: Callable[[Tuple], Any], rows: List[Tuple]) -> float:
+    gc.collect()
+    tracemalloc.start()
+    items = [factory(row) for row in rows]
+    memory, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del items
+
+    return memory / len(rows)
+
+
+def get_validated_event(event: Event) -> Event:
+    # the way events were built before, validating every nested entity
+    return Event(**event.dict())
+
+
+def benchmark(number_of_fixtures: int, runs: int) -> None:
+    rows = get_fixture_rows(number_of_fixtures)
+    models_memory = get_memory_per_item(get_db_fixture, rows)
+    records_memory = get_memory_per_item(get_fixture_record, rows)
+
+    print(f"Memory per fixture ({number_of_fixtures} fixtures)")
+    print(f"    {'database model':<24} {models_memory:>8.0f} B")
+    print(f"    {'fixture record':<24} {records_memory:>8.0f} B")
+
+    home_team = DBTeam(id=435, name="River Plate", picture="", country=1)
+    away_team = DBTeam(id=451, name="Boca Juniors", picture="", country=1)
+    teams = {home_team.id: home_team, away_team.id: away_team}
+    players = {
+        10: DBPlayer(id=10, name="J. Alvarez"),
+        11: DBPlayer(id=11, name="E. Fernandez"),
+    }
+    db_event = DBEvent(
+        id=1,
+        fixture=1,
+        time=35,
+        time_extra=None,
+        team=435,
+        player=10,
+        assist=11,
+        type="Goal",
+        detail="Normal Goal",
+        comments=None,
+    )
+    event = convert_db_event(db_event, away_team, teams, players)
+
+    print(f"Time per converted event ({runs} runs)")
+    for name, convert in [
+        ("trusted", lambda: convert_db_event(db_event, away_team, teams, players)),
+        ("validated", lambda: get_validated_event(event)),
+    ]:
+        seconds = min(timeit.repeat(convert, number=runs, repeat=5))
+        print(f"    {name + ' event':<24} {seconds / runs * 1e6:>8.1f} us")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Memory of the cached fixtures and CPU time of building events."
+    )
+    parser.add_argument("--fixtures", type=int, default=20000)
+    parser.add_argument("--runs", type=int, default=5000)
+    args = parser.parse_args()
+
+    benchmark(args.fixtures, args.runs)
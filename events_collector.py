@@ -1,14 +1,23 @@
-from typing import List
+import sys
+from typing import Any, Dict, List
 
+from partial_db_updater import fetch_fixtures_responses, get_budgeted_lots
 from src.api.fixtures_client import FixturesClient
-from src.db.fixtures_db_manager import FixturesDBManager
-from src.entities import Event
+from src.db.fixtures_db_manager import FixturesDBManager, is_finished_status
+from src.emojis import Emojis
+from src.entities import Event, Team
+from src.notifier_constants import (
+    FIXTURES_REFRESH_MAX_REQUESTS,
+    LIVE_EVENTS_NOTIF_TYPE,
+    NOT_PLAYED_OR_FINISHED_MATCH_STATUSES,
+)
 from src.notifier_logger import get_logger
+from src.senders.telegram_delivery import TelegramMessage, send_many_messages
+from src.utils.fixtures_utils import convert_fixtures_response_to_db
+from src.utils.notifier_utils import get_team_subscribers
 
 FIXTURES_DB_MANAGER = FixturesDBManager()
-FIXTURES_CLIENT = FixturesClient(
-    share_session=True, raise_for_status=True, perform_retries=True
-)
+FIXTURES_CLIENT = FixturesClient(raise_for_status=True, perform_retries=True)
 
 logger = get_logger(__name__)
 
@@ -17,15 +26,102 @@ def collect_events() -> None:
     """
     This functions collects and insert all events into a database.
     """
-    fixtures_client = FixturesClient()
     fixtures_to_collect = get_all_fixtures_ids_to_collect_events()
 
     for fixture_id in fixtures_to_collect:
-        events_response = fixtures_client.get_events(fixture_id)
-        for fixt_event in events_response.as_dict.get("response", []):
-            event = Event(**fixt_event)
-            event.fixture_id = fixture_id
-            FIXTURES_DB_MANAGER.save_fixture_event(event)
+        events_response = FIXTURES_CLIENT.get_events(fixture_id)
+        FIXTURES_DB_MANAGER.save_fixture_events(
+            fixture_id,
+            [
+                Event(**fixt_event)
+                for fixt_event in events_response.as_dict.get("response", [])
+            ],
+        )
+
+
+def collect_live_events(max_requests: int = FIXTURES_REFRESH_MAX_REQUESTS) -> None:
+    """
+    Collects the events of the in-play favourite fixtures, requested by lots of
+    fixtures ids (which come with their events), stores the ones not seen before
+    and notifies them to the subscribed users.
+    """
+    fixtures_responses = fetch_fixtures_responses(
+        get_budgeted_lots(get_live_fixtures_ids(), max_requests)
+    )
+
+    if not len(fixtures_responses):
+        return
+
+    # fixtures statuses and scores are refreshed as well, feeding the fixtures outbox.
+    FIXTURES_DB_MANAGER.save_fixtures(
+        convert_fixtures_response_to_db(fixtures_responses)
+    )
+
+    for fixture_response in fixtures_responses:
+        fixture_id = fixture_response["fixture"]["id"]
+        new_events = FIXTURES_DB_MANAGER.save_fixture_events(
+            fixture_id,
+            [Event(**fixt_event) for fixt_event in fixture_response.get("events", [])],
+        )
+        events_to_notify = [event for event in new_events if is_notifiable_event(event)]
+
+        if len(events_to_notify):
+            notify_live_events(fixture_response, events_to_notify)
+
+
+def get_live_fixtures_ids() -> List[int]:
+    # stored status may be outdated, so fixtures are considered live from their
+    # kick off until they are stored as finished.
+    surrounding = FIXTURES_DB_MANAGER.get_games_in_surrounding_n_hours(
+        hours=-3, favourite=True
+    )
+
+    return [
+        fixture.id
+        for fixture in surrounding
+        if not is_finished_status(fixture.match_status)
+        and fixture.match_status not in NOT_PLAYED_OR_FINISHED_MATCH_STATUSES
+    ]
+
+
+def is_notifiable_event(event: Event) -> bool:
+    return event.is_regular_goal() or (
+        event.type == "Card" and event.detail in ["Red Card", "Second Yellow card"]
+    )
+
+
+def notify_live_events(fixture_response: Dict[str, Any], events: List[Event]) -> None:
+    home_team = Team(**fixture_response["teams"]["home"])
+    away_team = Team(**fixture_response["teams"]["away"])
+    goals = fixture_response["goals"]
+    score_text = (
+        f"<not_translate>{home_team.name} {goals['home']} - {goals['away']} "
+        f"{away_team.name}</not_translate>"
+    )
+
+    for event in events:
+        event.rival_team = away_team if event.team.id == home_team.id else home_team
+
+    events_text = "\n".join(str(event) for event in events)
+    message = f"{Emojis.BELL.value} {score_text}\n\n{events_text}"
+
+    subscribers = {
+        subscriber.chat_id: subscriber
+        for subscriber in get_team_subscribers(
+            [home_team.id, away_team.id], [LIVE_EVENTS_NOTIF_TYPE]
+        )
+    }
+
+    logger.info(
+        f"Notifying {len(events)} live events of fixture {fixture_response['fixture']['id']} to {len(subscribers)} users"
+    )
+
+    send_many_messages(
+        [
+            TelegramMessage(chat_id=chat_id, message=message, lang=subscriber.lang)
+            for chat_id, subscriber in subscribers.items()
+        ]
+    )
 
 
 def is_from_favourite_league_or_has_favourite_teams(fixture) -> bool:
@@ -60,4 +156,7 @@ def get_all_fixtures_ids_to_collect_events() -> List[int]:
 
 
 if __name__ == "__main__":
-    collect_events()
+    if len(sys.argv) > 1 and sys.argv[1] == "live":
+        collect_live_events()
+    else:
+        collect_events()
@@ -1,10 +1,33 @@
 from config.notif_config import NotifConfig
+from src.db.fixtures_db_manager import USER_PREFERENCES_CACHE
 from src.notifier_logger import get_logger
 from src.telegram_bot.bot_app_builder import NotifBotAppBuilder
+from src.utils.fixture_store import FIXTURE_STORE
+from src.utils.search_index import CATALOG_SEARCH
 
 logger = get_logger(__name__)
 
 if __name__ == "__main__":
     notif_bot_app_builder = NotifBotAppBuilder(NotifConfig.TELEGRAM_TOKEN)
     application = notif_bot_app_builder.build_application()
-    application.run_polling()
+    CATALOG_SEARCH.refresh()
+    FIXTURE_STORE.load()
+    # the bot makes every preferences change, so it sees all the invalidations
+    USER_PREFERENCES_CACHE.enabled = True
+
+    if NotifConfig.TELEGRAM_WEBHOOK_URL:
+        # a single worker serves the webhook (see notifier_bot_nginx.conf), updates
+        # of different chats are processed concurrently.
+        logger.info(
+            f"Serving webhook on {NotifConfig.TELEGRAM_WEBHOOK_LISTEN}:"
+            f"{NotifConfig.TELEGRAM_WEBHOOK_PORT}"
+        )
+        application.run_webhook(
+            listen=NotifConfig.TELEGRAM_WEBHOOK_LISTEN,
+            port=NotifConfig.TELEGRAM_WEBHOOK_PORT,
+            url_path="telegram",
+            secret_token=NotifConfig.TELEGRAM_WEBHOOK_SECRET,
+            webhook_url=f"{NotifConfig.TELEGRAM_WEBHOOK_URL}/telegram",
+        )
+    else:
+        application.run_polling()
@@ -0,0 +1,127 @@
+import time
+from typing import Callable
+
+from apscheduler.events import (
+    EVENT_JOB_ERROR,
+    EVENT_JOB_MAX_INSTANCES,
+    EVENT_JOB_MISSED,
+    JobEvent,
+)
+from apscheduler.schedulers.blocking import BlockingScheduler
+from apscheduler.triggers.cron import CronTrigger
+
+from events_collector import collect_events, collect_live_events
+from partial_db_updater import update_fixtures
+from src.collectors.lineups_collector import LineUpsCollector
+from src.db.fixtures_db_manager import FixturesDBManager
+from src.notifier_logger import get_logger
+from src.notifiers.ft_team_game_approaching import notify_ft_team_game_approaching
+from src.notifiers.ft_team_game_played import notify_ft_team_game_played
+from src.statistics.stats_updater import update_stats
+
+FIXTURES_DB_MANAGER = FixturesDBManager()
+LINE_UPS_COLLECTOR = LineUpsCollector()
+
+# Hours in which fixtures are collected and refreshed, same as the crontab ones.
+MATCH_HOURS = "0-5,11-23"
+
+# A job never overlaps with its own previous run, and runs missed while it was
+# busy are coalesced into a single one.
+JOB_DEFAULTS = {"max_instances": 1, "coalesce": True, "misfire_grace_time": 30}
+
+logger = get_logger(__name__)
+
+
+def run_job(job_name: str, job: Callable[[], None]):
+    def run() -> None:
+        start = time.perf_counter()
+        job()
+
+        logger.info(f"Job {job_name} finished in {time.perf_counter() - start:.3f}s")
+
+    return run
+
+
+def on_job_event(event: JobEvent) -> None:
+    if event.code == EVENT_JOB_ERROR:
+        logger.error(
+            f"Job {event.job_id} failed - {str(event.exception)}",
+            exc_info=event.exception,
+        )
+    elif event.code == EVENT_JOB_MAX_INSTANCES:
+        logger.warning(
+            f"Job {event.job_id} skipped, its previous run is still in progress"
+        )
+    elif event.code == EVENT_JOB_MISSED:
+        logger.warning(f"Job {event.job_id} missed its scheduled run")
+
+
+def build_scheduler() -> BlockingScheduler:
+    """
+    Scheduler running in-process the notifiers and collectors that used to be
+    started by cron every few minutes.
+    """
+    scheduler = BlockingScheduler()
+
+    scheduler.add_job(
+        # fixtures are claimed in short transactions, not kept open while sending
+        run_job("ft_team_game_approaching", notify_ft_team_game_approaching),
+        CronTrigger(minute="*"),
+        id="ft_team_game_approaching",
+        **JOB_DEFAULTS,
+    )
+    scheduler.add_job(
+        # each fixture is claimed in its own transaction before it is notified.
+        run_job("ft_team_game_played", notify_ft_team_game_played),
+        # consuming the fixtures outbox is cheap when nothing changed
+        CronTrigger(second="*/10"),
+        id="ft_team_game_played",
+        **JOB_DEFAULTS,
+    )
+    scheduler.add_job(
+        run_job("update_stats", update_stats),
+        CronTrigger(minute="*"),
+        id="update_stats",
+        **JOB_DEFAULTS,
+    )
+    scheduler.add_job(
+        run_job("prune_fixtures_outbox", FIXTURES_DB_MANAGER.prune_fixtures_outbox),
+        CronTrigger(hour=8, minute=0),
+        id="prune_fixtures_outbox",
+        **JOB_DEFAULTS,
+    )
+    scheduler.add_job(
+        run_job("collect_fixtures_events", collect_events),
+        CronTrigger(minute="*/3", hour=MATCH_HOURS),
+        id="collect_fixtures_events",
+        **JOB_DEFAULTS,
+    )
+    scheduler.add_job(
+        run_job("collect_live_events", collect_live_events),
+        CronTrigger(minute="*", hour=MATCH_HOURS),
+        id="collect_live_events",
+        **JOB_DEFAULTS,
+    )
+    scheduler.add_job(
+        run_job("collect_line_ups", LINE_UPS_COLLECTOR.collect_line_ups),
+        CronTrigger(minute="*/3", hour=MATCH_HOURS),
+        id="collect_line_ups",
+        **JOB_DEFAULTS,
+    )
+    scheduler.add_job(
+        run_job("refresh_fixtures", update_fixtures),
+        CronTrigger(minute="*/5", hour=MATCH_HOURS),
+        id="refresh_fixtures",
+        **JOB_DEFAULTS,
+    )
+
+    scheduler.add_listener(
+        on_job_event, EVENT_JOB_ERROR | EVENT_JOB_MAX_INSTANCES | EVENT_JOB_MISSED
+    )
+
+    return scheduler
+
+
+if __name__ == "__main__":
+    logger.info("*** RUNNING Notifier Daemon ****")
+    build_scheduler().start()
@@ -1,39 +1,100 @@
 import sys
-from datetime import datetime, timedelta
-from typing import List
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional, Tuple
 
 from src.api.fixtures_client import FixturesClient
-from src.db.fixtures_db_manager import FixturesDBManager
-from src.notifier_logger import get_logger
-from src.utils.fixtures_utils import (
-    convert_fixture_response_to_db_fixture,
-    convert_fixtures_response_to_db,
+from src.db.fixtures_db_manager import FixturesDBManager, UpsertCounts
+from src.notifier_constants import (
+    FIXTURES_REFRESH_CONCURRENCY,
+    FIXTURES_REFRESH_LOT_SIZE,
+    FIXTURES_REFRESH_MAX_REQUESTS,
+    LIVE_MATCH_STATUSES,
 )
+from src.notifier_logger import get_logger
+from src.utils.date_utils import get_kickoff
+from src.utils.fixtures_utils import convert_fixtures_response_to_db
 
 FIXTURES_DB_MANAGER = FixturesDBManager()
-FIXTURES_CLIENT = FixturesClient(
-    share_session=True, raise_for_status=True, perform_retries=True
-)
+FIXTURES_CLIENT = FixturesClient(raise_for_status=True, perform_retries=True)
 UPDATE_DAYS_RANGE = 30
 
 logger = get_logger(__name__)
 
 
-def update_fixtures() -> None:
+def update_fixtures(
+    concurrency: int = FIXTURES_REFRESH_CONCURRENCY,
+    max_requests: int = FIXTURES_REFRESH_MAX_REQUESTS,
+) -> Dict[str, UpsertCounts]:
     """
-    This function updates only fixtures which are in surrounding current time for certain number of hours.
+    Refreshes the favourite fixtures surrounding current time. Lots are fetched in
+    parallel (live and closest to kick off first), as many as the requests budget
+    allows, and all the results are saved with a single bulk upsert.
     """
-    fixtures_client = FixturesClient()
-    fixtures_to_update = get_all_fixtures_ids_to_update()
-    lots_to_update = list(get_fixture_update_lots(fixtures_to_update))
-
-    for lot in lots_to_update[:1]:
-        logger.info(f"Updating fixtures for lot {lot}")
-        team_fixtures = fixtures_client.get_fixtures_by(ids=lot)
-        FIXTURES_DB_MANAGER.save_fixtures(
-            convert_fixtures_response_to_db(team_fixtures.as_dict["response"])
+    lots_to_update = get_budgeted_lots(get_all_fixtures_ids_to_update(), max_requests)
+    fixtures_responses = fetch_fixtures_responses(lots_to_update, concurrency)
+
+    return FIXTURES_DB_MANAGER.save_fixtures(
+        convert_fixtures_response_to_db(fixtures_responses)
+    )
+
+
+def get_budgeted_lots(fixture_ids: List[int], max_requests: int) -> List[List[int]]:
+    lots = list(get_fixture_update_lots(fixture_ids, FIXTURES_REFRESH_LOT_SIZE))
+
+    key_scheduler = FIXTURES_CLIENT.key_scheduler
+    max_requests = min(max_requests, len(lots))
+
+    while (
+        key_scheduler
+        and max_requests > 0
+        and not key_scheduler.can_afford(max_requests)
+    ):
+        max_requests -= 1
+
+    if len(lots) > max_requests:
+        skipped_fixtures = sum(len(lot) for lot in lots[max_requests:])
+        logger.warning(
+            f"Requests budget of {max_requests} exceeded, {skipped_fixtures} fixtures won't be refreshed this cycle"
         )
 
+    return lots[:max_requests]
+
+
+def fetch_fixtures_responses(
+    lots: List[List[int]], concurrency: int = FIXTURES_REFRESH_CONCURRENCY
+) -> List[Dict[str, Any]]:
+    """
+    Requests every lot of fixtures ids in parallel. Fixtures requested by id come
+    with their events, line ups and statistics.
+
+    :return: fixtures responses, one per fixture.
+    """
+    fixtures_responses = {}
+
+    if not lots:
+        return []
+
+    with ThreadPoolExecutor(max_workers=max(1, concurrency)) as executor:
+        futures = {
+            executor.submit(FIXTURES_CLIENT.get_fixtures_by, ids=lot): lot
+            for lot in lots
+        }
+
+        for future in as_completed(futures):
+            lot = futures[future]
+            try:
+                fixtures_response = future.result()
+            except Exception as e:
+                logger.error(f"Error requesting fixtures for lot {lot} - {str(e)}")
+                continue
+
+            logger.info(f"Fetched fixtures for lot {lot}")
+            for fixture_response in fixtures_response.as_dict.get("response", []):
+                fixtures_responses[fixture_response["fixture"]["id"]] = fixture_response
+
+    return list(fixtures_responses.values())
+
 
 def get_fixture_update_lots(
     fixtures_to_update: List[int], lot_size: int = 20
@@ -42,37 +103,52 @@ def get_fixture_update_lots(
         yield fixtures_to_update[i : i + lot_size]
 
 
-def get_all_fixtures_ids_to_update() -> List["DBFixture"]:
-    todays_fixtures = FIXTURES_DB_MANAGER.get_games_in_surrounding_n_hours(
+def get_all_fixtures_ids_to_update() -> List[int]:
+    surrounding_fixtures = FIXTURES_DB_MANAGER.get_games_in_surrounding_n_hours(
         hours=-3, favourite=True
     ) + FIXTURES_DB_MANAGER.get_games_in_surrounding_n_hours(hours=3, favourite=True)
 
-    return [fixture.id for fixture in todays_fixtures if fixture]
+    fixtures_to_update = {
+        fixture.id: fixture for fixture in surrounding_fixtures if fixture
+    }
+
+    return [
+        fixture.id for fixture in prioritize_fixtures(list(fixtures_to_update.values()))
+    ]
+
+
+def prioritize_fixtures(
+    fixtures: List["DBFixture"], now: Optional[datetime] = None
+) -> List["DBFixture"]:
+    """
+    Live fixtures go first, then the rest by how close their kick off is to now.
+    """
+    now = now or datetime.now(timezone.utc)
+
+    def priority(fixture: "DBFixture") -> Tuple[bool, float]:
+        kickoff = fixture.kickoff or get_kickoff(fixture.utc_date)
+        return (
+            fixture.match_status not in LIVE_MATCH_STATUSES,
+            abs((kickoff - now).total_seconds()),
+        )
+
+    return sorted(fixtures, key=priority)
 
 
 def populate_surrounding_fixtures(date: str) -> None:
     fixtures_response = FIXTURES_CLIENT.get_fixtures_by(date=date)
 
-    for item in fixtures_response.as_dict.get("response", []):
-        if isinstance(item, list):
-            for fixture in item:
-                # check_time = get_formatted_date(fixture["fixture"]["date"]).time()
-                # if is_time_in_surrounding_hours(check_time, hours=3):
-                FIXTURES_DB_MANAGER.save_fixtures(
-                    [convert_fixture_response_to_db_fixture(fixture)]
-                )
-        else:
-            # check_time = get_formatted_date(item["fixture"]["date"]).time()
-            # if is_time_in_surrounding_hours(check_time, hours=3):
-            FIXTURES_DB_MANAGER.save_fixtures(
-                [convert_fixture_response_to_db_fixture(item)]
-            )
+    FIXTURES_DB_MANAGER.save_fixtures(
+        convert_fixtures_response_to_db(fixtures_response.as_dict.get("response", []))
+    )
 
 
 if __name__ == "__main__":
     today = datetime.today()
     if len(sys.argv) > 1:
-        if sys.argv[1] == "multiple":
+        if sys.argv[1] == "refresh":
+            update_fixtures()
+        elif sys.argv[1] == "multiple":
             for day_number in range(0, UPDATE_DAYS_RANGE):
                 date = (today + timedelta(days=day_number)).strftime("%Y-%m-%d")
                 populate_surrounding_fixtures(date)
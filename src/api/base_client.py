@@ -1,4 +1,3 @@
-import random
 from typing import Optional
 
 import httpx
@@ -7,11 +6,23 @@ from pydantic import BaseModel
 from tenacity import Retrying, retry_if_exception_type, stop_after_attempt, wait_fixed
 
 from config.notif_config import NotifConfig
-from src.notifier_constants import MAX_RETRY_ATTEMPTS, TIME_OUT, WAIT_BETWEEN_REQUESTS
+from src.api.http_pool import HTTP_POOL
+from src.api.key_scheduler import RapidAPIKeyScheduler, get_key_scheduler
+from src.api.response_cache import RESPONSE_CACHE, get_cache_key, get_cache_ttl
+from src.notifier_constants import (
+    MAX_RETRY_ATTEMPTS,
+    RAPIDAPI_KEY_MAX_WAIT,
+    TIME_OUT,
+    WAIT_BETWEEN_REQUESTS,
+)
 from src.notifier_logger import get_logger
+from src.utils.cache_utils import SingleFlight
+from src.utils.deadline_utils import check_deadline, time_left
 
 logger = get_logger(__name__)
 
+IN_FLIGHT_REQUESTS = SingleFlight()
+
 
 class Response(BaseModel):
     status_code: int
@@ -25,7 +36,6 @@ class BaseClient:
 
     def __init__(
         self,
-        share_session: bool = False,
         raise_for_status: bool = False,
         perform_retries: bool = False,
     ) -> None:
@@ -34,29 +44,69 @@ class BaseClient:
             "x-rapidapi-host": NotifConfig.X_RAPIDAPI_HOST,
             "x-rapidapi-key": NotifConfig.X_RAPIDAPI_KEY,
         }
-        self._share_session = share_session
         self._raise_for_status = raise_for_status
         self._perform_retries = perform_retries
 
     @property
     def client(self) -> httpx.Client:
-        if self._share_session is False:
-            return httpx.Client()
-        if not self._client:
-            self._client = httpx.Client()
-        return self._client
+        return self._client or HTTP_POOL.get_client(self.base_url)
 
     @client.setter
     def client(self, value: Optional[httpx.Client]) -> None:
         self._client = value
 
+    @property
+    def key_scheduler(self) -> Optional[RapidAPIKeyScheduler]:
+        keys = [key for key in NotifConfig.X_RAPIDAPI_KEYS if key]
+
+        if not len(keys):
+            return None
+
+        return get_key_scheduler(httpx.URL(self.base_url).host, keys)
+
     def _request(self, method: str, url: str, headers: dict, **kwargs) -> "Response":
         logger.info(
             f"Request {' - '.join(filter(None, [method, url, str(kwargs.get('params', ''))]))}"
         )
-        if len(NotifConfig.X_RAPIDAPI_KEYS):
-            request_key = random.choice(NotifConfig.X_RAPIDAPI_KEYS)
-            headers["x-rapidapi-key"] = request_key
+
+        if method != "GET":
+            return self._do_request(method, url, headers, **kwargs)
+
+        # identical GET requests in flight at the same time share one response.
+        return IN_FLIGHT_REQUESTS.do(
+            (get_cache_key(method, url, kwargs.get("params")), self._raise_for_status),
+            self._do_request,
+            method,
+            url,
+            headers,
+            **kwargs,
+        )
+
+    def _do_request(self, method: str, url: str, headers: dict, **kwargs) -> "Response":
+        cache_ttl = get_cache_ttl(url) if method == "GET" else None
+
+        if cache_ttl:
+            response = RESPONSE_CACHE.get(
+                method,
+                url,
+                kwargs.get("params"),
+                cache_ttl,
+                lambda conditional_headers: self._fetch(
+                    method, url, {**headers, **conditional_headers}, **kwargs
+                ),
+            )
+        else:
+            response = self._fetch(method, url, headers, **kwargs)
+
+        return Response(
+            status_code=response.status_code,
+            text=response.text,
+            as_dict=response.json(),
+            headers=response.headers,
+        )
+
+    def _fetch(self, method: str, url: str, headers: dict, **kwargs) -> httpx.Response:
+        key_scheduler = self.key_scheduler if "x-rapidapi-host" in headers else None
 
         for attempt in Retrying(
             stop=stop_after_attempt(MAX_RETRY_ATTEMPTS if self._perform_retries else 1),
@@ -64,20 +114,31 @@ class BaseClient:
             retry=retry_if_exception_type(HTTPStatusError),
         ):
             with attempt:
-                response = self.client.request(
+                check_deadline()
+                request_headers = headers
+
+                if key_scheduler:
+                    request_key = key_scheduler.acquire(
+                        min(RAPIDAPI_KEY_MAX_WAIT, time_left(RAPIDAPI_KEY_MAX_WAIT))
+                    )
+                    request_headers = {**headers, "x-rapidapi-key": request_key}
+
+                response = HTTP_POOL.request(
                     method=method,
                     url=url,
-                    headers=headers,
-                    timeout=TIME_OUT,
+                    client=self.client,
+                    headers=request_headers,
+                    timeout=min(TIME_OUT, time_left(TIME_OUT)),
                     **kwargs,
                 )
 
-                if self._raise_for_status:
+                if key_scheduler:
+                    key_scheduler.release(
+                        request_key, response.headers, response.status_code
+                    )
+
+                # 304 answers conditional requests of cached responses.
+                if self._raise_for_status and response.status_code != 304:
                     response.raise_for_status()
 
-        return Response(
-            status_code=response.status_code,
-            text=response.text,
-            as_dict=response.json(),
-            headers=response.headers,
-        )
+        return response
@@ -0,0 +1,115 @@
+import atexit
+import time
+from dataclasses import asdict, dataclass
+from threading import Lock
+from typing import Any, Dict
+
+import httpx
+
+from src.notifier_constants import (
+    HTTP_POOL_KEEPALIVE_EXPIRY,
+    HTTP_POOL_MAX_CONNECTIONS,
+    HTTP_POOL_MAX_KEEPALIVE_CONNECTIONS,
+    TIME_OUT,
+)
+from src.notifier_logger import get_logger
+
+logger = get_logger(__name__)
+
+
+@dataclass
+class HostMetrics:
+    requests: int = 0
+    errors: int = 0
+    connections: int = 0
+    tls_handshakes: int = 0
+    total_time: float = 0.0
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            **asdict(self),
+            "avg_time": self.total_time / self.requests if self.requests else 0.0,
+        }
+
+
+class HTTPPool:
+    """
+    Process-wide pool of HTTP clients, one per upstream host, so connections (and
+    their TLS sessions) are kept alive and reused by every API client.
+    """
+
+    def __init__(self) -> None:
+        self._lock = Lock()
+        self._clients: Dict[str, httpx.Client] = {}
+        self._metrics: Dict[str, HostMetrics] = {}
+
+    def get_client(self, url: str) -> httpx.Client:
+        host = httpx.URL(url).host
+
+        with self._lock:
+            if host not in self._clients:
+                logger.info(f"Creating HTTP client for host {host}")
+                self._clients[host] = httpx.Client(
+                    http2=True,
+                    timeout=TIME_OUT,
+                    limits=httpx.Limits(
+                        max_connections=HTTP_POOL_MAX_CONNECTIONS,
+                        max_keepalive_connections=HTTP_POOL_MAX_KEEPALIVE_CONNECTIONS,
+                        keepalive_expiry=HTTP_POOL_KEEPALIVE_EXPIRY,
+                    ),
+                )
+                self._metrics[host] = HostMetrics()
+
+            return self._clients[host]
+
+    def request(
+        self, method: str, url: str, client: httpx.Client = None, **kwargs
+    ) -> httpx.Response:
+        host = httpx.URL(url).host
+        client = client or self.get_client(url)
+
+        with self._lock:
+            metrics = self._metrics.setdefault(host, HostMetrics())
+
+        def trace(event_name: str, info: Dict[str, Any]) -> None:
+            if event_name == "connection.connect_tcp.complete":
+                with self._lock:
+                    metrics.connections += 1
+            elif event_name == "connection.start_tls.complete":
+                with self._lock:
+                    metrics.tls_handshakes += 1
+
+        start = time.perf_counter()
+
+        try:
+            return client.request(
+                method=method, url=url, extensions={"trace": trace}, **kwargs
+            )
+        except httpx.HTTPError:
+            with self._lock:
+                metrics.errors += 1
+            raise
+        finally:
+            with self._lock:
+                metrics.requests += 1
+                metrics.total_time += time.perf_counter() - start
+
+    def metrics(self) -> Dict[str, Dict[str, Any]]:
+        with self._lock:
+            return {host: metrics.as_dict() for host, metrics in self._metrics.items()}
+
+    def close(self) -> None:
+        with self._lock:
+            clients = list(self._clients.values())
+            self._clients = {}
+
+        for client in clients:
+            client.close()
+
+
+HTTP_POOL = HTTPPool()
+
+
+@atexit.register
+def close_http_pool() -> None:
+    HTTP_POOL.close()
@@ -1,11 +1,10 @@
 from typing import Any, Dict
 
-import httpx
-
 from config.notif_config import NotifConfig
+from src.api.base_client import BaseClient
 
 
-class ImagesSearchClient:
+class ImagesSearchClient(BaseClient):
     def __init__(self) -> None:
         super().__init__()
         self.base_url = f"https://{NotifConfig.X_RAPIDAPI_IMG_SEARCH_HOST}"
@@ -19,4 +18,4 @@ class ImagesSearchClient:
         params = {"q": search_query}
         url = f"{self.base_url}{self.endpoint}"
 
-        return httpx.get(url, params, self.headers)
+        return self._request(url=url, method="GET", headers=self.headers, params=params)
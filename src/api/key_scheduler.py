@@ -0,0 +1,191 @@
+import time
+from dataclasses import dataclass
+from threading import Lock
+from typing import Callable, Dict, List, Mapping, Optional, Tuple
+
+from src.notifier_constants import (
+    RAPIDAPI_KEY_MAX_WAIT,
+    RAPIDAPI_MINUTE_WINDOW,
+    RAPIDAPI_QUOTA_RESERVE,
+)
+from src.notifier_logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class RapidAPIQuotaExhausted(Exception):
+    pass
+
+
+@dataclass
+class KeyQuota:
+    key: str
+    daily_remaining: Optional[int] = None
+    daily_reset_at: float = 0.0
+    minute_limit: Optional[int] = None
+    minute_remaining: Optional[int] = None
+    minute_reset_at: float = 0.0
+    blocked_until: float = 0.0
+
+    def refresh(self, now: float) -> None:
+        if self.daily_reset_at and now >= self.daily_reset_at:
+            self.daily_remaining, self.daily_reset_at = None, 0.0
+
+        # the window resets on the clock whichever headers came, without a known
+        # limit the remaining calls are unknown until the next response.
+        if now >= self.minute_reset_at:
+            self.minute_remaining = self.minute_limit
+            self.minute_reset_at = (
+                now + RAPIDAPI_MINUTE_WINDOW if self.minute_limit is not None else 0.0
+            )
+
+    def headroom(self, now: float) -> Tuple[bool, float, float]:
+        """
+        Whether the key can be used right now, and its daily and per minute calls
+        left, unknown quotas being considered unlimited.
+        """
+        daily_remaining = (
+            float("inf") if self.daily_remaining is None else self.daily_remaining
+        )
+        minute_remaining = (
+            float("inf") if self.minute_remaining is None else self.minute_remaining
+        )
+        available = (
+            now >= self.blocked_until and daily_remaining > 0 and minute_remaining > 0
+        )
+
+        return available, daily_remaining, minute_remaining
+
+
+def get_int_header(headers: Mapping[str, str], name: str) -> Optional[int]:
+    value = headers.get(name)
+    return int(value) if value is not None and value.isdigit() else None
+
+
+class RapidAPIKeyScheduler:
+    """
+    Routes each request to the key with the most quota left, as reported by the
+    rate limit headers of the previous responses, waiting for the per minute quota
+    to reset when every key ran out of it.
+    """
+
+    def __init__(
+        self,
+        keys: List[str],
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        self._lock = Lock()
+        self._quotas = {key: KeyQuota(key) for key in keys if key}
+        self._clock = clock
+        self._sleep = sleep
+
+    def acquire(self, max_wait: float = RAPIDAPI_KEY_MAX_WAIT) -> str:
+        waited = 0.0
+
+        while True:
+            with self._lock:
+                now = self._clock()
+                for quota in self._quotas.values():
+                    quota.refresh(now)
+
+                quota = max(self._quotas.values(), key=lambda q: q.headroom(now))
+
+                if quota.headroom(now)[0]:
+                    # reserved until the response tells the actual remaining quota,
+                    # so concurrent requests are spread across keys.
+                    if quota.daily_remaining is not None:
+                        quota.daily_remaining -= 1
+                    if quota.minute_remaining is not None:
+                        quota.minute_remaining -= 1
+                    return quota.key
+
+                if all(q.daily_remaining == 0 for q in self._quotas.values()):
+                    raise RapidAPIQuotaExhausted("Daily quota exhausted for every key")
+
+                wait_time = max(
+                    min(
+                        max(q.blocked_until, q.minute_reset_at) - now
+                        for q in self._quotas.values()
+                        if q.daily_remaining != 0
+                    ),
+                    0.1,
+                )
+
+            if waited + wait_time > max_wait:
+                raise RapidAPIQuotaExhausted(
+                    f"No key with available quota in the next {max_wait}s"
+                )
+
+            logger.info(f"Every key ran out of quota, waiting {wait_time:.1f}s")
+            self._sleep(wait_time)
+            waited += wait_time
+
+    def release(
+        self, key: str, headers: Mapping[str, str], status_code: int = 200
+    ) -> None:
+        with self._lock:
+            now = self._clock()
+            quota = self._quotas.get(key)
+
+            if quota is None:
+                return
+
+            daily_remaining = get_int_header(headers, "x-ratelimit-requests-remaining")
+            daily_reset = get_int_header(headers, "x-ratelimit-requests-reset")
+            minute_limit = get_int_header(headers, "x-ratelimit-limit")
+            minute_remaining = get_int_header(headers, "x-ratelimit-remaining")
+
+            if daily_remaining is not None:
+                quota.daily_remaining = daily_remaining
+            if daily_reset is not None:
+                quota.daily_reset_at = now + daily_reset
+            if minute_limit is not None:
+                quota.minute_limit = minute_limit
+            if minute_remaining is not None:
+                if now >= quota.minute_reset_at:
+                    quota.minute_reset_at = now + RAPIDAPI_MINUTE_WINDOW
+                quota.minute_remaining = minute_remaining
+
+            if status_code == 429:
+                retry_after = get_int_header(headers, "retry-after")
+                quota.blocked_until = now + (retry_after or RAPIDAPI_MINUTE_WINDOW)
+                logger.warning(f"Key ...{key[-4:]} rate limited, blocking it")
+
+    def can_afford(self, calls: int) -> bool:
+        """
+        Whether the given number of calls fits in the daily quota left across keys,
+        keeping a reserve for interactive bot commands.
+        """
+        with self._lock:
+            now = self._clock()
+            for quota in self._quotas.values():
+                quota.refresh(now)
+
+            if any(q.daily_remaining is None for q in self._quotas.values()):
+                return True
+
+            return (
+                sum(q.daily_remaining for q in self._quotas.values())
+                - RAPIDAPI_QUOTA_RESERVE
+                >= calls
+            )
+
+    def quotas(self) -> Dict[str, KeyQuota]:
+        with self._lock:
+            return dict(self._quotas)
+
+
+_KEY_SCHEDULERS: Dict[str, RapidAPIKeyScheduler] = {}
+_KEY_SCHEDULERS_LOCK = Lock()
+
+
+def get_key_scheduler(host: str, keys: List[str]) -> RapidAPIKeyScheduler:
+    """
+    Keys quotas are tracked per RapidAPI host, as each API has its own plan.
+    """
+    with _KEY_SCHEDULERS_LOCK:
+        if host not in _KEY_SCHEDULERS:
+            _KEY_SCHEDULERS[host] = RapidAPIKeyScheduler(keys)
+
+        return _KEY_SCHEDULERS[host]
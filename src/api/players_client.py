@@ -1,7 +1,5 @@
 from typing import Any, Dict
 
-import httpx
-
 from src.api.base_client import BaseClient
 
 
@@ -14,4 +12,4 @@ class PlayersClient(BaseClient):
         params = {"season": season, "id": player_id}
         url = f"{self.base_url}{self.endpoint}"
 
-        return httpx.get(url, params, self.headers)
+        return self._request(url=url, method="GET", headers=self.headers, params=params)
@@ -0,0 +1,155 @@
+import hashlib
+from datetime import datetime, timedelta, timezone
+from threading import Lock, Thread
+from typing import Callable, Dict, Optional
+
+import httpx
+
+from src.db.notif_sql_models import ApiResponseCache as DBApiResponseCache
+from src.db.response_cache_db_manager import ResponseCacheDBManager
+from src.notifier_constants import RESPONSE_CACHE_STALE_TTL, RESPONSE_CACHE_TTLS
+from src.notifier_logger import get_logger
+
+logger = get_logger(__name__)
+
+
+def get_cache_ttl(url: str) -> Optional[int]:
+    return RESPONSE_CACHE_TTLS.get(httpx.URL(url).path)
+
+
+def get_cache_key(method: str, url: str, params: Optional[dict] = None) -> str:
+    request_url = httpx.URL(url, params=sorted((params or {}).items()))
+    return hashlib.sha256(f"{method} {request_url}".encode("utf-8")).hexdigest()
+
+
+def is_cacheable(response: httpx.Response) -> bool:
+    # API-Football reports errors (e.g. reached rate limits) with 200 responses.
+    return response.status_code == 200 and not response.json().get("errors")
+
+
+class ResponseCache:
+    """
+    Stores in database the responses of slow changing endpoints, for as long as
+    their endpoint TTL. Once expired, a response is still served for a while,
+    while it is revalidated in the background (with a conditional request when
+    the API provided ETag or Last-Modified headers).
+    """
+
+    def __init__(self, cache_db_manager: ResponseCacheDBManager = None) -> None:
+        self._cache_db_manager = cache_db_manager or ResponseCacheDBManager()
+        self._revalidating = set()
+        self._lock = Lock()
+
+    def get(
+        self,
+        method: str,
+        url: str,
+        params: Optional[dict],
+        ttl: int,
+        fetch: Callable[[Dict[str, str]], httpx.Response],
+    ) -> httpx.Response:
+        """
+        :param fetch: performs the request, sending the given extra headers.
+        """
+        cache_key = get_cache_key(method, url, params)
+        now = datetime.now(timezone.utc)
+
+        try:
+            cached_response = self._cache_db_manager.get_response(cache_key)
+        except Exception as e:
+            logger.error(f"Error reading response cache for {url} - {str(e)}")
+            return fetch({})
+
+        if cached_response is None:
+            return self._fetch(cache_key, url, ttl, fetch)
+
+        if now < cached_response.expires_at:
+            logger.info(f"Cache hit for {url} - {params}")
+            return get_cached_response(cached_response)
+
+        if now < cached_response.expires_at + timedelta(
+            seconds=RESPONSE_CACHE_STALE_TTL
+        ):
+            logger.info(f"Serving stale response for {url} - {params}")
+            self._revalidate_in_background(cache_key, url, ttl, fetch, cached_response)
+            return get_cached_response(cached_response)
+
+        return self._fetch(cache_key, url, ttl, fetch, cached_response)
+
+    def _fetch(
+        self,
+        cache_key: str,
+        url: str,
+        ttl: int,
+        fetch: Callable[[Dict[str, str]], httpx.Response],
+        cached_response: Optional[DBApiResponseCache] = None,
+    ) -> httpx.Response:
+        conditional_headers = {}
+
+        if cached_response is not None and cached_response.etag:
+            conditional_headers["if-none-match"] = cached_response.etag
+        if cached_response is not None and cached_response.last_modified:
+            conditional_headers["if-modified-since"] = cached_response.last_modified
+
+        response = fetch(conditional_headers)
+        now = datetime.now(timezone.utc)
+        expires_at = now + timedelta(seconds=ttl)
+
+        try:
+            if response.status_code == 304 and cached_response is not None:
+                logger.info(f"Cached response for {url} not modified")
+                self._cache_db_manager.extend_response(cache_key, now, expires_at)
+                return get_cached_response(cached_response)
+
+            if is_cacheable(response):
+                self._cache_db_manager.save_response(
+                    DBApiResponseCache(
+                        cache_key=cache_key,
+                        url=str(response.request.url.copy_with(query=None)),
+                        body=response.text,
+                        etag=response.headers.get("etag"),
+                        last_modified=response.headers.get("last-modified"),
+                        fetched_at=now,
+                        expires_at=expires_at,
+                    )
+                )
+        except Exception as e:
+            logger.error(f"Error writing response cache for {url} - {str(e)}")
+
+        return response
+
+    def _revalidate_in_background(
+        self,
+        cache_key: str,
+        url: str,
+        ttl: int,
+        fetch: Callable[[Dict[str, str]], httpx.Response],
+        cached_response: DBApiResponseCache,
+    ) -> None:
+        with self._lock:
+            if cache_key in self._revalidating:
+                return
+            self._revalidating.add(cache_key)
+
+        def revalidate() -> None:
+            try:
+                self._fetch(cache_key, url, ttl, fetch, cached_response)
+            except Exception as e:
+                logger.error(f"Error revalidating cached response {url} - {str(e)}")
+            finally:
+                with self._lock:
+                    self._revalidating.discard(cache_key)
+
+        Thread(target=revalidate, daemon=True).start()
+
+
+def get_cached_response(cached_response: DBApiResponseCache) -> httpx.Response:
+    return httpx.Response(
+        200,
+        content=cached_response.body.encode("utf-8"),
+        headers={"content-type": "application/json", "x-cache": "HIT"},
+        request=httpx.Request("GET", cached_response.url),
+    )
+
+
+RESPONSE_CACHE = ResponseCache()
@@ -1,11 +1,10 @@
 from typing import Any, Dict
 
-import httpx
-
 from config.notif_config import NotifConfig
+from src.api.base_client import BaseClient
 
 
-class VideosSearchClient:
+class VideosSearchClient(BaseClient):
     def __init__(self) -> None:
         super().__init__()
         self.base_url = f"https://{NotifConfig.X_RAPIDAPI_VIDEO_SEARCH_HOST}"
@@ -15,4 +14,4 @@ class VideosSearchClient:
         }
 
     def search_football_videos(self) -> Dict[str, Any]:
-        return httpx.get(self.base_url, {}, self.headers)
+        return self._request(url=self.base_url, method="GET", headers=self.headers)
@@ -1,11 +1,10 @@
 from typing import Any, Dict, List
 
-import httpx
-
 from config.notif_config import NotifConfig
+from src.api.base_client import BaseClient
 
 
-class YoutubeSearchClient:
+class YoutubeSearchClient(BaseClient):
     def __init__(self) -> None:
         super().__init__()
         self.base_url = (
@@ -22,4 +21,6 @@ class YoutubeSearchClient:
     ) -> Dict[str, Any]:
         params = f"keywords=%5B%22{'%22%2C%22'.join(query)}%22%5D&language={language}&region={region}"
 
-        return httpx.post(self.base_url, params, self.headers)
+        return self._request(
+            url=self.base_url, method="POST", headers=self.headers, content=params
+        )
@@ -15,7 +15,7 @@ logger = get_logger(__name__)
 class LineUpsCollector:
     def __init__(self):
         self._fixtures_client = FixturesClient(
-            share_session=True, raise_for_status=True, perform_retries=True
+            raise_for_status=True, perform_retries=True
         )
         self._fixtures_db_manager = FixturesDBManager()
         self._lines_ups_db_manager = LineUpsDBManager()
@@ -1,5 +1,8 @@
+from typing import Dict, Optional
+
 from src.db.fixtures_db_manager import FixturesDBManager
 from src.db.notif_sql_models import LineUp as DBLineUp
+from src.db.notif_sql_models import Player as DBPlayer
 from src.entities import LineUp, Player
 
 
@@ -24,20 +27,33 @@ class LineUpConverter:
             grid=player_line_up_response["grid"],
         )
 
-    def db_model_to_entity(self, formation: str, line_up: list[DBLineUp]) -> LineUp:
+    def db_model_to_entity(
+        self,
+        formation: str,
+        line_up: list[DBLineUp],
+        players: Optional[Dict[int, DBPlayer]] = None,
+    ) -> LineUp:
         return LineUp(
             formation=formation,
-            goalkeeper=self.get_players_in_pos("G", line_up),
-            defenders=self.get_players_in_pos("D", line_up),
-            midfielders=self.get_players_in_pos("M", line_up),
-            forward_strikers=self.get_players_in_pos("F", line_up),
+            goalkeeper=self.get_players_in_pos("G", line_up, players),
+            defenders=self.get_players_in_pos("D", line_up, players),
+            midfielders=self.get_players_in_pos("M", line_up, players),
+            forward_strikers=self.get_players_in_pos("F", line_up, players),
         )
 
-    def get_players_in_pos(self, pos: str, line_up: list[DBLineUp]) -> list[Player]:
+    def get_players_in_pos(
+        self,
+        pos: str,
+        line_up: list[DBLineUp],
+        players: Optional[Dict[int, DBPlayer]] = None,
+    ) -> list[Player]:
+        """
+        Players are taken from the given preloaded players (by id) if any, otherwise
+        they are queried one by one.
+        """
         return [
-            player
-            for player in [
-                self._fixtures_db_manager.get_player(play.player)[0]
-                for play in list(filter(lambda lup: lup.pos == pos, line_up))
-            ]
+            players[play.player]
+            if players is not None
+            else self._fixtures_db_manager.get_player(play.player)[0]
+            for play in list(filter(lambda lup: lup.pos == pos, line_up))
         ]
@@ -0,0 +1,49 @@
+from typing import Dict
+
+from sqlalchemy import delete
+from sqlalchemy.dialects.postgresql import insert
+from sqlmodel import select
+
+from src.db.db_manager import NotifierDBManager
+from src.db.notif_sql_models import BotPersistence as DBBotPersistence
+
+
+class BotPersistenceDBManager:
+    def __init__(self) -> None:
+        self._notifier_db_manager = NotifierDBManager()
+
+    def get_entries(self, namespace: str) -> Dict[str, bytes]:
+        entries_statement = select(DBBotPersistence).where(
+            DBBotPersistence.namespace == namespace
+        )
+
+        return {
+            entry.key: entry.data
+            for entry in self._notifier_db_manager.select_records(entries_statement)
+        }
+
+    def save_entry(self, namespace: str, key: str, data: bytes) -> None:
+        entry_statement = insert(DBBotPersistence.__table__).values(
+            namespace=namespace, key=key, data=data
+        )
+
+        self._notifier_db_manager.execute_statements(
+            [
+                entry_statement.on_conflict_do_update(
+                    index_elements=[DBBotPersistence.namespace, DBBotPersistence.key],
+                    set_={"data": entry_statement.excluded.data},
+                ).returning(DBBotPersistence.key)
+            ]
+        )
+
+    def delete_entry(self, namespace: str, key: str) -> None:
+        self._notifier_db_manager.execute_statements(
+            [
+                delete(DBBotPersistence.__table__)
+                .where(
+                    DBBotPersistence.namespace == namespace,
+                    DBBotPersistence.key == key,
+                )
+                .returning(DBBotPersistence.key)
+            ]
+        )
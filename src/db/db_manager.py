@@ -1,5 +1,11 @@
-from typing import Any, List
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from threading import Lock
+from typing import Any, Dict, Iterator, List, Optional
 
+from sqlalchemy.engine import Engine
+from sqlalchemy.pool import QueuePool
 from sqlmodel import Session, SQLModel, create_engine
 
 from config.notif_config import NotifConfig
@@ -7,46 +13,197 @@ from src.notifier_logger import get_logger
 
 logger = get_logger(__name__)
 
+# Session shared by every NotifierDBManager operation running inside a unit of work.
+_UNIT_OF_WORK_SESSION: ContextVar[Optional[Session]] = ContextVar(
+    "unit_of_work_session", default=None
+)
+
+
+class PoolMetrics:
+    def __init__(self) -> None:
+        self._lock = Lock()
+        self.checkouts = 0
+        self.total_wait_time = 0.0
+        self.max_wait_time = 0.0
+        self.total_checkout_time = 0.0
+        self.max_checkout_time = 0.0
+
+    def record_wait(self, wait_time: float) -> None:
+        with self._lock:
+            self.checkouts += 1
+            self.total_wait_time += wait_time
+            self.max_wait_time = max(self.max_wait_time, wait_time)
+
+    def record_checkout(self, checkout_time: float) -> None:
+        with self._lock:
+            self.total_checkout_time += checkout_time
+            self.max_checkout_time = max(self.max_checkout_time, checkout_time)
+
+    def as_dict(self) -> Dict[str, float]:
+        with self._lock:
+            return {
+                "checkouts": self.checkouts,
+                "avg_wait_time": self.total_wait_time / self.checkouts
+                if self.checkouts
+                else 0.0,
+                "max_wait_time": self.max_wait_time,
+                "avg_checkout_time": self.total_checkout_time / self.checkouts
+                if self.checkouts
+                else 0.0,
+                "max_checkout_time": self.max_checkout_time,
+            }
+
+
+class MeteredQueuePool(QueuePool):
+    """
+    QueuePool that keeps track of how long connections take to be handed out
+    (wait time) and how long they are held until returned (checkout time).
+    """
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.metrics = PoolMetrics()
+
+    def recreate(self) -> "MeteredQueuePool":
+        pool = super().recreate()
+        pool.metrics = self.metrics
+        return pool
+
+    def _do_get(self):
+        start = time.perf_counter()
+        connection_record = super()._do_get()
+        checked_out_at = time.perf_counter()
+        self.metrics.record_wait(checked_out_at - start)
+        connection_record.info["checked_out_at"] = checked_out_at
+
+        return connection_record
+
+    def _do_return_conn(self, connection_record) -> None:
+        checked_out_at = connection_record.info.pop("checked_out_at", None)
+
+        if checked_out_at is not None:
+            self.metrics.record_checkout(time.perf_counter() - checked_out_at)
+
+        super()._do_return_conn(connection_record)
+
 
 class NotifierDBManager:
     ENGINE = None
+    _ENGINE_LOCK = Lock()
 
-    def __init__(self) -> None:
-        NotifierDBManager.ENGINE = (
-            create_engine(
-                NotifConfig.POSTGRES_DB_URL,
-                connect_args={
-                    "user": NotifConfig.DB_USER,
-                    "password": NotifConfig.DB_PASS,
-                },
-                echo=True,
-            )
-            if not NotifierDBManager.ENGINE
-            else NotifierDBManager.ENGINE
-        )
-
-        self._engine = NotifierDBManager.ENGINE
+    @property
+    def _engine(self) -> Engine:
+        """
+        The engine (and its connection pool) is shared by every manager, and only
+        created the first time the database is used, not when managers are built.
+        """
+        if NotifierDBManager.ENGINE is None:
+            with NotifierDBManager._ENGINE_LOCK:
+                if NotifierDBManager.ENGINE is None:
+                    NotifierDBManager.ENGINE = create_engine(
+                        NotifConfig.POSTGRES_DB_URL,
+                        connect_args={
+                            "user": NotifConfig.DB_USER,
+                            "password": NotifConfig.DB_PASS,
+                            "options": "-c statement_timeout="
+                            f"{NotifConfig.DB_STATEMENT_TIMEOUT}",
+                        },
+                        echo=NotifConfig.DB_ECHO,
+                        poolclass=MeteredQueuePool,
+                        pool_size=NotifConfig.DB_POOL_SIZE,
+                        max_overflow=NotifConfig.DB_MAX_OVERFLOW,
+                        pool_timeout=NotifConfig.DB_POOL_TIMEOUT,
+                        pool_recycle=NotifConfig.DB_POOL_RECYCLE,
+                        pool_pre_ping=True,
+                    )
+
+        return NotifierDBManager.ENGINE
 
     def create_db_and_tables(self) -> None:
         logger.info("Creating database and tables")
         SQLModel.metadata.create_all(self._engine)
 
+    @contextmanager
+    def unit_of_work(self) -> Iterator[Session]:
+        """
+        Runs every database operation performed inside the context (by any
+        manager) on the same session and transaction, which is committed when the
+        context exits, or rolled back if an exception is raised.
+        """
+        current_session = _UNIT_OF_WORK_SESSION.get()
+
+        if current_session is not None:
+            yield current_session
+            return
+
+        with Session(self._engine, expire_on_commit=False) as session:
+            token = _UNIT_OF_WORK_SESSION.set(session)
+            try:
+                with session.begin():
+                    yield session
+            finally:
+                _UNIT_OF_WORK_SESSION.reset(token)
+
+    @contextmanager
+    def outside_unit_of_work(self) -> Iterator[None]:
+        """
+        Runs the database operations performed inside the context on their own
+        sessions, so their errors don't abort the transaction of the current unit
+        of work, if any, and their changes are committed regardless of it.
+        """
+        token = _UNIT_OF_WORK_SESSION.set(None)
+        try:
+            yield
+        finally:
+            _UNIT_OF_WORK_SESSION.reset(token)
+
+    @contextmanager
+    def _session(self) -> Iterator[Session]:
+        """
+        Yields the unit of work session if there is one, otherwise a new session
+        which is committed and closed on exit.
+        """
+        current_session = _UNIT_OF_WORK_SESSION.get()
+
+        if current_session is not None:
+            yield current_session
+            current_session.flush()
+            return
+
+        with Session(self._engine, expire_on_commit=False) as session:
+            yield session
+            session.commit()
+
+    @staticmethod
+    def in_unit_of_work() -> bool:
+        return _UNIT_OF_WORK_SESSION.get() is not None
+
     def insert_record(self, db_object: Any) -> None:
-        session = Session(self._engine)
-        session.add(db_object)
-        session.commit()
+        with self._session() as session:
+            session.add(db_object)
 
     def insert_records(self, db_objects: List[Any]) -> None:
-        with Session(self._engine) as session:
-            for db_object in db_objects:
-                session.add(db_object)
-                session.commit()
+        with self._session() as session:
+            session.add_all(db_objects)
 
     def delete_record(self, db_object: Any) -> None:
-        session = Session(self._engine)
-        session.delete(db_object)
-        session.commit()
+        with self._session() as session:
+            session.delete(db_object)
+
+    def execute_statements(self, statements: List[Any]) -> List[List[Any]]:
+        with self._session() as session:
+            return [session.execute(statement).all() for statement in statements]
 
     def select_records(self, statement):
-        with Session(self._engine) as session:
+        with self._session() as session:
             return session.exec(statement).all()
+
+    def pool_metrics(self) -> Dict[str, Any]:
+        pool = self._engine.pool
+
+        return {
+            "size": pool.size(),
+            "checked_out": pool.checkedout(),
+            "overflow": pool.overflow(),
+            **pool.metrics.as_dict(),
+        }
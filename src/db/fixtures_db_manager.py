@@ -1,9 +1,22 @@
+import functools
+import inspect
 import random
-from datetime import datetime, timedelta
-from typing import TYPE_CHECKING, List, Optional
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    ContextManager,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+)
 
-from sqlalchemy import asc, desc, not_
-from sqlmodel import func, or_, select
+from sqlalchemy import String, asc, cast, delete, desc, literal_column, not_, update
+from sqlalchemy.dialects.postgresql import Insert, insert
+from sqlmodel import Session, and_, func, or_, select
 
 from src.db.db_manager import NotifierDBManager
 from src.db.notif_sql_models import ConfigLanguage as DBConfigLanguage
@@ -12,23 +25,39 @@ from src.db.notif_sql_models import Event as DBEvent
 from src.db.notif_sql_models import FavouriteLeague as DBFavouriteLeague
 from src.db.notif_sql_models import FavouriteTeam as DBFavouriteTeam
 from src.db.notif_sql_models import Fixture as DBFixture
+from src.db.notif_sql_models import FixtureOutbox as DBFixtureOutbox
 from src.db.notif_sql_models import Language as DBLanguage
 from src.db.notif_sql_models import League as DBLeague
+from src.db.notif_sql_models import LeagueStatistics as DBLeagueStatistics
 from src.db.notif_sql_models import NotifConfig as DBNotifConfig
 from src.db.notif_sql_models import NotifType as DBNotifType
+from src.db.notif_sql_models import OutboxCursor as DBOutboxCursor
 from src.db.notif_sql_models import Player as DBPlayer
 from src.db.notif_sql_models import Team as DBTeam
+from src.db.notif_sql_models import TeamStatistics as DBTeamStatistics
 from src.db.notif_sql_models import TimeZone as DBTimeZone
 from src.db.notif_sql_models import UserTimeZone as DBUserTimeZone
-from src.notifier_constants import SURROUNDING_INDEXES
+from src.notifier_constants import (
+    FIXTURE_EVENTS_COLLECTED,
+    FIXTURE_EVENTS_LOCK_KEY,
+    FIXTURE_FINISHED,
+    FIXTURE_KICKOFF_CHANGED,
+    FIXTURES_OUTBOX_BATCH_SIZE,
+    FIXTURES_OUTBOX_LOCK_KEY,
+    FIXTURES_OUTBOX_RETENTION_DAYS,
+    SURROUNDING_DAYS,
+    USER_PREFERENCES_TTL,
+)
 from src.notifier_logger import get_logger
+from src.utils.cache_utils import SingleFlight, TTLCache
 from src.utils.date_utils import (
     get_date_diff,
-    get_formatted_date,
+    get_day_range_in_time_zone,
+    get_kickoff,
     get_time_in_time_zone,
     get_time_in_time_zone_str,
 )
-from src.utils.db_utils import remove_duplicate_fixtures
+from src.utils.db_utils import get_events_by_key, is_event_corrected
 
 logger = get_logger(__name__)
 
@@ -53,16 +82,200 @@ class EventConverter:
         )
 
 
+@dataclass
+class UpsertCounts:
+    inserted: int = 0
+    updated: int = 0
+
+
+@dataclass
+class UserPreferences:
+    chat_id: str
+    language: Optional[DBLanguage] = None
+    user_time_zones: List[DBUserTimeZone] = field(default_factory=list)
+    main_time_zone: Optional[DBTimeZone] = None
+    additional_time_zones: List[DBTimeZone] = field(default_factory=list)
+    notif_config: List[DBNotifConfig] = field(default_factory=list)
+    favourite_teams: List[int] = field(default_factory=list)
+    favourite_leagues: List[int] = field(default_factory=list)
+
+
+# Per chat preferences snapshots, invalidated by the setters changing them. The
+# invalidations are only seen by the process making the change, so the cache is
+# only enabled by the bot, which makes every change, and other processes (e.g. the
+# notifiers) always read preferences from database.
+USER_PREFERENCES_CACHE = TTLCache(ttl=USER_PREFERENCES_TTL, enabled=False)
+
+
+def invalidates_user_preferences(method: Callable) -> Callable:
+    @functools.wraps(method)
+    def wrapper(*args, **kwargs):
+        chat_id = inspect.signature(method).bind(*args, **kwargs).arguments["chat_id"]
+
+        try:
+            return method(*args, **kwargs)
+        finally:
+            USER_PREFERENCES_CACHE.invalidate(str(chat_id))
+
+    return wrapper
+
+
+IN_FLIGHT_READS = SingleFlight()
+
+
+def coalesces_reads(method: Callable) -> Callable:
+    """
+    Concurrent calls with the same arguments share a single query, unless they run
+    inside a unit of work, which must see its own transaction. Every caller gets
+    its own list, but the records in it are shared, so they must only be read.
+    """
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        if NotifierDBManager.in_unit_of_work():
+            return method(self, *args, **kwargs)
+
+        result = IN_FLIGHT_READS.do(
+            (method.__name__, repr(args), repr(sorted(kwargs.items()))),
+            method,
+            self,
+            *args,
+            **kwargs,
+        )
+
+        return list(result) if isinstance(result, list) else result
+
+    return wrapper
+
+
+# "xmax" system column is 0 only for rows that were just inserted, so it lets an
+# upsert tell inserted rows apart from updated ones.
+UPSERT_INSERTED_COLUMN = literal_column("xmax = 0").label("inserted")
+
+
+def get_leagues_upsert_statement(leagues: List[dict]) -> Insert:
+    statement = insert(DBLeague.__table__).values(leagues)
+
+    return statement.on_conflict_do_update(
+        index_elements=[DBLeague.id],
+        set_={
+            "name": statement.excluded.name,
+            "logo": statement.excluded.logo,
+            "country": statement.excluded.country,
+        },
+    ).returning(DBLeague.id, UPSERT_INSERTED_COLUMN)
+
+
+def get_teams_upsert_statement(teams: List[dict]) -> Insert:
+    statement = insert(DBTeam.__table__).values(teams)
+
+    return statement.on_conflict_do_update(
+        index_elements=[DBTeam.id],
+        set_={
+            "name": statement.excluded.name,
+            "picture": func.coalesce(
+                func.nullif(statement.excluded.picture, ""), DBTeam.picture
+            ),
+            "aliases": statement.excluded.aliases,
+            "country": func.coalesce(statement.excluded.country, DBTeam.country),
+        },
+    ).returning(DBTeam.id, UPSERT_INSERTED_COLUMN)
+
+
+def get_fixtures_upsert_statement(fixtures: List[dict]) -> Insert:
+    statement = insert(DBFixture.__table__).values(fixtures)
+
+    return statement.on_conflict_do_update(
+        index_elements=[DBFixture.id],
+        set_={
+            column: statement.excluded[column]
+            for column in fixtures[0].keys()
+            if column != "id"
+        },
+    ).returning(DBFixture.id, UPSERT_INSERTED_COLUMN)
+
+
+def get_statistics_upsert_statement(
+    model: Any, key_column: str, statistics: List[dict]
+) -> Insert:
+    statement = insert(model.__table__).values(statistics)
+
+    return statement.on_conflict_do_update(
+        index_elements=[key_column],
+        set_={
+            column: statement.excluded[column]
+            for column in statistics[0].keys()
+            if column != key_column
+        },
+    ).returning(model.__table__.c[key_column])
+
+
+def is_finished_status(match_status: Optional[str]) -> bool:
+    return "finished" in (match_status or "").lower()
+
+
+def get_fixture_transitions(
+    previous_fixtures: Dict[int, Any], fixtures: List[dict]
+) -> List[DBFixtureOutbox]:
+    """
+    Compares the stored state of each fixture (status and kick off) with the one
+    being upserted, and returns the outbox events for the detected transitions.
+    """
+    now = datetime.now(timezone.utc)
+    transitions = []
+
+    for fixture in fixtures:
+        previous_fixture = previous_fixtures.get(fixture["id"])
+        previous_status = previous_fixture.match_status if previous_fixture else None
+        previous_kickoff = previous_fixture.kickoff if previous_fixture else None
+        event_types = []
+
+        if is_finished_status(fixture["match_status"]) and not is_finished_status(
+            previous_status
+        ):
+            event_types.append(FIXTURE_FINISHED)
+
+        if previous_kickoff and previous_kickoff != fixture["kickoff"]:
+            event_types.append(FIXTURE_KICKOFF_CHANGED)
+
+        transitions += [
+            DBFixtureOutbox(
+                fixture=fixture["id"],
+                event_type=event_type,
+                previous_status=previous_status,
+                match_status=fixture["match_status"],
+                previous_kickoff=previous_kickoff,
+                kickoff=fixture["kickoff"],
+                created_at=now,
+            )
+            for event_type in event_types
+        ]
+
+    return transitions
+
+
 class FixturesDBManager:
     def __init__(self):
         self._notifier_db_manager = NotifierDBManager()
 
+    def unit_of_work(self) -> ContextManager[Session]:
+        return self._notifier_db_manager.unit_of_work()
+
     def get_all_fixtures(self) -> List[Optional[DBFixture]]:
         return self._notifier_db_manager.select_records(select(DBFixture))
 
     def get_all_countries(self) -> List[Optional[DBCountry]]:
         return self._notifier_db_manager.select_records(select(DBCountry))
 
+    def get_all_teams(self) -> List[DBTeam]:
+        return self._notifier_db_manager.select_records(select(DBTeam))
+
+    def get_all_time_zones(self) -> List[DBTimeZone]:
+        return self._notifier_db_manager.select_records(select(DBTimeZone))
+
+    def get_all_languages(self) -> List[DBLanguage]:
+        return self._notifier_db_manager.select_records(select(DBLanguage))
+
     def get_countries_by_name(self, name: str) -> Optional[DBTeam]:
         countries_statement = (
             select(DBCountry)
@@ -79,6 +292,14 @@ class FixturesDBManager:
         team_statement = select(DBTeam).where(DBTeam.id == team_id)
         return self._notifier_db_manager.select_records(team_statement)
 
+    @coalesces_reads
+    def get_teams_by_ids(self, team_ids: List[int]) -> List[DBTeam]:
+        if not len(team_ids):
+            return []
+
+        statement = select(DBTeam).where(DBTeam.id.in_(set(team_ids)))
+        return self._notifier_db_manager.select_records(statement)
+
     def get_all_favourite_teams(self) -> List[Optional[DBTeam]]:
         favourite_teams_statement = select(DBFavouriteTeam.team).distinct()
 
@@ -96,6 +317,56 @@ class FixturesDBManager:
 
         return self._notifier_db_manager.select_records(favourite_teams_statement)
 
+    @coalesces_reads
+    def get_user_preferences(self, chat_id: str) -> UserPreferences:
+        """
+        Snapshot of the chat's language, time zones, notifications config and
+        favourites, cached for a while in the bot process and invalidated by the
+        setters changing them.
+        """
+        chat_id = str(chat_id)
+        user_preferences = USER_PREFERENCES_CACHE.get(chat_id)
+
+        if user_preferences is None:
+            language_statement = (
+                select(DBLanguage)
+                .join(DBConfigLanguage, DBConfigLanguage.lang_id == DBLanguage.lang_id)
+                .where(DBConfigLanguage.chat_id == chat_id)
+            )
+            languages = self._notifier_db_manager.select_records(language_statement)
+            user_time_zones = self.get_user_time_zones(chat_id)
+            time_zones = {
+                time_zone.id: time_zone
+                for time_zone in self.get_time_zones_by_ids(
+                    [user_time_zone.time_zone for user_time_zone in user_time_zones]
+                )
+            }
+
+            user_preferences = UserPreferences(
+                chat_id=chat_id,
+                language=languages[0] if len(languages) else None,
+                user_time_zones=user_time_zones,
+                main_time_zone=next(
+                    (
+                        time_zones[user_time_zone.time_zone]
+                        for user_time_zone in user_time_zones
+                        if user_time_zone.is_main_tz
+                    ),
+                    None,
+                ),
+                additional_time_zones=[
+                    time_zones[user_time_zone.time_zone]
+                    for user_time_zone in user_time_zones
+                    if not user_time_zone.is_main_tz
+                ],
+                notif_config=self.get_user_notif_config(chat_id),
+                favourite_teams=self.get_favourite_teams(chat_id),
+                favourite_leagues=self.get_favourite_leagues(chat_id),
+            )
+            USER_PREFERENCES_CACHE.set(chat_id, user_preferences)
+
+        return user_preferences
+
     def get_favourite_teams_for_team(
         self, team_id: int
     ) -> List[Optional[DBFavouriteTeam]]:
@@ -105,6 +376,81 @@ class FixturesDBManager:
 
         return self._notifier_db_manager.select_records(favourite_teams_statement)
 
+    def get_teams_subscriptions(
+        self, team_ids: List[int], notif_types: List[int]
+    ) -> List[Tuple[str, int, int, Optional[str]]]:
+        """
+        :return: (chat_id, team, notif_type, language short name) of every user with
+        any of the given teams as favourite and any of the given notification types
+        enabled.
+        """
+        if not len(team_ids):
+            return []
+
+        statement = (
+            select(
+                DBFavouriteTeam.chat_id,
+                DBFavouriteTeam.team,
+                DBNotifConfig.notif_type,
+                DBLanguage.short_name,
+            )
+            .join(
+                DBNotifConfig,
+                and_(
+                    cast(DBNotifConfig.chat_id, String) == DBFavouriteTeam.chat_id,
+                    DBNotifConfig.notif_type.in_(notif_types),
+                    DBNotifConfig.status == True,
+                ),
+            )
+            .outerjoin(
+                DBConfigLanguage, DBConfigLanguage.chat_id == DBFavouriteTeam.chat_id
+            )
+            .outerjoin(DBLanguage, DBLanguage.lang_id == DBConfigLanguage.lang_id)
+            .where(DBFavouriteTeam.team.in_(set(team_ids)))
+        )
+
+        return self._notifier_db_manager.select_records(statement)
+
+    def get_favourite_teams_notif_subscriptions(
+        self, notif_type: int
+    ) -> List[Tuple[str, int, str, Optional[str], Optional[str]]]:
+        """
+        :return: (chat_id, team, notification time, main time zone name, language
+        short name) of every favourite team of the users with the given notification
+        type enabled.
+        """
+        statement = (
+            select(
+                DBFavouriteTeam.chat_id,
+                DBFavouriteTeam.team,
+                DBNotifConfig.time,
+                DBTimeZone.name,
+                DBLanguage.short_name,
+            )
+            .join(
+                DBNotifConfig,
+                and_(
+                    cast(DBNotifConfig.chat_id, String) == DBFavouriteTeam.chat_id,
+                    DBNotifConfig.notif_type == notif_type,
+                    DBNotifConfig.status == True,
+                ),
+            )
+            .outerjoin(
+                DBUserTimeZone,
+                and_(
+                    DBUserTimeZone.chat_id == DBFavouriteTeam.chat_id,
+                    DBUserTimeZone.is_main_tz == True,
+                ),
+            )
+            .outerjoin(DBTimeZone, DBTimeZone.id == DBUserTimeZone.time_zone)
+            .outerjoin(
+                DBConfigLanguage, DBConfigLanguage.chat_id == DBFavouriteTeam.chat_id
+            )
+            .outerjoin(DBLanguage, DBLanguage.lang_id == DBConfigLanguage.lang_id)
+        )
+
+        return self._notifier_db_manager.select_records(statement)
+
     def get_favourite_leagues(self, chat_id: str) -> List[Optional[DBTeam]]:
         favourite_leagues_statement = select(DBFavouriteLeague.league).where(
             DBFavouriteLeague.chat_id == str(chat_id)
@@ -131,6 +477,14 @@ class FixturesDBManager:
         league_statement = select(DBLeague).where(DBLeague.id == league_id)
         return self._notifier_db_manager.select_records(league_statement)
 
+    @coalesces_reads
+    def get_leagues_by_ids(self, league_ids: List[int]) -> List[DBLeague]:
+        if not len(league_ids):
+            return []
+
+        statement = select(DBLeague).where(DBLeague.id.in_(set(league_ids)))
+        return self._notifier_db_manager.select_records(statement)
+
     def get_leagues_by_name(self, name: str) -> Optional[DBTeam]:
         teams_statement = (
             select(DBLeague)
@@ -151,6 +505,14 @@ class FixturesDBManager:
         time_zone_statement = select(DBTimeZone).where(DBTimeZone.id == time_zone_id)
         return self._notifier_db_manager.select_records(time_zone_statement)
 
+    @coalesces_reads
+    def get_time_zones_by_ids(self, time_zone_ids: List[int]) -> List[DBTimeZone]:
+        if not len(time_zone_ids):
+            return []
+
+        statement = select(DBTimeZone).where(DBTimeZone.id.in_(set(time_zone_ids)))
+        return self._notifier_db_manager.select_records(statement)
+
     def get_user_time_zones(self, chat_id: str) -> List[Optional[DBUserTimeZone]]:
         user_time_zones_statement = select(DBUserTimeZone).where(
             DBUserTimeZone.chat_id == str(chat_id)
@@ -158,6 +520,16 @@ class FixturesDBManager:
 
         return self._notifier_db_manager.select_records(user_time_zones_statement)
 
+    def get_users_time_zones(self, chat_ids: List[str]) -> List[DBUserTimeZone]:
+        if not len(chat_ids):
+            return []
+
+        user_time_zones_statement = select(DBUserTimeZone).where(
+            DBUserTimeZone.chat_id.in_({str(chat_id) for chat_id in chat_ids})
+        )
+
+        return self._notifier_db_manager.select_records(user_time_zones_statement)
+
     def get_time_zones_by_name(self, name: str) -> Optional[DBTimeZone]:
         teams_statement = (
             select(DBTimeZone)
@@ -179,42 +551,26 @@ class FixturesDBManager:
         days: int,
         leagues: List[int] = [],
         teams: List[int] = [],
-    ) -> List[Optional[DBFixture]]:
-        surrounding_fixtures = []
-
-        if days > 0:
-            days_range = range(1, days + 1)
-        elif days < 0:
-            days_range = range(days, 0)
-        else:
-            days_range = range(0, 1)
-
-        statement = select(DBFixture)
-
-        for day in days_range:
-            utc_today = datetime.utcnow()
-            surrounding_day = utc_today + timedelta(days=day)
-            games_date = str(surrounding_day.date())
-            statement.where(DBFixture.utc_date.ilike(games_date))
-
-        if len(leagues):
-            league_statement = statement.where(DBFixture.league.in_(leagues))
-            surrounding_fixtures += self._notifier_db_manager.select_records(
-                league_statement
-            )
-        elif len(teams):
-            team_statement = statement.where(
-                or_(DBFixture.home_team.in_(teams), DBFixture.away_team.in_(teams))
-            )
-            team_fixtures = self._notifier_db_manager.select_records(team_statement)
-
-            surrounding_fixtures = remove_duplicate_fixtures(team_fixtures)
-        else:
-            surrounding_fixtures += self._notifier_db_manager.select_records(statement)
-
-        surrounding_fixtures.sort(key=lambda fixture: fixture.utc_date)
+        time_zone: str = "UTC",
+        exclude_statuses: List[str] = [],
+    ) -> List[DBFixture]:
+        """
+        Fixtures of the next n days (the previous ones if negative, or today if 0),
+        with days taken in the given time zone, and sorted by kick off.
+        """
+        today = get_time_in_time_zone_str(datetime.utcnow(), time_zone).date()
+        first_day = today + timedelta(days=min(days, 1))
+        start, end = get_day_range_in_time_zone(
+            first_day, time_zone, days=max(abs(days), 1)
+        )
 
-        return surrounding_fixtures
+        return self.get_fixtures_in_range(
+            start,
+            end,
+            leagues=leagues,
+            teams=teams,
+            exclude_statuses=exclude_statuses,
+        )
 
     def get_surround_games_in_time_zone(
         self,
@@ -223,44 +579,84 @@ class FixturesDBManager:
         teams: List[int] = [],
         time_zone: str = "UTC",
         exclude_statuses: List[str] = [],
-    ) -> List[Optional[DBFixture]]:
-        days_to_grab = SURROUNDING_INDEXES.get(surround_type)
-
-        utc_now = datetime.utcnow()
-        now_in_time_zone = get_time_in_time_zone_str(utc_now, time_zone)
-
-        dates_to_check = {
-            "today": now_in_time_zone.date(),
-            "tomorrow": (now_in_time_zone + timedelta(days=1)).date(),
-            "yesterday": (now_in_time_zone - timedelta(days=1)).date(),
-        }
-
-        date_to_check_in_time_zone = dates_to_check.get(surround_type)
-
-        logger.info(f"Date to check in time zone -> {date_to_check_in_time_zone}")
-
-        today_games = []
-
-        surrounding_fixtures = (
-            self.get_games_in_surrounding_n_days(days_to_grab[0], leagues, teams)
-            + self.get_games_in_surrounding_n_days(days_to_grab[1], leagues, teams)
-            + self.get_games_in_surrounding_n_days(days_to_grab[2], leagues, teams)
+    ) -> List[DBFixture]:
+        return self.get_games_in_surrounding_n_days(
+            SURROUNDING_DAYS[surround_type],
+            leagues=leagues,
+            teams=teams,
+            time_zone=time_zone,
+            exclude_statuses=exclude_statuses,
         )
 
-        logger.info(
-            f"Fixtures: {', '.join([str(fxt.id) for fxt in surrounding_fixtures])}"
+    def get_fixtures_in_range(
+        self,
+        start: datetime,
+        end: datetime,
+        leagues: List[int] = [],
+        teams: List[int] = [],
+        exclude_statuses: List[str] = [],
+    ) -> List[DBFixture]:
+        """
+        Fixtures kicking off in [start, end), sorted by kick off. When leagues or
+        teams are given, only the ones of any of those leagues or teams.
+        """
+        statement = (
+            select(DBFixture)
+            .where(DBFixture.kickoff >= start, DBFixture.kickoff < end)
+            .order_by(asc(DBFixture.kickoff))
         )
 
-        for fixture in surrounding_fixtures:
-            if fixture.match_status not in exclude_statuses:
-                fixture_date_in_time_zone = get_time_in_time_zone_str(
-                    get_formatted_date(fixture.utc_date), time_zone
-                ).date()
+        leagues_or_teams_conditions = []
+
+        if len(leagues):
+            leagues_or_teams_conditions.append(DBFixture.league.in_(set(leagues)))
+        if len(teams):
+            leagues_or_teams_conditions += [
+                DBFixture.home_team.in_(set(teams)),
+                DBFixture.away_team.in_(set(teams)),
+            ]
+        if len(leagues_or_teams_conditions):
+            statement = statement.where(or_(*leagues_or_teams_conditions))
+
+        if len(exclude_statuses):
+            statement = statement.where(DBFixture.match_status.notin_(exclude_statuses))
 
-                if date_to_check_in_time_zone == fixture_date_in_time_zone:
-                    today_games.append(fixture)
+        return self._notifier_db_manager.select_records(statement)
 
-        return remove_duplicate_fixtures(today_games)
+    def get_fixtures_rows(
+        self,
+        columns: List[str],
+        fixture_ids: Optional[List[int]] = None,
+        kickoff_from: Optional[datetime] = None,
+        kickoff_to: Optional[datetime] = None,
+        updated_from: Optional[datetime] = None,
+    ) -> List[Tuple]:
+        """
+        The given columns of every fixture, or of the given ones, or of the ones
+        kicking off in [kickoff_from, kickoff_to), or updated since updated_from,
+        as plain rows instead of models.
+        """
+        statement = select(*[DBFixture.__table__.c[column] for column in columns])
+
+        if fixture_ids is not None:
+            if not len(fixture_ids):
+                return []
+
+            statement = statement.where(DBFixture.id.in_(set(fixture_ids)))
+
+        if kickoff_from is not None:
+            statement = statement.where(DBFixture.kickoff >= kickoff_from)
+
+        if kickoff_to is not None:
+            statement = statement.where(DBFixture.kickoff < kickoff_to)
+
+        if updated_from is not None:
+            statement = statement.where(DBFixture.updated_at >= updated_from)
+
+        return [
+            tuple(row)
+            for row in self._notifier_db_manager.execute_statements([statement])[0]
+        ]
 
     def get_games_in_surrounding_n_hours(
         self,
@@ -269,21 +665,16 @@ class FixturesDBManager:
         status: str = "",
         exclude_statuses: List[str] = [],
     ) -> List[Optional[DBFixture]]:
-        time_to_check = datetime.now() + timedelta(hours=hours)
-        now_str = datetime.now().strftime("%Y-%m-%dT%H:%M:%S")
-        time_to_check_str = datetime.strftime(time_to_check, "%Y-%m-%dT%H:%M:%S")
+        now = datetime.now(timezone.utc)
+        time_to_check = now + timedelta(hours=hours)
 
         if hours > 0:
-            statement = (
-                select(DBFixture)
-                .where(DBFixture.utc_date < time_to_check_str)
-                .where(DBFixture.utc_date > now_str)
+            statement = select(DBFixture).where(
+                DBFixture.kickoff > now, DBFixture.kickoff < time_to_check
             )
         else:
-            statement = (
-                select(DBFixture)
-                .where(DBFixture.utc_date > time_to_check_str)
-                .where(DBFixture.utc_date < now_str)
+            statement = select(DBFixture).where(
+                DBFixture.kickoff > time_to_check, DBFixture.kickoff < now
             )
 
         if status:
@@ -315,6 +706,17 @@ class FixturesDBManager:
 
         return self._notifier_db_manager.select_records(fixtures_statement)
 
+    def get_fixtures_by_ids(self, fixture_ids: List[int]) -> List[DBFixture]:
+        if not len(fixture_ids):
+            return []
+
+        fixtures_statement = (
+            select(DBFixture)
+            .where(DBFixture.id.in_(set(fixture_ids)))
+            .order_by(asc(DBFixture.kickoff))
+        )
+        return self._notifier_db_manager.select_records(fixtures_statement)
+
     def get_fixtures_by_team(self, team_id: int) -> Optional[List[DBFixture]]:
         fixtures_statement = (
             select(DBFixture)
@@ -324,7 +726,7 @@ class FixturesDBManager:
                     DBFixture.away_team == team_id,
                 )
             )
-            .order_by(asc(DBFixture.utc_date))
+            .order_by(asc(DBFixture.kickoff))
         )
 
         return self._notifier_db_manager.select_records(fixtures_statement)
@@ -335,14 +737,17 @@ class FixturesDBManager:
         fixtures_statement = select(DBFixture).where(DBFixture.league == league_id)
 
         if date:
+            day_start = datetime.strptime(date, "%Y-%m-%d").replace(tzinfo=timezone.utc)
             fixtures_statement = fixtures_statement.where(
-                DBFixture.utc_date.contains(date)
+                DBFixture.kickoff >= day_start,
+                DBFixture.kickoff < day_start + timedelta(days=1),
             )
 
-        fixtures_statement = fixtures_statement.order_by(asc(DBFixture.utc_date))
+        fixtures_statement = fixtures_statement.order_by(asc(DBFixture.kickoff))
 
         return self._notifier_db_manager.select_records(fixtures_statement)
 
+    @coalesces_reads
     def get_next_fixture(
         self,
         team_id: int = None,
@@ -350,9 +755,9 @@ class FixturesDBManager:
         number_of_fixtures: int = 1,
         exclude_statuses: List[str] = [],
     ) -> Optional[List[DBFixture]]:
-        today = datetime.strftime(datetime.utcnow(), "%Y-%m-%dT%H:%M:%S")
-
-        statement = select(DBFixture).where(DBFixture.utc_date >= today)
+        statement = select(DBFixture).where(
+            DBFixture.kickoff >= datetime.now(timezone.utc)
+        )
 
         if team_id:
             statement = statement.where(
@@ -367,14 +772,11 @@ class FixturesDBManager:
                 not_(DBFixture.match_status.in_(exclude_statuses))
             )
 
-        statement = statement.order_by(asc(DBFixture.utc_date))
-
-        next_fixtures = self._notifier_db_manager.select_records(statement)
+        statement = statement.order_by(asc(DBFixture.kickoff)).limit(number_of_fixtures)
 
-        return (
-            next_fixtures[:number_of_fixtures] if len(next_fixtures) else next_fixtures
-        )
+        return self._notifier_db_manager.select_records(statement)
 
+    @coalesces_reads
     def get_last_fixture(
         self,
         team_id: int = None,
@@ -383,9 +785,9 @@ class FixturesDBManager:
         year: str = None,
         exclude_statuses: List[str] = [],
     ) -> Optional[List[DBFixture]]:
-        today = datetime.strftime(datetime.utcnow(), "%Y-%m-%dT%H:%M:%S")
-
-        statement = select(DBFixture).where(DBFixture.utc_date <= today)
+        statement = select(DBFixture).where(
+            DBFixture.kickoff <= datetime.now(timezone.utc)
+        )
 
         if team_id:
             statement = statement.where(
@@ -396,21 +798,23 @@ class FixturesDBManager:
             statement = statement.where(DBFixture.league == league_id)
 
         if year:
-            statement = statement.where(DBFixture.utc_date.contains(year))
+            statement = statement.where(
+                DBFixture.kickoff >= datetime(int(year), 1, 1, tzinfo=timezone.utc),
+                DBFixture.kickoff < datetime(int(year) + 1, 1, 1, tzinfo=timezone.utc),
+            )
 
         if len(exclude_statuses):
             statement = statement.where(
                 not_(DBFixture.match_status.in_(exclude_statuses))
             )
 
-        statement = statement.order_by(desc(DBFixture.utc_date))
-
-        next_fixtures = self._notifier_db_manager.select_records(statement)
-
-        return (
-            next_fixtures[:number_of_fixtures] if len(next_fixtures) else next_fixtures
+        statement = statement.order_by(desc(DBFixture.kickoff)).limit(
+            number_of_fixtures
         )
 
+        return self._notifier_db_manager.select_records(statement)
+
+    @coalesces_reads
     def get_head_to_head_fixtures(self, team_1: str, team_2: str):
         statement = (
             select(DBFixture)
@@ -418,7 +822,7 @@ class FixturesDBManager:
                 or_(DBFixture.home_team == team_1, DBFixture.away_team == team_1),
             )
             .where(or_(DBFixture.home_team == team_2, DBFixture.away_team == team_2))
-            .order_by(DBFixture.utc_date)
+            .order_by(DBFixture.kickoff)
         )
 
         fixtures = self._notifier_db_manager.select_records(statement)
@@ -461,6 +865,7 @@ class FixturesDBManager:
         # for later using it again
         return self._notifier_db_manager.select_records(league_statement)[0]
 
+    @invalidates_user_preferences
     def insert_favourite_team(self, team_id: int, chat_id: str) -> DBFavouriteTeam:
         team = self.get_team(team_id)
 
@@ -491,6 +896,7 @@ class FixturesDBManager:
 
         return self._notifier_db_manager.select_records(favourite_team_statement)[0]
 
+    @invalidates_user_preferences
     def insert_favourite_league(self, league_id: int, chat_id: str) -> DBFavouriteTeam:
         league = self.get_league(league_id)
 
@@ -521,6 +927,7 @@ class FixturesDBManager:
 
         return self._notifier_db_manager.select_records(favourite_league_statement)[0]
 
+    @invalidates_user_preferences
     def insert_favourite_team(self, team_id: int, chat_id: str) -> DBFavouriteTeam:
         team = self.get_team(team_id)
 
@@ -551,6 +958,7 @@ class FixturesDBManager:
 
         return self._notifier_db_manager.select_records(favourite_team_statement)[0]
 
+    @invalidates_user_preferences
     def insert_user_time_zone(
         self, time_zone_id: int, chat_id: str, main: bool = False
     ) -> DBUserTimeZone:
@@ -609,6 +1017,14 @@ class FixturesDBManager:
         player_statement = select(DBPlayer).where(DBPlayer.id == player_id)
         return self._notifier_db_manager.select_records(player_statement)
 
+    @coalesces_reads
+    def get_players_by_ids(self, player_ids: List[int]) -> List[DBPlayer]:
+        if not len(player_ids):
+            return []
+
+        statement = select(DBPlayer).where(DBPlayer.id.in_(set(player_ids)))
+        return self._notifier_db_manager.select_records(statement)
+
     def insert_player(self, player: "Player") -> DBPlayer:
         player_statement = select(DBPlayer).where(DBPlayer.id == player.id)
         retrieved_player = self._notifier_db_manager.select_records(player_statement)
@@ -694,6 +1110,7 @@ class FixturesDBManager:
             db_fixture.id = fixture.id
             db_fixture.utc_date = fixture.utc_date
             db_fixture.bsas_date = fixture.bsas_date
+            db_fixture.kickoff = fixture.kickoff
             db_fixture.league = fixture.league
             db_fixture.round = fixture.round
             db_fixture.match_status = fixture.match_status
@@ -709,87 +1126,378 @@ class FixturesDBManager:
             db_fixture.approach_notified = fixture.approach_notified
             db_fixture.line_up_check_attempt = fixture.line_up_check_attempt
 
+        db_fixture.kickoff = db_fixture.kickoff or get_kickoff(db_fixture.utc_date)
+
         self._notifier_db_manager.insert_record(db_fixture)
 
-    def save_fixture_event(self, event: "Event") -> None:
+    def _insert_event_players(self, event: "Event") -> None:
         if event.player.name is not None and event.player.id is not None:
             self.insert_player(event.player)
         if event.assist.name is not None and event.assist.id is not None:
             self.insert_player(event.assist)
+
+    def save_fixture_event(self, event: "Event") -> None:
+        self._insert_event_players(event)
         logger.info(
             f"Inserting Event {event.type} - {event.player.name} - assist: {event.assist.name}"
         )
         db_event = EventConverter.to_db_model(event)
         self._notifier_db_manager.insert_record(db_event)
 
+    def _update_fixture_event(self, event_id: int, event: "Event") -> None:
+        self._insert_event_players(event)
+        logger.info(
+            f"Updating Event {event_id} {event.type} - {event.player.name} - "
+            f"assist: {event.assist.name}"
+        )
+        self._notifier_db_manager.execute_statements(
+            [
+                update(DBEvent.__table__)
+                .where(DBEvent.id == event_id)
+                .values(
+                    player=event.player.id,
+                    assist=event.assist.id,
+                    detail=event.detail,
+                    comments=event.comments,
+                )
+                .returning(DBEvent.id)
+            ]
+        )
+
+    def save_fixture_events(
+        self, fixture_id: int, events: List["Event"]
+    ) -> List["Event"]:
+        """
+        Inserts the events of a fixture which are not stored yet, compared by their
+        key, so the same response can be saved any number of times. Stored events
+        whose player or detail got corrected are updated instead.
+
+        :return: the inserted events.
+        """
+        new_events = []
+
+        with self.unit_of_work():
+            self._notifier_db_manager.execute_statements(
+                [
+                    select(
+                        func.pg_advisory_xact_lock(FIXTURE_EVENTS_LOCK_KEY, fixture_id)
+                    )
+                ]
+            )
+            stored_events = get_events_by_key(self.get_fixture_events(fixture_id))
+
+            for event in events:
+                event.fixture_id = fixture_id
+
+            db_events = get_events_by_key(
+                [EventConverter.to_db_model(event) for event in events]
+            )
+
+            for event, (event_key, db_event) in zip(events, db_events.items()):
+                stored_event = stored_events.get(event_key)
+
+                if stored_event is None:
+                    self.save_fixture_event(event)
+                    new_events.append(event)
+                elif is_event_corrected(stored_event, db_event):
+                    self._update_fixture_event(stored_event.id, event)
+
+            if len(new_events):
+                self._insert_events_collected_transition(fixture_id)
+
+        return new_events
+
+    def _insert_events_collected_transition(self, fixture_id: int) -> None:
+        """
+        Events of finished fixtures are announced in the fixtures outbox, as the
+        statistics computed from them become outdated.
+        """
+        fixture = self.get_fixture_by_id(fixture_id)
+
+        if not len(fixture) or not is_finished_status(fixture[0].match_status):
+            return
+
+        self.insert_fixture_transitions(
+            [
+                DBFixtureOutbox(
+                    fixture=fixture_id,
+                    event_type=FIXTURE_EVENTS_COLLECTED,
+                    previous_status=fixture[0].match_status,
+                    match_status=fixture[0].match_status,
+                    previous_kickoff=fixture[0].kickoff,
+                    kickoff=fixture[0].kickoff,
+                    created_at=datetime.now(timezone.utc),
+                )
+            ]
+        )
+
+    @coalesces_reads
     def get_fixture_events(self, fixture_id: int) -> Optional[DBEvent]:
         event_statement = (
             select(DBEvent)
             .where(DBEvent.fixture == fixture_id)
-            .order_by(asc(DBEvent.time), asc(DBEvent.time_extra))
+            .order_by(asc(DBEvent.time), asc(DBEvent.time_extra), asc(DBEvent.id))
+        )
+        return self._notifier_db_manager.select_records(event_statement)
+
+    @coalesces_reads
+    def get_fixtures_events(self, fixture_ids: List[int]) -> List[DBEvent]:
+        if not len(fixture_ids):
+            return []
+
+        event_statement = (
+            select(DBEvent)
+            .where(DBEvent.fixture.in_(set(fixture_ids)))
+            .order_by(asc(DBEvent.fixture), asc(DBEvent.time), asc(DBEvent.time_extra))
         )
         return self._notifier_db_manager.select_records(event_statement)
 
-    def save_fixtures(self, team_fixtures: List["FixtureForDB"]) -> None:
-        db_fixtures = []
+    def save_fixtures(
+        self, team_fixtures: List["FixtureForDB"]
+    ) -> Dict[str, UpsertCounts]:
+        """
+        Upserts leagues, teams and fixtures of the given fixtures with one
+        INSERT ... ON CONFLICT DO UPDATE statement per table, all of them in a single
+        transaction, together with the fixtures outbox events of the status and kick
+        off transitions they introduce.
+
+        :return: inserted and updated rows counts, by table name.
+        """
+        if not len(team_fixtures):
+            return {}
 
+        leagues, teams, fixtures = {}, {}, {}
+
+        # rows are keyed by id, as ON CONFLICT DO UPDATE can't affect the same
+        # row twice within the same statement.
         for conv_fix in team_fixtures:
-            retrieved_league = self.insert_league(conv_fix.championship)
-            retrieved_home_team = self.insert_team(conv_fix.home_team)
-            retrieved_away_team = self.insert_team(conv_fix.away_team)
+            leagues[conv_fix.championship.league_id] = {
+                "id": conv_fix.championship.league_id,
+                "name": conv_fix.championship.name,
+                "logo": conv_fix.championship.logo,
+                "country": conv_fix.championship.country,
+            }
+
+            for fixture_team in [conv_fix.home_team, conv_fix.away_team]:
+                teams[fixture_team.id] = {
+                    "id": fixture_team.id,
+                    "name": fixture_team.name,
+                    "picture": fixture_team.picture,
+                    "aliases": fixture_team.aliases,
+                    "country": fixture_team.country or None,
+                }
+
+            fixtures[conv_fix.id] = {
+                "id": conv_fix.id,
+                "utc_date": conv_fix.utc_date,
+                "bsas_date": conv_fix.bsas_date,
+                "kickoff": get_kickoff(conv_fix.utc_date),
+                "league": conv_fix.championship.league_id,
+                "round": conv_fix.round,
+                "home_team": conv_fix.home_team.id,
+                "away_team": conv_fix.away_team.id,
+                "match_status": conv_fix.match_status,
+                "referee": conv_fix.referee,
+                "home_score": conv_fix.match_score.home_score,
+                "away_score": conv_fix.match_score.away_score,
+                "penalty_home_score": conv_fix.match_score.penalty_home_score,
+                "penalty_away_score": conv_fix.match_score.penalty_away_score,
+                "venue": conv_fix.venue,
+            }
+
+        with self.unit_of_work():
+            # stored rows are locked until commit, so concurrent saves of the same
+            # fixtures can't both see (and report) the same transition.
+            previous_fixtures = {
+                fixture.id: fixture
+                for fixture in self._notifier_db_manager.select_records(
+                    select(DBFixture.id, DBFixture.match_status, DBFixture.kickoff)
+                    .where(DBFixture.id.in_(list(fixtures.keys())))
+                    .with_for_update()
+                )
+            }
+
+            upsert_results = self._notifier_db_manager.execute_statements(
+                [
+                    get_leagues_upsert_statement(list(leagues.values())),
+                    get_teams_upsert_statement(list(teams.values())),
+                    get_fixtures_upsert_statement(list(fixtures.values())),
+                ]
+            )
 
-            fixture_statement = select(DBFixture).where(DBFixture.id == conv_fix.id)
-            retrieved_fixture = self._notifier_db_manager.select_records(
-                fixture_statement
+            self.insert_fixture_transitions(
+                get_fixture_transitions(previous_fixtures, list(fixtures.values()))
             )
 
-            if not len(retrieved_fixture):
-                logger.info(
-                    f"Inserting Fixture {conv_fix.home_team.name} vs "
-                    f"{conv_fix.away_team.name} - it does not exist in the "
-                    f"database"
-                )
-                db_fixture = DBFixture(
-                    id=conv_fix.id,
-                    utc_date=conv_fix.utc_date,
-                    bsas_date=conv_fix.bsas_date,
-                    league=retrieved_league.id,
-                    round=conv_fix.round,
-                    home_team=retrieved_home_team.id,
-                    away_team=retrieved_away_team.id,
-                    match_status=conv_fix.match_status,
-                    referee=conv_fix.referee,
-                    home_score=conv_fix.match_score.home_score,
-                    away_score=conv_fix.match_score.away_score,
-                    penalty_home_score=conv_fix.match_score.penalty_home_score,
-                    penalty_away_score=conv_fix.match_score.penalty_away_score,
-                    venue=conv_fix.venue,
+        upsert_counts = {}
+
+        for table_name, rows in zip(["league", "team", "fixture"], upsert_results):
+            inserted = sum(1 for row in rows if row.inserted)
+            upsert_counts[table_name] = UpsertCounts(
+                inserted=inserted, updated=len(rows) - inserted
+            )
+            logger.info(
+                f"Upserted {table_name} records - inserted: {inserted} - "
+                f"updated: {len(rows) - inserted}"
+            )
+
+        return upsert_counts
+
+    def insert_fixture_transitions(self, transitions: List[DBFixtureOutbox]) -> None:
+        if not len(transitions):
+            return
+
+        with self.unit_of_work():
+            self._notifier_db_manager.execute_statements(
+                [select(func.pg_advisory_xact_lock(FIXTURES_OUTBOX_LOCK_KEY))]
+            )
+            logger.info(f"Inserting {len(transitions)} fixture transitions in outbox")
+            self._notifier_db_manager.insert_records(transitions)
+
+    def get_fixture_transitions(
+        self,
+        consumer: str,
+        event_types: List[str],
+        limit: int = FIXTURES_OUTBOX_BATCH_SIZE,
+    ) -> List[DBFixtureOutbox]:
+        """
+        Returns the outbox events of the given types the consumer has not processed
+        yet, in the order they were produced.
+        """
+        cursor_statement = select(DBOutboxCursor.last_event_id).where(
+            DBOutboxCursor.consumer == consumer
+        )
+        cursor = self._notifier_db_manager.select_records(cursor_statement)
+
+        return self.get_outbox_events(
+            cursor[0] if len(cursor) else 0, event_types, limit=limit
+        )
+
+    def get_outbox_events(
+        self,
+        last_event_id: int,
+        event_types: Optional[List[str]] = None,
+        limit: int = FIXTURES_OUTBOX_BATCH_SIZE,
+    ) -> List[DBFixtureOutbox]:
+        """
+        Outbox events produced after the given one, of any type if none is given.
+        """
+        statement = select(DBFixtureOutbox).where(DBFixtureOutbox.id > last_event_id)
+
+        if event_types is not None:
+            statement = statement.where(DBFixtureOutbox.event_type.in_(event_types))
+
+        return self._notifier_db_manager.select_records(
+            statement.order_by(asc(DBFixtureOutbox.id)).limit(limit)
+        )
+
+    def advance_outbox_cursor(self, consumer: str, last_event_id: int) -> None:
+        cursor_statement = insert(DBOutboxCursor.__table__).values(
+            consumer=consumer, last_event_id=last_event_id
+        )
+
+        self._notifier_db_manager.execute_statements(
+            [
+                cursor_statement.on_conflict_do_update(
+                    index_elements=[DBOutboxCursor.consumer],
+                    set_={"last_event_id": cursor_statement.excluded.last_event_id},
+                ).returning(DBOutboxCursor.consumer)
+            ]
+        )
+
+    def prune_fixtures_outbox(
+        self, retention: timedelta = timedelta(days=FIXTURES_OUTBOX_RETENTION_DAYS)
+    ) -> int:
+        """
+        Deletes the outbox events older than the retention that every consumer has
+        already processed.
+
+        :return: number of deleted events.
+        """
+        consumed_event_id = select(
+            func.min(DBOutboxCursor.last_event_id)
+        ).scalar_subquery()
+        statement = (
+            delete(DBFixtureOutbox.__table__)
+            .where(
+                DBFixtureOutbox.created_at < datetime.now(timezone.utc) - retention,
+                DBFixtureOutbox.id <= consumed_event_id,
+            )
+            .returning(DBFixtureOutbox.id)
+        )
+        deleted_events = self._notifier_db_manager.execute_statements([statement])[0]
+
+        logger.info(f"Pruned {len(deleted_events)} fixtures outbox events")
+
+        return len(deleted_events)
+
+    def _update_fixtures(self, fixture_ids: List[int], **values) -> None:
+        if not len(fixture_ids):
+            return
+
+        self._notifier_db_manager.execute_statements(
+            [
+                update(DBFixture.__table__)
+                .where(DBFixture.id.in_(set(fixture_ids)))
+                .values(**values)
+                .returning(DBFixture.id)
+            ]
+        )
+
+    def mark_fixtures_played_notified(self, fixture_ids: List[int]) -> None:
+        self._update_fixtures(fixture_ids, played_notified=True)
+
+    def mark_fixtures_approach_notified(self, fixture_ids: List[int]) -> None:
+        self._update_fixtures(fixture_ids, approach_notified=True)
+
+    def get_team_statistics(self, team_id: int) -> Optional[DBTeamStatistics]:
+        statement = select(DBTeamStatistics).where(DBTeamStatistics.team == team_id)
+        team_statistics = self._notifier_db_manager.select_records(statement)
+
+        return team_statistics[0] if len(team_statistics) else None
+
+    def get_league_statistics(self, league_id: int) -> Optional[DBLeagueStatistics]:
+        statement = select(DBLeagueStatistics).where(
+            DBLeagueStatistics.league == league_id
+        )
+        league_statistics = self._notifier_db_manager.select_records(statement)
+
+        return league_statistics[0] if len(league_statistics) else None
+
+    def save_teams_statistics(self, teams_statistics: List[DBTeamStatistics]) -> None:
+        if not len(teams_statistics):
+            return
+
+        self._notifier_db_manager.execute_statements(
+            [
+                get_statistics_upsert_statement(
+                    DBTeamStatistics,
+                    "team",
+                    [team_statistics.dict() for team_statistics in teams_statistics],
                 )
-            else:
-                logger.info(
-                    f"Updating Fixture {conv_fix.home_team.name} vs "
-                    f"{conv_fix.away_team.name}"
+            ]
+        )
+
+    def save_leagues_statistics(
+        self, leagues_statistics: List[DBLeagueStatistics]
+    ) -> None:
+        if not len(leagues_statistics):
+            return
+
+        self._notifier_db_manager.execute_statements(
+            [
+                get_statistics_upsert_statement(
+                    DBLeagueStatistics,
+                    "league",
+                    [
+                        league_statistics.dict()
+                        for league_statistics in leagues_statistics
+                    ],
                 )
-                db_fixture = retrieved_fixture.pop()
-                db_fixture.id = conv_fix.id
-                db_fixture.utc_date = conv_fix.utc_date
-                db_fixture.bsas_date = conv_fix.bsas_date
-                db_fixture.league = retrieved_league.id
-                db_fixture.round = conv_fix.round
-                db_fixture.match_status = conv_fix.match_status
-                db_fixture.referee = conv_fix.referee
-                db_fixture.home_team = retrieved_home_team.id
-                db_fixture.away_team = retrieved_away_team.id
-                db_fixture.home_score = conv_fix.match_score.home_score
-                db_fixture.away_score = conv_fix.match_score.away_score
-                db_fixture.penalty_home_score = conv_fix.match_score.penalty_home_score
-                db_fixture.penalty_away_score = conv_fix.match_score.penalty_away_score
-                db_fixture.venue = conv_fix.venue
-
-            db_fixtures.append(db_fixture)
-
-        self._notifier_db_manager.insert_records(db_fixtures)
+            ]
+        )
 
+    @invalidates_user_preferences
     def delete_user_time_zone(self, time_zone_id: int, chat_id: str) -> None:
         time_zone_statement = select(DBUserTimeZone).where(
             DBUserTimeZone.chat_id == chat_id, DBUserTimeZone.time_zone == time_zone_id
@@ -806,6 +1514,7 @@ class FixturesDBManager:
 
         self._notifier_db_manager.delete_record(user_time_zone[0])
 
+    @invalidates_user_preferences
     def delete_favourite_team(self, team_id: int, chat_id: str) -> None:
         favourite_team_statement = select(DBFavouriteTeam).where(
             DBFavouriteTeam.chat_id == chat_id, DBFavouriteTeam.team == team_id
@@ -822,6 +1531,7 @@ class FixturesDBManager:
 
         self._notifier_db_manager.delete_record(favourite_team[0])
 
+    @invalidates_user_preferences
     def delete_favourite_league(self, league_id: int, chat_id: str) -> None:
         favourite_league_statement = select(DBFavouriteLeague).where(
             DBFavouriteLeague.chat_id == chat_id, DBFavouriteLeague.league == league_id
@@ -858,6 +1568,7 @@ class FixturesDBManager:
 
         return self._notifier_db_manager.select_records(statement)
 
+    @invalidates_user_preferences
     def insert_or_update_user_notif_config(
         self, notif_type: int, chat_id: str, status: bool = True, time: str = "8:00"
     ) -> None:
@@ -922,6 +1633,7 @@ class FixturesDBManager:
 
         return self._notifier_db_manager.select_records(languages_statement)
 
+    @invalidates_user_preferences
     def insert_or_update_user_config_language(self, lang_id: int, chat_id: str) -> None:
         user_config_lang_statement = select(DBConfigLanguage).where(
             DBConfigLanguage.chat_id == chat_id
@@ -1,4 +1,4 @@
-from typing import Optional
+from typing import List, Optional
 
 from sqlalchemy import asc
 from sqlmodel import select
@@ -24,6 +24,15 @@ class LineUpsDBManager:
 
         return self._notifier_db_manager.select_records(line_up_statement)
 
+    def get_fixtures_line_ups(self, fixture_ids: List[int]) -> List[DBLineUp]:
+        if not len(fixture_ids):
+            return []
+
+        line_up_statement = select(DBLineUp).where(
+            DBLineUp.fixture.in_(set(fixture_ids))
+        )
+        return self._notifier_db_manager.select_records(line_up_statement)
+
     def insert_line_up(self, line_up: DBLineUp) -> DBLineUp:
         line_up_statement = select(DBLineUp).where(
             DBLineUp.fixture == line_up.fixture,
@@ -0,0 +1,104 @@
+from typing import List
+
+from sqlalchemy import text
+
+from src.db.db_manager import NotifierDBManager
+from src.notifier_logger import get_logger
+
+logger = get_logger(__name__)
+
+# every statement is idempotent, so migrations can be run on each deployment.
+MIGRATIONS: List[str] = [
+    "ALTER TABLE fixture ADD COLUMN IF NOT EXISTS kickoff timestamptz",
+    "UPDATE fixture SET kickoff = utc_date::timestamptz WHERE kickoff IS NULL",
+    "CREATE INDEX IF NOT EXISTS ix_fixture_kickoff ON fixture (kickoff)",
+    "CREATE INDEX IF NOT EXISTS ix_fixture_home_team_kickoff "
+    "ON fixture (home_team, kickoff)",
+    "CREATE INDEX IF NOT EXISTS ix_fixture_away_team_kickoff "
+    "ON fixture (away_team, kickoff)",
+    "CREATE INDEX IF NOT EXISTS ix_fixture_league_kickoff ON fixture (league, kickoff)",
+    "CREATE INDEX IF NOT EXISTS ix_fixture_match_status ON fixture (match_status)",
+    "ANALYZE fixture",
+    "CREATE TABLE IF NOT EXISTS translation ("
+    "source_hash VARCHAR NOT NULL, "
+    "lang VARCHAR NOT NULL, "
+    "source_text VARCHAR NOT NULL, "
+    "translated_text VARCHAR NOT NULL, "
+    "PRIMARY KEY (source_hash, lang))",
+    "CREATE TABLE IF NOT EXISTS fixtureoutbox ("
+    "id SERIAL PRIMARY KEY, "
+    "fixture INTEGER NOT NULL REFERENCES fixture (id), "
+    "event_type VARCHAR NOT NULL, "
+    "previous_status VARCHAR, "
+    "match_status VARCHAR NOT NULL, "
+    "previous_kickoff timestamptz, "
+    "kickoff timestamptz, "
+    "created_at timestamptz NOT NULL)",
+    "CREATE INDEX IF NOT EXISTS ix_fixtureoutbox_event_type "
+    "ON fixtureoutbox (event_type)",
+    "CREATE TABLE IF NOT EXISTS outboxcursor ("
+    "consumer VARCHAR PRIMARY KEY, "
+    "last_event_id INTEGER NOT NULL)",
+    "INSERT INTO notiftype (id, name, description) VALUES "
+    "(7, 'Live Events FT', 'Goals and red cards of favourite teams matches, live.') "
+    "ON CONFLICT (id) DO NOTHING",
+    "SELECT setval('notiftype_id_seq', (SELECT max(id) FROM notiftype))",
+    # live events are opt-in, subscribed users can enable them from /notif_config.
+    "INSERT INTO notifconfig (chat_id, notif_type, status, time) "
+    "SELECT DISTINCT chat_id, 7, false, '8:00' FROM notifconfig "
+    "ON CONFLICT (chat_id, notif_type) DO NOTHING",
+    "CREATE TABLE IF NOT EXISTS apiresponsecache ("
+    "cache_key VARCHAR PRIMARY KEY, "
+    "url VARCHAR NOT NULL, "
+    "body VARCHAR NOT NULL, "
+    "etag VARCHAR, "
+    "last_modified VARCHAR, "
+    "fetched_at timestamptz NOT NULL, "
+    "expires_at timestamptz NOT NULL)",
+    "CREATE TABLE IF NOT EXISTS botpersistence ("
+    "namespace VARCHAR NOT NULL, "
+    "key VARCHAR NOT NULL, "
+    "data BYTEA NOT NULL, "
+    "PRIMARY KEY (namespace, key))",
+    "CREATE TABLE IF NOT EXISTS teamstatistics ("
+    "team INTEGER PRIMARY KEY REFERENCES team (id), "
+    "season INTEGER NOT NULL, "
+    "games_won INTEGER NOT NULL, "
+    "games_drawn INTEGER NOT NULL, "
+    "games_lost INTEGER NOT NULL, "
+    "goals_scored INTEGER NOT NULL, "
+    "goals_received INTEGER NOT NULL, "
+    "top_scorers JSONB NOT NULL, "
+    "last_matches JSONB NOT NULL, "
+    "updated_at timestamptz NOT NULL)",
+    "ALTER TABLE fixture ADD COLUMN IF NOT EXISTS updated_at timestamptz",
+    "UPDATE fixture SET updated_at = now() WHERE updated_at IS NULL",
+    "CREATE INDEX IF NOT EXISTS ix_fixture_updated_at ON fixture (updated_at)",
+    # every writer of fixtures (ORM, bulk upserts, plain SQL) bumps updated_at.
+    "CREATE OR REPLACE FUNCTION set_fixture_updated_at() RETURNS trigger AS $$ "
+    "BEGIN "
+    "IF TG_OP = 'UPDATE' THEN "
+    "NEW.updated_at := OLD.updated_at; "
+    "IF NEW IS NOT DISTINCT FROM OLD THEN RETURN NEW; END IF; "
+    "END IF; "
+    "NEW.updated_at := now(); "
+    "RETURN NEW; "
+    "END $$ LANGUAGE plpgsql",
+    "DROP TRIGGER IF EXISTS fixture_updated_at ON fixture",
+    "CREATE TRIGGER fixture_updated_at BEFORE INSERT OR UPDATE ON fixture "
+    "FOR EACH ROW EXECUTE PROCEDURE set_fixture_updated_at()",
+    "CREATE TABLE IF NOT EXISTS leaguestatistics ("
+    "league INTEGER PRIMARY KEY REFERENCES league (id), "
+    "season INTEGER NOT NULL, "
+    "games_played INTEGER NOT NULL, "
+    "goals INTEGER NOT NULL, "
+    "last_matches_goals JSONB NOT NULL, "
+    "updated_at timestamptz NOT NULL)",
+]
+
+
+def run_migrations(notifier_db_manager: NotifierDBManager) -> None:
+    with notifier_db_manager.unit_of_work() as session:
+        for migration in MIGRATIONS:
+            logger.info(f"Running migration: {migration}")
+            session.execute(text(migration))
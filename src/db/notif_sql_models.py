@@ -1,5 +1,8 @@
+from datetime import datetime
 from typing import List, Optional
 
+from sqlalchemy import Column, DateTime, Index, LargeBinary
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlmodel import Field, SQLModel
 
 
@@ -28,10 +31,21 @@ class Country(SQLModel, table=True):
 
 
 class Fixture(SQLModel, table=True):
-    __table_args__ = {"extend_existing": True}
+    __table_args__ = (
+        Index("ix_fixture_kickoff", "kickoff"),
+        Index("ix_fixture_home_team_kickoff", "home_team", "kickoff"),
+        Index("ix_fixture_away_team_kickoff", "away_team", "kickoff"),
+        Index("ix_fixture_league_kickoff", "league", "kickoff"),
+        Index("ix_fixture_match_status", "match_status"),
+        Index("ix_fixture_updated_at", "updated_at"),
+        {"extend_existing": True},
+    )
     id: int = Field(primary_key=True)
     utc_date: str
     bsas_date: str
+    kickoff: Optional[datetime] = Field(
+        default=None, sa_column=Column(DateTime(timezone=True))
+    )
     league: int = Field(foreign_key="league.id")
     round: str
     home_team: int = Field(foreign_key="team.id")
@@ -47,6 +61,10 @@ class Fixture(SQLModel, table=True):
     penalty_away_score: Optional[int] = None
     highlights: Optional[List[str]] = None
     line_up_check_attempt: Optional[int] = None
+    # set by a database trigger whenever the row is inserted or changes
+    updated_at: Optional[datetime] = Field(
+        default=None, sa_column=Column(DateTime(timezone=True))
+    )
 
 
 class LineUp(SQLModel, table=True):
@@ -133,3 +151,99 @@ class Event(SQLModel, table=True):
     type: str
     detail: Optional[str] = None
     comments: Optional[str] = None
+
+
+class Translation(SQLModel, table=True):
+    __table_args__ = {"extend_existing": True}
+    source_hash: str = Field(primary_key=True)
+    lang: str = Field(primary_key=True)
+    source_text: str
+    translated_text: str
+
+
+class FixtureOutbox(SQLModel, table=True):
+    __table_args__ = {"extend_existing": True}
+    id: Optional[int] = Field(default=None, primary_key=True)
+    fixture: int = Field(foreign_key="fixture.id")
+    event_type: str = Field(index=True)
+    previous_status: Optional[str] = None
+    match_status: str
+    previous_kickoff: Optional[datetime] = Field(
+        default=None, sa_column=Column(DateTime(timezone=True))
+    )
+    kickoff: Optional[datetime] = Field(
+        default=None, sa_column=Column(DateTime(timezone=True))
+    )
+    created_at: datetime = Field(
+        sa_column=Column(DateTime(timezone=True), nullable=False)
+    )
+
+
+class OutboxCursor(SQLModel, table=True):
+    __table_args__ = {"extend_existing": True}
+    consumer: str = Field(primary_key=True)
+    last_event_id: int = 0
+
+
+class ApiResponseCache(SQLModel, table=True):
+    __table_args__ = {"extend_existing": True}
+    cache_key: str = Field(primary_key=True)
+    url: str
+    body: str
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    fetched_at: datetime = Field(
+        sa_column=Column(DateTime(timezone=True), nullable=False)
+    )
+    expires_at: datetime = Field(
+        sa_column=Column(DateTime(timezone=True), nullable=False)
+    )
+
+
+class BotPersistence(SQLModel, table=True):
+    __table_args__ = {"extend_existing": True}
+    namespace: str = Field(primary_key=True)
+    key: str = Field(primary_key=True)
+    data: bytes = Field(sa_column=Column(LargeBinary, nullable=False))
+
+
+class TeamStatistics(SQLModel, table=True):
+    """
+    Team record, goals and top scorers of the season (year), and its last matches
+    results, refreshed whenever one of its fixtures finishes.
+    """
+
+    __table_args__ = {"extend_existing": True}
+    team: int = Field(foreign_key="team.id", primary_key=True)
+    season: int
+    games_won: int = 0
+    games_drawn: int = 0
+    games_lost: int = 0
+    goals_scored: int = 0
+    goals_received: int = 0
+    # [player name, goals] pairs, sorted by goals
+    top_scorers: List[list] = Field(
+        default_factory=list, sa_column=Column(JSONB, nullable=False)
+    )
+    # latest first, each with its result, goals and scorers
+    last_matches: List[dict] = Field(
+        default_factory=list, sa_column=Column(JSONB, nullable=False)
+    )
+    updated_at: datetime = Field(
+        sa_column=Column(DateTime(timezone=True), nullable=False)
+    )
+
+
+class LeagueStatistics(SQLModel, table=True):
+    __table_args__ = {"extend_existing": True}
+    league: int = Field(foreign_key="league.id", primary_key=True)
+    season: int
+    games_played: int = 0
+    goals: int = 0
+    # goals of each of the last matches, latest first
+    last_matches_goals: List[int] = Field(
+        default_factory=list, sa_column=Column(JSONB, nullable=False)
+    )
+    updated_at: datetime = Field(
+        sa_column=Column(DateTime(timezone=True), nullable=False)
+    )
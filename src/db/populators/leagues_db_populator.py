@@ -20,23 +20,31 @@ from src.db.notif_sql_models import League, Team
 CURRENT_DIR = Path(__file__).parent.absolute()
 LEAGUES_FILE = CURRENT_DIR / "leagues.json"
 
-fixtures_db_manager = FixturesDBManager()
-
-with open(LEAGUES_FILE, "r") as file:
-    # Load the JSON data from the file
-    data = json.load(file)
-
-    for league in data.get("response", []):
-        try:
-            print(f"Inserting league {league['league']['name']}")
-
-            db_league = Championship(
-                id=league["league"]["id"],
-                name=league["league"]["name"],
-                logo=league["league"]["logo"],
-                country=league["country"]["name"],
-            )
-
-            fixtures_db_manager.insert_league(db_league)
-        except:
-            print(f"Failed to insert league {league.get('league',{}).get('name','')}")
+
+def populate_leagues() -> None:
+    fixtures_db_manager = FixturesDBManager()
+
+    with open(LEAGUES_FILE, "r") as file:
+        # Load the JSON data from the file
+        data = json.load(file)
+
+        for league in data.get("response", []):
+            try:
+                print(f"Inserting league {league['league']['name']}")
+
+                db_league = Championship(
+                    id=league["league"]["id"],
+                    name=league["league"]["name"],
+                    logo=league["league"]["logo"],
+                    country=league["country"]["name"],
+                )
+
+                fixtures_db_manager.insert_league(db_league)
+            except:
+                print(
+                    f"Failed to insert league {league.get('league',{}).get('name','')}"
+                )
+
+
+if __name__ == "__main__":
+    populate_leagues()
@@ -13,11 +13,17 @@ sys.path.insert(2, project_dir)
 from src.db.db_manager import NotifierDBManager
 from src.db.fixtures_db_manager import FixturesDBManager
 
-notifier_db_manager = NotifierDBManager()
 
-fixtures_db_manager = FixturesDBManager()
+def populate_notif_type_config() -> None:
+    notifier_db_manager = NotifierDBManager()
 
-users = fixtures_db_manager.get_all_notif_users()
+    fixtures_db_manager = FixturesDBManager()
 
-for user in users:
-    fixtures_db_manager.insert_or_update_user_notif_config(6, user)
+    users = fixtures_db_manager.get_all_notif_users()
+
+    for user in users:
+        fixtures_db_manager.insert_or_update_user_notif_config(6, user)
+
+
+if __name__ == "__main__":
+    populate_notif_type_config()
@@ -14,11 +14,17 @@ from src.db.db_manager import NotifierDBManager
 from src.db.notif_sql_models import NotifType
 from src.notifier_constants import NOTIFICATION_TYPES
 
-notifier_db_manager = NotifierDBManager()
 
-for notification_type in NOTIFICATION_TYPES:
-    notif_type = NotifType(
-        name=notification_type["name"], description=notification_type["description"]
-    )
+def populate_notif_types() -> None:
+    notifier_db_manager = NotifierDBManager()
 
-    notifier_db_manager.insert_record(notif_type)
+    for notification_type in NOTIFICATION_TYPES:
+        notif_type = NotifType(
+            name=notification_type["name"], description=notification_type["description"]
+        )
+
+        notifier_db_manager.insert_record(notif_type)
+
+
+if __name__ == "__main__":
+    populate_notif_types()
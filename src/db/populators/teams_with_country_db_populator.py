@@ -18,35 +18,40 @@ from src.db.notif_sql_models import Team
 CURRENT_DIR = Path(__file__).parent.absolute()
 TEAMS_DIR = CURRENT_DIR / "teams"
 
-fixtures_db_manager = FixturesDBManager()
 
+def populate_teams_with_country() -> None:
+    fixtures_db_manager = FixturesDBManager()
 
-for country_teams_file in TEAMS_DIR.glob("*.json"):
-    print(f"Checking file {country_teams_file}")
+    for country_teams_file in TEAMS_DIR.glob("*.json"):
+        print(f"Checking file {country_teams_file}")
 
-    with open(country_teams_file, "r") as file:
-        # Load the JSON data from the file
-        data = json.load(file)
+        with open(country_teams_file, "r") as file:
+            # Load the JSON data from the file
+            data = json.load(file)
 
-        for team in data.get("response", []):
-            try:
-                print(f"Inserting team {team['team']['name']}")
+            for team in data.get("response", []):
+                try:
+                    print(f"Inserting team {team['team']['name']}")
 
-                country = team["team"]["country"]
+                    country = team["team"]["country"]
 
-                db_countries = fixtures_db_manager.get_countries_by_name(country)
+                    db_countries = fixtures_db_manager.get_countries_by_name(country)
 
-                country_id = db_countries[0].id
+                    country_id = db_countries[0].id
 
-                db_team = Team(
-                    id=team["team"]["id"],
-                    name=team["team"]["name"],
-                    picture=team["team"]["logo"],
-                    country=country_id,
-                )
+                    db_team = Team(
+                        id=team["team"]["id"],
+                        name=team["team"]["name"],
+                        picture=team["team"]["logo"],
+                        country=country_id,
+                    )
 
-                fixtures_db_manager.insert_team(db_team)
-            except:
-                print(
-                    f"Failed to insert team {team.get('team',{}).get('name','')} for file {country_teams_file}"
-                )
+                    fixtures_db_manager.insert_team(db_team)
+                except:
+                    print(
+                        f"Failed to insert team {team.get('team',{}).get('name','')} for file {country_teams_file}"
+                    )
+
+
+if __name__ == "__main__":
+    populate_teams_with_country()
@@ -15,10 +15,16 @@ sys.path.insert(2, project_dir)
 from src.db.db_manager import NotifierDBManager
 from src.db.notif_sql_models import TimeZone
 
-zones = pytz.all_timezones
 
-notifier_db_manager = NotifierDBManager()
+def populate_time_zones() -> None:
+    zones = pytz.all_timezones
 
-db_time_zones = [TimeZone(name=zone) for zone in zones]
+    notifier_db_manager = NotifierDBManager()
 
-notifier_db_manager.insert_records(db_time_zones)
+    db_time_zones = [TimeZone(name=zone) for zone in zones]
+
+    notifier_db_manager.insert_records(db_time_zones)
+
+
+if __name__ == "__main__":
+    populate_time_zones()
@@ -0,0 +1,66 @@
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy.dialects.postgresql import insert
+from sqlmodel import select
+
+from src.db.db_manager import NotifierDBManager
+from src.db.notif_sql_models import ApiResponseCache as DBApiResponseCache
+from src.notifier_logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class ResponseCacheDBManager:
+    """
+    The cache is read and written outside the unit of work of the caller, whose
+    transaction must not be aborted by a failing cache statement.
+    """
+
+    def __init__(self) -> None:
+        self._notifier_db_manager = NotifierDBManager()
+
+    def get_response(self, cache_key: str) -> Optional[DBApiResponseCache]:
+        response_statement = select(DBApiResponseCache).where(
+            DBApiResponseCache.cache_key == cache_key
+        )
+        with self._notifier_db_manager.outside_unit_of_work():
+            cached_responses = self._notifier_db_manager.select_records(
+                response_statement
+            )
+
+        return cached_responses[0] if len(cached_responses) else None
+
+    def save_response(self, cached_response: DBApiResponseCache) -> None:
+        values = cached_response.dict()
+        response_statement = insert(DBApiResponseCache.__table__).values(values)
+
+        with self._notifier_db_manager.outside_unit_of_work():
+            self._notifier_db_manager.execute_statements(
+                [
+                    response_statement.on_conflict_do_update(
+                        index_elements=[DBApiResponseCache.cache_key],
+                        set_={
+                            column: response_statement.excluded[column]
+                            for column in values.keys()
+                            if column != "cache_key"
+                        },
+                    ).returning(DBApiResponseCache.cache_key)
+                ]
+            )
+
+    def extend_response(
+        self, cache_key: str, fetched_at: datetime, expires_at: datetime
+    ) -> None:
+        cached_response = self.get_response(cache_key)
+
+        if cached_response is None:
+            return
+
+        logger.info(
+            f"Extending cached response {cached_response.url} until {expires_at}"
+        )
+        cached_response.fetched_at = fetched_at
+        cached_response.expires_at = expires_at
+        with self._notifier_db_manager.outside_unit_of_work():
+            self._notifier_db_manager.insert_record(cached_response)
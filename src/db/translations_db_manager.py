@@ -0,0 +1,69 @@
+import hashlib
+from typing import Dict, List
+
+from sqlalchemy.dialects.postgresql import insert
+from sqlmodel import select
+
+from src.db.db_manager import NotifierDBManager
+from src.db.notif_sql_models import ConfigLanguage as DBConfigLanguage
+from src.db.notif_sql_models import Language as DBLanguage
+from src.db.notif_sql_models import Translation as DBTranslation
+from src.notifier_logger import get_logger
+
+logger = get_logger(__name__)
+
+
+def get_source_hash(source_text: str) -> str:
+    return hashlib.sha256(source_text.encode("utf-8")).hexdigest()
+
+
+class TranslationsDBManager:
+    def __init__(self) -> None:
+        self._notifier_db_manager = NotifierDBManager()
+
+    def get_translations(self, source_texts: List[str], lang: str) -> Dict[str, str]:
+        if not len(source_texts):
+            return {}
+
+        translations_statement = select(
+            DBTranslation.source_text, DBTranslation.translated_text
+        ).where(
+            DBTranslation.source_hash.in_(
+                {get_source_hash(source_text) for source_text in source_texts}
+            ),
+            DBTranslation.lang == lang,
+        )
+
+        return dict(self._notifier_db_manager.select_records(translations_statement))
+
+    def insert_translations(self, translations: Dict[str, str], lang: str) -> None:
+        if not len(translations):
+            return
+
+        logger.info(f"Inserting {len(translations)} '{lang}' translations")
+        translations_statement = (
+            insert(DBTranslation.__table__)
+            .values(
+                [
+                    {
+                        "source_hash": get_source_hash(source_text),
+                        "lang": lang,
+                        "source_text": source_text,
+                        "translated_text": translated_text,
+                    }
+                    for source_text, translated_text in translations.items()
+                ]
+            )
+            .on_conflict_do_nothing()
+            .returning(DBTranslation.source_hash)
+        )
+        self._notifier_db_manager.execute_statements([translations_statement])
+
+    def get_configured_languages(self) -> List[str]:
+        languages_statement = (
+            select(DBLanguage.short_name)
+            .join(DBConfigLanguage, DBConfigLanguage.lang_id == DBLanguage.lang_id)
+            .distinct()
+        )
+
+        return self._notifier_db_manager.select_records(languages_statement)
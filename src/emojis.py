@@ -1,83 +1,112 @@
+import functools
 from enum import Enum
+from typing import Dict, Tuple
 
 import emoji
 
 
+@functools.lru_cache(maxsize=None)
+def get_emojis_by_name() -> Tuple[Dict[str, str], Dict[str, str]]:
+    """
+    Emojis by alias and by English name. emoji.emojize scans every emoji for each
+    name, which made importing this module take tens of milliseconds.
+    """
+    fully_qualified = emoji.STATUS["fully_qualified"]
+    emojis_by_alias, emojis_by_name = {}, {}
+
+    for emoji_text, data in emoji.EMOJI_DATA.items():
+        if data["status"] > fully_qualified:
+            continue
+
+        for alias in data.get("alias", []):
+            emojis_by_alias.setdefault(alias, emoji_text)
+        emojis_by_name.setdefault(data["en"], emoji_text)
+
+    return emojis_by_alias, emojis_by_name
+
+
+def get_emoji_by_alias(alias: str) -> str:
+    """
+    Same as emoji.emojize(alias, language="alias") for a single ':alias:'.
+    """
+    emojis_by_alias, emojis_by_name = get_emojis_by_name()
+
+    return emojis_by_alias.get(alias) or emojis_by_name.get(alias) or alias
+
+
 def get_emoji_text_by_name(name: str) -> str:
-    return emoji.emojize(f":{name}:", language="alias")
+    return get_emoji_by_alias(f":{name}:")
 
 
 class Emojis(Enum):
-    FRANCE = emoji.emojize(":France:", language="alias")
-    ARGENTINA = emoji.emojize(":Argentina:", language="alias")
-    NETHERLANDS = emoji.emojize(":Netherlands:", language="alias")
-    SPAIN = emoji.emojize(":Spain:", language="alias")
-    GOAT = emoji.emojize(":goat:", language="alias")
-    THOUGHT_BALLOON = emoji.emojize(":thought_balloon:", language="alias")
-    WAVING_HAND = emoji.emojize(":wave:", language="alias")
-    ALARM_CLOCK = emoji.emojize(":alarm_clock:", language="alias")
-    EARTH = emoji.emojize(":globe_showing_Americas:", language="alias")
-    SOCCER_BALL = emoji.emojize(":soccer:", language="alias")
-    TROPHY = emoji.emojize(":trophy:", language="alias")
-    PUSHPIN = emoji.emojize(":pushpin:", language="alias")
-    SCALE = emoji.emojize(":balance_scale:", language="alias")
-    GLOBE = emoji.emojize(":globe_with_meridians:", language="alias")
-    EUROPEAN_UNION = emoji.emojize(":European_Union:", language="alias")
-    SPIRAL_CALENDAR = emoji.emojize(":spiral_calendar:", language="alias")
-    RED_EXCLAMATION_MARK = emoji.emojize(":red_exclamation_mark:", language="alias")
-    RIGHT_ARROW = emoji.emojize(":right_arrow:", language="alias")
-    CHART_INCREASING = emoji.emojize(":chart_increasing:", language="alias")
-    CHECK_MARK = emoji.emojize(":check_mark:", language="alias")
-    GOAL_NET = emoji.emojize(":goal_net:", language="alias")
-    GLOBE_WITH_MERIDIANS = emoji.emojize(":globe_with_meridians:", language="alias")
-    FILM_PROJECTOR = emoji.emojize(":film_projector:", language="alias")
-    GLOVES = emoji.emojize(":gloves:", language="alias")
-    JOYSTICK = emoji.emojize(":joystick:", language="alias")
-    SHIELD = emoji.emojize(":shield:", language="alias")
-    MAGIC_WAND = emoji.emojize(":magic_wand:", language="alias")
-    SCORING = emoji.emojize(
-        ":person_playing_handball_dark_skin_tone:", language="alias"
-    )
-    LIGHT_BULB = emoji.emojize(":light_bulb:", language="alias")
-    SKULL = emoji.emojize(":skull:", language="alias")
-    NUMBERS = emoji.emojize(":input_numbers:", language="alias")
-    FAMILY = emoji.emojize(":input_numbers:", language="alias")
-    FLEXED_BICEPS = emoji.emojize(":flexed_biceps:", language="alias")
-    MICROBE = emoji.emojize(":microbe:", language="alias")
-    FACE_WITH_MEDICAL_MASK = emoji.emojize(":face_with_medical_mask:", language="alias")
-    TELEVISION = emoji.emojize(":television:", language="alias")
-    BLUE_CIRCLE = emoji.emojize(":blue_circle:", language="alias")
-    YELLOW_CIRCLE = emoji.emojize(":yellow_circle:", language="alias")
-    PIRATE_FLAG = emoji.emojize(":pirate_flag:", language="alias")
-    WHITE_CIRCLE = emoji.emojize(":white_circle:", language="alias")
-    RED_CIRCLE = emoji.emojize(":red_circle:", language="alias")
-    RIGHT_FACING_FIST = emoji.emojize(":right-facing_fist:", language="alias")
-    LEFT_FACING_FIST = emoji.emojize(":left-facing_fist:", language="alias")
-    SAD_FACE = emoji.emojize(":crying_face:", language="alias")
-    STADIUM = emoji.emojize(":stadium:", language="alias")
-    POLICE_WOMAN = emoji.emojize(":woman_police_officer:", language="alias")
-    MAN_RUNNING = emoji.emojize(":man_running:", language="alias")
-    CROSS_MARK = emoji.emojize(":cross_mark:", language="alias")
-    PARTYING_FACE = emoji.emojize(":partying_face:", language="alias")
-    NO_ENTRY = emoji.emojize(":no_entry:", language="alias")
-    CHECK_MARK_BUTTON = emoji.emojize(":check_mark_button:", language="alias")
-    BELL = emoji.emojize(":bell:", language="alias")
-    SPEAKING_HEAD = emoji.emojize(":speaking_head:", language="alias")
-    FOLDED_HANDS = emoji.emojize(":folded_hands:", language="alias")
-    SMILEY_FACE = emoji.emojize(":beaming_face_with_smiling_eyes:", language="alias")
-    ROBOT = emoji.emojize(":robot:", language="alias")
-    DEVELOPER = emoji.emojize(":technologist_light_skin_tone:", language="alias")
-    DOWN_FACING_FIST = emoji.emojize(":backhand_index_pointing_down:", language="alias")
-    MINUS = emoji.emojize(":minus:", language="alias")
-    EQUAL = emoji.emojize(":heavy_equals_sign:", language="alias")
-    FACE_WITHOUT_MOUTH = emoji.emojize(":face_without_mouth:", language="alias")
-    BACK_ARROW = emoji.emojize(":BACK_arrow:", language="alias")
-    SOON_ARROW = emoji.emojize(":SOON_arrow:", language="alias")
-    RED_SQUARE = emoji.emojize(":red_square:", language="alias")
-    YELLOW_SQUARE = emoji.emojize(":yellow_square:", language="alias")
-    UPWARDS_BUTTON = emoji.emojize(":upwards_button:", language="alias")
-    DONWARDS_BUTTON = emoji.emojize(":downwards_button:", language="alias")
-    FACEPALM = emoji.emojize(":man_facepalming_light_skin_tone:", language="alias")
-    FIRST_PLACE_MEDAL = emoji.emojize(":1st_place_medal:", language="alias")
-    SECOND_PLACE_MEDAL = emoji.emojize(":2nd_place_medal:", language="alias")
-    THIRD_PLACE_MEDAL = emoji.emojize(":3rd_place_medal:", language="alias")
+    FRANCE = get_emoji_by_alias(":France:")
+    ARGENTINA = get_emoji_by_alias(":Argentina:")
+    NETHERLANDS = get_emoji_by_alias(":Netherlands:")
+    SPAIN = get_emoji_by_alias(":Spain:")
+    GOAT = get_emoji_by_alias(":goat:")
+    THOUGHT_BALLOON = get_emoji_by_alias(":thought_balloon:")
+    WAVING_HAND = get_emoji_by_alias(":wave:")
+    ALARM_CLOCK = get_emoji_by_alias(":alarm_clock:")
+    EARTH = get_emoji_by_alias(":globe_showing_Americas:")
+    SOCCER_BALL = get_emoji_by_alias(":soccer:")
+    TROPHY = get_emoji_by_alias(":trophy:")
+    PUSHPIN = get_emoji_by_alias(":pushpin:")
+    SCALE = get_emoji_by_alias(":balance_scale:")
+    GLOBE = get_emoji_by_alias(":globe_with_meridians:")
+    EUROPEAN_UNION = get_emoji_by_alias(":European_Union:")
+    SPIRAL_CALENDAR = get_emoji_by_alias(":spiral_calendar:")
+    RED_EXCLAMATION_MARK = get_emoji_by_alias(":red_exclamation_mark:")
+    RIGHT_ARROW = get_emoji_by_alias(":right_arrow:")
+    CHART_INCREASING = get_emoji_by_alias(":chart_increasing:")
+    CHECK_MARK = get_emoji_by_alias(":check_mark:")
+    GOAL_NET = get_emoji_by_alias(":goal_net:")
+    GLOBE_WITH_MERIDIANS = get_emoji_by_alias(":globe_with_meridians:")
+    FILM_PROJECTOR = get_emoji_by_alias(":film_projector:")
+    GLOVES = get_emoji_by_alias(":gloves:")
+    JOYSTICK = get_emoji_by_alias(":joystick:")
+    SHIELD = get_emoji_by_alias(":shield:")
+    MAGIC_WAND = get_emoji_by_alias(":magic_wand:")
+    SCORING = get_emoji_by_alias(":person_playing_handball_dark_skin_tone:")
+    LIGHT_BULB = get_emoji_by_alias(":light_bulb:")
+    SKULL = get_emoji_by_alias(":skull:")
+    NUMBERS = get_emoji_by_alias(":input_numbers:")
+    FAMILY = get_emoji_by_alias(":input_numbers:")
+    FLEXED_BICEPS = get_emoji_by_alias(":flexed_biceps:")
+    MICROBE = get_emoji_by_alias(":microbe:")
+    FACE_WITH_MEDICAL_MASK = get_emoji_by_alias(":face_with_medical_mask:")
+    TELEVISION = get_emoji_by_alias(":television:")
+    BLUE_CIRCLE = get_emoji_by_alias(":blue_circle:")
+    YELLOW_CIRCLE = get_emoji_by_alias(":yellow_circle:")
+    PIRATE_FLAG = get_emoji_by_alias(":pirate_flag:")
+    WHITE_CIRCLE = get_emoji_by_alias(":white_circle:")
+    RED_CIRCLE = get_emoji_by_alias(":red_circle:")
+    RIGHT_FACING_FIST = get_emoji_by_alias(":right-facing_fist:")
+    LEFT_FACING_FIST = get_emoji_by_alias(":left-facing_fist:")
+    SAD_FACE = get_emoji_by_alias(":crying_face:")
+    STADIUM = get_emoji_by_alias(":stadium:")
+    POLICE_WOMAN = get_emoji_by_alias(":woman_police_officer:")
+    MAN_RUNNING = get_emoji_by_alias(":man_running:")
+    CROSS_MARK = get_emoji_by_alias(":cross_mark:")
+    PARTYING_FACE = get_emoji_by_alias(":partying_face:")
+    NO_ENTRY = get_emoji_by_alias(":no_entry:")
+    CHECK_MARK_BUTTON = get_emoji_by_alias(":check_mark_button:")
+    BELL = get_emoji_by_alias(":bell:")
+    SPEAKING_HEAD = get_emoji_by_alias(":speaking_head:")
+    FOLDED_HANDS = get_emoji_by_alias(":folded_hands:")
+    SMILEY_FACE = get_emoji_by_alias(":beaming_face_with_smiling_eyes:")
+    ROBOT = get_emoji_by_alias(":robot:")
+    DEVELOPER = get_emoji_by_alias(":technologist_light_skin_tone:")
+    DOWN_FACING_FIST = get_emoji_by_alias(":backhand_index_pointing_down:")
+    MINUS = get_emoji_by_alias(":minus:")
+    EQUAL = get_emoji_by_alias(":heavy_equals_sign:")
+    FACE_WITHOUT_MOUTH = get_emoji_by_alias(":face_without_mouth:")
+    BACK_ARROW = get_emoji_by_alias(":BACK_arrow:")
+    SOON_ARROW = get_emoji_by_alias(":SOON_arrow:")
+    RED_SQUARE = get_emoji_by_alias(":red_square:")
+    YELLOW_SQUARE = get_emoji_by_alias(":yellow_square:")
+    UPWARDS_BUTTON = get_emoji_by_alias(":upwards_button:")
+    DONWARDS_BUTTON = get_emoji_by_alias(":downwards_button:")
+    FACEPALM = get_emoji_by_alias(":man_facepalming_light_skin_tone:")
+    FIRST_PLACE_MEDAL = get_emoji_by_alias(":1st_place_medal:")
+    SECOND_PLACE_MEDAL = get_emoji_by_alias(":2nd_place_medal:")
+    THIRD_PLACE_MEDAL = get_emoji_by_alias(":3rd_place_medal:")
@@ -21,7 +21,7 @@ from src.emojis import Emojis, get_emoji_text_by_name
 FIXTURES_DB_MANAGER = FixturesDBManager()
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class MatchScore:
     home_score: int
     away_score: int
@@ -155,7 +155,7 @@ class Event(BaseModel):
         )
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Championship:
     league_id: int
     name: str
@@ -163,13 +163,13 @@ class Championship:
     logo: str
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class MatchHighlights:
     url: str
     embed_url: str
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class LineUp:
     formation: str
     goalkeeper: List[Player]
@@ -196,7 +196,7 @@ class LineUp:
         )
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class RemainingTime:
     days: int
     hours: int
@@ -233,7 +233,7 @@ class RemainingTime:
         return f"{days_phrase}{hours_phrase}{minutes_phrase}"
 
 
-@dataclass
+@dataclass(slots=True)
 class FixtureForDB:
     id: int
     utc_date: str
@@ -249,7 +249,7 @@ class FixtureForDB:
     venue: str
 
 
-@dataclass
+@dataclass(slots=True)
 class Fixture:
     id: int
     utc_date: datetime
@@ -273,7 +273,6 @@ class Fixture:
     head_to_head: List["Fixture"] = field(init=False)
 
     def __post_init__(self) -> None:
-        self.line_up = None
         home_score = (
             f" {self.match_score.home_score} "
             if self.match_score.home_score is not None
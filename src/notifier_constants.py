@@ -32,15 +32,18 @@ NOTIFICATION_TYPES = [
     },
 ]
 
+# Goals and red cards of favourite teams fixtures, as they happen.
+LIVE_EVENTS_NOTIF_TYPE = 7
+
 # Notification types that are sent daily.
 DAILY_NOTIF_TYPES = [1, 2, 5]
 
 # Surrounding days to check when retrieving fixtures, for validating them against
 # the user's time zone
-SURROUNDING_INDEXES = {
-    "today": (-1, 0, 1),
-    "tomorrow": (0, 1, 2),
-    "yesterday": (-2, -1, 0),
+SURROUNDING_DAYS = {
+    "today": 0,
+    "tomorrow": 1,
+    "yesterday": -1,
 }
 
 TELEGRAM_MSG_LENGTH_LIMIT = 3500
@@ -49,6 +52,104 @@ TELEGRAM_MSG_LENGTH_LIMIT = 3500
 TIME_OUT = 20
 MAX_RETRY_ATTEMPTS = 3
 WAIT_BETWEEN_REQUESTS = 1
+HTTP_POOL_MAX_CONNECTIONS = 20
+HTTP_POOL_MAX_KEEPALIVE_CONNECTIONS = 10
+HTTP_POOL_KEEPALIVE_EXPIRY = 60
+
+# RESPONSE CACHE
+# Seconds responses of slow changing endpoints are fresh for, by endpoint path.
+RESPONSE_CACHE_TTLS = {
+    "/v3/leagues": 24 * 60 * 60,
+    "/v3/teams": 7 * 24 * 60 * 60,
+    "/v3/standings": 6 * 60 * 60,
+    "/v3/fixtures/headtohead": 12 * 60 * 60,
+}
+# Seconds after expiring during which a response is still served, while it is
+# revalidated in the background.
+RESPONSE_CACHE_STALE_TTL = 24 * 60 * 60
+
+# RAPIDAPI KEYS
+RAPIDAPI_MINUTE_WINDOW = 60
+# Maximum time a request waits for a key to have per minute quota available.
+RAPIDAPI_KEY_MAX_WAIT = 90
+# Daily calls collectors leave untouched, for the bot commands requests.
+RAPIDAPI_QUOTA_RESERVE = 50
+
+# FIXTURES REFRESH
+LIVE_MATCH_STATUSES = [
+    "First Half",
+    "Halftime",
+    "Second Half",
+    "Extra Time",
+    "Break Time",
+    "Penalty In Progress",
+    "In Progress",
+]
+FIXTURES_REFRESH_LOT_SIZE = 20
+FIXTURES_REFRESH_CONCURRENCY = 4
+# Maximum number of API requests a single refresh cycle is allowed to spend.
+FIXTURES_REFRESH_MAX_REQUESTS = 15
+
+# FIXTURES OUTBOX
+FIXTURE_FINISHED = "finished"
+FIXTURE_KICKOFF_CHANGED = "kickoff_changed"
+FIXTURE_EVENTS_COLLECTED = "events_collected"
+# Arbitrary key of the advisory lock serializing the writers of the outbox, so
+# events are committed in id order and consumers never skip one.
+FIXTURES_OUTBOX_LOCK_KEY = 20230501
+FIXTURES_OUTBOX_BATCH_SIZE = 500
+# Days outbox events are kept once every consumer processed them.
+FIXTURES_OUTBOX_RETENTION_DAYS = 7
+# Key of the advisory locks (one per fixture) serializing writers of fixture events.
+FIXTURE_EVENTS_LOCK_KEY = 4
+
+# STATISTICS
+# Finished fixtures the team and league statistics are computed from.
+TEAM_STATS_MAX_FIXTURES = 120
+LEAGUE_STATS_MAX_FIXTURES = 400
+TEAM_STATS_LAST_MATCHES = 5
+LEAGUE_STATS_LAST_MATCHES = 20
+TEAM_STATS_TOP_SCORERS = 3
+
+# TELEGRAM DELIVERY
+TELEGRAM_GLOBAL_MESSAGES_PER_SECOND = 30
+TELEGRAM_CHAT_MESSAGES_PER_SECOND = 1
+TELEGRAM_DELIVERY_CONCURRENCY = 30
+TELEGRAM_DELIVERY_MAX_ATTEMPTS = 3
+
+# TRANSLATIONS
+TRANSLATIONS_CACHE_SIZE = 4096
+TRANSLATION_MAX_CHARS = 4500
+TRANSLATION_SEGMENTS_SEPARATOR = "\n|||\n"
+
+# BOT COMMANDS
+BOT_COMMANDS_MAX_WORKERS = 16
+# Seconds a command can take before the user is told to try again later.
+BOT_COMMAND_TIMEOUT = 30
+# Updates processed at the same time, those of a same chat are still sequential.
+BOT_CONCURRENT_UPDATES = 64
+# Changes are written after each update, this only catches the leftovers.
+BOT_PERSISTENCE_UPDATE_INTERVAL = 60
+
+# SEARCH INDEX
+SEARCH_INDEX_TTL = 3600
+# Minimum trigrams similarity for a name to be considered a typo of the search.
+SEARCH_INDEX_MIN_SIMILARITY = 0.45
+SEARCH_INDEX_MIN_TRIGRAM_HITS = 2
+# Best ranked results of a search given to the user, short queries match a lot.
+SEARCH_RESULTS_LIMIT = 50
+
+# FIXTURE STORE
+# Seconds between full loads of the fixtures, changes in between are read by the
+# fixtures updated_at.
+FIXTURE_STORE_TTL = 3600
+FIXTURE_STORE_REFRESH_INTERVAL = 60
+# Seconds of changes read again on every update, so the ones committed late by
+# transactions started before the previous update are not missed.
+FIXTURE_STORE_UPDATE_OVERLAP = 300
+
+# USER PREFERENCES
+USER_PREFERENCES_TTL = 300
 
 # PAGE SIZES
 TIME_ZONES_PAGE_SIZE = 10
@@ -17,7 +17,7 @@ from src.notifiers.user_messages import (
     STATISTICS_KICK_OFF,
     TIMELINES,
 )
-from src.senders.telegram_sender import send_telegram_message
+from src.senders.telegram_delivery import TelegramMessage, send_many_messages
 
 logger = get_logger(__name__)
 
@@ -36,9 +36,10 @@ def notify_all_users(message: str):
         if user not in all_users_filtered:
             all_users_filtered.append(user)
 
-    for user in all_users_filtered:
-        logger.info(f"Sending broadcast message to user {user}")
-        send_telegram_message(chat_id=user, message=message)
+    logger.info(f"Sending broadcast message to {len(all_users_filtered)} users")
+    send_many_messages(
+        [TelegramMessage(chat_id=user, message=message) for user in all_users_filtered]
+    )
 
 
 if __name__ == "__main__":
@@ -15,11 +15,11 @@ from src.emojis import Emojis
 from src.entities import Fixture
 from src.notifier_logger import get_logger
 from src.senders.telegram_sender import send_telegram_message
-from src.telegram_bot.command_handlers.bot_commands_handler import (
+from src.telegram_bot.command_handlers.notifier_bot_commands_handler import (
     NotifierBotCommandsHandler,
 )
 from src.utils.date_utils import get_time_in_time_zone_str, is_time_between
-from src.utils.fixtures_utils import convert_db_fixture
+from src.utils.fixtures_utils import convert_db_fixtures
 from src.utils.notifier_utils import (
     get_user_main_time_zone,
     get_user_notif_config,
@@ -93,10 +93,11 @@ def notify_fl_leagues_playing() -> None:
             exclude_statuses=["Time to be defined"],
         )
 
-        for fixture in today_matches:
-            converted_fixture = convert_db_fixture(
-                fixture, user_time_zones=fixtures_db_manager.get_user_time_zones(user)
-            )
+        converted_fixtures = convert_db_fixtures(
+            today_matches, user_time_zones=fixtures_db_manager.get_user_time_zones(user)
+        )
+
+        for converted_fixture in converted_fixtures:
             if converted_fixture.get_time_in_main_zone() > now:
                 user_fixtures_to_notif.append(converted_fixture)
 
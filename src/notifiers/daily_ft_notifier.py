@@ -1,7 +1,8 @@
 import inspect
 import os
 import sys
-from datetime import datetime
+from datetime import date, datetime, timedelta
+from typing import Dict, List
 
 current_dir = os.path.dirname(os.path.abspath(inspect.getfile(inspect.currentframe())))
 parent_dir = os.path.dirname(current_dir)
@@ -10,107 +11,122 @@ sys.path.insert(0, parent_dir)
 sys.path.insert(1, project_dir)
 
 from src.db.fixtures_db_manager import FixturesDBManager
-from src.db.notif_sql_models import NotifConfig
+from src.db.notif_sql_models import Fixture as DBFixture
 from src.emojis import Emojis
+from src.entities import Fixture
 from src.notifier_constants import NOT_PLAYED_OR_FINISHED_MATCH_STATUSES
 from src.notifier_logger import get_logger
 from src.senders.telegram_sender import send_telegram_message
-from src.telegram_bot.command_handlers.bot_commands_handler import (
-    NotifierBotCommandsHandler,
-)
 from src.telegram_bot.command_handlers.statistics_command_handler import (
     TeamStatisticsBotCommandsHandler,
 )
-from src.utils.date_utils import get_time_in_time_zone_str, is_time_between
-from src.utils.fixtures_utils import convert_db_fixture
-from src.utils.notifier_utils import (
-    get_user_main_time_zone,
-    get_user_notif_config,
-    is_user_subscribed_to_notif,
+from src.utils.date_utils import (
+    get_day_range_in_time_zone,
+    get_time_in_time_zone_str,
+    is_notif_hour,
 )
+from src.utils.fixtures_utils import convert_db_fixtures
+from src.utils.notifier_utils import DigestBucket, get_favourite_teams_digest_buckets
 
 logger = get_logger(__name__)
 
 
 class DailyFTNotifier:
+    """
+    Daily digest of the favourite teams games, computed per bucket of users
+    sharing main time zone and notification hour: the bucket's day fixtures are
+    loaded once, and each user's digest is sliced out of them.
+    """
+
     def __init__(self, notif_type: int) -> None:
         self._notif_type = notif_type
         self._fixtures_db_manager = FixturesDBManager()
 
-    def notify_daily_ft(self) -> NotifConfig:
-        users = self._fixtures_db_manager.get_favourite_teams_users()
-        for user in users:
-            logger.info(f"Favourite Team Games notifier for user {user}")
+    def notify_daily_ft(self) -> None:
+        for bucket in get_favourite_teams_digest_buckets(self._notif_type):
+            now = get_time_in_time_zone_str(datetime.utcnow(), bucket.time_zone)
 
-            if not is_user_subscribed_to_notif(user, self._notif_type):
+            if not is_notif_hour(now, bucket.notif_hour):
                 logger.info(
-                    f"User {user} is not subscribed to notification type {self._notif_type} - Skipping."
+                    f"Current time in time zone {bucket.time_zone} ({now.time()}) is "
+                    f"not around {bucket.notif_hour}:00 - Skipping "
+                    f"{len(bucket.subscribers)} users."
                 )
                 continue
 
-            notif_config = get_user_notif_config(self._notif_type, user)
-            notif_hour = int(notif_config.time.split(":")[0])
+            logger.info(
+                f"Favourite Team Games notifier for {len(bucket.subscribers)} users "
+                f"in time zone {bucket.time_zone} at {bucket.notif_hour}:00"
+            )
 
-            user_main_time_zone = get_user_main_time_zone(user)
-            now = datetime.utcnow()
+            if self._notif_type == 1:
+                self._notify_today_ft(bucket, now)
+            else:
+                self._notify_played_ft_stats(bucket, now)
 
-            if user_main_time_zone:
-                logger.info(f"User main timezone - {user_main_time_zone.name}")
-                now = get_time_in_time_zone_str(now, user_main_time_zone.name)
+    def _get_bucket_fixtures(
+        self, bucket: DigestBucket, day: date, exclude_statuses: List[str] = []
+    ) -> List[DBFixture]:
+        start, end = get_day_range_in_time_zone(day, bucket.time_zone)
 
-            begin_time = (
-                now.replace()
-                .replace(hour=notif_hour - 1, minute=55, second=0, microsecond=0)
-                .time()
-            )
-            end_time = (
-                now.replace()
-                .replace(hour=notif_hour, minute=5, second=0, microsecond=0)
-                .time()
-            )
+        return self._fixtures_db_manager.get_fixtures_in_range(
+            start, end, teams=list(bucket.teams()), exclude_statuses=exclude_statuses
+        )
 
-            if not is_time_between(now.time(), begin_time, end_time):
-                logger.info(
-                    f"Current time in time zone {user_main_time_zone.name if user_main_time_zone else 'UTC'} ("
-                    f"{now.time()}) is not between - {begin_time} and {end_time}"
-                )
+    def _get_subscribers_fixtures(
+        self, bucket: DigestBucket, db_fixtures: List[DBFixture]
+    ) -> Dict[str, List[Fixture]]:
+        """
+        Each subscriber's favourite teams fixtures, converted once per distinct set
+        of user time zones in the bucket.
+        """
+        converted_fixtures = {}
+        subscribers_fixtures = {}
+
+        for subscriber in bucket.subscribers.values():
+            subscriber_db_fixtures = [
+                fixture
+                for fixture in db_fixtures
+                if fixture.home_team in subscriber.favourite_teams
+                or fixture.away_team in subscriber.favourite_teams
+            ]
+
+            if not subscriber_db_fixtures:
                 continue
 
-            favourite_teams = [
-                team for team in self._fixtures_db_manager.get_favourite_teams(user)
+            time_zones_key = subscriber.time_zones_key()
+
+            if time_zones_key not in converted_fixtures:
+                converted_fixtures[time_zones_key] = {
+                    fixture.id: fixture
+                    for fixture in convert_db_fixtures(
+                        db_fixtures, user_time_zones=subscriber.user_time_zones
+                    )
+                }
+
+            subscribers_fixtures[subscriber.chat_id] = [
+                converted_fixtures[time_zones_key][fixture.id]
+                for fixture in subscriber_db_fixtures
             ]
 
-            if self._notif_type == 1:
-                self._notify_today_ft(favourite_teams, user, user_main_time_zone, now)
-            else:
-                self._notify_played_ft_stats(
-                    favourite_teams, user, user_main_time_zone, now
-                )
+        return subscribers_fixtures
 
-    def _notify_today_ft(
-        self, favourite_teams: list, user: str, user_main_time_zone, now: datetime
-    ):
-        user_fixtures_to_notif = []
-        today_matches = self._fixtures_db_manager.get_surround_games_in_time_zone(
-            surround_type="today",
-            time_zone=user_main_time_zone.name if user_main_time_zone else "UTC",
-            teams=favourite_teams,
-            exclude_statuses=["Time to be defined"],
+    def _notify_today_ft(self, bucket: DigestBucket, now: datetime) -> None:
+        db_fixtures = self._get_bucket_fixtures(
+            bucket, now.date(), exclude_statuses=["Time to be defined"]
         )
+        utc_now = datetime.utcnow()
 
-        for fixture in today_matches:
-            if (
-                fixture.away_team in favourite_teams
-                or fixture.home_team in favourite_teams
-            ):
-                converted_fixture = convert_db_fixture(
-                    fixture,
-                    user_time_zones=self._fixtures_db_manager.get_user_time_zones(user),
-                )
-                if converted_fixture.get_time_in_main_zone() > now:
-                    user_fixtures_to_notif.append(converted_fixture)
+        for chat_id, fixtures in self._get_subscribers_fixtures(
+            bucket, db_fixtures
+        ).items():
+            user_fixtures_to_notif = [
+                fixture for fixture in fixtures if fixture.utc_date > utc_now
+            ]
+
+            if not user_fixtures_to_notif:
+                continue
 
-        if user_fixtures_to_notif:
             notif_text = (
                 "One of your favourite teams is "
                 if len(user_fixtures_to_notif) == 1
@@ -124,50 +140,41 @@ class DailyFTNotifier:
                 [fixture.one_line_telegram_repr() for fixture in user_fixtures_to_notif]
             )
             final_text = f"{initial_notif_text}<not_translate>\n\n</not_translate>{fixtures_text}"
-            logger.info(f"Notifying FT Games Today to user {user} - text: {final_text}")
-            notifier_commands_handler = NotifierBotCommandsHandler(user)
-            user_lang = notifier_commands_handler.get_user_language(user)
+            logger.info(
+                f"Notifying FT Games Today to user {chat_id} - text: {final_text}"
+            )
             send_telegram_message(
-                chat_id=user, message=final_text, lang=user_lang.short_name
+                chat_id=chat_id,
+                message=final_text,
+                lang=bucket.subscribers[chat_id].lang,
             )
 
-    def _notify_played_ft_stats(
-        self, favourite_teams: list, user: str, user_main_time_zone, now: datetime
-    ):
-        user_fixtures_to_notif = []
-        yesterday_matches = self._fixtures_db_manager.get_surround_games_in_time_zone(
-            "yesterday",
-            time_zone=user_main_time_zone.name if user_main_time_zone else "UTC",
-            teams=favourite_teams,
-        )
-
-        notifier_commands_handler = NotifierBotCommandsHandler(user)
-        user_lang = notifier_commands_handler.get_user_language(user)
-
-        for fixture in yesterday_matches:
-            if (
-                fixture.away_team in favourite_teams
-                or fixture.home_team in favourite_teams
-            ) and not (
+    def _notify_played_ft_stats(self, bucket: DigestBucket, now: datetime) -> None:
+        db_fixtures = [
+            fixture
+            for fixture in self._get_bucket_fixtures(
+                bucket, (now - timedelta(days=1)).date()
+            )
+            if not (
                 fixture.match_status in NOT_PLAYED_OR_FINISHED_MATCH_STATUSES
                 or "half" in fixture.match_status
                 or fixture.home_score is None
                 or fixture.away_score is None
-            ):
-                converted_fixture = convert_db_fixture(
-                    fixture,
-                    user_time_zones=self._fixtures_db_manager.get_user_time_zones(user),
-                )
-                logger.info(
-                    f"Converted fixture {converted_fixture.home_team.name} vs {converted_fixture.away_team.name}"
-                )
-                if converted_fixture.get_time_in_main_zone() < now:
-                    logger.info(
-                        f"Appending fixture {converted_fixture.home_team.name} vs {converted_fixture.away_team.name} to be notified."
-                    )
-                    user_fixtures_to_notif.append(converted_fixture)
+            )
+        ]
+        utc_now = datetime.utcnow()
+
+        for chat_id, fixtures in self._get_subscribers_fixtures(
+            bucket, db_fixtures
+        ).items():
+            subscriber = bucket.subscribers[chat_id]
+            user_fixtures_to_notif = [
+                fixture for fixture in fixtures if fixture.utc_date < utc_now
+            ]
+
+            if not user_fixtures_to_notif:
+                continue
 
-        if user_fixtures_to_notif:
             notif_text = (
                 "One of your favourite teams  "
                 if len(user_fixtures_to_notif) == 1
@@ -180,27 +187,27 @@ class DailyFTNotifier:
                 f"{Emojis.CHART_INCREASING.value} Here you have an updated summary {Emojis.DOWN_FACING_FIST.value}\n\n"
             )
             send_telegram_message(
-                chat_id=user, message=initial_notif_text, lang=user_lang.short_name
+                chat_id=chat_id, message=initial_notif_text, lang=subscriber.lang
             )
 
-        for fixture in user_fixtures_to_notif:
-            team_id = (
-                fixture.home_team.id
-                if fixture.home_team.id in favourite_teams
-                else fixture.away_team.id
-            )
-            stats_notifier_commands_handler = TeamStatisticsBotCommandsHandler(
-                chat_id=user, team_id=team_id
-            )
+            for fixture in user_fixtures_to_notif:
+                team_id = (
+                    fixture.home_team.id
+                    if fixture.home_team.id in subscriber.favourite_teams
+                    else fixture.away_team.id
+                )
+                stats_notifier_commands_handler = TeamStatisticsBotCommandsHandler(
+                    chat_id=chat_id, team_id=team_id
+                )
 
-            text, photo = stats_notifier_commands_handler.teams_summary()
-            logger.info(
-                f"Notifying stats for {converted_fixture.home_team.name} vs {converted_fixture.away_team.name}"
-            )
+                text, photo = stats_notifier_commands_handler.teams_summary()
+                logger.info(
+                    f"Notifying stats for {fixture.home_team.name} vs {fixture.away_team.name}"
+                )
 
-            send_telegram_message(
-                chat_id=user, message=text, photo=photo, lang=user_lang.short_name
-            )
+                send_telegram_message(
+                    chat_id=chat_id, message=text, photo=photo, lang=subscriber.lang
+                )
 
 
 if __name__ == "__main__":
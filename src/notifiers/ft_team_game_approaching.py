@@ -1,7 +1,7 @@
 import inspect
 import os
 import sys
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 
 current_dir = os.path.dirname(os.path.abspath(inspect.getfile(inspect.currentframe())))
 parent_dir = os.path.dirname(current_dir)
@@ -11,10 +11,13 @@ sys.path.insert(1, project_dir)
 
 from src.db.fixtures_db_manager import FixturesDBManager
 from src.emojis import Emojis
-from src.notifier_constants import NOT_PLAYED_OR_FINISHED_MATCH_STATUSES
+from src.notifier_constants import (
+    FIXTURE_KICKOFF_CHANGED,
+    NOT_PLAYED_OR_FINISHED_MATCH_STATUSES,
+)
 from src.notifier_logger import get_logger
 from src.senders.telegram_sender import send_telegram_message
-from src.telegram_bot.command_handlers.bot_commands_handler import (
+from src.telegram_bot.command_handlers.notifier_bot_commands_handler import (
     NotifierBotCommandsHandler,
 )
 from src.utils.date_utils import get_formatted_date, is_time_between
@@ -25,8 +28,59 @@ fixtures_db_manager = FixturesDBManager()
 
 logger = get_logger(__name__)
 
+APPROACHING_GAME_OUTBOX_CONSUMER = "ft_team_game_approaching"
+
+
+def reset_rescheduled_fixtures() -> None:
+    """
+    Fixtures whose kick off changed (taken from the fixtures outbox) are notified
+    again when their new kick off approaches.
+    """
+    with fixtures_db_manager.unit_of_work():
+        transitions = fixtures_db_manager.get_fixture_transitions(
+            APPROACHING_GAME_OUTBOX_CONSUMER, [FIXTURE_KICKOFF_CHANGED]
+        )
+
+        if not len(transitions):
+            return
+
+        now = datetime.now(timezone.utc)
+
+        for fixture in fixtures_db_manager.get_fixtures_by_ids(
+            [transition.fixture for transition in transitions]
+        ):
+            if fixture.approach_notified is True and fixture.kickoff > now:
+                logger.info(
+                    f"Fixture {fixture.id} was rescheduled to {fixture.kickoff}"
+                )
+                fixture.approach_notified = False
+                fixtures_db_manager.insert_or_update_fixture(fixture)
+
+        fixtures_db_manager.advance_outbox_cursor(
+            APPROACHING_GAME_OUTBOX_CONSUMER, transitions[-1].id
+        )
+
+
+def notify_fixture_approaching(fixture, chat_id: str) -> None:
+    converted_fixture = convert_db_fixture(
+        fixture,
+        user_time_zones=fixtures_db_manager.get_user_time_zones(chat_id),
+    )
+    initial_notif_text = f"{Emojis.BELL.value}{Emojis.BELL.value}{Emojis.BELL.value}\n\nHi! {Emojis.WAVING_HAND.value}\nYour favourite team is playing soon {Emojis.TELEVISION.value}"
+    notif_text = f"{initial_notif_text}<not_translate>\n\n</not_translate>{converted_fixture.telegram_like_repr(line_ups=True)}"
+    logger.info(f"Notifying FT Game Approaching to user {chat_id} - text: {notif_text}")
+    notifier_commands_handler = NotifierBotCommandsHandler(chat_id)
+    user_lang = notifier_commands_handler.get_user_language(chat_id)
+    send_telegram_message(
+        chat_id=chat_id,
+        message=notif_text,
+        lang=user_lang.short_name,
+    )
+
 
 def notify_ft_team_game_approaching() -> None:
+    reset_rescheduled_fixtures()
+
     surrounding_fixtures = fixtures_db_manager.get_games_in_surrounding_n_hours(
         0.5, exclude_statuses=["Time to be defined"]
     )
@@ -53,33 +107,23 @@ def notify_ft_team_game_approaching() -> None:
                 )
                 continue
 
-            if len(favourite_teams_records):
-                chat_ids_to_notify = list(
-                    set([ft.chat_id for ft in favourite_teams_records])
-                )
-                for chat_id in chat_ids_to_notify:
-                    if is_user_subscribed_to_notif(chat_id, 3):
-                        converted_fixture = convert_db_fixture(
-                            fixture,
-                            user_time_zones=fixtures_db_manager.get_user_time_zones(
-                                chat_id
-                            ),
-                        )
-                        initial_notif_text = f"{Emojis.BELL.value}{Emojis.BELL.value}{Emojis.BELL.value}\n\nHi! {Emojis.WAVING_HAND.value}\nYour favourite team is playing soon {Emojis.TELEVISION.value}"
-                        notif_text = f"{initial_notif_text}<not_translate>\n\n</not_translate>{converted_fixture.telegram_like_repr(line_ups=True)}"
-                        logger.info(
-                            f"Notifying FT Game Approaching to user {chat_id} - text: {notif_text}"
-                        )
-                        notifier_commands_handler = NotifierBotCommandsHandler(chat_id)
-                        user_lang = notifier_commands_handler.get_user_language(chat_id)
-                        send_telegram_message(
-                            chat_id=chat_id,
-                            message=notif_text,
-                            lang=user_lang.short_name,
-                        )
-
-            fixture.approach_notified = True
-            fixtures_db_manager.insert_or_update_fixture(fixture)
+            # claimed in its own short transaction, so it is not notified twice
+            # and no transaction is kept open while messages are sent
+            fixtures_db_manager.mark_fixtures_approach_notified([fixture.id])
+
+            chat_ids_to_notify = set([ft.chat_id for ft in favourite_teams_records])
+
+            for chat_id in chat_ids_to_notify:
+                if not is_user_subscribed_to_notif(chat_id, 3):
+                    continue
+
+                try:
+                    notify_fixture_approaching(fixture, chat_id)
+                except Exception as e:
+                    logger.error(
+                        f"Error notifying fixture {fixture.id} approaching to "
+                        f"user {chat_id} - {str(e)}"
+                    )
 
 
 if __name__ == "__main__":
@@ -1,7 +1,9 @@
 import inspect
 import os
 import sys
-from datetime import datetime
+from collections import defaultdict
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List
 
 current_dir = os.path.dirname(os.path.abspath(inspect.getfile(inspect.currentframe())))
 parent_dir = os.path.dirname(current_dir)
@@ -11,131 +13,253 @@ sys.path.insert(1, project_dir)
 
 from src.api.fixtures_client import FixturesClient
 from src.db.fixtures_db_manager import FixturesDBManager
+from src.db.notif_sql_models import Fixture as DBFixture
+from src.db.notif_sql_models import TimeZone as DBTimeZone
 from src.emojis import Emojis
-from src.entities import Event
-from src.notifier_constants import NOT_PLAYED_OR_FINISHED_MATCH_STATUSES
+from src.entities import Event, Fixture
+from src.notifier_constants import (
+    FIXTURE_FINISHED,
+    NOT_PLAYED_OR_FINISHED_MATCH_STATUSES,
+)
 from src.notifier_logger import get_logger
 from src.senders.telegram_sender import send_telegram_message
-from src.telegram_bot.command_handlers.bot_commands_handler import (
-    NotifierBotCommandsHandler,
-)
-from src.utils.date_utils import get_formatted_date
-from src.utils.fixtures_utils import convert_db_fixture
-from src.utils.notifier_utils import is_user_subscribed_to_notif
+from src.utils.fixtures_utils import convert_db_fixtures, localize_fixture
+from src.utils.message_utils import translate_text
+from src.utils.notifier_utils import TeamSubscriber, get_team_subscribers
 
 fixtures_db_manager = FixturesDBManager()
+fixtures_client = FixturesClient()
 
 logger = get_logger(__name__)
 
+PLAYED_GAME_NOTIF_TYPE = 4
+TIMELINE_NOTIF_TYPE = 6
+PLAYED_GAME_OUTBOX_CONSUMER = "ft_team_game_played"
+PLAYED_GAME_MAX_HOURS = 6
 
-def notify_ft_team_game_played() -> None:
-    surrounding_fixtures = fixtures_db_manager.get_games_in_surrounding_n_hours(
-        hours=-4, status="finished"
-    )
 
-    for fixture in surrounding_fixtures:
+def get_fixtures_to_notify(fixture_ids: List[int]) -> List[DBFixture]:
+    # fixtures that finished long ago (e.g. first stored when already played) are
+    # not notified anymore.
+    oldest_kickoff = datetime.now(timezone.utc) - timedelta(hours=PLAYED_GAME_MAX_HOURS)
+    fixtures_to_notify = []
+
+    for fixture in fixtures_db_manager.get_fixtures_by_ids(fixture_ids):
         logger.info(f"Checking notification for fixture {fixture.id}")
-        fixture_time = get_formatted_date(fixture.utc_date)
-        utc_now = datetime.utcnow()
 
-        if utc_now > fixture_time:
-            if fixture.played_notified is True:
-                logger.info(f"Fixture was already notified")
-                continue
+        if fixture.played_notified is True:
+            logger.info(f"Fixture was already notified")
+            continue
 
-            if fixture.match_status in NOT_PLAYED_OR_FINISHED_MATCH_STATUSES:
-                logger.info(
-                    f"Fixture {fixture.id} is not notified because of its status"
+        if fixture.match_status in NOT_PLAYED_OR_FINISHED_MATCH_STATUSES:
+            logger.info(f"Fixture {fixture.id} is not notified because of its status")
+            continue
+
+        if fixture.kickoff < oldest_kickoff:
+            logger.info(f"Fixture {fixture.id} is not notified because it is too old")
+            continue
+
+        fixtures_to_notify.append(fixture)
+
+    return fixtures_to_notify
+
+
+def collect_missing_events(fixtures: List[DBFixture]) -> None:
+    fixtures_with_events = {
+        event.fixture
+        for event in fixtures_db_manager.get_fixtures_events(
+            [fixture.id for fixture in fixtures]
+        )
+    }
+
+    for fixture in fixtures:
+        if fixture.id not in fixtures_with_events:
+            logger.info(
+                f"Fixture {fixture.id} does not event. Will attempt collection."
+            )
+            try:
+                events_response = fixtures_client.get_events(fixture.id)
+                fixtures_db_manager.save_fixture_events(
+                    fixture.id,
+                    [
+                        Event(**fixt_event)
+                        for fixt_event in events_response.as_dict.get("response", [])
+                    ],
                 )
-                continue
+            except Exception as e:
+                # the fixture is still notified, only without its timeline
+                logger.error(f"Error collecting events of fixture {fixture.id} - {e}")
+
+
+def claim_fixture(fixture_id: int, last_event_id: int) -> None:
+    """
+    Marks the fixture as notified and moves the outbox cursor past its transitions
+    in a short transaction of its own, committed before notifying it, so a failure
+    while sending never gets it notified twice.
+    """
+    with fixtures_db_manager.unit_of_work():
+        fixtures_db_manager.mark_fixtures_played_notified([fixture_id])
+        fixtures_db_manager.advance_outbox_cursor(
+            PLAYED_GAME_OUTBOX_CONSUMER, last_event_id
+        )
+
 
-            favourite_teams_records = fixtures_db_manager.get_favourite_teams_for_team(
-                fixture.home_team
-            ) + fixtures_db_manager.get_favourite_teams_for_team(fixture.away_team)
+def notify_fixture_played(
+    fixture: Fixture,
+    subscribers: List[TeamSubscriber],
+    time_zones: Dict[int, DBTimeZone],
+    utc_time_zone: DBTimeZone,
+) -> None:
+    """
+    Renders (and translates) the fixture notification once per team, language and
+    time zones of the subscribers, and sends it to each of them.
+    """
+    subscribers_groups = defaultdict(list)
 
-            if len(favourite_teams_records):
+    for subscriber in subscribers:
+        subscribers_groups[
+            (subscriber.team, subscriber.lang, subscriber.time_zones_key())
+        ].append(subscriber)
+
+    for (team, lang, _), group_subscribers in subscribers_groups.items():
+        localized_fixture = localize_fixture(
+            fixture, group_subscribers[0].user_time_zones, time_zones, utc_time_zone
+        )
+        team_name = (
+            localized_fixture.home_team.name
+            if localized_fixture.home_team.id == team
+            else localized_fixture.away_team.name
+        )
+        initial_notif_text = f"{Emojis.BELL.value}{Emojis.BELL.value}{Emojis.BELL.value}\n\nHi! {Emojis.WAVING_HAND.value}\nYour favourite team <strong>{team_name}</strong> just played today! {Emojis.TELEVISION.value}"
+        notif_text = f"{initial_notif_text}<not_translate>\n\n</not_translate>{localized_fixture.matched_played_telegram_like_repr()}"
+        translated_notif_text = (
+            translate_text(notif_text, lang) if lang != "en" else notif_text
+        )
+        timeline_text = localized_fixture.get_all_events_text()
+
+        for subscriber in group_subscribers:
+            logger.info(
+                f"Notifying FT Game Played to user {subscriber.chat_id} - text: {notif_text}"
+            )
+
+            # Send main played game message
+            send_telegram_message(
+                chat_id=subscriber.chat_id,
+                message=translated_notif_text,
+                translate=False,
+            )
+
+            # Send timeline if any
+            if timeline_text and TIMELINE_NOTIF_TYPE in subscriber.notif_types:
                 logger.info(
-                    f"Notifying fixture {fixture.id} - {fixture.home_team} vs. {fixture.away_team}"
+                    f"Notifying timeline for fixture {fixture.id} and user {subscriber.chat_id}"
                 )
 
-                # Check fixture events and attempt to populate them if they are not there.
-                fixture_events = fixtures_db_manager.get_fixture_events(fixture.id)
-                if not len(fixture_events):
+                text = f"{Emojis.ALARM_CLOCK.value} Game's timeline {Emojis.ALARM_CLOCK.value}\n\n{timeline_text}"
+
+                send_telegram_message(
+                    chat_id=subscriber.chat_id,
+                    message=text,
+                    lang=subscriber.lang,
+                    translate=False,
+                )
+            else:
+                if not timeline_text:
+                    logger.info(f"Fixture {fixture.id} does not have timeline yet.")
+                else:
                     logger.info(
-                        f"Fixture {fixture.id} does not event. Will attempt collection."
+                        f"User is not subscribed to include timeline in notification."
                     )
-                    fixtures_client = FixturesClient()
-                    events_response = fixtures_client.get_events(fixture.id)
-                    for fixt_event in events_response.as_dict.get("response", []):
-                        event = Event(**fixt_event)
-                        event.fixture_id = fixture.id
-                        fixtures_db_manager.save_fixture_event(event)
-
-                for ft_record in favourite_teams_records:
-                    if is_user_subscribed_to_notif(ft_record.chat_id, 4):
-                        converted_fixture = convert_db_fixture(
-                            fixture,
-                            user_time_zones=fixtures_db_manager.get_user_time_zones(
-                                ft_record.chat_id
-                            ),
-                        )
-                        team_name = (
-                            converted_fixture.home_team.name
-                            if converted_fixture.home_team.id == ft_record.team
-                            else converted_fixture.away_team.name
-                        )
-                        initial_notif_text = f"{Emojis.BELL.value}{Emojis.BELL.value}{Emojis.BELL.value}\n\nHi! {Emojis.WAVING_HAND.value}\nYour favourite team <strong>{team_name}</strong> just played today! {Emojis.TELEVISION.value}"
-                        notif_text = f"{initial_notif_text}<not_translate>\n\n</not_translate>{converted_fixture.matched_played_telegram_like_repr()}"
-                        logger.info(
-                            f"Notifying FT Game Played to user {ft_record.chat_id} - text: {notif_text}"
-                        )
-                        notifier_commands_handler = NotifierBotCommandsHandler(
-                            ft_record.chat_id
-                        )
-                        user_lang = notifier_commands_handler.get_user_language(
-                            ft_record.chat_id
-                        )
-
-                        # Send main played game message
-                        send_telegram_message(
-                            chat_id=ft_record.chat_id,
-                            message=notif_text,
-                            lang=user_lang.short_name,
-                        )
-
-                        # Send timeline if any
-                        timeline_text = converted_fixture.get_all_events_text()
-                        if timeline_text and is_user_subscribed_to_notif(
-                            ft_record.chat_id, 6
-                        ):
-                            logger.info(
-                                f"Notifying timeline for fixture {fixture.id} and user {ft_record.chat_id}"
-                            )
-
-                            text = f"{Emojis.ALARM_CLOCK.value} Game's timeline {Emojis.ALARM_CLOCK.value}\n\n{timeline_text}"
-
-                            send_telegram_message(
-                                chat_id=ft_record.chat_id,
-                                message=text,
-                                lang=user_lang.short_name,
-                                translate=False,
-                            )
-                        else:
-                            if not timeline_text:
-                                logger.info(
-                                    f"Fixture {fixture.id} does not have timeline yet."
-                                )
-                            else:
-                                logger.info(
-                                    f"User is not subscribed to include timeline in notification."
-                                )
-                    else:
-                        logger.info(
-                            f"User {ft_record.chat_id} is not subscribed to played games notifications."
-                        )
-
-            fixture.played_notified = True
-            fixtures_db_manager.insert_or_update_fixture(fixture)
+
+
+def notify_ft_team_game_played() -> None:
+    """
+    Notifies the fixtures that finished since the last run, taken from the
+    fixtures outbox. Each fixture is claimed right before its messages are sent,
+    and no database transaction is kept open while sending.
+    """
+    transitions = fixtures_db_manager.get_fixture_transitions(
+        PLAYED_GAME_OUTBOX_CONSUMER, [FIXTURE_FINISHED]
+    )
+
+    if not len(transitions):
+        return
+
+    # transitions come in id order, so each fixture keeps its last one
+    last_event_ids = {transition.fixture: transition.id for transition in transitions}
+
+    fixtures_to_notify = get_fixtures_to_notify(list(last_event_ids.keys()))
+
+    teams_subscribers = defaultdict(list)
+
+    for subscriber in get_team_subscribers(
+        [fixture.home_team for fixture in fixtures_to_notify]
+        + [fixture.away_team for fixture in fixtures_to_notify],
+        [PLAYED_GAME_NOTIF_TYPE, TIMELINE_NOTIF_TYPE],
+    ):
+        if PLAYED_GAME_NOTIF_TYPE in subscriber.notif_types:
+            teams_subscribers[subscriber.team].append(subscriber)
+        else:
+            logger.info(
+                f"User {subscriber.chat_id} is not subscribed to played games notifications."
+            )
+
+    fixtures_with_subscribers = [
+        fixture
+        for fixture in fixtures_to_notify
+        if teams_subscribers[fixture.home_team] or teams_subscribers[fixture.away_team]
+    ]
+    converted_fixtures = {}
+
+    if len(fixtures_with_subscribers):
+        collect_missing_events(fixtures_with_subscribers)
+
+        time_zones = {
+            time_zone.id: time_zone
+            for time_zone in fixtures_db_manager.get_time_zones_by_ids(
+                [
+                    user_time_zone.time_zone
+                    for subscribers in teams_subscribers.values()
+                    for subscriber in subscribers
+                    for user_time_zone in subscriber.user_time_zones
+                ]
+            )
+        }
+        utc_time_zone = fixtures_db_manager.get_time_zones_by_name("UTC")[0]
+        converted_fixtures = {
+            fixture.id: fixture
+            for fixture in convert_db_fixtures(fixtures_with_subscribers)
+        }
+
+    # claimed in the order of their transitions, so the cursor only moves forward
+    # past fixtures that are already claimed
+    for fixture in sorted(
+        fixtures_to_notify, key=lambda fixture: last_event_ids[fixture.id]
+    ):
+        claim_fixture(fixture.id, last_event_ids[fixture.id])
+        converted_fixture = converted_fixtures.get(fixture.id)
+
+        if converted_fixture is None:
+            continue
+
+        logger.info(
+            f"Notifying fixture {converted_fixture.id} - {converted_fixture.home_team.name} vs. {converted_fixture.away_team.name}"
+        )
+
+        try:
+            notify_fixture_played(
+                converted_fixture,
+                teams_subscribers[converted_fixture.home_team.id]
+                + teams_subscribers[converted_fixture.away_team.id],
+                time_zones,
+                utc_time_zone,
+            )
+        except Exception as e:
+            logger.error(f"Error notifying fixture {converted_fixture.id} - {e}")
+
+    fixtures_db_manager.advance_outbox_cursor(
+        PLAYED_GAME_OUTBOX_CONSUMER, transitions[-1].id
+    )
 
 
 if __name__ == "__main__":
@@ -0,0 +1,220 @@
+import asyncio
+import dataclasses
+import time
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+
+import httpx
+
+from config.notif_config import NotifConfig
+from src.notifier_constants import (
+    TELEGRAM_CHAT_MESSAGES_PER_SECOND,
+    TELEGRAM_DELIVERY_CONCURRENCY,
+    TELEGRAM_DELIVERY_MAX_ATTEMPTS,
+    TELEGRAM_GLOBAL_MESSAGES_PER_SECOND,
+    TIME_OUT,
+)
+from src.notifier_logger import get_logger
+from src.senders.telegram_sender import get_message_text
+from src.utils.message_utils import translate_texts
+
+logger = get_logger(__name__)
+
+
+@dataclass
+class TelegramMessage:
+    chat_id: str
+    message: str = ""
+    photo: str = ""
+    lang: str = ""
+    translate: bool = True
+
+
+@dataclass
+class DeliveryResult:
+    chat_id: str
+    delivered: bool
+    status_code: Optional[int] = None
+    attempts: int = 0
+
+
+def translate_messages(messages: List[TelegramMessage]) -> List[TelegramMessage]:
+    """
+    Translates the messages to be translated with one batch per target language.
+    """
+    messages_indexes_by_lang = defaultdict(list)
+
+    for index, message in enumerate(messages):
+        if message.lang and message.lang != "en" and message.translate is True:
+            messages_indexes_by_lang[message.lang].append(index)
+
+    translated_messages = list(messages)
+
+    for lang, indexes in messages_indexes_by_lang.items():
+        translated_texts = translate_texts(
+            [messages[index].message for index in indexes], lang
+        )
+        for index, translated_text in zip(indexes, translated_texts):
+            translated_messages[index] = dataclasses.replace(
+                messages[index], message=translated_text, translate=False
+            )
+
+    return translated_messages
+
+
+class TokenBucket:
+    def __init__(self, rate: float, capacity: Optional[float] = None) -> None:
+        self._rate = rate
+        self._capacity = capacity or rate
+        self._tokens = self._capacity
+        self._updated_at = time.monotonic()
+        self._blocked_until = 0.0
+        self._lock = asyncio.Lock()
+
+    def block_for(self, seconds: float) -> None:
+        self._blocked_until = max(self._blocked_until, time.monotonic() + seconds)
+
+    async def acquire(self) -> None:
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+
+                if now < self._blocked_until:
+                    await asyncio.sleep(self._blocked_until - now)
+                    continue
+
+                self._tokens = min(
+                    self._capacity, self._tokens + (now - self._updated_at) * self._rate
+                )
+                self._updated_at = now
+
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+
+                await asyncio.sleep((1 - self._tokens) / self._rate)
+
+
+class TelegramDeliveryEngine:
+    """
+    Sends Telegram messages concurrently through a shared async client, keeping
+    within Telegram's global and per chat rate limits and backing off for as long
+    as Telegram requests it when flood control is hit.
+    """
+
+    def __init__(
+        self,
+        token: str = NotifConfig.TELEGRAM_TOKEN,
+        global_rate: float = TELEGRAM_GLOBAL_MESSAGES_PER_SECOND,
+        chat_rate: float = TELEGRAM_CHAT_MESSAGES_PER_SECOND,
+        concurrency: int = TELEGRAM_DELIVERY_CONCURRENCY,
+        max_attempts: int = TELEGRAM_DELIVERY_MAX_ATTEMPTS,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+    ) -> None:
+        self._base_url = f"https://api.telegram.org/bot{token}"
+        self._client = httpx.AsyncClient(timeout=TIME_OUT, transport=transport)
+        self._global_bucket = TokenBucket(global_rate)
+        self._chat_rate = chat_rate
+        self._chat_buckets: Dict[str, TokenBucket] = {}
+        self._concurrency = concurrency
+        self._max_attempts = max_attempts
+
+    async def __aenter__(self) -> "TelegramDeliveryEngine":
+        return self
+
+    async def __aexit__(self, *args) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        await self._client.aclose()
+
+    def _chat_bucket(self, chat_id: str) -> TokenBucket:
+        if chat_id not in self._chat_buckets:
+            self._chat_buckets[chat_id] = TokenBucket(self._chat_rate, capacity=1)
+
+        return self._chat_buckets[chat_id]
+
+    async def send(self, message: TelegramMessage) -> DeliveryResult:
+        text = await asyncio.to_thread(
+            get_message_text, message.message, message.lang, message.translate
+        )
+
+        if message.photo:
+            url = f"{self._base_url}/sendPhoto"
+            params = {"photo": message.photo, "caption": text}
+        else:
+            url = f"{self._base_url}/sendMessage"
+            params = {"text": text}
+
+        params.update({"chat_id": message.chat_id, "parse_mode": "HTML"})
+        chat_bucket = self._chat_bucket(message.chat_id)
+        status_code = None
+
+        for attempt in range(1, self._max_attempts + 1):
+            await chat_bucket.acquire()
+            await self._global_bucket.acquire()
+
+            try:
+                response = await self._client.post(url, json=params)
+            except httpx.HTTPError as e:
+                logger.error(f"Error sending message to chat {message.chat_id} - {e}")
+                continue
+
+            status_code = response.status_code
+
+            if status_code == 429:
+                retry_after = (
+                    response.json().get("parameters", {}).get("retry_after", 1)
+                )
+                logger.warning(
+                    f"Flood control hit sending to chat {message.chat_id}, "
+                    f"retrying after {retry_after} seconds"
+                )
+                chat_bucket.block_for(retry_after)
+                self._global_bucket.block_for(retry_after)
+                continue
+
+            if not response.is_success:
+                logger.error(
+                    f"Message to chat {message.chat_id} was not delivered - "
+                    f"{status_code}: {response.text}"
+                )
+
+            return DeliveryResult(
+                chat_id=message.chat_id,
+                delivered=response.is_success,
+                status_code=status_code,
+                attempts=attempt,
+            )
+
+        return DeliveryResult(
+            chat_id=message.chat_id,
+            delivered=False,
+            status_code=status_code,
+            attempts=self._max_attempts,
+        )
+
+    async def send_many(self, messages: List[TelegramMessage]) -> List[DeliveryResult]:
+        messages = await asyncio.to_thread(translate_messages, messages)
+        semaphore = asyncio.Semaphore(self._concurrency)
+
+        async def send_with_semaphore(message: TelegramMessage) -> DeliveryResult:
+            async with semaphore:
+                return await self.send(message)
+
+        results = await asyncio.gather(
+            *[send_with_semaphore(message) for message in messages]
+        )
+        delivered = sum(1 for result in results if result.delivered)
+        logger.info(f"Delivered {delivered} out of {len(messages)} messages")
+
+        return results
+
+
+def send_many_messages(messages: List[TelegramMessage]) -> List[DeliveryResult]:
+    async def deliver() -> List[DeliveryResult]:
+        async with TelegramDeliveryEngine() as delivery_engine:
+            return await delivery_engine.send_many(messages)
+
+    return asyncio.run(deliver())
@@ -11,11 +11,7 @@ def send_telegram_message(
     lang: str = "",
     translate: bool = True,
 ) -> None:
-    message = (
-        translate_text(message, lang)
-        if lang and lang != "en" and translate is True
-        else message.replace("<not_translate>", "").replace("</not_translate>", "")
-    )
+    message = get_message_text(message, lang, translate)
     telegram_client = TelegramClient(NotifConfig.TELEGRAM_TOKEN)
     if photo:
         response = telegram_client.send_photo(chat_id, photo_url=photo, text=message)
@@ -25,3 +21,11 @@ def send_telegram_message(
         response = telegram_client.send_message(chat_id, message)
 
     print(f"TELEGRAM MESSAGE SENT RESPONSE: {response.status_code}\n{response.text}")
+
+
+def get_message_text(message: str, lang: str = "", translate: bool = True) -> str:
+    return (
+        translate_text(message, lang)
+        if lang and lang != "en" and translate is True
+        else message.replace("<not_translate>", "").replace("</not_translate>", "")
+    )
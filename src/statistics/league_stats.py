@@ -1,18 +1,84 @@
-from pydantic import BaseModel
+from datetime import datetime, timezone
+from typing import List, Optional
 
 from src.db.fixtures_db_manager import FixturesDBManager
-from src.notifier_constants import NOT_PLAYED_OR_FINISHED_MATCH_STATUSES
+from src.db.notif_sql_models import Fixture as DBFixture
+from src.db.notif_sql_models import LeagueStatistics as DBLeagueStatistics
+from src.notifier_constants import LEAGUE_STATS_LAST_MATCHES, LEAGUE_STATS_MAX_FIXTURES
+from src.notifier_logger import get_logger
+from src.statistics.team_stats import is_played_fixture
+
+fixtures_db_manager = FixturesDBManager()
+
+logger = get_logger(__name__)
+
+
+def get_league_statistics(
+    league_id: int, fixtures: List[DBFixture], season: int
+) -> DBLeagueStatistics:
+    """
+    Computes the league statistics from its latest fixtures, sorted from the most
+    recent one.
+    """
+    played_fixtures = list(filter(is_played_fixture, fixtures))
+    season_goals = [
+        fixture.home_score + fixture.away_score
+        for fixture in played_fixtures
+        if fixture.kickoff.year == season
+    ]
+
+    return DBLeagueStatistics(
+        league=league_id,
+        season=season,
+        games_played=len(season_goals),
+        goals=sum(season_goals),
+        last_matches_goals=[
+            fixture.home_score + fixture.away_score
+            for fixture in played_fixtures[:LEAGUE_STATS_LAST_MATCHES]
+        ],
+        updated_at=datetime.now(timezone.utc),
+    )
+
+
+def refresh_leagues_statistics(league_ids: List[int]) -> List[DBLeagueStatistics]:
+    season = datetime.now(timezone.utc).year
+    leagues_statistics = [
+        get_league_statistics(
+            league_id,
+            fixtures_db_manager.get_last_fixture(
+                league_id=league_id, number_of_fixtures=LEAGUE_STATS_MAX_FIXTURES
+            ),
+            season,
+        )
+        for league_id in set(league_ids)
+    ]
+
+    fixtures_db_manager.save_leagues_statistics(leagues_statistics)
+    logger.info(f"Refreshed statistics of {len(leagues_statistics)} leagues")
+
+    return leagues_statistics
 
 
 class LeagueStats:
     def __init__(self, league_id: int) -> None:
-        self._fixtures_db_manager = FixturesDBManager()
         self._league_id = league_id
+        self._statistics: Optional[DBLeagueStatistics] = None
+
+    @property
+    def statistics(self) -> DBLeagueStatistics:
+        if self._statistics is None:
+            statistics = fixtures_db_manager.get_league_statistics(self._league_id)
+
+            # Rows refreshed last season would report an empty current year.
+            if (
+                statistics is None
+                or statistics.season != datetime.now(timezone.utc).year
+            ):
+                statistics = refresh_leagues_statistics([self._league_id])[0]
+
+            self._statistics = statistics
+
+        return self._statistics
 
     def goals_scored_last_n_matches(self, number_of_matches: int) -> int:
-        last_n_fixtures = self._fixtures_db_manager.get_last_fixture(
-            league_id=self._league_id, number_of_fixtures=number_of_matches
-        )
-        return sum(
-            fixture.home_score + fixture.away_score for fixture in last_n_fixtures
-        )
+        return sum(self.statistics.last_matches_goals[:number_of_matches])
@@ -0,0 +1,45 @@
+from src.db.fixtures_db_manager import FixturesDBManager
+from src.notifier_constants import FIXTURE_EVENTS_COLLECTED, FIXTURE_FINISHED
+from src.notifier_logger import get_logger
+from src.statistics.league_stats import refresh_leagues_statistics
+from src.statistics.team_stats import refresh_teams_statistics
+
+fixtures_db_manager = FixturesDBManager()
+
+logger = get_logger(__name__)
+
+STATS_OUTBOX_CONSUMER = "stats_updater"
+
+
+def update_stats() -> None:
+    """
+    Refreshes the statistics of the teams and leagues of the fixtures that
+    finished, or got their events collected, since the last run, taken from the
+    fixtures outbox.
+    """
+    with fixtures_db_manager.unit_of_work():
+        transitions = fixtures_db_manager.get_fixture_transitions(
+            STATS_OUTBOX_CONSUMER, [FIXTURE_FINISHED, FIXTURE_EVENTS_COLLECTED]
+        )
+
+        if not len(transitions):
+            return
+
+        fixtures = fixtures_db_manager.get_fixtures_by_ids(
+            [transition.fixture for transition in transitions]
+        )
+
+        refresh_teams_statistics(
+            [fixture.home_team for fixture in fixtures]
+            + [fixture.away_team for fixture in fixtures]
+        )
+        refresh_leagues_statistics([fixture.league for fixture in fixtures])
+
+        fixtures_db_manager.advance_outbox_cursor(
+            STATS_OUTBOX_CONSUMER, transitions[-1].id
+        )
+
+
+if __name__ == "__main__":
+    logger.info("*** RUNNING Statistics Updater ****")
+    update_stats()
@@ -1,16 +1,30 @@
-from typing import Optional
+from collections import Counter, defaultdict
+from datetime import datetime, timezone
+from typing import Dict, List, Optional, Tuple
 
 from pydantic import BaseModel, validator
 
 from src.db.fixtures_db_manager import FixturesDBManager
+from src.db.notif_sql_models import Event as DBEvent
+from src.db.notif_sql_models import Fixture as DBFixture
+from src.db.notif_sql_models import Player as DBPlayer
+from src.db.notif_sql_models import TeamStatistics as DBTeamStatistics
 from src.emojis import Emojis
-from src.entities import Event
-from src.notifier_constants import NOT_PLAYED_OR_FINISHED_MATCH_STATUSES
+from src.notifier_constants import (
+    NOT_PLAYED_OR_FINISHED_MATCH_STATUSES,
+    TEAM_STATS_LAST_MATCHES,
+    TEAM_STATS_MAX_FIXTURES,
+    TEAM_STATS_TOP_SCORERS,
+)
 from src.notifier_logger import get_logger
-from src.utils.fixtures_utils import convert_db_event, has_all_events
+from src.utils.fixtures_utils import has_all_events
+
+fixtures_db_manager = FixturesDBManager()
 
 logger = get_logger(__name__)
 
+SCORER_GOAL_DETAILS = ["Normal Goal", "Penalty"]
+
 
 class TeamRecord(BaseModel):
     games_won: int = 0
@@ -46,133 +60,242 @@ class TeamRecord(BaseModel):
         return games_won + games_drawn + games_lost
 
 
+def is_played_fixture(fixture: DBFixture) -> bool:
+    return not (
+        fixture.match_status in NOT_PLAYED_OR_FINISHED_MATCH_STATUSES
+        or "half" in fixture.match_status
+        or fixture.home_score is None
+        or fixture.away_score is None
+    )
+
+
+def get_team_goals(fixture: DBFixture, team_id: int) -> Tuple[int, int]:
+    """
+    :return: goals scored and received by the team in the fixture.
+    """
+    if fixture.home_team == team_id:
+        return fixture.home_score, fixture.away_score
+
+    return fixture.away_score, fixture.home_score
+
+
+def get_team_scorers(
+    fixture: DBFixture,
+    events: List[DBEvent],
+    team_id: int,
+    players: Dict[int, DBPlayer],
+) -> Dict[str, int]:
+    """
+    Goals of each of the team's scorers in the fixture, own goals apart. Empty if
+    not all of the fixture events were collected.
+    """
+    if not has_all_events(fixture, events):
+        return {}
+
+    return dict(
+        Counter(
+            players[event.player].name
+            for event in events
+            if event.team == team_id
+            and event.type == "Goal"
+            and event.detail in SCORER_GOAL_DETAILS
+            and event.player in players
+            and players[event.player].name is not None
+        )
+    )
+
+
+def get_top_scorers(
+    scorers: Dict[str, int], top: int = TEAM_STATS_TOP_SCORERS
+) -> List[list]:
+    return [
+        [player, goals]
+        for player, goals in sorted(
+            scorers.items(), key=lambda scorer: scorer[1], reverse=True
+        )[:top]
+    ]
+
+
+def get_team_statistics(
+    team_id: int,
+    fixtures: List[DBFixture],
+    fixtures_events: Dict[int, List[DBEvent]],
+    players: Dict[int, DBPlayer],
+    season: int,
+) -> DBTeamStatistics:
+    """
+    Computes the team statistics from its latest fixtures, sorted from the most
+    recent one.
+    """
+    last_matches = []
+    season_scorers = Counter()
+    games_won = games_drawn = games_lost = goals_scored = goals_received = 0
+
+    for fixture in filter(is_played_fixture, fixtures):
+        fixture_goals_scored, fixture_goals_received = get_team_goals(fixture, team_id)
+        scorers = get_team_scorers(
+            fixture, fixtures_events.get(fixture.id, []), team_id, players
+        )
+
+        if len(last_matches) < TEAM_STATS_LAST_MATCHES:
+            last_matches.append(
+                {
+                    "fixture": fixture.id,
+                    "goals_scored": fixture_goals_scored,
+                    "goals_received": fixture_goals_received,
+                    "scorers": scorers,
+                }
+            )
+
+        if fixture.kickoff.year != season:
+            continue
+
+        games_won += fixture_goals_scored > fixture_goals_received
+        games_drawn += fixture_goals_scored == fixture_goals_received
+        games_lost += fixture_goals_scored < fixture_goals_received
+        goals_scored += fixture_goals_scored
+        goals_received += fixture_goals_received
+        season_scorers.update(scorers)
+
+    return DBTeamStatistics(
+        team=team_id,
+        season=season,
+        games_won=games_won,
+        games_drawn=games_drawn,
+        games_lost=games_lost,
+        goals_scored=goals_scored,
+        goals_received=goals_received,
+        top_scorers=get_top_scorers(season_scorers),
+        last_matches=last_matches,
+        updated_at=datetime.now(timezone.utc),
+    )
+
+
+def refresh_teams_statistics(team_ids: List[int]) -> List[DBTeamStatistics]:
+    """
+    Computes again and stores the statistics of the given teams.
+    """
+    season = datetime.now(timezone.utc).year
+    teams_statistics = []
+
+    for team_id in set(team_ids):
+        fixtures = fixtures_db_manager.get_last_fixture(
+            team_id=team_id, number_of_fixtures=TEAM_STATS_MAX_FIXTURES
+        )
+
+        fixtures_events = defaultdict(list)
+        for event in fixtures_db_manager.get_fixtures_events(
+            [fixture.id for fixture in fixtures if is_played_fixture(fixture)]
+        ):
+            fixtures_events[event.fixture].append(event)
+
+        players = {
+            player.id: player
+            for player in fixtures_db_manager.get_players_by_ids(
+                [
+                    event.player
+                    for events in fixtures_events.values()
+                    for event in events
+                    if event.team == team_id and event.type == "Goal"
+                ]
+            )
+        }
+
+        teams_statistics.append(
+            get_team_statistics(team_id, fixtures, fixtures_events, players, season)
+        )
+
+    fixtures_db_manager.save_teams_statistics(teams_statistics)
+    logger.info(f"Refreshed statistics of {len(teams_statistics)} teams")
+
+    return teams_statistics
+
+
+RESULT_EMOJIS = {
+    1: Emojis.CHECK_MARK_BUTTON,
+    0: Emojis.EQUAL,
+    -1: Emojis.CROSS_MARK,
+}
+
+
 class TeamStats:
+    """
+    Team statistics, read from its materialized row, which is computed on first
+    read if the team doesn't have one yet.
+    """
+
     def __init__(self, team_id: int):
-        self._fixtures_db_manager = FixturesDBManager()
         self._team_id = team_id
+        self._statistics: Optional[DBTeamStatistics] = None
 
-    def number_of_goals(
-        self,
-        number_of_matches: int = 5,
-        scored: bool = True,
-        year: Optional[str] = None,
-    ):
-        last_n_fixtures = self._fixtures_db_manager.get_last_fixture(
-            team_id=self._team_id, number_of_fixtures=number_of_matches, year=year
-        )
-
-        number_of_goals = 0
+    @property
+    def statistics(self) -> DBTeamStatistics:
+        if self._statistics is None:
+            statistics = fixtures_db_manager.get_team_statistics(self._team_id)
 
-        for fixture in last_n_fixtures:
+            # Rows refreshed last season would report an empty current year.
             if (
-                fixture.match_status in NOT_PLAYED_OR_FINISHED_MATCH_STATUSES
-                or "half" in fixture.match_status
-                or fixture.home_score is None
-                or fixture.away_score is None
+                statistics is None
+                or statistics.season != datetime.now(timezone.utc).year
             ):
-                continue
-
-            if fixture.home_team == self._team_id:
-                number_of_goals = (
-                    number_of_goals + fixture.home_score
-                    if scored
-                    else number_of_goals + fixture.away_score
-                )
-            else:
-                number_of_goals = (
-                    number_of_goals + fixture.away_score
-                    if scored
-                    else number_of_goals + fixture.home_score
-                )
+                statistics = refresh_teams_statistics([self._team_id])[0]
 
-        return number_of_goals
+            self._statistics = statistics
 
-    def get_goal_scorers(self, events: list[Event]) -> dict:
-        all_goals = [
-            event
-            for event in events
-            if event.is_regular_goal()
-            and event.player.name is not None
-            and event.detail != "Own Goal"
-        ]
-        goal_scorers = {}
-
-        for goal in all_goals:
-            current_goals = (
-                goal_scorers[goal.player.name]
-                if goal.player.name in goal_scorers
-                else 0
-            )
-            goal_scorers[goal.player.name] = current_goals + 1
+        return self._statistics
 
-        sorted_players_by_goals = sorted(
-            goal_scorers.items(), key=lambda scorer: scorer[1], reverse=True
-        )[:3]
+    def _is_season(self, year: Optional[str]) -> bool:
+        return year is not None and int(year) == self.statistics.season
+
+    def number_of_goals(
+        self,
+        number_of_matches: int = TEAM_STATS_LAST_MATCHES,
+        scored: bool = True,
+        year: Optional[str] = None,
+    ) -> int:
+        if year is not None:
+            if not self._is_season(year):
+                return 0
 
-        return dict(sorted_players_by_goals)
+            return (
+                self.statistics.goals_scored
+                if scored
+                else self.statistics.goals_received
+            )
+
+        return sum(
+            last_match["goals_scored" if scored else "goals_received"]
+            for last_match in self.statistics.last_matches[:number_of_matches]
+        )
 
     def team_record_in_last_n_matches(
         self, number_of_matches: int, year: Optional[str] = None
     ) -> TeamRecord:
-        last_n_fixtures = self._fixtures_db_manager.get_last_fixture(
-            team_id=self._team_id, number_of_fixtures=120, year=year
-        )
+        if year is not None:
+            if not self._is_season(year):
+                return TeamRecord()
 
-        filtered_fixtures = [
-            fixt
-            for fixt in last_n_fixtures
-            if not (
-                fixt.match_status in NOT_PLAYED_OR_FINISHED_MATCH_STATUSES
-                or "half" in fixt.match_status
-                or fixt.home_score is None
-                or fixt.away_score is None
+            return TeamRecord(
+                games_won=self.statistics.games_won,
+                games_drawn=self.statistics.games_drawn,
+                games_lost=self.statistics.games_lost,
+                top_scorers=dict(self.statistics.top_scorers),
             )
-        ]
-
-        games_won = 0
-        games_drawn = 0
-        games_lost = 0
 
-        record_emojis = []
-        fixt_events = []
+        results = []
+        scorers = Counter()
 
-        for fixt in filtered_fixtures[:number_of_matches]:
-            events = self._fixtures_db_manager.get_fixture_events(fixt.id)
-
-            if has_all_events(fixt, events):
-                fixt_events.extend(
-                    convert_db_event(event)
-                    for event in events
-                    if event.team == self._team_id
-                )
-
-            if fixt.home_team == self._team_id:
-                if fixt.home_score > fixt.away_score:
-                    games_won += 1
-                    record_emojis.append(Emojis.CHECK_MARK_BUTTON.value)
-                elif fixt.home_score < fixt.away_score:
-                    games_lost += 1
-                    record_emojis.append(Emojis.CROSS_MARK.value)
-                else:
-                    games_drawn += 1
-                    record_emojis.append(Emojis.EQUAL.value)
-            else:
-                if fixt.home_score > fixt.away_score:
-                    games_lost += 1
-                    record_emojis.append(Emojis.CROSS_MARK.value)
-                elif fixt.home_score < fixt.away_score:
-                    games_won += 1
-                    record_emojis.append(Emojis.CHECK_MARK_BUTTON.value)
-                else:
-                    games_drawn += 1
-                    record_emojis.append(Emojis.EQUAL.value)
-
-        top_scorers = self.get_goal_scorers(fixt_events)
+        for last_match in self.statistics.last_matches[:number_of_matches]:
+            goals_difference = last_match["goals_scored"] - last_match["goals_received"]
+            results.append((goals_difference > 0) - (goals_difference < 0))
+            scorers.update(last_match["scorers"])
 
         return TeamRecord(
-            games_won=games_won,
-            games_drawn=games_drawn,
-            games_lost=games_lost,
-            all_record_matches_emojis="".join(record_emojis),
-            top_scorers=top_scorers,
+            games_won=results.count(1),
+            games_drawn=results.count(0),
+            games_lost=results.count(-1),
+            all_record_matches_emojis="".join(
+                RESULT_EMOJIS[result].value for result in results
+            ),
+            top_scorers=dict(get_top_scorers(scorers)),
         )
@@ -1,7 +1,86 @@
+import asyncio
+from typing import Dict, Optional
+
+from telegram import Update
 from telegram.ext import ApplicationBuilder
 from telegram.ext._application import Application
 
+from src.notifier_constants import BOT_COMMAND_TIMEOUT, BOT_CONCURRENT_UPDATES
+from src.notifier_logger import get_logger
+from src.telegram_bot.bot_persistence import DBPersistence
 from src.telegram_bot.notifier_bot_handlers import NOTIFIER_BOT_HANDLERS
+from src.utils.deadline_utils import deadline
+
+logger = get_logger(__name__)
+
+
+class ChatOrderedApplication(Application):
+    """
+    Processes updates of different chats concurrently, while those of a same chat
+    are still processed one by one, as the conversation handlers expect. Each
+    update is given BOT_COMMAND_TIMEOUT seconds, once its turn comes.
+
+    With a database persistence, changes are written right after each update, so
+    a restart doesn't drop conversations in progress.
+    """
+
+    def __init__(self, **kwargs) -> None:
+        super().__init__(**kwargs)
+        self._chat_locks: Dict[int, asyncio.Lock] = {}
+        self._chat_pending_updates: Dict[int, int] = {}
+
+    async def process_update(self, update: object) -> None:
+        chat_id = get_update_chat_id(update)
+
+        if chat_id is None:
+            return await super().process_update(update)
+
+        lock = self._chat_locks.setdefault(chat_id, asyncio.Lock())
+        self._chat_pending_updates[chat_id] = (
+            self._chat_pending_updates.get(chat_id, 0) + 1
+        )
+
+        try:
+            async with lock:
+                # every command run while processing the update shares its deadline
+                with deadline(BOT_COMMAND_TIMEOUT):
+                    await super().process_update(update)
+
+                await self._write_persistence()
+        finally:
+            self._chat_pending_updates[chat_id] -= 1
+
+            if not self._chat_pending_updates[chat_id]:
+                del self._chat_pending_updates[chat_id]
+                del self._chat_locks[chat_id]
+
+    async def _write_persistence(self) -> None:
+        if isinstance(self.persistence, DBPersistence):
+            await self.update_persistence()
+
+
+def get_update_chat_id(update: object) -> Optional[int]:
+    if isinstance(update, Update) and update.effective_chat:
+        return update.effective_chat.id
+
+    return None
+
+
+async def on_error(update: object, context) -> None:
+    if isinstance(context.error, asyncio.TimeoutError):
+        logger.warning(f"Command timed out processing update {update}")
+
+        if isinstance(update, Update) and update.effective_chat:
+            await context.bot.send_message(
+                chat_id=update.effective_chat.id,
+                text="Sorry, this is taking longer than expected. Please try again later.",
+            )
+        return
+
+    logger.error(
+        f"Error processing update {update} - {str(context.error)}",
+        exc_info=context.error,
+    )
 
 
 class NotifBotAppBuilder:
@@ -9,9 +88,18 @@ class NotifBotAppBuilder:
         self._telegram_token = telegram_token
 
     def build_application(self) -> Application:
-        application = ApplicationBuilder().token(self._telegram_token).build()
+        application = (
+            ApplicationBuilder()
+            .token(self._telegram_token)
+            .application_class(ChatOrderedApplication)
+            .concurrent_updates(BOT_CONCURRENT_UPDATES)
+            .persistence(DBPersistence())
+            .build()
+        )
 
         for count, handler in enumerate(NOTIFIER_BOT_HANDLERS):
             application.add_handler(handler, count)
 
+        application.add_error_handler(on_error)
+
         return application
@@ -0,0 +1,126 @@
+import json
+import pickle
+from typing import Any, Dict, Optional, Tuple, Union
+
+from telegram.ext import BasePersistence, PersistenceInput
+
+from src.db.bot_persistence_db_manager import BotPersistenceDBManager
+from src.notifier_constants import BOT_PERSISTENCE_UPDATE_INTERVAL
+from src.notifier_logger import get_logger
+from src.telegram_bot.commands_utils import run_command
+
+logger = get_logger(__name__)
+
+USER_DATA_NAMESPACE = "user_data"
+CHAT_DATA_NAMESPACE = "chat_data"
+CONVERSATION_NAMESPACE_PREFIX = "conversation:"
+
+ConversationKey = Tuple[Union[int, str], ...]
+ConversationDict = Dict[ConversationKey, object]
+
+
+def get_conversation_namespace(name: str) -> str:
+    return f"{CONVERSATION_NAMESPACE_PREFIX}{name}"
+
+
+def get_conversation_key(key: ConversationKey) -> str:
+    return json.dumps(list(key))
+
+
+class DBPersistence(BasePersistence[Dict[Any, Any], Dict[Any, Any], Dict[Any, Any]]):
+    """
+    Stores users and chats data and conversations states in database, so they
+    survive restarts. Changes are written as soon as the application hands them
+    over.
+    """
+
+    def __init__(
+        self,
+        persistence_db_manager: BotPersistenceDBManager = None,
+        update_interval: float = BOT_PERSISTENCE_UPDATE_INTERVAL,
+    ) -> None:
+        super().__init__(
+            store_data=PersistenceInput(bot_data=False, callback_data=False),
+            update_interval=update_interval,
+        )
+        self._persistence_db_manager = (
+            persistence_db_manager or BotPersistenceDBManager()
+        )
+
+    async def _get_entries(self, namespace: str) -> Dict[int, Dict[Any, Any]]:
+        entries = await run_command(self._persistence_db_manager.get_entries, namespace)
+
+        return {int(key): pickle.loads(data) for key, data in entries.items()}
+
+    async def _save_entry(self, namespace: str, key: str, data: Any) -> None:
+        await run_command(
+            self._persistence_db_manager.save_entry, namespace, key, pickle.dumps(data)
+        )
+
+    async def _delete_entry(self, namespace: str, key: str) -> None:
+        await run_command(self._persistence_db_manager.delete_entry, namespace, key)
+
+    async def get_user_data(self) -> Dict[int, Dict[Any, Any]]:
+        return await self._get_entries(USER_DATA_NAMESPACE)
+
+    async def get_chat_data(self) -> Dict[int, Dict[Any, Any]]:
+        return await self._get_entries(CHAT_DATA_NAMESPACE)
+
+    async def get_bot_data(self) -> Dict[Any, Any]:
+        return {}
+
+    async def get_callback_data(self) -> None:
+        return None
+
+    async def get_conversations(self, name: str) -> ConversationDict:
+        entries = await run_command(
+            self._persistence_db_manager.get_entries, get_conversation_namespace(name)
+        )
+
+        return {
+            tuple(json.loads(key)): pickle.loads(data) for key, data in entries.items()
+        }
+
+    async def update_conversation(
+        self, name: str, key: ConversationKey, new_state: Optional[object]
+    ) -> None:
+        if new_state is None:
+            await self._delete_entry(
+                get_conversation_namespace(name), get_conversation_key(key)
+            )
+        else:
+            await self._save_entry(
+                get_conversation_namespace(name), get_conversation_key(key), new_state
+            )
+
+    async def update_user_data(self, user_id: int, data: Dict[Any, Any]) -> None:
+        await self._save_entry(USER_DATA_NAMESPACE, str(user_id), data)
+
+    async def update_chat_data(self, chat_id: int, data: Dict[Any, Any]) -> None:
+        await self._save_entry(CHAT_DATA_NAMESPACE, str(chat_id), data)
+
+    async def update_bot_data(self, data: Dict[Any, Any]) -> None:
+        pass
+
+    async def update_callback_data(self, data: Any) -> None:
+        pass
+
+    async def drop_user_data(self, user_id: int) -> None:
+        await self._delete_entry(USER_DATA_NAMESPACE, str(user_id))
+
+    async def drop_chat_data(self, chat_id: int) -> None:
+        await self._delete_entry(CHAT_DATA_NAMESPACE, str(chat_id))
+
+    async def refresh_user_data(self, user_id: int, user_data: Dict[Any, Any]) -> None:
+        # a single bot process writes the data, so the in-memory one is never stale
+        pass
+
+    async def refresh_chat_data(self, chat_id: int, chat_data: Dict[Any, Any]) -> None:
+        pass
+
+    async def refresh_bot_data(self, bot_data: Dict[Any, Any]) -> None:
+        pass
+
+    async def flush(self) -> None:
+        # every change is already written when handed over by the application
+        pass
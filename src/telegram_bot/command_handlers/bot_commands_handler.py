@@ -13,7 +13,12 @@ from src.telegram_bot.command_handlers.notifier_bot_commands_handler import (
     NotifierBotCommandsHandler,
 )
 from src.utils.db_utils import remove_duplicate_fixtures
-from src.utils.fixtures_utils import convert_db_fixture, get_head_to_heads
+from src.utils.fixture_store import FIXTURE_STORE
+from src.utils.fixtures_utils import (
+    convert_db_fixture,
+    convert_db_fixtures,
+    get_head_to_heads,
+)
 from src.utils.notification_text_utils import (
     telegram_last_team_or_league_fixture_notification,
     telegram_next_team_or_league_fixture_notification,
@@ -29,9 +34,9 @@ class SurroundingMatchesHandler(NotifierBotCommandsHandler):
         self._teams = []
         self._leagues = []
         self._user = user
-        self._user_time_zones = self._fixtures_db_manager.get_user_time_zones(
+        self._user_time_zones = self._fixtures_db_manager.get_user_preferences(
             self._chat_id
-        )
+        ).user_time_zones
         self._user_main_time_zone = self.get_user_main_time_zone()
 
     def validate_command_input(self) -> Optional[str]:
@@ -41,17 +46,17 @@ class SurroundingMatchesHandler(NotifierBotCommandsHandler):
                 "ft",
                 "favourite_teams",
             ]:
-                self._teams = self._fixtures_db_manager.get_favourite_teams(
+                self._teams = self._fixtures_db_manager.get_user_preferences(
                     self._chat_id
-                )
+                ).favourite_teams
             elif str(self._command_args[0]).lower() in [
                 "fleagues",
                 "fl",
                 "favourite_leagues",
             ]:
-                self._leagues = self._fixtures_db_manager.get_favourite_leagues(
+                self._leagues = self._fixtures_db_manager.get_user_preferences(
                     self._chat_id
-                )
+                ).favourite_leagues
             else:
                 self._leagues = self._command_args
         else:
@@ -74,10 +79,9 @@ class SurroundingMatchesHandler(NotifierBotCommandsHandler):
         )
 
         if len(today_games_fixtures):
-            converted_games = [
-                convert_db_fixture(fixture, self._user_time_zones)
-                for fixture in today_games_fixtures
-            ]
+            converted_games = convert_db_fixtures(
+                today_games_fixtures, self._user_time_zones
+            )
             texts = self.get_fixtures_text(converted_games)
             leagues = [fixture.championship for fixture in converted_games]
             photo = random.choice([league.logo for league in leagues])
@@ -103,10 +107,9 @@ class SurroundingMatchesHandler(NotifierBotCommandsHandler):
         )
 
         if len(played_games_fixtures):
-            converted_fixtures = [
-                convert_db_fixture(fixture, self._user_time_zones)
-                for fixture in played_games_fixtures
-            ]
+            converted_fixtures = convert_db_fixtures(
+                played_games_fixtures, self._user_time_zones
+            )
             texts = self.get_fixtures_text(converted_fixtures, played=True)
             leagues = [fixture.championship for fixture in converted_fixtures]
             photo = random.choice([league.logo for league in leagues])
@@ -132,10 +135,9 @@ class SurroundingMatchesHandler(NotifierBotCommandsHandler):
         )
 
         if len(tomorrow_games_fixtures):
-            converted_fixtures = [
-                convert_db_fixture(fixture, self._user_time_zones)
-                for fixture in tomorrow_games_fixtures
-            ]
+            converted_fixtures = convert_db_fixtures(
+                tomorrow_games_fixtures, self._user_time_zones
+            )
             texts = self.get_fixtures_text(converted_fixtures)
             leagues = [fixture.championship for fixture in converted_fixtures]
             photo = random.choice([league.logo for league in leagues])
@@ -288,7 +290,7 @@ class NextAndLastMatchCommandHandler(NotifierBotCommandsHandler):
         team_id = self._command_args[0]
         team = self._fixtures_db_manager.get_team(team_id)[0]
 
-        next_team_db_fixture = self._fixtures_db_manager.get_next_fixture(
+        next_team_db_fixture = FIXTURE_STORE.get_next_fixture(
             team_id=team_id, exclude_statuses=self._exclude_statuses
         )
 
@@ -318,7 +320,7 @@ class NextAndLastMatchCommandHandler(NotifierBotCommandsHandler):
         team_id = self._command_args[0]
         team = self._fixtures_db_manager.get_team(team_id)[0]
 
-        last_team_db_fixture = self._fixtures_db_manager.get_last_fixture(
+        last_team_db_fixture = FIXTURE_STORE.get_last_fixture(
             team_id=team_id, exclude_statuses=self._exclude_statuses
         )
 
@@ -345,7 +347,7 @@ class NextAndLastMatchCommandHandler(NotifierBotCommandsHandler):
         team_id = self._command_args[0]
 
         if self._team:
-            upcoming_fixtures = self._fixtures_db_manager.get_next_fixture(
+            upcoming_fixtures = FIXTURE_STORE.get_next_fixture(
                 team_id=team_id,
                 number_of_fixtures=5,
                 exclude_statuses=self._exclude_statuses,
@@ -353,13 +355,13 @@ class NextAndLastMatchCommandHandler(NotifierBotCommandsHandler):
         elif self._favourite_teams:
             upcoming_fixtures = []
             for fav_team in self._favourite_teams:
-                upcoming_fixtures += self._fixtures_db_manager.get_next_fixture(
+                upcoming_fixtures += FIXTURE_STORE.get_next_fixture(
                     team_id=fav_team, exclude_statuses=self._exclude_statuses
                 )
         else:
             upcoming_fixtures = []
             for fav_league in self._favourite_leagues:
-                upcoming_fixtures += self._fixtures_db_manager.get_next_fixture(
+                upcoming_fixtures += FIXTURE_STORE.get_next_fixture(
                     league_id=fav_league, exclude_statuses=self._exclude_statuses
                 )
 
@@ -370,9 +372,7 @@ class NextAndLastMatchCommandHandler(NotifierBotCommandsHandler):
 
             fixtures = remove_duplicate_fixtures(upcoming_fixtures)
 
-            converted_fixtures = [
-                convert_db_fixture(fixture, user_time_zones) for fixture in fixtures
-            ]
+            converted_fixtures = convert_db_fixtures(fixtures, user_time_zones)
 
             converted_fixtures.sort(key=lambda fixture: fixture.bsas_date)
             texts = self.get_fixtures_text(converted_fixtures, with_date=True)
@@ -411,7 +411,7 @@ class NextAndLastMatchCommandHandler(NotifierBotCommandsHandler):
                 "",
             )
 
-        last_team_fixtures = self._fixtures_db_manager.get_last_fixture(
+        last_team_fixtures = FIXTURE_STORE.get_last_fixture(
             team_id=team_id,
             number_of_fixtures=5,
             exclude_statuses=self._exclude_statuses,
@@ -421,10 +421,9 @@ class NextAndLastMatchCommandHandler(NotifierBotCommandsHandler):
             user_time_zones = self._fixtures_db_manager.get_user_time_zones(
                 self._chat_id
             )
-            converted_fixtures = [
-                convert_db_fixture(fixture, user_time_zones)
-                for fixture in last_team_fixtures
-            ]
+            converted_fixtures = convert_db_fixtures(
+                last_team_fixtures, user_time_zones
+            )
             introductory_text = self.text_to_user_language(
                 f"{Emojis.WAVING_HAND.value} Hi {self._user}, "
                 f"the last matches of {team.name} were:"
@@ -465,9 +464,9 @@ class NextAndLastMatchLeagueCommandHandler(NotifierBotCommandsHandler):
         self._command_args = commands_args
         self._user = user
         self._chat_id = chat_id
-        self._user_time_zones = self._fixtures_db_manager.get_user_time_zones(
+        self._user_time_zones = self._fixtures_db_manager.get_user_preferences(
             self._chat_id
-        )
+        ).user_time_zones
 
     def validate_command_input(self) -> str:
         response = ""
@@ -498,7 +497,7 @@ class NextAndLastMatchLeagueCommandHandler(NotifierBotCommandsHandler):
         except IndexError:
             return ("No league was found for the given id.", "")
 
-        next_league_db_fixture = self._fixtures_db_manager.get_next_fixture(
+        next_league_db_fixture = FIXTURE_STORE.get_next_fixture(
             league_id=league.id, exclude_statuses=EXCLUDE_STATUS_FOR_UPCOMING_MATCHES
         )
 
@@ -531,7 +530,7 @@ class NextAndLastMatchLeagueCommandHandler(NotifierBotCommandsHandler):
         except IndexError:
             return ("No league was found for the given id.", "")
 
-        last_league_db_fixture = self._fixtures_db_manager.get_last_fixture(
+        last_league_db_fixture = FIXTURE_STORE.get_last_fixture(
             league_id=league.id,
             exclude_statuses=EXCLUDE_STATUS_FOR_UPCOMING_MATCHES,
         )
@@ -558,17 +557,16 @@ class NextAndLastMatchLeagueCommandHandler(NotifierBotCommandsHandler):
         league_id = self._command_args[0]
         league = self._fixtures_db_manager.get_league(league_id)[0]
 
-        next_league_db_fixtures = self._fixtures_db_manager.get_next_fixture(
+        next_league_db_fixtures = FIXTURE_STORE.get_next_fixture(
             league_id=league.id,
             number_of_fixtures=5,
             exclude_statuses=EXCLUDE_STATUS_FOR_UPCOMING_MATCHES,
         )
 
         if len(next_league_db_fixtures):
-            converted_fixtures = [
-                convert_db_fixture(fixture, user_time_zones=self._user_time_zones)
-                for fixture in next_league_db_fixtures
-            ]
+            converted_fixtures = convert_db_fixtures(
+                next_league_db_fixtures, user_time_zones=self._user_time_zones
+            )
 
             match_date = (
                 "TODAY!"
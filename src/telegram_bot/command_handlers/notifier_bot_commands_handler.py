@@ -1,6 +1,4 @@
-from typing import Any, List, Optional
-
-from deep_translator import GoogleTranslator
+from typing import Any, List
 
 from src.db.fixtures_db_manager import FixturesDBManager
 from src.db.notif_sql_models import ConfigLanguage as DBConfigLanguage
@@ -8,8 +6,15 @@ from src.db.notif_sql_models import Fixture
 from src.db.notif_sql_models import Language as DBLanguage
 from src.db.notif_sql_models import League as DBLeague
 from src.db.notif_sql_models import Team as DBTeam
-from src.notifier_constants import ENGLISH_LANG_ID, TELEGRAM_MSG_LENGTH_LIMIT
+from src.db.notif_sql_models import TimeZone as DBTimeZone
+from src.notifier_constants import (
+    ENGLISH_LANG_ID,
+    SEARCH_RESULTS_LIMIT,
+    TELEGRAM_MSG_LENGTH_LIMIT,
+)
 from src.notifier_logger import get_logger
+from src.utils.message_utils import translate_segment
+from src.utils.search_index import CATALOG_SEARCH
 
 logger = get_logger(__name__)
 
@@ -21,42 +26,44 @@ class NotifierBotCommandsHandler:
         self._language: DBLanguage = self.get_user_language(self._chat_id)
 
     def get_user_language(self, chat_id: str) -> DBLanguage:
-        try:
-            config_language: DBConfigLanguage = (
-                self._fixtures_db_manager.get_config_language(str(chat_id))[0]
-            )
-        except IndexError:
+        language = self._fixtures_db_manager.get_user_preferences(chat_id).language
+
+        if language is None:
             self._fixtures_db_manager.insert_or_update_user_config_language(
-                lang_id=ENGLISH_LANG_ID, chat_id=self._chat_id
+                lang_id=ENGLISH_LANG_ID, chat_id=str(chat_id)
             )
-            config_language = self._fixtures_db_manager.get_config_language(
-                str(chat_id)
-            )[0]
-
-        return self._fixtures_db_manager.get_language_by_id(config_language.lang_id)[0]
-
-    def search_team(self, team_text: str) -> Optional[DBTeam]:
-        teams = self._fixtures_db_manager.get_teams_by_name(team_text)
-        if len(teams):
-            for team in teams:
-                team.country = (
-                    self._fixtures_db_manager.get_country(team.country)[0].name
-                    if team.country
-                    else ""
-                )
-        return teams
-
-    def search_league(self, league_text: str) -> Optional[DBLeague]:
-        return self._fixtures_db_manager.get_leagues_by_name(league_text)
-
-    def search_leagues_by_country(self, country_text: str) -> Optional[DBLeague]:
-        return self._fixtures_db_manager.get_leagues_by_country(country_text)
-
-    def search_time_zone(self, time_zone_text: str) -> Optional[DBTeam]:
-        return self._fixtures_db_manager.get_time_zones_by_name(time_zone_text)
-
-    def search_language(self, language_text: str) -> Optional[DBLanguage]:
-        return self._fixtures_db_manager.get_languages_by_name(language_text)
+            language = self._fixtures_db_manager.get_user_preferences(chat_id).language
+
+        return language
+
+    def search_team(
+        self, team_text: str, limit: int = SEARCH_RESULTS_LIMIT
+    ) -> List[DBTeam]:
+        """
+        Best ranked teams matching the text, with their country name instead of
+        its id.
+        """
+        return CATALOG_SEARCH.search_teams(team_text, limit)
+
+    def search_league(
+        self, league_text: str, limit: int = SEARCH_RESULTS_LIMIT
+    ) -> List[DBLeague]:
+        return CATALOG_SEARCH.search_leagues(league_text, limit)
+
+    def search_leagues_by_country(
+        self, country_text: str, limit: int = SEARCH_RESULTS_LIMIT
+    ) -> List[DBLeague]:
+        return CATALOG_SEARCH.search_leagues_by_country(country_text, limit)
+
+    def search_time_zone(
+        self, time_zone_text: str, limit: int = SEARCH_RESULTS_LIMIT
+    ) -> List[DBTimeZone]:
+        return CATALOG_SEARCH.search_time_zones(time_zone_text, limit)
+
+    def search_language(
+        self, language_text: str, limit: int = SEARCH_RESULTS_LIMIT
+    ) -> List[DBLanguage]:
+        return CATALOG_SEARCH.search_languages(language_text, limit)
 
     def is_available_team(self, team_id: int) -> bool:
         team = self._fixtures_db_manager.get_team(team_id)
@@ -139,10 +146,7 @@ class NotifierBotCommandsHandler:
         ]
 
     def text_to_user_language(self, text: str) -> str:
-        google_translator = GoogleTranslator(
-            source="en", target=self._language.short_name
-        )
-        return google_translator.translate(text)
+        return translate_segment(text, self._language.short_name)
 
     def is_valid_id(self, id: Any) -> bool:
         try:
@@ -152,19 +156,8 @@ class NotifierBotCommandsHandler:
             return False
 
     def get_user_main_time_zone(self) -> str:
-        time_zones = self._fixtures_db_manager.get_user_time_zones(self._chat_id)
-        main_time_zone = ""
-
-        if len(time_zones):
-            main_time_zone = [
-                time_zone for time_zone in time_zones if time_zone.is_main_tz
-            ]
-
-            if len(main_time_zone):
-                main_time_zone = main_time_zone[0]
-
-        return (
-            self._fixtures_db_manager.get_time_zone(main_time_zone.time_zone)[0].name
-            if main_time_zone
-            else "UTC"
-        )
+        main_time_zone = self._fixtures_db_manager.get_user_preferences(
+            self._chat_id
+        ).main_time_zone
+
+        return main_time_zone.name if main_time_zone else "UTC"
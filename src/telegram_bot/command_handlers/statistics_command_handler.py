@@ -4,7 +4,7 @@ from src.db.notif_sql_models import Team
 from src.emojis import Emojis
 from src.entities import Fixture
 from src.statistics.team_stats import TeamStats
-from src.telegram_bot.command_handlers.bot_commands_handler import (
+from src.telegram_bot.command_handlers.notifier_bot_commands_handler import (
     NotifierBotCommandsHandler,
 )
 from src.utils.fixtures_utils import convert_db_fixture, get_head_to_heads
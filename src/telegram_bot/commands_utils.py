@@ -1,37 +1,86 @@
+import asyncio
+import contextvars
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, TypeVar
+
 from telegram import Update
 
+from src.notifier_constants import BOT_COMMAND_TIMEOUT, BOT_COMMANDS_MAX_WORKERS
 from src.notifier_logger import get_logger
 from src.telegram_bot.command_handlers.bot_commands_handler import (
     NotifierBotCommandsHandler,
 )
+from src.utils.deadline_utils import deadline, time_left
 from src.utils.message_utils import translate_text
 
 logger = get_logger(__name__)
 
+T = TypeVar("T")
 
-async def reply_text(update: Update, text, **kwargs) -> None:
-    chat_id = update.effective_chat.id
-    command_handler = NotifierBotCommandsHandler(update.effective_chat.id)
-    user_language = command_handler.get_user_language(str(chat_id)).short_name
-    text_to_send = (
+# Command handlers, database managers and translations are synchronous, so they
+# run on this bounded pool to keep the event loop serving other users.
+COMMANDS_EXECUTOR = ThreadPoolExecutor(
+    max_workers=BOT_COMMANDS_MAX_WORKERS, thread_name_prefix="bot_command"
+)
+
+
+async def run_command(
+    function: Callable[..., T],
+    *args: Any,
+    timeout: float = BOT_COMMAND_TIMEOUT,
+    **kwargs: Any,
+) -> T:
+    """
+    Runs the blocking function in the commands executor, raising TimeoutError if it
+    takes longer than timeout seconds, or than the time left to the deadline of the
+    update being processed. The function sees that deadline too, so the clients it
+    uses stop once nobody waits for its result.
+    """
+    loop = asyncio.get_running_loop()
+
+    with deadline(timeout):
+        if not time_left():
+            raise TimeoutError("Command deadline exceeded")
+
+        context = contextvars.copy_context()
+
+        return await asyncio.wait_for(
+            loop.run_in_executor(
+                COMMANDS_EXECUTOR,
+                functools.partial(context.run, function, *args, **kwargs),
+            ),
+            timeout=time_left(),
+        )
+
+
+def get_user_language(chat_id: str) -> str:
+    return (
+        NotifierBotCommandsHandler(chat_id).get_user_language(str(chat_id)).short_name
+    )
+
+
+def get_text_to_send(chat_id: str, text: str, translate: bool = True) -> str:
+    user_language = get_user_language(chat_id)
+
+    return (
         translate_text(text=text, target_lang=user_language)
-        if user_language != "en"
+        if user_language != "en" and translate is True
         else text.replace("<not_translate>", "").replace("</not_translate>", "")
     )
 
+
+async def reply_text(update: Update, text, **kwargs) -> None:
+    text_to_send = await run_command(get_text_to_send, update.effective_chat.id, text)
+
     await update.message.reply_text(text_to_send, parse_mode="HTML", **kwargs)
 
 
 async def send_message(
     update: Update, context, text: str, translate: bool = True, **kwargs
 ) -> None:
-    chat_id = update.effective_chat.id
-    command_handler = NotifierBotCommandsHandler(update.effective_chat.id)
-    user_language = command_handler.get_user_language(str(chat_id)).short_name
-    text_to_send = (
-        translate_text(text=text, target_lang=user_language)
-        if user_language != "en" and translate is True
-        else text.replace("<not_translate>", "").replace("</not_translate>", "")
+    text_to_send = await run_command(
+        get_text_to_send, update.effective_chat.id, text, translate
     )
 
     logger.info(f"Text to send\n\n {text_to_send}")
@@ -44,13 +93,8 @@ async def send_message(
 async def send_photo(
     update: Update, context, photo: str, caption: str, **kwargs
 ) -> None:
-    chat_id = update.effective_chat.id
-    command_handler = NotifierBotCommandsHandler(update.effective_chat.id)
-    user_language = command_handler.get_user_language(str(chat_id)).short_name
-    text_to_send = (
-        translate_text(text=caption, target_lang=user_language)
-        if user_language != "en"
-        else caption.replace("<not_translate>", "").replace("</not_translate>", "")
+    text_to_send = await run_command(
+        get_text_to_send, update.effective_chat.id, caption
     )
 
     await context.bot.send_photo(
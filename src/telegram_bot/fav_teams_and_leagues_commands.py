@@ -20,7 +20,7 @@ from src.telegram_bot.command_handlers.bot_commands_handler import (
     NotifierBotCommandsHandler,
     SearchCommandHandler,
 )
-from src.telegram_bot.commands_utils import reply_text, send_message
+from src.telegram_bot.commands_utils import reply_text, run_command, send_message
 from src.telegram_bot.matches_commands import (
     last_match_handler,
     last_match_league_handler,
@@ -49,37 +49,39 @@ async def add_favourite_team(update: Update, context):
 
 
 async def add_favourite_team_handler(update: Update, context):
-    commands_handler = FavouriteTeamsCommandHandler(
+    commands_handler = await run_command(
+        FavouriteTeamsCommandHandler,
         [context.user_data["team_id"]],
         update.effective_user.first_name,
         str(update.effective_chat.id),
     )
 
-    validated_input = commands_handler.validate_command_input()
+    validated_input = await run_command(commands_handler.validate_command_input)
 
     if validated_input:
         await send_message(update, context, validated_input)
     else:
-        text = commands_handler.add_favourite_team()
+        text = await run_command(commands_handler.add_favourite_team)
 
         await send_message(update, context, text)
 
 
 async def favourite_teams(update: Update, context):
     logger.info(f"'favourite_teams' command executed - by {update.effective_user.name}")
-    commands_handler = FavouriteTeamsCommandHandler(
+    commands_handler = await run_command(
+        FavouriteTeamsCommandHandler,
         context.args,
         update.effective_user.first_name,
         str(update.effective_chat.id),
         is_list=True,
     )
 
-    validated_input = commands_handler.validate_command_input()
+    validated_input = await run_command(commands_handler.validate_command_input)
 
     if validated_input:
         await send_message(update, context, validated_input)
     else:
-        text = commands_handler.get_favourite_teams_response()
+        text = await run_command(commands_handler.get_favourite_teams_response)
         await send_message(update, context, text)
 
 
@@ -87,21 +89,24 @@ async def delete_favourite_team(update: Update, context):
     logger.info(
         f"'delete_favourite_team' command executed - by {update.effective_user.name}"
     )
-    commands_handler = FavouriteTeamsCommandHandler(
-        context.args, update.effective_user.first_name, str(update.effective_chat.id)
+    commands_handler = await run_command(
+        FavouriteTeamsCommandHandler,
+        context.args,
+        update.effective_user.first_name,
+        str(update.effective_chat.id),
     )
 
     if not len(context.args):
         await own_favourite_teams_inline_keyboard(
-            update, context, commands_handler.get_favourite_teams()
+            update, context, await run_command(commands_handler.get_favourite_teams)
         )
     else:
-        validated_input = commands_handler.validate_command_input()
+        validated_input = await run_command(commands_handler.validate_command_input)
 
         if validated_input:
             await send_message(update, context, validated_input)
         else:
-            text = commands_handler.delete_favourite_team()
+            text = await run_command(commands_handler.delete_favourite_team)
 
             await send_message(update, context, text)
 
@@ -221,18 +226,19 @@ async def add_favourite_league(update: Update, context):
 
 
 async def add_favourite_league_handler(update: Update, context):
-    commands_handler = FavouriteLeaguesCommandHandler(
+    commands_handler = await run_command(
+        FavouriteLeaguesCommandHandler,
         [context.user_data["league_id"]],
         update.effective_user.first_name,
         str(update.effective_chat.id),
     )
 
-    validated_input = commands_handler.validate_command_input()
+    validated_input = await run_command(commands_handler.validate_command_input)
 
     if validated_input:
         await send_message(update, context, validated_input)
     else:
-        text = commands_handler.add_favourite_league()
+        text = await run_command(commands_handler.add_favourite_league)
         await send_message(update, context, text)
 
 
@@ -240,21 +246,24 @@ async def delete_favourite_league(update: Update, context):
     logger.info(
         f"'delete_favourite_league' command executed - by {update.effective_user.name}"
     )
-    commands_handler = FavouriteLeaguesCommandHandler(
-        context.args, update.effective_user.first_name, str(update.effective_chat.id)
+    commands_handler = await run_command(
+        FavouriteLeaguesCommandHandler,
+        context.args,
+        update.effective_user.first_name,
+        str(update.effective_chat.id),
     )
 
     if not len(context.args):
         await own_favourite_leagues_inline_keyboard(
-            update, context, commands_handler.get_favourite_leagues()
+            update, context, await run_command(commands_handler.get_favourite_leagues)
         )
     else:
-        validated_input = commands_handler.validate_command_input()
+        validated_input = await run_command(commands_handler.validate_command_input)
 
         if validated_input:
             await send_message(update, context, validated_input)
         else:
-            text = commands_handler.delete_favourite_league()
+            text = await run_command(commands_handler.delete_favourite_league)
             await send_message(update, context, text)
 
 
@@ -262,19 +271,20 @@ async def favourite_leagues(update: Update, context):
     logger.info(
         f"'favourite_leagues' command executed - by {update.effective_user.name}"
     )
-    commands_handler = FavouriteLeaguesCommandHandler(
+    commands_handler = await run_command(
+        FavouriteLeaguesCommandHandler,
         context.args,
         update.effective_user.first_name,
         str(update.effective_chat.id),
         is_list=True,
     )
 
-    validated_input = commands_handler.validate_command_input()
+    validated_input = await run_command(commands_handler.validate_command_input)
 
     if validated_input:
         await send_message(update, context, validated_input)
     else:
-        text = commands_handler.get_favourite_leagues_response()
+        text = await run_command(commands_handler.get_favourite_leagues_response)
         await send_message(update, context, text)
 
 
@@ -282,8 +292,8 @@ async def available_leagues(update: Update, context):
     logger.info(
         f"'available_leagues' command executed - by {update.effective_user.name}"
     )
-    notifier_commands_handler = NotifierBotCommandsHandler()
-    texts = notifier_commands_handler.available_leagues_texts()
+    notifier_commands_handler = await run_command(NotifierBotCommandsHandler)
+    texts = await run_command(notifier_commands_handler.available_leagues_texts)
 
     intrductory_text = (
         f"{Emojis.WAVING_HAND.value}Hi {update.effective_user.first_name}!\n\n"
@@ -308,15 +318,15 @@ async def search_team(update: Update, context):
 
 
 async def search_team_handler(update, context):
-    command_handler = SearchCommandHandler(
-        [update.message.text], update.effective_user.first_name
+    command_handler = await run_command(
+        SearchCommandHandler, [update.message.text], update.effective_user.first_name
     )
-    validated_input = command_handler.validate_command_input()
+    validated_input = await run_command(command_handler.validate_command_input)
 
     if validated_input:
         await send_message(update, context, validated_input)
     else:
-        teams = command_handler.search_team(update.message.text)
+        teams = await run_command(command_handler.search_team, update.message.text)
 
         page = 0
         pages = len(teams) // TEAMS_PAGE_SIZE + (
@@ -500,15 +510,15 @@ async def search_league(update: Update, context):
 
 
 async def search_league_handler(update, context):
-    command_handler = SearchCommandHandler(
-        [update.message.text], update.effective_user.first_name
+    command_handler = await run_command(
+        SearchCommandHandler, [update.message.text], update.effective_user.first_name
     )
-    validated_input = command_handler.validate_command_input()
+    validated_input = await run_command(command_handler.validate_command_input)
 
     if validated_input:
         await send_message(update, context, validated_input)
     else:
-        leagues = command_handler.search_league(update.message.text)
+        leagues = await run_command(command_handler.search_league, update.message.text)
 
         page = 0
         pages = len(leagues) // TEAMS_PAGE_SIZE + (
@@ -534,14 +544,14 @@ async def search_leagues_by_country(update: Update, context):
 
 
 async def search_leagues_by_country_handler(update: Update, context):
-    command_handler = SearchCommandHandler(
-        [update.message.text], update.effective_user.first_name
+    command_handler = await run_command(
+        SearchCommandHandler, [update.message.text], update.effective_user.first_name
     )
-    validated_input = command_handler.validate_command_input()
+    validated_input = await run_command(command_handler.validate_command_input)
 
     if validated_input:
         await send_message(update, context, validated_input)
     else:
-        text = command_handler.search_leagues_by_country_notif()
+        text = await run_command(command_handler.search_leagues_by_country_notif)
         logger.info(f"Search Leagues by Country - text: {text}")
         await send_message(update, context, text)
@@ -11,7 +11,7 @@ from src.notifier_logger import get_logger
 from src.telegram_bot.command_handlers.bot_commands_handler import (
     LanguagesCommandHandler,
 )
-from src.telegram_bot.commands_utils import reply_text, send_message
+from src.telegram_bot.commands_utils import reply_text, run_command, send_message
 
 logger = get_logger(__name__)
 
@@ -96,23 +96,28 @@ async def search_languages_callback_handler(update: Update, context) -> None:
 
 
 async def set_language_handler(update: Update, context):
-    commands_handler = LanguagesCommandHandler(
+    commands_handler = await run_command(
+        LanguagesCommandHandler,
         update.effective_user.first_name,
         str(update.effective_chat.id),
     )
 
-    text = commands_handler.set_language(context.user_data["lang_id"])
+    text = await run_command(
+        commands_handler.set_language, context.user_data["lang_id"]
+    )
 
     await send_message(update, context, text)
 
 
 async def my_language(update: Update, context):
     logger.info(f"'my_language' command executed - by {update.effective_user.name}")
-    commands_handler = LanguagesCommandHandler(
-        update.effective_user.first_name, str(update.effective_chat.id)
+    commands_handler = await run_command(
+        LanguagesCommandHandler,
+        update.effective_user.first_name,
+        str(update.effective_chat.id),
     )
 
-    text = commands_handler.get_config_language()
+    text = await run_command(commands_handler.get_config_language)
 
     await context.bot.send_message(
         chat_id=update.effective_chat.id, text=text, parse_mode="HTML"
@@ -123,11 +128,11 @@ async def search_language_handler(update: Update, context):
     logger.info(
         f"'search_language {update.message.text}' command executed - by {update.effective_user.name}"
     )
-    command_handler = LanguagesCommandHandler(
-        [update.message.text], update.effective_user.first_name
+    command_handler = await run_command(
+        LanguagesCommandHandler, [update.message.text], update.effective_user.first_name
     )
 
-    languages = command_handler.search_language(update.message.text)
+    languages = await run_command(command_handler.search_language, update.message.text)
 
     page = 0
     pages = len(languages) // LANGUAGES_PAGE_SIZE + (
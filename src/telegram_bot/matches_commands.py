@@ -16,7 +16,12 @@ from src.telegram_bot.command_handlers.bot_commands_handler import (
     NextAndLastMatchLeagueCommandHandler,
     SurroundingMatchesHandler,
 )
-from src.telegram_bot.commands_utils import reply_text, send_message, send_photo
+from src.telegram_bot.commands_utils import (
+    reply_text,
+    run_command,
+    send_message,
+    send_photo,
+)
 
 logger = get_logger(__name__)
 
@@ -37,18 +42,21 @@ async def next_match_handler(update: Update, context):
     logger.info(
         f"'next_match {context.user_data['team_id']}' command executed - by {update.effective_user.name}"
     )
-    command_handler = NextAndLastMatchCommandHandler(
+    command_handler = await run_command(
+        NextAndLastMatchCommandHandler,
         [context.user_data["team_id"]],
         update.effective_user.first_name,
         str(update.effective_chat.id),
     )
 
-    validated_input = command_handler.validate_command_input()
+    validated_input = await run_command(command_handler.validate_command_input)
 
     if validated_input:
         await send_message(update, context, validated_input)
     else:
-        text, photo, fixture_id = command_handler.next_match_team_notif()
+        text, photo, fixture_id = await run_command(
+            command_handler.next_match_team_notif
+        )
         logger.info(f"Fixture - text: {text} - photo: {photo}")
         keyboard = [
             [
@@ -86,17 +94,20 @@ async def last_match_handler(update: Update, context):
     logger.info(
         f"'last_match {context.user_data['team_id']}' command executed - by {update.effective_user.first_name}"
     )
-    command_handler = NextAndLastMatchCommandHandler(
+    command_handler = await run_command(
+        NextAndLastMatchCommandHandler,
         [context.user_data["team_id"]],
         update.effective_user.first_name,
         str(update.effective_chat.id),
     )
-    validated_input = command_handler.validate_command_input()
+    validated_input = await run_command(command_handler.validate_command_input)
 
     if validated_input:
         await send_message(update, context, validated_input)
     else:
-        text, photo, fixture_id = command_handler.last_match_team_notif()
+        text, photo, fixture_id = await run_command(
+            command_handler.last_match_team_notif
+        )
         logger.info(f"Fixture - text: {text} - photo: {photo}")
         keyboard = [
             [
@@ -141,18 +152,19 @@ async def next_match_league_handler(update: Update, context):
     logger.info(
         f"'next_match_league {context.user_data['league_id']}' command executed - by {update.effective_user.name}"
     )
-    command_handler = NextAndLastMatchLeagueCommandHandler(
+    command_handler = await run_command(
+        NextAndLastMatchLeagueCommandHandler,
         [context.user_data["league_id"]],
         update.effective_user.first_name,
         update.effective_chat.id,
     )
 
-    validated_input = command_handler.validate_command_input()
+    validated_input = await run_command(command_handler.validate_command_input)
 
     if validated_input:
         await send_message(update, context, validated_input)
     else:
-        text, photo = command_handler.next_match_league_notif()
+        text, photo = await run_command(command_handler.next_match_league_notif)
         logger.info(f"Fixture - text: {text} - photo: {photo}")
         if photo:
             await send_photo(
@@ -183,18 +195,19 @@ async def next_matches_league_handler(update: Update, context):
     logger.info(
         f"'next_matches_league {context.user_data['league_id']}' command executed - by {update.effective_user.name}"
     )
-    command_handler = NextAndLastMatchLeagueCommandHandler(
+    command_handler = await run_command(
+        NextAndLastMatchLeagueCommandHandler,
         [context.user_data["league_id"]],
         update.effective_user.first_name,
         update.effective_chat.id,
     )
 
-    validated_input = command_handler.validate_command_input()
+    validated_input = await run_command(command_handler.validate_command_input)
 
     if validated_input:
         await send_message(update, context, validated_input)
     else:
-        texts = command_handler.next_matches_league_notif()
+        texts = await run_command(command_handler.next_matches_league_notif)
         logger.info(f"Fixture - texts: {texts}")
         for text in texts:
             await send_message(update, context, text)
@@ -218,19 +231,20 @@ async def last_match_league_handler(update: Update, context):
     logger.info(
         f"'last_match_league {context.user_data['league_id']}' command executed - by {update.effective_user.first_name}"
     )
-    command_handler = NextAndLastMatchLeagueCommandHandler(
+    command_handler = await run_command(
+        NextAndLastMatchLeagueCommandHandler,
         [context.user_data["league_id"]],
         update.effective_user.first_name,
         update.effective_chat.id,
     )
-    validated_input = command_handler.validate_command_input()
+    validated_input = await run_command(command_handler.validate_command_input)
 
     if validated_input:
         await context.bot.send_message(
             chat_id=update.effective_chat.id, text=validated_input
         )
     else:
-        text, photo = command_handler.last_match_league_notif()
+        text, photo = await run_command(command_handler.last_match_league_notif)
         logger.info(f"Fixture - text: {text} - photo: {photo}")
 
         if photo:
@@ -281,12 +295,15 @@ async def timeline(update: Update, context):
     logger.info(
         f"/timeline {' '.join(context.args)}' command executed - by {update.effective_user.name}"
     )
-    command_handler = NextAndLastMatchCommandHandler(
-        context.args, update.effective_user.first_name, str(update.effective_chat.id)
+    command_handler = await run_command(
+        NextAndLastMatchCommandHandler,
+        context.args,
+        update.effective_user.first_name,
+        str(update.effective_chat.id),
     )
 
     fixture_id = context.args[0]
-    timeline_text = command_handler.timeline(fixture_id)
+    timeline_text = await run_command(command_handler.timeline, fixture_id)
     text = (
         timeline_text
         if timeline_text
@@ -299,12 +316,15 @@ async def line_ups(update: Update, context):
     logger.info(
         f"/lineups {' '.join(context.args)}' command executed - by {update.effective_user.name}"
     )
-    command_handler = NextAndLastMatchCommandHandler(
-        context.args, update.effective_user.first_name, str(update.effective_chat.id)
+    command_handler = await run_command(
+        NextAndLastMatchCommandHandler,
+        context.args,
+        update.effective_user.first_name,
+        str(update.effective_chat.id),
     )
 
     fixture_id = context.args[0]
-    line_ups_text = command_handler.line_ups(fixture_id)
+    line_ups_text = await run_command(command_handler.line_ups, fixture_id)
     text = (
         line_ups_text
         if line_ups_text
@@ -383,8 +403,11 @@ async def today_matches(update: Update, context):
     logger.info(
         f"/today_matches {' '.join(context.args)}' command executed - by {update.effective_user.name}"
     )
-    command_handler = SurroundingMatchesHandler(
-        context.args, update.effective_user.first_name, str(update.effective_chat.id)
+    command_handler = await run_command(
+        SurroundingMatchesHandler,
+        context.args,
+        update.effective_user.first_name,
+        str(update.effective_chat.id),
     )
 
     if not len(context.args):
@@ -392,12 +415,12 @@ async def today_matches(update: Update, context):
             update, context, "today_matches"
         )
     else:
-        validated_input = command_handler.validate_command_input()
+        validated_input = await run_command(command_handler.validate_command_input)
 
         if validated_input:
             await send_message(update, context, validated_input)
         else:
-            texts, photo = command_handler.today_games()
+            texts, photo = await run_command(command_handler.today_games)
 
             for text in texts:
                 await send_message(update, context, text)
@@ -407,8 +430,11 @@ async def upcoming_matches(update: Update, context):
     logger.info(
         f"'upcoming_matches {' '.join(context.args)}' command executed - by {update.effective_user.name}"
     )
-    command_handler = NextAndLastMatchCommandHandler(
-        context.args, update.effective_user.first_name, str(update.effective_chat.id)
+    command_handler = await run_command(
+        NextAndLastMatchCommandHandler,
+        context.args,
+        update.effective_user.first_name,
+        str(update.effective_chat.id),
     )
 
     if not len(context.args):
@@ -416,12 +442,12 @@ async def upcoming_matches(update: Update, context):
             update, context, "upcoming_matches"
         )
     else:
-        validated_input = command_handler.validate_command_input()
+        validated_input = await run_command(command_handler.validate_command_input)
 
         if validated_input:
             await send_message(update, context, validated_input)
         else:
-            texts, photo = command_handler.upcoming_matches()
+            texts, photo = await run_command(command_handler.upcoming_matches)
 
             for text in texts:
                 await send_message(update, context, text)
@@ -444,18 +470,19 @@ async def last_matches_handler(update: Update, context):
     logger.info(
         f"'last_matches {context.user_data['team_id']}' command executed - by {update.effective_user.name}"
     )
-    command_handler = NextAndLastMatchCommandHandler(
+    command_handler = await run_command(
+        NextAndLastMatchCommandHandler,
         [context.user_data["team_id"]],
         update.effective_user.first_name,
         str(update.effective_chat.id),
     )
 
-    validated_input = command_handler.validate_command_input()
+    validated_input = await run_command(command_handler.validate_command_input)
 
     if validated_input:
         await send_message(update, context, validated_input)
     else:
-        texts, photo = command_handler.last_matches()
+        texts, photo = await run_command(command_handler.last_matches)
 
         for text in texts:
             await send_message(update, context, text)
@@ -465,8 +492,11 @@ async def yesterday_matches(update: Update, context):
     logger.info(
         f"'yesterday_matches {' '.join(context.args)}' command executed - by {update.effective_user.name}"
     )
-    command_handler = SurroundingMatchesHandler(
-        context.args, update.effective_user.first_name, str(update.effective_chat.id)
+    command_handler = await run_command(
+        SurroundingMatchesHandler,
+        context.args,
+        update.effective_user.first_name,
+        str(update.effective_chat.id),
     )
 
     if not len(context.args):
@@ -474,12 +504,12 @@ async def yesterday_matches(update: Update, context):
             update, context, "yesterday_matches"
         )
     else:
-        validated_input = command_handler.validate_command_input()
+        validated_input = await run_command(command_handler.validate_command_input)
 
         if validated_input:
             await send_message(update, context, validated_input)
         else:
-            texts, photo = command_handler.yesterday_games()
+            texts, photo = await run_command(command_handler.yesterday_games)
 
             for text in texts:
                 await send_message(update, context, text)
@@ -489,8 +519,11 @@ async def tomorrow_matches(update: Update, context):
     logger.info(
         f"'tomorrow_matches {' '.join(context.args)}' command executed - by {update.effective_user.name}"
     )
-    command_handler = SurroundingMatchesHandler(
-        context.args, update.effective_user.first_name, str(update.effective_chat.id)
+    command_handler = await run_command(
+        SurroundingMatchesHandler,
+        context.args,
+        update.effective_user.first_name,
+        str(update.effective_chat.id),
     )
 
     if not len(context.args):
@@ -498,12 +531,12 @@ async def tomorrow_matches(update: Update, context):
             update, context, "tomorrow_matches"
         )
     else:
-        validated_input = command_handler.validate_command_input()
+        validated_input = await run_command(command_handler.validate_command_input)
 
         if validated_input:
             await send_message(update, context, validated_input)
         else:
-            texts, photo = command_handler.tomorrow_games()
+            texts, photo = await run_command(command_handler.tomorrow_games)
 
             for text in texts:
                 await send_message(update, context, text)
@@ -4,7 +4,7 @@ from src.notifier_logger import get_logger
 from src.telegram_bot.command_handlers.bot_commands_handler import (
     NotifConfigCommandHandler,
 )
-from src.telegram_bot.commands_utils import send_message
+from src.telegram_bot.commands_utils import run_command, send_message
 
 logger = get_logger(__name__)
 
@@ -13,11 +13,14 @@ async def subscribe_to_notifications(update: Update, context):
     logger.info(
         f"'subscribe_to_notifications' command executed - by {update.effective_user.name}"
     )
-    command_handler = NotifConfigCommandHandler(
-        context.args, update.effective_user.first_name, str(update.effective_chat.id)
+    command_handler = await run_command(
+        NotifConfigCommandHandler,
+        context.args,
+        update.effective_user.first_name,
+        str(update.effective_chat.id),
     )
 
-    text = command_handler.subscribe_to_notifications()
+    text = await run_command(command_handler.subscribe_to_notifications)
 
     await send_message(update, context, text)
 
@@ -30,18 +33,19 @@ async def enable_notif_config(update: Update, context):
     if not len(context.args):
         await enable_or_disable_notif_config_inline_keyboard(update, context)
     else:
-        command_handler = NotifConfigCommandHandler(
+        command_handler = await run_command(
+            NotifConfigCommandHandler,
             context.args,
             update.effective_user.first_name,
             str(update.effective_chat.id),
         )
 
-        validated_input = command_handler.validate_command_input()
+        validated_input = await run_command(command_handler.validate_command_input)
 
         if validated_input:
             await send_message(update, context, validated_input)
         else:
-            text = command_handler.enable_notification()
+            text = await run_command(command_handler.enable_notification)
 
             await send_message(update, context, text)
 
@@ -56,18 +60,19 @@ async def disable_notif_config(update: Update, context):
             update, context, enable=False
         )
     else:
-        command_handler = NotifConfigCommandHandler(
+        command_handler = await run_command(
+            NotifConfigCommandHandler,
             context.args,
             update.effective_user.first_name,
             str(update.effective_chat.id),
         )
 
-        validated_input = command_handler.validate_command_input()
+        validated_input = await run_command(command_handler.validate_command_input)
 
         if validated_input:
             await send_message(update, context, validated_input)
         else:
-            text = command_handler.disable_notification()
+            text = await run_command(command_handler.disable_notification)
 
             await send_message(update, context, text)
 
@@ -76,14 +81,17 @@ async def set_daily_notif_time(update: Update, context):
     logger.info(
         f"'set_daily_notif_time {' '.join(context.args)}' command executed - by {update.effective_user.name}"
     )
-    command_handler = NotifConfigCommandHandler(
-        context.args, update.effective_user.first_name, str(update.effective_chat.id)
+    command_handler = await run_command(
+        NotifConfigCommandHandler,
+        context.args,
+        update.effective_user.first_name,
+        str(update.effective_chat.id),
     )
 
     if not len(context.args):
         await set_daily_notification_times_inline_keyboard(update, context)
     else:
-        text = command_handler.set_daily_notification_time()
+        text = await run_command(command_handler.set_daily_notification_time)
 
         await send_message(update, context, text)
 
@@ -139,14 +147,15 @@ async def notif_config_inline_keyboard(
     context,
 ):
     logger.info(f"'notif_config' command executed - by {update.effective_user.name}")
-    command_handler = NotifConfigCommandHandler(
+    command_handler = await run_command(
+        NotifConfigCommandHandler,
         context.args,
         update.effective_user.first_name,
         str(update.effective_chat.id),
         is_list=True,
     )
 
-    text = command_handler.notif_config()
+    text = await run_command(command_handler.notif_config)
 
     keyboard = [
         [
@@ -172,14 +181,17 @@ async def notif_config_inline_keyboard(
 async def enable_or_disable_notif_config_inline_keyboard(
     update: Update, context, enable: bool = True
 ):
-    command_handler = NotifConfigCommandHandler(
+    command_handler = await run_command(
+        NotifConfigCommandHandler,
         context.args,
         update.effective_user.first_name,
         str(update.effective_chat.id),
         is_list=True,
     )
 
-    all_notif_types = command_handler._fixtures_db_manager.get_all_notif_types()
+    all_notif_types = await run_command(
+        command_handler._fixtures_db_manager.get_all_notif_types
+    )
 
     action = "enable" if enable else "disable"
 
@@ -174,6 +174,8 @@ NOTIFIER_BOT_HANDLERS = [
         },
         fallbacks=[MessageHandler(~filters.Regex("^/add_favourite_team$"), cancel)],
         conversation_timeout=CONVERSATION_TIMEOUT,
+        name="add_favourite_team",
+        persistent=True,
     ),
     ConversationHandler(
         entry_points=[CommandHandler("add_favourite_league", add_favourite_league)],
@@ -185,6 +187,8 @@ NOTIFIER_BOT_HANDLERS = [
         },
         fallbacks=[MessageHandler(~filters.Regex("^/add_favourite_league$"), cancel)],
         conversation_timeout=CONVERSATION_TIMEOUT,
+        name="add_favourite_league",
+        persistent=True,
     ),
     ConversationHandler(
         entry_points=[CommandHandler("search_team", search_team)],
@@ -196,6 +200,8 @@ NOTIFIER_BOT_HANDLERS = [
         },
         fallbacks=[MessageHandler(~filters.Regex("^/search_team$"), cancel)],
         conversation_timeout=CONVERSATION_TIMEOUT,
+        name="search_team",
+        persistent=True,
     ),
     ConversationHandler(
         entry_points=[CommandHandler("search_league", search_league)],
@@ -207,6 +213,8 @@ NOTIFIER_BOT_HANDLERS = [
         },
         fallbacks=[MessageHandler(~filters.Regex("^/search_league$"), cancel)],
         conversation_timeout=CONVERSATION_TIMEOUT,
+        name="search_league",
+        persistent=True,
     ),
     ConversationHandler(
         entry_points=[
@@ -224,6 +232,8 @@ NOTIFIER_BOT_HANDLERS = [
             MessageHandler(~filters.Regex("^/search_leagues_by_country$"), cancel)
         ],
         conversation_timeout=CONVERSATION_TIMEOUT,
+        name="search_leagues_by_country",
+        persistent=True,
     ),
     ConversationHandler(
         entry_points=[CommandHandler("next_match", next_match)],
@@ -235,6 +245,8 @@ NOTIFIER_BOT_HANDLERS = [
         },
         fallbacks=[MessageHandler(~filters.Regex("^/next_match$"), cancel)],
         conversation_timeout=CONVERSATION_TIMEOUT,
+        name="next_match",
+        persistent=True,
     ),
     ConversationHandler(
         entry_points=[CommandHandler("last_match", last_match)],
@@ -246,6 +258,8 @@ NOTIFIER_BOT_HANDLERS = [
         },
         fallbacks=[MessageHandler(~filters.Regex("^/last_match$"), cancel)],
         conversation_timeout=CONVERSATION_TIMEOUT,
+        name="last_match",
+        persistent=True,
     ),
     ConversationHandler(
         entry_points=[CommandHandler("last_matches", last_matches)],
@@ -257,6 +271,8 @@ NOTIFIER_BOT_HANDLERS = [
         },
         fallbacks=[MessageHandler(~filters.Regex("^/last_matches$"), cancel)],
         conversation_timeout=CONVERSATION_TIMEOUT,
+        name="last_matches",
+        persistent=True,
     ),
     ConversationHandler(
         entry_points=[CommandHandler("next_match_league", next_match_league)],
@@ -268,6 +284,8 @@ NOTIFIER_BOT_HANDLERS = [
         },
         fallbacks=[MessageHandler(~filters.Regex("^/next_match_league$"), cancel)],
         conversation_timeout=CONVERSATION_TIMEOUT,
+        name="next_match_league",
+        persistent=True,
     ),
     ConversationHandler(
         entry_points=[CommandHandler("next_matches_league", next_matches_league)],
@@ -279,6 +297,8 @@ NOTIFIER_BOT_HANDLERS = [
         },
         fallbacks=[MessageHandler(~filters.Regex("^/next_matches_league$"), cancel)],
         conversation_timeout=CONVERSATION_TIMEOUT,
+        name="next_matches_league",
+        persistent=True,
     ),
     ConversationHandler(
         entry_points=[CommandHandler("last_match_league", last_match_league)],
@@ -290,6 +310,8 @@ NOTIFIER_BOT_HANDLERS = [
         },
         fallbacks=[MessageHandler(~filters.Regex("^/last_match_league$"), cancel)],
         conversation_timeout=CONVERSATION_TIMEOUT,
+        name="last_match_league",
+        persistent=True,
     ),
     ConversationHandler(
         entry_points=[CommandHandler("set_main_time_zone", set_main_time_zone)],
@@ -303,6 +325,8 @@ NOTIFIER_BOT_HANDLERS = [
         },
         fallbacks=[MessageHandler(~filters.Regex("^/set_main_time_zone$"), cancel)],
         conversation_timeout=CONVERSATION_TIMEOUT,
+        name="set_main_time_zone",
+        persistent=True,
     ),
     ConversationHandler(
         entry_points=[CommandHandler("set_add_time_zone", set_add_time_zone)],
@@ -318,6 +342,8 @@ NOTIFIER_BOT_HANDLERS = [
             MessageHandler(~filters.Regex("^/set_add_time_zone$"), cancel),
         ],
         conversation_timeout=CONVERSATION_TIMEOUT,
+        name="set_add_time_zone",
+        persistent=True,
     ),
     ConversationHandler(
         entry_points=[CommandHandler("search_time_zone", search_time_zone)],
@@ -333,6 +359,8 @@ NOTIFIER_BOT_HANDLERS = [
             MessageHandler(~filters.Regex("^/search_time_zone$"), cancel),
         ],
         conversation_timeout=CONVERSATION_TIMEOUT,
+        name="search_time_zone",
+        persistent=True,
     ),
     ConversationHandler(
         entry_points=[CommandHandler("set_language", set_language)],
@@ -346,6 +374,8 @@ NOTIFIER_BOT_HANDLERS = [
             MessageHandler(~filters.Regex("^/set_language"), cancel),
         ],
         conversation_timeout=CONVERSATION_TIMEOUT,
+        name="set_language",
+        persistent=True,
     ),
     ConversationHandler(
         entry_points=[CommandHandler("team_summary", team_summary)],
@@ -357,5 +387,7 @@ NOTIFIER_BOT_HANDLERS = [
         },
         fallbacks=[MessageHandler(~filters.Regex("^/team_summary$"), cancel)],
         conversation_timeout=CONVERSATION_TIMEOUT,
+        name="team_summary",
+        persistent=True,
     ),
 ]
@@ -6,7 +6,7 @@ from src.notifier_logger import get_logger
 from src.telegram_bot.command_handlers.statistics_command_handler import (
     TeamStatisticsBotCommandsHandler,
 )
-from src.telegram_bot.commands_utils import reply_text, send_photo
+from src.telegram_bot.commands_utils import reply_text, run_command, send_photo
 
 logger = get_logger(__name__)
 
@@ -27,11 +27,12 @@ async def team_summary(update: Update, context):
 
 
 async def team_summary_handler(update: Update, context):
-    commands_handler = TeamStatisticsBotCommandsHandler(
+    commands_handler = await run_command(
+        TeamStatisticsBotCommandsHandler,
         context.user_data["team_id"],
         str(update.effective_chat.id),
     )
 
-    text, photo = commands_handler.teams_summary()
+    text, photo = await run_command(commands_handler.teams_summary)
 
     await send_photo(update=update, context=context, photo=photo, caption=text)
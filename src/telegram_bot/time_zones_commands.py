@@ -14,7 +14,7 @@ from src.telegram_bot.command_handlers.bot_commands_handler import (
     SearchCommandHandler,
     TimeZonesCommandHandler,
 )
-from src.telegram_bot.commands_utils import reply_text, send_message
+from src.telegram_bot.commands_utils import reply_text, run_command, send_message
 
 logger = get_logger(__name__)
 
@@ -100,18 +100,19 @@ async def search_time_zones_callback_handler(update: Update, context) -> None:
 
 
 async def set_main_time_zone_handler(update: Update, context):
-    commands_handler = TimeZonesCommandHandler(
+    commands_handler = await run_command(
+        TimeZonesCommandHandler,
         [context.user_data["time_zone_id"]],
         update.effective_user.first_name,
         str(update.effective_chat.id),
     )
 
-    validated_input = commands_handler.validate_command_input()
+    validated_input = await run_command(commands_handler.validate_command_input)
 
     if validated_input:
         await send_message(update, context, validated_input)
     else:
-        text = commands_handler.add_time_zone(main=True)
+        text = await run_command(commands_handler.add_time_zone, main=True)
 
         await send_message(update, context, text)
 
@@ -133,37 +134,39 @@ async def set_add_time_zone_handler(update: Update, context):
     logger.info(
         f"'set_add_time_zone' {context.user_data['time_zone_id']} command executed - by {update.effective_user.name}"
     )
-    commands_handler = TimeZonesCommandHandler(
+    commands_handler = await run_command(
+        TimeZonesCommandHandler,
         [context.user_data["time_zone_id"]],
         update.effective_user.first_name,
         str(update.effective_chat.id),
     )
 
-    validated_input = commands_handler.validate_command_input()
+    validated_input = await run_command(commands_handler.validate_command_input)
 
     if validated_input:
         await send_message(update, context, validated_input)
     else:
-        text = commands_handler.add_time_zone()
+        text = await run_command(commands_handler.add_time_zone)
 
         await send_message(update, context, text)
 
 
 async def my_time_zones(update: Update, context):
     logger.info(f"'my_time_zones' command executed - by {update.effective_user.name}")
-    commands_handler = TimeZonesCommandHandler(
+    commands_handler = await run_command(
+        TimeZonesCommandHandler,
         context.args,
         update.effective_user.first_name,
         str(update.effective_chat.id),
         is_list=True,
     )
 
-    validated_input = commands_handler.validate_command_input()
+    validated_input = await run_command(commands_handler.validate_command_input)
 
     if validated_input:
         await send_message(update, context, validated_input)
     else:
-        text = commands_handler.get_my_time_zones()
+        text = await run_command(commands_handler.get_my_time_zones)
 
         await send_message(update, context, text)
 
@@ -172,21 +175,24 @@ async def delete_time_zone(update: Update, context):
     logger.info(
         f"'delete_time_zone' command executed - by {update.effective_user.name}"
     )
-    commands_handler = TimeZonesCommandHandler(
-        context.args, update.effective_user.first_name, str(update.effective_chat.id)
+    commands_handler = await run_command(
+        TimeZonesCommandHandler,
+        context.args,
+        update.effective_user.first_name,
+        str(update.effective_chat.id),
     )
 
     if not len(context.args):
         await own_time_zones_inline_keyboard(
-            update, context, commands_handler.get_time_zones()
+            update, context, await run_command(commands_handler.get_time_zones)
         )
     else:
-        validated_input = commands_handler.validate_command_input()
+        validated_input = await run_command(commands_handler.validate_command_input)
 
         if validated_input:
             await send_message(update, context, validated_input)
         else:
-            text = commands_handler.delete_time_zone()
+            text = await run_command(commands_handler.delete_time_zone)
 
             await send_message(update, context, text)
 
@@ -258,15 +264,17 @@ async def search_time_zone_handler(update: Update, context):
     logger.info(
         f"'search_time_zone {update.message.text}' command executed - by {update.effective_user.name}"
     )
-    command_handler = SearchCommandHandler(
-        [update.message.text], update.effective_user.first_name
+    command_handler = await run_command(
+        SearchCommandHandler, [update.message.text], update.effective_user.first_name
     )
-    validated_input = command_handler.validate_command_input()
+    validated_input = await run_command(command_handler.validate_command_input)
 
     if validated_input:
         await send_message(update, context, validated_input)
     else:
-        time_zones = command_handler.search_time_zone(update.message.text)
+        time_zones = await run_command(
+            command_handler.search_time_zone, update.message.text
+        )
 
         page = 0
         pages = len(time_zones) // TIME_ZONES_PAGE_SIZE + (
@@ -1,6 +1,7 @@
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
 from enum import Enum
 from time import time
+from typing import Tuple
 
 import pytz
 
@@ -84,3 +85,37 @@ def is_time_between(check_time: time, begin_time: time, end_time: time):
         return check_time >= begin_time and check_time <= end_time
     else:
         return check_time >= begin_time or check_time <= end_time
+
+
+def is_notif_hour(now: datetime, notif_hour: int) -> bool:
+    """
+    Whether now is within five minutes of the notification hour, both in the same
+    time zone.
+    """
+    notif_time = now.replace(hour=notif_hour, minute=0, second=0, microsecond=0)
+
+    return is_time_between(
+        now.time(),
+        (notif_time - timedelta(minutes=5)).time(),
+        (notif_time + timedelta(minutes=5)).time(),
+    )
+
+
+def get_day_range_in_time_zone(
+    day: date, time_zone: str, days: int = 1
+) -> Tuple[datetime, datetime]:
+    """
+    UTC [start, end) of the given number of days from the given one, in the time
+    zone.
+    """
+    required_tz = pytz.timezone(time_zone)
+    start = required_tz.localize(datetime.combine(day, datetime.min.time()))
+    end = required_tz.localize(
+        datetime.combine(day + timedelta(days=days), datetime.min.time())
+    )
+
+    return start.astimezone(pytz.utc), end.astimezone(pytz.utc)
+
+
+def get_kickoff(utc_date: str) -> datetime:
+    return datetime.fromisoformat(utc_date)
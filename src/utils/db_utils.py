@@ -1,6 +1,7 @@
-from typing import List
+from collections import Counter
+from typing import Dict, List, Tuple
 
-from src.db.notif_sql_models import Fixture
+from src.db.notif_sql_models import Event, Fixture
 
 
 def remove_duplicate_fixtures(fixtures: List[Fixture]) -> List[Fixture]:
@@ -10,3 +11,42 @@ def remove_duplicate_fixtures(fixtures: List[Fixture]) -> List[Fixture]:
             result_fixtures.append(fixture)
 
     return result_fixtures
+
+
+def get_event_key(event: Event) -> Tuple:
+    """
+    Key identifying an event of a fixture, stable across API responses, as events
+    don't come with an id. Player and detail are left out, as the API corrects
+    them after the event happened.
+    """
+    return (
+        event.fixture,
+        event.team,
+        event.type,
+        event.time,
+        event.time_extra or "",
+    )
+
+
+def get_events_by_key(events: List[Event]) -> Dict[Tuple, Event]:
+    """
+    Events by their key plus their position among the events sharing it, as a
+    team can make several substitutions or get several cards in the same minute.
+    """
+    events_by_key = {}
+    occurrences = Counter()
+
+    for event in events:
+        event_key = get_event_key(event)
+        events_by_key[(*event_key, occurrences[event_key])] = event
+        occurrences[event_key] += 1
+
+    return events_by_key
+
+
+def is_event_corrected(stored_event: Event, event: Event) -> bool:
+    return (stored_event.player, stored_event.assist, stored_event.detail) != (
+        event.player,
+        event.assist,
+        event.detail,
+    )
@@ -0,0 +1,47 @@
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator, Optional
+
+# Monotonic time by which the work running in the current context has to be done.
+_DEADLINE: ContextVar[Optional[float]] = ContextVar("deadline", default=None)
+
+
+@contextmanager
+def deadline(timeout: float) -> Iterator[None]:
+    """
+    Gives the work done inside the context timeout seconds, or less if it already
+    runs under an earlier deadline. Threads only see it when they are given a copy
+    of the context.
+    """
+    current_deadline = _DEADLINE.get()
+    new_deadline = time.monotonic() + timeout
+    token = _DEADLINE.set(
+        new_deadline
+        if current_deadline is None
+        else min(current_deadline, new_deadline)
+    )
+    try:
+        yield
+    finally:
+        _DEADLINE.reset(token)
+
+
+def time_left(default: Optional[float] = None) -> Optional[float]:
+    """
+    Seconds left until the current deadline, or the default if there is none.
+    """
+    current_deadline = _DEADLINE.get()
+
+    if current_deadline is None:
+        return default
+
+    return max(current_deadline - time.monotonic(), 0.0)
+
+
+def check_deadline() -> None:
+    """
+    Lets blocking work stop between steps once nobody waits for its result.
+    """
+    if time_left() == 0.0:
+        raise TimeoutError("Deadline exceeded")
@@ -0,0 +1,246 @@
+import sys
+import time
+from collections import defaultdict
+from dataclasses import dataclass, fields
+from datetime import datetime, timedelta, timezone
+from threading import Lock, Thread
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from src.db.fixtures_db_manager import FixturesDBManager
+from src.notifier_constants import (
+    FIXTURE_STORE_REFRESH_INTERVAL,
+    FIXTURE_STORE_TTL,
+    FIXTURE_STORE_UPDATE_OVERLAP,
+)
+from src.notifier_logger import get_logger
+
+logger = get_logger(__name__)
+
+
+@dataclass(frozen=True, slots=True)
+class FixtureRecord:
+    """
+    Read only copy of a fixture row, with the attributes needed to convert it into
+    a Fixture entity, so it can be used in place of the database model.
+    """
+
+    id: int
+    utc_date: str
+    kickoff: Optional[datetime]
+    league: int
+    round: str
+    home_team: int
+    away_team: int
+    venue: str
+    match_status: str
+    referee: str
+    home_score: Optional[int]
+    away_score: Optional[int]
+    penalty_home_score: Optional[int]
+    penalty_away_score: Optional[int]
+
+
+FIXTURE_RECORD_COLUMNS = [field.name for field in fields(FixtureRecord)]
+
+
+def get_fixture_record(row: Tuple) -> FixtureRecord:
+    # rounds, venues, statuses and kickoff dates repeat a lot across fixtures
+    return FixtureRecord(
+        *(sys.intern(value) if isinstance(value, str) else value for value in row)
+    )
+
+
+def get_updated_from() -> datetime:
+    # the changes of the last seconds are read again on the next update
+    return datetime.now(timezone.utc) - timedelta(seconds=FIXTURE_STORE_UPDATE_OVERLAP)
+
+
+class FixtureIndexes:
+    def __init__(self, records: Iterable[FixtureRecord] = ()) -> None:
+        self.fixtures: Dict[int, FixtureRecord] = {}
+        self.team_fixtures: Dict[int, Set[int]] = defaultdict(set)
+        self.league_fixtures: Dict[int, Set[int]] = defaultdict(set)
+
+        for record in records:
+            self.put(record)
+
+    def __len__(self) -> int:
+        return len(self.fixtures)
+
+    def put(self, record: FixtureRecord) -> None:
+        previous_record = self.fixtures.get(record.id)
+
+        if previous_record is not None:
+            self.team_fixtures[previous_record.home_team].discard(record.id)
+            self.team_fixtures[previous_record.away_team].discard(record.id)
+            self.league_fixtures[previous_record.league].discard(record.id)
+
+        self.fixtures[record.id] = record
+        self.team_fixtures[record.home_team].add(record.id)
+        self.team_fixtures[record.away_team].add(record.id)
+        self.league_fixtures[record.league].add(record.id)
+
+    def get_records(
+        self, team_id: Optional[int] = None, league_id: Optional[int] = None
+    ) -> List[FixtureRecord]:
+        if not team_id and not league_id:
+            return list(self.fixtures.values())
+
+        fixture_ids = None
+
+        if team_id:
+            fixture_ids = self.team_fixtures.get(team_id, set())
+
+        if league_id:
+            league_fixture_ids = self.league_fixtures.get(league_id, set())
+            fixture_ids = (
+                league_fixture_ids
+                if fixture_ids is None
+                else fixture_ids & league_fixture_ids
+            )
+
+        return [self.fixtures[fixture_id] for fixture_id in fixture_ids]
+
+
+class FixtureStore:
+    """
+    In-process copy of the fixtures, indexed by id, team and league, so next and
+    last matches are answered without hitting the database. It is fully loaded
+    every FIXTURE_STORE_TTL seconds, and in between, every
+    FIXTURE_STORE_REFRESH_INTERVAL seconds, the fixtures inserted or changed since
+    the previous read (by their updated_at) are read again in background.
+    """
+
+    def __init__(
+        self,
+        fixtures_db_manager: FixturesDBManager = None,
+        ttl: float = FIXTURE_STORE_TTL,
+        refresh_interval: float = FIXTURE_STORE_REFRESH_INTERVAL,
+    ) -> None:
+        self._fixtures_db_manager = fixtures_db_manager
+        self._ttl = ttl
+        self._refresh_interval = refresh_interval
+        self._indexes: Optional[FixtureIndexes] = None
+        self._updated_from: Optional[datetime] = None
+        self._loaded_at = 0.0
+        self._updated_at = 0.0
+        self._lock = Lock()
+        self._load_lock = Lock()
+        self._refreshing = False
+
+    def _get_fixtures_db_manager(self) -> FixturesDBManager:
+        return self._fixtures_db_manager or FixturesDBManager()
+
+    def load(self) -> None:
+        start = time.perf_counter()
+        updated_from = get_updated_from()
+        indexes = FixtureIndexes(
+            get_fixture_record(row)
+            for row in self._get_fixtures_db_manager().get_fixtures_rows(
+                FIXTURE_RECORD_COLUMNS
+            )
+        )
+
+        with self._lock:
+            self._indexes = indexes
+            self._updated_from = updated_from
+            self._loaded_at = self._updated_at = time.monotonic()
+
+        logger.info(
+            f"Fixture store loaded in {time.perf_counter() - start:.3f}s - "
+            f"{len(indexes)} fixtures"
+        )
+
+    def update(self) -> None:
+        updated_from = get_updated_from()
+        records = [
+            get_fixture_record(row)
+            for row in self._get_fixtures_db_manager().get_fixtures_rows(
+                FIXTURE_RECORD_COLUMNS, updated_from=self._updated_from
+            )
+        ]
+
+        with self._lock:
+            for record in records:
+                self._indexes.put(record)
+
+            self._updated_from = updated_from
+            self._updated_at = time.monotonic()
+
+    def _refresh_in_background(self, full: bool) -> None:
+        def refresh() -> None:
+            try:
+                self.load() if full else self.update()
+            except Exception as e:
+                logger.error(f"Error refreshing fixture store - {str(e)}")
+            finally:
+                with self._lock:
+                    self._refreshing = False
+
+        Thread(target=refresh, daemon=True).start()
+
+    def _get_records(
+        self, team_id: Optional[int] = None, league_id: Optional[int] = None
+    ) -> List[FixtureRecord]:
+        if self._indexes is None:
+            # concurrent first requests wait for a single load
+            with self._load_lock:
+                if self._indexes is None:
+                    self.load()
+
+        with self._lock:
+            now = time.monotonic()
+            is_stale = now - self._loaded_at > self._ttl
+            is_outdated = now - self._updated_at > self._refresh_interval
+
+            if (is_stale or is_outdated) and not self._refreshing:
+                self._refreshing = True
+                self._refresh_in_background(full=is_stale)
+
+            return self._indexes.get_records(
+                int(team_id) if team_id else None,
+                int(league_id) if league_id else None,
+            )
+
+    def get_next_fixture(
+        self,
+        team_id: int = None,
+        league_id: int = None,
+        number_of_fixtures: int = 1,
+        exclude_statuses: List[str] = [],
+    ) -> List[FixtureRecord]:
+        now = datetime.now(timezone.utc)
+        next_fixtures = [
+            record
+            for record in self._get_records(team_id, league_id)
+            if record.kickoff is not None
+            and record.kickoff >= now
+            and record.match_status not in exclude_statuses
+        ]
+        next_fixtures.sort(key=lambda record: record.kickoff)
+
+        return next_fixtures[:number_of_fixtures]
+
+    def get_last_fixture(
+        self,
+        team_id: int = None,
+        league_id: int = None,
+        number_of_fixtures: int = 1,
+        year: str = None,
+        exclude_statuses: List[str] = [],
+    ) -> List[FixtureRecord]:
+        now = datetime.now(timezone.utc)
+        last_fixtures = [
+            record
+            for record in self._get_records(team_id, league_id)
+            if record.kickoff is not None
+            and record.kickoff <= now
+            and (not year or record.kickoff.astimezone(timezone.utc).year == int(year))
+            and record.match_status not in exclude_statuses
+        ]
+        last_fixtures.sort(key=lambda record: record.kickoff, reverse=True)
+
+        return last_fixtures[:number_of_fixtures]
+
+
+FIXTURE_STORE = FixtureStore()
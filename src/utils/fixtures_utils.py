@@ -1,24 +1,25 @@
+import dataclasses
 import re
 import urllib
+from collections import defaultdict
 from datetime import datetime
 from typing import Any, Dict, List, Optional, Tuple, Union
 from urllib.error import HTTPError
 
-from deep_translator import GoogleTranslator
-from sqlmodel import select
-
 from src.api.fixtures_client import FixturesClient
 from src.api.images_search_client import ImagesSearchClient
 from src.api.videos_search_client import VideosSearchClient
 from src.api.youtube_search_client import YoutubeSearchClient
 from src.converters.converters import LineUpConverter
-from src.db.db_manager import NotifierDBManager
 from src.db.fixtures_db_manager import FixturesDBManager
 from src.db.line_ups_db_manager import LineUpsDBManager
 from src.db.notif_sql_models import Event as DBEvent
 from src.db.notif_sql_models import Fixture as DBFixture
 from src.db.notif_sql_models import League as DBLeague
+from src.db.notif_sql_models import LineUp as DBLineUp
+from src.db.notif_sql_models import Player as DBPlayer
 from src.db.notif_sql_models import Team as DBTeam
+from src.db.notif_sql_models import TimeZone as DBTimeZone
 from src.db.notif_sql_models import UserTimeZone
 from src.entities import (
     Assist,
@@ -174,7 +175,7 @@ def get_head_to_heads(team_1: str, team_2: str) -> Optional[List[Fixture]]:
     head_to_head_fixtures = FIXTURES_DB_MANAGER.get_head_to_head_fixtures(
         team_1, team_2
     )
-    return [convert_db_fixture(fixture) for fixture in head_to_head_fixtures]
+    return convert_db_fixtures(head_to_head_fixtures)
 
 
 def get_last_fixture(
@@ -201,86 +202,222 @@ def get_last_fixture(
     )
 
 
-def convert_db_event(event: DBEvent, rival_team: Optional[DBTeam] = None) -> Event:
-    event_db_player = FIXTURES_DB_MANAGER.get_player(event.player)
-    event_db_assist = FIXTURES_DB_MANAGER.get_player(event.assist)
-    event_db_team = FIXTURES_DB_MANAGER.get_team(event.team)
-
-    return Event(
-        time=Time(
-            elapsed=event.time,
-            extra=event.time_extra,
-        ),
-        team=Team(
-            id=event_db_team[0].id,
-            name=event_db_team[0].name,
-            logo=event_db_team[0].picture,
-            country=event_db_team[0].country,
-            picture=event_db_team[0].picture,
+def convert_db_event(
+    event: DBEvent,
+    rival_team: Optional[DBTeam] = None,
+    teams: Optional[Dict[int, DBTeam]] = None,
+    players: Optional[Dict[int, DBPlayer]] = None,
+) -> Event:
+    """
+    Converts an event from database into an Event entity. Its team and players are
+    taken from the given preloaded teams and players (by id) if any, otherwise they
+    are queried.
+    """
+    if teams is not None and players is not None:
+        event_db_team = [teams[event.team]]
+        event_db_player = [players[event.player]] if event.player in players else []
+        event_db_assist = [players[event.assist]] if event.assist in players else []
+    else:
+        event_db_player = FIXTURES_DB_MANAGER.get_player(event.player)
+        event_db_assist = FIXTURES_DB_MANAGER.get_player(event.assist)
+        event_db_team = FIXTURES_DB_MANAGER.get_team(event.team)
+
+    # database rows are trusted, so entities are built without validation.
+    return Event.construct(
+        time=Time.construct(
+            elapsed=event.time, extra=get_optional_str(event.time_extra)
         ),
-        player=Player(
+        team=get_trusted_team(event_db_team[0], picture=event_db_team[0].picture),
+        player=Player.construct(
             id=event_db_player[0].id if len(event_db_player) else None,
             name=event_db_player[0].name if len(event_db_player) else None,
         ),
-        assist=Assist(
+        assist=Assist.construct(
             id=event_db_assist[0].id if len(event_db_assist) else None,
             name=event_db_assist[0].name if len(event_db_assist) else None,
-        )
-        if len(event_db_assist)
-        else Assist(),
+        ),
         type=event.type,
         detail=event.detail,
         comments=event.comments,
-        fixture_id=event.fixture,
-        rival_team=Team(
-            id=rival_team.id,
-            name=rival_team.name,
-            logo=rival_team.picture,
-            country=rival_team.country,
-            picture=rival_team.picture,
-        )
+        fixture_id=get_optional_str(event.fixture),
+        rival_team=get_trusted_team(rival_team, picture=rival_team.picture)
         if rival_team
         else None,
     )
 
 
-def convert_db_fixture(
-    fixture: DBFixture, user_time_zones: Optional[List[UserTimeZone]] = []
-) -> Fixture:
+def get_optional_str(value: Any) -> Optional[str]:
+    return str(value) if value is not None else None
+
+
+def get_trusted_team(db_team: DBTeam, picture: str = "") -> Team:
     """
-    Converts a fixture from database into a Fixture entity for notifying.
+    Team entity for a team from database, built without running validation.
     """
-    utc_date = datetime.strptime(fixture.utc_date[:-6], "%Y-%m-%dT%H:%M:%S")
-    ams_date = get_time_in_time_zone(utc_date, TimeZones.AMSTERDAM)
-    bsas_date = get_time_in_time_zone(utc_date, TimeZones.BSAS)
+    return Team.construct(
+        id=db_team.id,
+        name=db_team.name,
+        logo=db_team.picture,
+        aliases=[],
+        country=get_optional_str(db_team.country),
+        picture=picture,
+    )
 
-    # league_name, round_name = __get_translated_league_name_and_round(fixture)
-    notifier_db_manager = NotifierDBManager()
 
-    main_time_zone = FIXTURES_DB_MANAGER.get_time_zones_by_name("UTC")[0]
+def get_time_zones(
+    user_time_zones: List[UserTimeZone],
+) -> Tuple[DBTimeZone, List[DBTimeZone]]:
+    time_zones = {
+        time_zone.id: time_zone
+        for time_zone in FIXTURES_DB_MANAGER.get_time_zones_by_ids(
+            [user_time_zone.time_zone for user_time_zone in user_time_zones]
+        )
+    }
+
+    main_time_zone, additional_time_zones = split_time_zones(
+        user_time_zones, time_zones
+    )
+
+    if main_time_zone is None:
+        main_time_zone = FIXTURES_DB_MANAGER.get_time_zones_by_name("UTC")[0]
+
+    return (main_time_zone, additional_time_zones)
+
+
+def split_time_zones(
+    user_time_zones: List[UserTimeZone], time_zones: Dict[int, DBTimeZone]
+) -> Tuple[Optional[DBTimeZone], List[DBTimeZone]]:
+    main_time_zone = None
     additional_time_zones = []
 
     for user_time_zone in user_time_zones:
-        db_time_zone = FIXTURES_DB_MANAGER.get_time_zone(user_time_zone.time_zone)[0]
+        db_time_zone = time_zones[user_time_zone.time_zone]
         if user_time_zone.is_main_tz is True:
             main_time_zone = db_time_zone
         else:
             additional_time_zones.append(db_time_zone)
 
-    league: DBLeague = notifier_db_manager.select_records(
-        select(DBLeague).where(DBLeague.id == fixture.league)
-    )[0]
-    home_team: DBTeam = notifier_db_manager.select_records(
-        select(DBTeam).where(DBTeam.id == fixture.home_team)
-    )[0]
-    away_team: DBTeam = notifier_db_manager.select_records(
-        select(DBTeam).where(DBTeam.id == fixture.away_team)
-    )[0]
-    fixture_db_events = FIXTURES_DB_MANAGER.get_fixture_events(fixture.id)
+    return (main_time_zone, additional_time_zones)
+
+
+def localize_fixture(
+    fixture: Fixture,
+    user_time_zones: List[UserTimeZone],
+    time_zones: Dict[int, DBTimeZone],
+    default_time_zone: DBTimeZone,
+) -> Fixture:
+    """
+    Returns a copy of an already converted fixture, for the given user time zones,
+    taken from the preloaded time zones (by id).
+    """
+    main_time_zone, additional_time_zones = split_time_zones(
+        user_time_zones, time_zones
+    )
+
+    return dataclasses.replace(
+        fixture,
+        main_time_zone=main_time_zone or default_time_zone,
+        additional_time_zones=additional_time_zones,
+    )
+
+
+def convert_db_fixture(
+    fixture: DBFixture, user_time_zones: Optional[List[UserTimeZone]] = []
+) -> Fixture:
+    """
+    Converts a fixture from database into a Fixture entity for notifying.
+    """
+    return convert_db_fixtures([fixture], user_time_zones)[0]
+
+
+def convert_db_fixtures(
+    fixtures: List[DBFixture], user_time_zones: Optional[List[UserTimeZone]] = []
+) -> List[Fixture]:
+    """
+    Converts fixtures from database into Fixture entities for notifying, loading
+    leagues, teams, events, line ups and players of all of them at once.
+    """
+    if not len(fixtures):
+        return []
+
+    fixture_ids = [fixture.id for fixture in fixtures]
+    main_time_zone, additional_time_zones = get_time_zones(user_time_zones)
+
+    leagues = {
+        league.id: league
+        for league in FIXTURES_DB_MANAGER.get_leagues_by_ids(
+            [fixture.league for fixture in fixtures]
+        )
+    }
+
+    fixtures_db_events = defaultdict(list)
+    for db_event in FIXTURES_DB_MANAGER.get_fixtures_events(fixture_ids):
+        fixtures_db_events[db_event.fixture].append(db_event)
+
+    fixtures_db_line_ups = defaultdict(list)
+    for db_line_up in LINE_UPS_DB_MANAGER.get_fixtures_line_ups(fixture_ids):
+        fixtures_db_line_ups[db_line_up.fixture].append(db_line_up)
+
+    team_ids = [fixture.home_team for fixture in fixtures] + [
+        fixture.away_team for fixture in fixtures
+    ]
+    player_ids = []
+
+    for db_events in fixtures_db_events.values():
+        for db_event in db_events:
+            team_ids.append(db_event.team)
+            player_ids += [db_event.player, db_event.assist]
+
+    for db_line_ups in fixtures_db_line_ups.values():
+        player_ids += [db_line_up.player for db_line_up in db_line_ups]
+
+    teams = {team.id: team for team in FIXTURES_DB_MANAGER.get_teams_by_ids(team_ids)}
+    players = {
+        player.id: player
+        for player in FIXTURES_DB_MANAGER.get_players_by_ids(
+            [player_id for player_id in player_ids if player_id is not None]
+        )
+    }
+
+    return [
+        build_fixture(
+            fixture,
+            leagues[fixture.league],
+            teams,
+            players,
+            fixtures_db_events[fixture.id],
+            fixtures_db_line_ups[fixture.id],
+            main_time_zone,
+            additional_time_zones,
+        )
+        for fixture in fixtures
+    ]
+
+
+def build_fixture(
+    fixture: DBFixture,
+    league: DBLeague,
+    teams: Dict[int, DBTeam],
+    players: Dict[int, DBPlayer],
+    fixture_db_events: List[DBEvent],
+    db_line_ups: List[DBLineUp],
+    main_time_zone: DBTimeZone,
+    additional_time_zones: List[DBTimeZone],
+) -> Fixture:
+    utc_date = datetime.strptime(fixture.utc_date[:-6], "%Y-%m-%dT%H:%M:%S")
+    ams_date = get_time_in_time_zone(utc_date, TimeZones.AMSTERDAM)
+    bsas_date = get_time_in_time_zone(utc_date, TimeZones.BSAS)
+
+    home_team = teams[fixture.home_team]
+    away_team = teams[fixture.away_team]
+
     fixture_events = (
         [
             convert_db_event(
-                db_event, away_team if db_event.team == home_team.id else home_team
+                db_event,
+                away_team if db_event.team == home_team.id else home_team,
+                teams,
+                players,
             )
             for db_event in fixture_db_events
         ]
@@ -289,7 +426,6 @@ def convert_db_fixture(
     )
 
     home_line_up, away_line_up = None, None
-    db_line_ups = LINE_UPS_DB_MANAGER.get_fixture_line_ups(fixture_id=fixture.id)
 
     if len(db_line_ups):
         line_ups_converter = LineUpConverter()
@@ -303,6 +439,7 @@ def convert_db_fixture(
             line_ups_converter.db_model_to_entity(
                 formation=home_team_line_up[0].formation or "",
                 line_up=home_team_line_up,
+                players=players,
             )
             if len(home_team_line_up)
             else None
@@ -311,6 +448,7 @@ def convert_db_fixture(
             line_ups_converter.db_model_to_entity(
                 formation=away_team_line_up[0].formation or "",
                 line_up=away_team_line_up,
+                players=players,
             )
             if len(away_team_line_up)
             else None
@@ -331,20 +469,8 @@ def convert_db_fixture(
             league.logo,
         ),
         fixture.round,
-        Team(
-            id=home_team.id,
-            name=home_team.name,
-            logo=home_team.picture,
-            aliases=[],
-            country=home_team.country,
-        ),
-        Team(
-            id=away_team.id,
-            name=away_team.name,
-            logo=away_team.picture,
-            aliases=[],
-            country=away_team.country,
-        ),
+        get_trusted_team(home_team),
+        get_trusted_team(away_team),
         MatchScore(
             fixture.home_score,
             fixture.away_score,
@@ -487,6 +613,8 @@ def __get_translated_league_name_and_round(
     fixture_response: Dict[str, Any]
 ) -> Tuple[str, str]:
     if __is_team_or_league_for_spanish_translation(fixture_response):
+        from deep_translator import GoogleTranslator
+
         google_translator = GoogleTranslator(source="en", target="es")
         league_name = google_translator.translate(fixture_response["league"]["name"])
         round_name = google_translator.translate(fixture_response["league"]["round"])
@@ -1,11 +1,55 @@
 import re
+from collections import OrderedDict
+from threading import Lock
+from typing import Dict, Hashable, List, Optional
 
-from deep_translator import GoogleTranslator
-
+from src.db.translations_db_manager import TranslationsDBManager
+from src.notifier_constants import (
+    TRANSLATION_MAX_CHARS,
+    TRANSLATION_SEGMENTS_SEPARATOR,
+    TRANSLATIONS_CACHE_SIZE,
+)
 from src.notifier_logger import get_logger
+from src.utils.deadline_utils import check_deadline
 
 logger = get_logger(__name__)
 
+TRANSLATIONS_DB_MANAGER = TranslationsDBManager()
+
+TRANSLATION_SEGMENTS_SEPARATOR_PATTERN = re.compile(
+    r"\s*".join(re.escape(char) for char in TRANSLATION_SEGMENTS_SEPARATOR.strip())
+)
+
+
+class LRUCache:
+    def __init__(self, max_size: int) -> None:
+        self._max_size = max_size
+        self._items: OrderedDict = OrderedDict()
+        self._lock = Lock()
+
+    def get(self, key: Hashable) -> Optional[str]:
+        with self._lock:
+            if key not in self._items:
+                return None
+
+            self._items.move_to_end(key)
+            return self._items[key]
+
+    def set(self, key: Hashable, value: str) -> None:
+        with self._lock:
+            self._items[key] = value
+            self._items.move_to_end(key)
+
+            if len(self._items) > self._max_size:
+                self._items.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._items.clear()
+
+
+TRANSLATIONS_CACHE = LRUCache(TRANSLATIONS_CACHE_SIZE)
+
 
 def ignore_parts_of_string(input_string: str) -> tuple:
     not_translate_pattern = r"<not_translate>(.*?)<\/not_translate>"
@@ -16,28 +60,178 @@ def ignore_parts_of_string(input_string: str) -> tuple:
     return not_translate_matches, not_translate_split_list
 
 
-def translate_text(text: str, target_lang: str = "en") -> str:
+def get_segments_chunks(segments: List[str]) -> List[List[str]]:
+    """
+    Groups segments in chunks which, joined by the separator, fit in one translation
+    request.
+    """
+    chunks, chunk, chunk_length = [], [], 0
+
+    for segment in segments:
+        segment_length = len(segment) + len(TRANSLATION_SEGMENTS_SEPARATOR)
+
+        if chunk and chunk_length + segment_length > TRANSLATION_MAX_CHARS:
+            chunks.append(chunk)
+            chunk, chunk_length = [], 0
+
+        chunk.append(segment)
+        chunk_length += segment_length
+
+    if chunk:
+        chunks.append(chunk)
+
+    return chunks
+
+
+def request_translations(segments: List[str], target_lang: str) -> List[str]:
+    """
+    Translates segments joined by sentinel separators, with one request per chunk.
+    If the translated chunk can't be split back into the same number of segments,
+    its segments are translated one by one.
+    """
+    # deep_translator pulls requests and BeautifulSoup, so it's only imported
+    # once something has to be translated.
+    from deep_translator import GoogleTranslator
+
     translator = GoogleTranslator(source="en", target=target_lang)
-    not_translate_matches, not_translate_split_list = ignore_parts_of_string(text)
+    translated_segments = []
 
-    logger.info(f"NOT TRANSLATE MATCHES -> {not_translate_matches}")
-    logger.info(f"not_translate_split_list -> {not_translate_split_list}")
+    for chunk in get_segments_chunks(segments):
+        check_deadline()
+        translated_chunk = translator.translate(
+            TRANSLATION_SEGMENTS_SEPARATOR.join(chunk)
+        )
+        split_translated_chunk = re.split(
+            TRANSLATION_SEGMENTS_SEPARATOR_PATTERN, translated_chunk or ""
+        )
+
+        if len(split_translated_chunk) != len(chunk):
+            logger.warning(
+                f"Could not split batch translation into {len(chunk)} segments, "
+                f"translating them one by one"
+            )
+            split_translated_chunk = [
+                translator.translate(segment) for segment in chunk
+            ]
+
+        translated_segments += [
+            translated_segment.strip() if translated_segment is not None else None
+            for translated_segment in split_translated_chunk
+        ]
 
-    final_translated_list = []
-    for phrase in not_translate_split_list:
-        if phrase not in not_translate_matches:
-            final_translated_list.append(translator.translate(phrase))
+    return translated_segments
+
+
+def translate_segments(segments: List[str], target_lang: str) -> Dict[str, str]:
+    """
+    Translates english segments of text, taking them from the in-process and the
+    persistent translations caches if they were already translated to the target
+    language. The rest of them are translated in batch.
+
+    :return: translated segments, by segment.
+    """
+    translations = {}
+    not_cached_segments = []
+
+    for segment in dict.fromkeys(segments):
+        if target_lang == "en" or not segment.strip():
+            translations[segment] = segment.strip()
+        elif (
+            cached_translation := TRANSLATIONS_CACHE.get((segment.strip(), target_lang))
+        ) is not None:
+            translations[segment] = cached_translation
         else:
-            final_translated_list.append(phrase)
+            not_cached_segments.append(segment)
 
-    logger.info(f"Final translated list -> {not_translate_split_list}")
+    stored_translations = (
+        TRANSLATIONS_DB_MANAGER.get_translations(
+            [segment.strip() for segment in not_cached_segments], target_lang
+        )
+        if not_cached_segments
+        else {}
+    )
+    new_segments = []
+
+    for segment in not_cached_segments:
+        if segment.strip() in stored_translations:
+            translations[segment] = stored_translations[segment.strip()]
+        else:
+            new_segments.append(segment)
 
-    return "".join(
-        list(
-            filter(
-                lambda item: item is not None
-                and item not in ["<not_translate>", "</not_translate>"],
-                final_translated_list,
+    if new_segments:
+        new_translations = dict(
+            zip(
+                [segment.strip() for segment in new_segments],
+                request_translations(
+                    [segment.strip() for segment in new_segments], target_lang
+                ),
             )
         )
+        TRANSLATIONS_DB_MANAGER.insert_translations(
+            {
+                segment: translation
+                for segment, translation in new_translations.items()
+                if translation is not None
+            },
+            target_lang,
+        )
+
+        for segment in new_segments:
+            translations[segment] = new_translations[segment.strip()]
+
+    for segment, translation in translations.items():
+        if segment.strip() and translation is not None:
+            TRANSLATIONS_CACHE.set((segment.strip(), target_lang), translation)
+
+    return translations
+
+
+def translate_segment(segment: str, target_lang: str) -> str:
+    return translate_segments([segment], target_lang)[segment]
+
+
+def translate_texts(texts: List[str], target_lang: str = "en") -> List[str]:
+    """
+    Translates texts, leaving out their <not_translate> parts, with all of their
+    translatable segments translated together.
+    """
+    split_texts = [ignore_parts_of_string(text) for text in texts]
+    translations = translate_segments(
+        [
+            phrase
+            for not_translate_matches, not_translate_split_list in split_texts
+            for phrase in not_translate_split_list
+            if phrase not in not_translate_matches
+        ],
+        target_lang,
     )
+
+    translated_texts = []
+
+    for not_translate_matches, not_translate_split_list in split_texts:
+        final_translated_list = [
+            translations[phrase] if phrase not in not_translate_matches else phrase
+            for phrase in not_translate_split_list
+        ]
+        translated_texts.append(
+            "".join(
+                list(
+                    filter(
+                        lambda item: item is not None
+                        and item not in ["<not_translate>", "</not_translate>"],
+                        final_translated_list,
+                    )
+                )
+            )
+        )
+
+    return translated_texts
+
+
+def translate_text(text: str, target_lang: str = "en") -> str:
+    not_translate_matches, not_translate_split_list = ignore_parts_of_string(text)
+
+    logger.info(f"NOT TRANSLATE MATCHES -> {not_translate_matches}")
+    logger.info(f"not_translate_split_list -> {not_translate_split_list}")
+
+    return translate_texts([text], target_lang)[0]
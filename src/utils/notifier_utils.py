@@ -1,13 +1,15 @@
-from typing import Optional
+from collections import defaultdict
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Set, Tuple
 
 from src.db.fixtures_db_manager import FixturesDBManager
-from src.db.notif_sql_models import NotifConfig, TimeZone
+from src.db.notif_sql_models import NotifConfig, TimeZone, UserTimeZone
 
 fixtures_db_manager = FixturesDBManager()
 
 
 def is_user_subscribed_to_notif(user: str, notif_type: int) -> bool:
-    user_config = fixtures_db_manager.get_user_notif_config(user)
+    user_config = fixtures_db_manager.get_user_preferences(user).notif_config
 
     if len(user_config):
         config_for_type: NotifConfig = list(
@@ -19,25 +21,133 @@ def is_user_subscribed_to_notif(user: str, notif_type: int) -> bool:
 
 
 def get_user_main_time_zone(user: str) -> Optional[TimeZone]:
-    user_time_zones = fixtures_db_manager.get_user_time_zones(user)
-    user_main_time_zone = None
-    filtered_user_main_time_zone = [
-        time_zone.time_zone for time_zone in user_time_zones if time_zone.is_main_tz
-    ]
-
-    if len(filtered_user_main_time_zone):
-        user_main_time_zone = fixtures_db_manager.get_time_zone(
-            filtered_user_main_time_zone[0]
-        )[0]
-
-    return user_main_time_zone
+    return fixtures_db_manager.get_user_preferences(user).main_time_zone
 
 
 def get_user_notif_config(notif_type: int, user: str) -> NotifConfig:
-    user_notif_config = fixtures_db_manager.get_user_notif_config(user)
+    user_notif_config = fixtures_db_manager.get_user_preferences(user).notif_config
 
     return [
         user_config
         for user_config in user_notif_config
         if user_config.notif_type == notif_type
     ][0]
+
+
+def get_time_zones_key(
+    user_time_zones: List[UserTimeZone],
+) -> Tuple[Tuple[int, bool], ...]:
+    return tuple(
+        sorted(
+            (user_time_zone.time_zone, user_time_zone.is_main_tz)
+            for user_time_zone in user_time_zones
+        )
+    )
+
+
+@dataclass
+class TeamSubscriber:
+    chat_id: str
+    team: int
+    lang: str = "en"
+    notif_types: Set[int] = field(default_factory=set)
+    user_time_zones: List[UserTimeZone] = field(default_factory=list)
+
+    def time_zones_key(self) -> Tuple[Tuple[int, bool], ...]:
+        return get_time_zones_key(self.user_time_zones)
+
+
+def get_team_subscribers(
+    team_ids: List[int], notif_types: List[int]
+) -> List[TeamSubscriber]:
+    """
+    Loads, with a fixed number of queries, every user having any of the given teams
+    as favourite and subscribed to any of the given notification types, together
+    with its language and time zones.
+    """
+    subscribers = {}
+
+    for chat_id, team, notif_type, lang in fixtures_db_manager.get_teams_subscriptions(
+        team_ids, notif_types
+    ):
+        subscriber = subscribers.setdefault(
+            (chat_id, team),
+            TeamSubscriber(chat_id=chat_id, team=team, lang=lang or "en"),
+        )
+        subscriber.notif_types.add(notif_type)
+
+    users_time_zones = defaultdict(list)
+
+    for user_time_zone in fixtures_db_manager.get_users_time_zones(
+        list({subscriber.chat_id for subscriber in subscribers.values()})
+    ):
+        users_time_zones[user_time_zone.chat_id].append(user_time_zone)
+
+    for subscriber in subscribers.values():
+        subscriber.user_time_zones = users_time_zones[subscriber.chat_id]
+
+    return list(subscribers.values())
+
+
+@dataclass
+class DigestSubscriber:
+    chat_id: str
+    lang: str = "en"
+    favourite_teams: Set[int] = field(default_factory=set)
+    user_time_zones: List[UserTimeZone] = field(default_factory=list)
+
+    def time_zones_key(self) -> Tuple[Tuple[int, bool], ...]:
+        return get_time_zones_key(self.user_time_zones)
+
+
+@dataclass
+class DigestBucket:
+    time_zone: str
+    notif_hour: int
+    subscribers: Dict[str, DigestSubscriber] = field(default_factory=dict)
+
+    def teams(self) -> Set[int]:
+        return {
+            team
+            for subscriber in self.subscribers.values()
+            for team in subscriber.favourite_teams
+        }
+
+
+def get_favourite_teams_digest_buckets(notif_type: int) -> List[DigestBucket]:
+    """
+    Users with the given daily notification type enabled, with their favourite
+    teams, language and time zones, grouped by main time zone and notification
+    hour. Loaded with a fixed number of queries, whatever the number of users.
+    """
+    buckets = {}
+
+    for (
+        chat_id,
+        team,
+        notif_time,
+        time_zone,
+        lang,
+    ) in fixtures_db_manager.get_favourite_teams_notif_subscriptions(notif_type):
+        time_zone = time_zone or "UTC"
+        notif_hour = int(notif_time.split(":")[0])
+        bucket = buckets.setdefault(
+            (time_zone, notif_hour), DigestBucket(time_zone, notif_hour)
+        )
+        subscriber = bucket.subscribers.setdefault(
+            chat_id, DigestSubscriber(chat_id=chat_id, lang=lang or "en")
+        )
+        subscriber.favourite_teams.add(team)
+
+    users_time_zones = defaultdict(list)
+
+    for user_time_zone in fixtures_db_manager.get_users_time_zones(
+        list({chat_id for bucket in buckets.values() for chat_id in bucket.subscribers})
+    ):
+        users_time_zones[user_time_zone.chat_id].append(user_time_zone)
+
+    for bucket in buckets.values():
+        for subscriber in bucket.subscribers.values():
+            subscriber.user_time_zones = users_time_zones[subscriber.chat_id]
+
+    return list(buckets.values())
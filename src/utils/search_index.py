@@ -0,0 +1,338 @@
+import heapq
+import re
+import time
+import unicodedata
+from collections import Counter, defaultdict
+from dataclasses import dataclass
+from threading import Lock, Thread
+from typing import Dict, Generic, Iterable, List, Optional, Set, Tuple, TypeVar
+
+from src.db.fixtures_db_manager import FixturesDBManager
+from src.db.notif_sql_models import Language as DBLanguage
+from src.db.notif_sql_models import League as DBLeague
+from src.db.notif_sql_models import Team as DBTeam
+from src.db.notif_sql_models import TimeZone as DBTimeZone
+from src.notifier_constants import (
+    SEARCH_INDEX_MIN_SIMILARITY,
+    SEARCH_INDEX_MIN_TRIGRAM_HITS,
+    SEARCH_INDEX_TTL,
+    SEARCH_RESULTS_LIMIT,
+)
+from src.notifier_logger import get_logger
+
+logger = get_logger(__name__)
+
+T = TypeVar("T")
+
+NON_ALPHANUMERIC_PATTERN = re.compile(r"[^0-9a-z]+")
+
+
+def fold_text(text: str) -> str:
+    """
+    Lower cased text without accents nor punctuation, e.g. 'Atlético-MG' is
+    folded to 'atletico mg'.
+    """
+    decomposed_text = unicodedata.normalize("NFKD", text)
+    unaccented_text = "".join(
+        char for char in decomposed_text if not unicodedata.combining(char)
+    )
+
+    return " ".join(
+        NON_ALPHANUMERIC_PATTERN.sub(" ", unaccented_text.casefold()).split()
+    )
+
+
+def get_trigrams(text: str) -> Set[str]:
+    padded_text = f"  {text} "
+    return {padded_text[i : i + 3] for i in range(len(padded_text) - 2)}
+
+
+def get_similarity(trigrams: Set[str], other_trigrams: Set[str]) -> float:
+    return 2 * len(trigrams & other_trigrams) / (len(trigrams) + len(other_trigrams))
+
+
+class PrefixTrie:
+    def __init__(self) -> None:
+        # each node maps its children chars, and None to the ids below it
+        self._root: Dict[Optional[str], dict] = {}
+
+    def insert(self, word: str, document_id: int) -> None:
+        node = self._root
+
+        for char in word:
+            node = node.setdefault(char, {})
+            node.setdefault(None, set()).add(document_id)
+
+    def search(self, prefix: str) -> Set[int]:
+        node = self._root
+
+        for char in prefix:
+            node = node.get(char)
+
+            if node is None:
+                return set()
+
+        return node.get(None, set())
+
+
+@dataclass
+class IndexedName:
+    name: str
+    words: List[str]
+    trigrams: Set[str]
+    words_trigrams: List[Set[str]]
+
+
+def get_indexed_name(name: str) -> IndexedName:
+    words = name.split()
+
+    return IndexedName(
+        name=name,
+        words=words,
+        trigrams=get_trigrams(name),
+        words_trigrams=[get_trigrams(word) for word in words],
+    )
+
+
+def get_name_score(query: str, query_trigrams: Set[str], name: IndexedName) -> float:
+    """
+    Exact matches rank first, then names starting with the query, names with words
+    starting with each of the query ones, names containing it, and last the ones
+    similar enough to be a typo.
+    """
+    if name.name == query:
+        return 4.0
+    if name.name.startswith(query):
+        return 3.0
+    if all(
+        any(word.startswith(query_word) for word in name.words)
+        for query_word in query.split()
+    ):
+        return 2.0
+    if query in name.name:
+        return 1.0
+
+    similarity = max(
+        get_similarity(query_trigrams, trigrams)
+        for trigrams in [name.trigrams, *name.words_trigrams]
+    )
+
+    return similarity if similarity >= SEARCH_INDEX_MIN_SIMILARITY else 0.0
+
+
+class SearchIndex(Generic[T]):
+    """
+    Accent and case insensitive search of items by any of their names, combining
+    a prefix trie of the names words with a trigrams index for partial and typo
+    tolerant matches.
+    """
+
+    def __init__(self, documents: Iterable[Tuple[T, Iterable[str]]]) -> None:
+        self._items: List[T] = []
+        self._names: List[List[IndexedName]] = []
+        self._trie = PrefixTrie()
+        self._trigrams: Dict[str, Set[int]] = defaultdict(set)
+
+        for item, names in documents:
+            folded_names = [
+                fold_text(name) for name in dict.fromkeys(names) if name is not None
+            ]
+            indexed_names = [
+                get_indexed_name(name) for name in dict.fromkeys(folded_names) if name
+            ]
+
+            if not indexed_names:
+                continue
+
+            document_id = len(self._items)
+            self._items.append(item)
+            self._names.append(indexed_names)
+
+            for indexed_name in indexed_names:
+                for word in indexed_name.words:
+                    self._trie.insert(word, document_id)
+                for trigram in indexed_name.trigrams:
+                    self._trigrams[trigram].add(document_id)
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def _get_candidates(self, query: str, query_trigrams: Set[str]) -> Set[int]:
+        query_words = query.split()
+        candidates = set.intersection(
+            *(self._trie.search(query_word) for query_word in query_words)
+        )
+
+        trigram_hits = Counter(
+            document_id
+            for trigram in query_trigrams
+            for document_id in self._trigrams.get(trigram, ())
+        )
+        min_hits = max(
+            SEARCH_INDEX_MIN_TRIGRAM_HITS,
+            int(len(query_trigrams) * SEARCH_INDEX_MIN_SIMILARITY / 2),
+        )
+        candidates.update(
+            document_id
+            for document_id, hits in trigram_hits.items()
+            if hits >= min_hits
+        )
+
+        return candidates
+
+    def search(self, query: str, limit: Optional[int] = None) -> List[T]:
+        folded_query = fold_text(query)
+
+        if not folded_query:
+            return []
+
+        query_trigrams = get_trigrams(folded_query)
+        scored_documents = []
+
+        for document_id in self._get_candidates(folded_query, query_trigrams):
+            score, name = max(
+                (get_name_score(folded_query, query_trigrams, name), name.name)
+                for name in self._names[document_id]
+            )
+
+            if score:
+                scored_documents.append((-score, len(name), name, document_id))
+
+        scored_documents = (
+            sorted(scored_documents)
+            if limit is None
+            else heapq.nsmallest(limit, scored_documents)
+        )
+
+        return [self._items[document_id] for *_, document_id in scored_documents]
+
+
+@dataclass
+class CatalogIndexes:
+    teams: SearchIndex[DBTeam]
+    leagues: SearchIndex[DBLeague]
+    leagues_by_country: SearchIndex[DBLeague]
+    time_zones: SearchIndex[DBTimeZone]
+    languages: SearchIndex[DBLanguage]
+
+
+class CatalogSearch:
+    """
+    In-process search of teams, leagues, time zones and languages, which are
+    loaded from database once and rebuilt in background every SEARCH_INDEX_TTL
+    seconds, so searches don't hit the database.
+    """
+
+    def __init__(
+        self,
+        fixtures_db_manager: FixturesDBManager = None,
+        ttl: float = SEARCH_INDEX_TTL,
+    ) -> None:
+        self._fixtures_db_manager = fixtures_db_manager
+        self._ttl = ttl
+        self._indexes: Optional[CatalogIndexes] = None
+        self._built_at = 0.0
+        self._lock = Lock()
+        self._refreshing = False
+
+    def _build_indexes(self) -> CatalogIndexes:
+        start = time.perf_counter()
+        fixtures_db_manager = self._fixtures_db_manager or FixturesDBManager()
+        countries = {
+            country.id: country.name
+            for country in fixtures_db_manager.get_all_countries()
+        }
+
+        teams = []
+        for team in fixtures_db_manager.get_all_teams():
+            # search results are shown with their country name
+            team_with_country = DBTeam(**team.dict())
+            team_with_country.country = countries.get(team.country, "")
+            teams.append((team_with_country, [team.name, *(team.aliases or [])]))
+
+        leagues = fixtures_db_manager.get_all_leagues()
+
+        indexes = CatalogIndexes(
+            teams=SearchIndex(teams),
+            leagues=SearchIndex((league, [league.name]) for league in leagues),
+            leagues_by_country=SearchIndex(
+                (league, [league.country]) for league in leagues
+            ),
+            time_zones=SearchIndex(
+                (time_zone, [time_zone.name])
+                for time_zone in fixtures_db_manager.get_all_time_zones()
+            ),
+            languages=SearchIndex(
+                (language, [language.name])
+                for language in fixtures_db_manager.get_all_languages()
+            ),
+        )
+
+        logger.info(
+            f"Search indexes built in {time.perf_counter() - start:.3f}s - "
+            f"{len(indexes.teams)} teams, {len(leagues)} leagues"
+        )
+
+        return indexes
+
+    def refresh(self) -> None:
+        indexes = self._build_indexes()
+
+        with self._lock:
+            self._indexes = indexes
+            self._built_at = time.monotonic()
+
+    def _refresh_in_background(self) -> None:
+        def refresh() -> None:
+            try:
+                self.refresh()
+            except Exception as e:
+                logger.error(f"Error refreshing search indexes - {str(e)}")
+            finally:
+                with self._lock:
+                    self._refreshing = False
+
+        Thread(target=refresh, daemon=True).start()
+
+    def _get_indexes(self) -> CatalogIndexes:
+        with self._lock:
+            indexes = self._indexes
+            is_stale = time.monotonic() - self._built_at > self._ttl
+
+            if indexes is not None and is_stale and not self._refreshing:
+                self._refreshing = True
+                self._refresh_in_background()
+
+        if indexes is None:
+            self.refresh()
+            indexes = self._indexes
+
+        return indexes
+
+    def search_teams(
+        self, text: str, limit: int = SEARCH_RESULTS_LIMIT
+    ) -> List[DBTeam]:
+        return self._get_indexes().teams.search(text, limit)
+
+    def search_leagues(
+        self, text: str, limit: int = SEARCH_RESULTS_LIMIT
+    ) -> List[DBLeague]:
+        return self._get_indexes().leagues.search(text, limit)
+
+    def search_leagues_by_country(
+        self, text: str, limit: int = SEARCH_RESULTS_LIMIT
+    ) -> List[DBLeague]:
+        return self._get_indexes().leagues_by_country.search(text, limit)
+
+    def search_time_zones(
+        self, text: str, limit: int = SEARCH_RESULTS_LIMIT
+    ) -> List[DBTimeZone]:
+        return self._get_indexes().time_zones.search(text, limit)
+
+    def search_languages(
+        self, text: str, limit: int = SEARCH_RESULTS_LIMIT
+    ) -> List[DBLanguage]:
+        return self._get_indexes().languages.search(text, limit)
+
+
+CATALOG_SEARCH = CatalogSearch()
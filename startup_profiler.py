@@ -0,0 +1,86 @@
+import argparse
+import statistics
+import subprocess
+import sys
+from collections import defaultdict
+from typing import Dict, List, Tuple
+
+ENTRY_POINTS = [
+    "notifier_bot",
+    "notifier_daemon",
+    "events_collector",
+    "partial_db_updater",
+    "src.notifiers.ft_team_game_approaching",
+    "src.notifiers.ft_team_game_played",
+    "src.notifiers.daily_ft_notifier",
+    "src.notifiers.daily_fl_notifier",
+]
+
+
+def parse_import_times(import_time_output: str) -> List[Tuple[str, int, int]]:
+    """
+    Parses the `python -X importtime` output into (module, self us, cumulative us).
+    """
+    import_times = []
+
+    for line in import_time_output.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+
+        self_time, cumulative_time, module = line[len("import time:") :].split("|")
+        import_times.append(
+            (module.strip(), int(self_time.strip()), int(cumulative_time.strip()))
+        )
+
+    return import_times
+
+
+def get_packages_times(import_times: List[Tuple[str, int, int]]) -> Dict[str, int]:
+    packages_times = defaultdict(int)
+
+    for module, self_time, _ in import_times:
+        packages_times[module.split(".")[0]] += self_time
+
+    return packages_times
+
+
+def profile_import(module: str) -> List[Tuple[str, int, int]]:
+    process = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+    )
+
+    if process.returncode:
+        raise RuntimeError(f"Importing {module} failed:\n{process.stderr[-2000:]}")
+
+    return parse_import_times(process.stderr)
+
+
+def profile_startup(modules: List[str], runs: int, top: int) -> None:
+    for module in modules:
+        runs_times = [profile_import(module) for _ in range(runs)]
+        total_time = statistics.median(
+            next(cumulative for name, _, cumulative in times if name == module)
+            for times in runs_times
+        )
+        packages_times = get_packages_times(runs_times[-1])
+        heaviest_packages = sorted(
+            packages_times.items(), key=lambda item: item[1], reverse=True
+        )[:top]
+
+        print(f"{module}: {total_time / 1000:.1f} ms (median of {runs} runs)")
+        for package, package_time in heaviest_packages:
+            print(f"    {package:<24} {package_time / 1000:>8.1f} ms")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Import time of the entry points and their heaviest packages."
+    )
+    parser.add_argument("modules", nargs="*", default=ENTRY_POINTS)
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--top", type=int, default=8)
+    args = parser.parse_args()
+
+    profile_startup(args.modules, args.runs, args.top)
@@ -0,0 +1,65 @@
+import asyncio
+from typing import Dict
+
+from src.telegram_bot.bot_persistence import DBPersistence
+
+
+class InMemoryBotPersistenceDBManager:
+    def __init__(self) -> None:
+        self.entries: Dict[tuple, bytes] = {}
+
+    def get_entries(self, namespace: str) -> Dict[str, bytes]:
+        return {k: v for (n, k), v in self.entries.items() if n == namespace}
+
+    def save_entry(self, namespace: str, key: str, data: bytes) -> None:
+        self.entries[(namespace, key)] = data
+
+    def delete_entry(self, namespace: str, key: str) -> None:
+        self.entries.pop((namespace, key), None)
+
+
+def test_conversations_survive_restarts():
+    # given
+    persistence_db_manager = InMemoryBotPersistenceDBManager()
+    persistence = DBPersistence(persistence_db_manager)
+
+    async def move_conversations():
+        await persistence.update_conversation("add_favourite_team", (1, 2), 4)
+        await persistence.update_conversation("search_team", (1, 2), 6)
+        await persistence.update_conversation("search_team", (1, 2), None)
+        await persistence.update_conversation("search_team", (3, 4), 6)
+
+        restarted_persistence = DBPersistence(persistence_db_manager)
+
+        return (
+            await restarted_persistence.get_conversations("add_favourite_team"),
+            await restarted_persistence.get_conversations("search_team"),
+        )
+
+    # when
+    add_favourite_team_conversations, search_team_conversations = asyncio.run(
+        move_conversations()
+    )
+
+    # then
+    assert add_favourite_team_conversations == {(1, 2): 4}
+    assert search_team_conversations == {(3, 4): 6}
+
+
+def test_user_data_survives_restarts():
+    # given
+    persistence_db_manager = InMemoryBotPersistenceDBManager()
+    persistence = DBPersistence(persistence_db_manager)
+
+    async def save_user_data():
+        await persistence.update_user_data(2, {"command": "last_match"})
+        await persistence.update_user_data(3, {"command": "next_match"})
+        await persistence.drop_user_data(3)
+
+        return await DBPersistence(persistence_db_manager).get_user_data()
+
+    # when
+    user_data = asyncio.run(save_user_data())
+
+    # then
+    assert user_data == {2: {"command": "last_match"}}
@@ -0,0 +1,49 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+from threading import Barrier, Event
+
+import pytest
+
+from src.utils.cache_utils import SingleFlight
+
+
+def test_single_flight_shares_in_flight_call():
+    # given
+    single_flight = SingleFlight()
+    release_call = Event()
+    all_started = Barrier(5)
+    calls = []
+
+    def fetch(team_id: int) -> dict:
+        calls.append(team_id)
+        release_call.wait(timeout=5)
+        return {"team": team_id}
+
+    def get_team() -> dict:
+        all_started.wait()
+        return single_flight.do(("team", 435), fetch, 435)
+
+    # when
+    with ThreadPoolExecutor(max_workers=5) as executor:
+        futures = [executor.submit(get_team) for _ in range(5)]
+        time.sleep(0.2)
+        release_call.set()
+        results = [future.result() for future in futures]
+
+    # then
+    assert calls == [435]
+    assert all(result is results[0] for result in results)
+
+
+def test_single_flight_shares_errors_and_forgets_finished_calls():
+    # given
+    single_flight = SingleFlight()
+
+    def fail() -> None:
+        raise ValueError("upstream error")
+
+    # when - then
+    with pytest.raises(ValueError):
+        single_flight.do("key", fail)
+
+    assert single_flight.do("key", lambda: "retried") == "retried"
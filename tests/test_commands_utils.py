@@ -0,0 +1,53 @@
+import asyncio
+import time
+
+import pytest
+
+from src.telegram_bot.commands_utils import run_command
+from src.utils.deadline_utils import deadline, time_left
+
+
+def slow_command(seconds: float) -> float:
+    time.sleep(seconds)
+    return seconds
+
+
+def test_run_command_does_not_block_event_loop():
+    # given
+    async def run_commands():
+        return await asyncio.gather(*(run_command(slow_command, 0.2) for _ in range(4)))
+
+    # when
+    start = time.monotonic()
+    results = asyncio.run(run_commands())
+    elapsed = time.monotonic() - start
+
+    # then
+    assert results == [0.2] * 4
+    assert elapsed < 0.6
+
+
+def test_run_command_times_out():
+    # when - then
+    with pytest.raises(asyncio.TimeoutError):
+        asyncio.run(run_command(slow_command, 0.3, timeout=0.05))
+
+
+def test_run_command_shares_the_update_deadline():
+    # given
+    async def run_commands():
+        with deadline(0.3):
+            await run_command(slow_command, 0.2)
+            await run_command(slow_command, 0.2)
+
+    # when - then
+    with pytest.raises(asyncio.TimeoutError):
+        asyncio.run(run_commands())
+
+
+def test_run_command_passes_the_deadline_to_the_function():
+    # when
+    command_time_left = asyncio.run(run_command(time_left, timeout=5))
+
+    # then
+    assert 0 < command_time_left <= 5
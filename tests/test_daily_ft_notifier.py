@@ -0,0 +1,121 @@
+from datetime import datetime, timezone
+from unittest.mock import MagicMock, patch
+
+from freezegun import freeze_time
+
+from src.db.notif_sql_models import Fixture as DBFixture
+from src.db.notif_sql_models import UserTimeZone
+from src.notifiers.daily_ft_notifier import DailyFTNotifier
+from src.utils.notifier_utils import (
+    DigestBucket,
+    DigestSubscriber,
+    get_favourite_teams_digest_buckets,
+)
+
+
+def get_db_fixture(fixture_id: int, home_team: int, away_team: int) -> DBFixture:
+    return DBFixture(
+        id=fixture_id,
+        utc_date="2023-05-01T21:00:00+00:00",
+        bsas_date="2023-05-01T18:00:00+00:00",
+        league=128,
+        round="Regular Season - 1",
+        home_team=home_team,
+        away_team=away_team,
+        venue="Estadio Monumental",
+        match_status="Not Started",
+        referee="Perluigi Colina",
+    )
+
+
+def get_converted_fixture(fixture_id: int) -> MagicMock:
+    converted_fixture = MagicMock(id=fixture_id, utc_date=datetime(2023, 5, 1, 21))
+    converted_fixture.one_line_telegram_repr.return_value = f"fixture {fixture_id}"
+
+    return converted_fixture
+
+
+@patch("src.notifiers.daily_ft_notifier.send_telegram_message")
+@patch("src.notifiers.daily_ft_notifier.convert_db_fixtures")
+@patch("src.notifiers.daily_ft_notifier.get_favourite_teams_digest_buckets")
+@patch("src.notifiers.daily_ft_notifier.FixturesDBManager")
+def test_notify_daily_ft_loads_fixtures_once_per_bucket(
+    fixtures_db_manager_mock,
+    get_favourite_teams_digest_buckets_mock,
+    convert_db_fixtures_mock,
+    send_telegram_message_mock,
+):
+    # given
+    get_favourite_teams_digest_buckets_mock.return_value = [
+        DigestBucket(
+            "America/Argentina/Buenos_Aires",
+            17,
+            {
+                "1": DigestSubscriber("1", "es", {435}),
+                "2": DigestSubscriber("2", "en", {451, 1}),
+            },
+        ),
+        DigestBucket("UTC", 8, {"3": DigestSubscriber("3", "en", {435})}),
+    ]
+    get_fixtures_in_range_mock = (
+        fixtures_db_manager_mock.return_value.get_fixtures_in_range
+    )
+    get_fixtures_in_range_mock.return_value = [
+        get_db_fixture(1, 435, 451),
+        get_db_fixture(2, 1, 2),
+    ]
+    convert_db_fixtures_mock.return_value = [
+        get_converted_fixture(1),
+        get_converted_fixture(2),
+    ]
+
+    # when
+    with freeze_time("2023-05-01 19:58:00"):
+        DailyFTNotifier(notif_type=1).notify_daily_ft()
+
+    # then
+    get_fixtures_in_range_mock.assert_called_once_with(
+        datetime(2023, 5, 1, 3, tzinfo=timezone.utc),
+        datetime(2023, 5, 2, 3, tzinfo=timezone.utc),
+        teams=[1, 435, 451],
+        exclude_statuses=["Time to be defined"],
+    )
+    assert convert_db_fixtures_mock.call_count == 1
+    sent_messages = {
+        call.kwargs["chat_id"]: call.kwargs
+        for call in send_telegram_message_mock.call_args_list
+    }
+    assert list(sent_messages) == ["1", "2"]
+    assert sent_messages["1"]["lang"] == "es"
+    assert "fixture 1" in sent_messages["1"]["message"]
+    assert "fixture 2" not in sent_messages["1"]["message"]
+    assert "fixture 1" in sent_messages["2"]["message"]
+    assert "fixture 2" in sent_messages["2"]["message"]
+
+
+@patch("src.utils.notifier_utils.fixtures_db_manager")
+def test_get_favourite_teams_digest_buckets(fixtures_db_manager_mock):
+    # given
+    fixtures_db_manager_mock.get_favourite_teams_notif_subscriptions.return_value = [
+        ("1", 435, "10:00", "Europe/Amsterdam", "es"),
+        ("1", 451, "10:00", "Europe/Amsterdam", "es"),
+        ("2", 435, "10:30", "Europe/Amsterdam", None),
+        ("3", 435, "9:00", None, "en"),
+    ]
+    fixtures_db_manager_mock.get_users_time_zones.return_value = [
+        UserTimeZone(chat_id="1", time_zone=2, is_main_tz=True)
+    ]
+
+    # when
+    buckets = get_favourite_teams_digest_buckets(1)
+
+    # then
+    assert [(bucket.time_zone, bucket.notif_hour) for bucket in buckets] == [
+        ("Europe/Amsterdam", 10),
+        ("UTC", 9),
+    ]
+    assert buckets[0].teams() == {435, 451}
+    assert buckets[0].subscribers["1"].favourite_teams == {435, 451}
+    assert buckets[0].subscribers["1"].time_zones_key() == ((2, True),)
+    assert buckets[0].subscribers["2"].lang == "en"
+    assert list(buckets[1].subscribers) == ["3"]
@@ -1,10 +1,13 @@
-from datetime import datetime
+from datetime import date, datetime, timezone
 
 from freezegun import freeze_time
 
 from src.utils.date_utils import (
     get_date_diff,
+    get_day_range_in_time_zone,
     get_formatted_date,
+    get_time_in_time_zone_str,
+    is_notif_hour,
     is_time_between,
     is_time_in_surrounding_hours,
 )
@@ -105,3 +108,23 @@ def test_get_date_diff_now_earlier():
         # then
         assert diff.days == 0
         assert diff.seconds == 1800
+
+
+def test_get_day_range_in_time_zone():
+    # when
+    start, end = get_day_range_in_time_zone(
+        date(2023, 5, 1), "America/Argentina/Buenos_Aires"
+    )
+
+    # then
+    assert start == datetime(2023, 5, 1, 3, tzinfo=timezone.utc)
+    assert end == datetime(2023, 5, 2, 3, tzinfo=timezone.utc)
+
+
+def test_is_notif_hour_around_midnight():
+    # given
+    now = get_time_in_time_zone_str(datetime(2023, 5, 1, 21, 57), "Europe/Amsterdam")
+
+    # when - then
+    assert is_notif_hour(now, 0) is True
+    assert is_notif_hour(now, 23) is False
@@ -10,8 +10,83 @@ def test_unique_db_engine_when_multiple_instances_calls(create_engine_mock):
     create_engine_mock.side_effect = [MagicMock(id="mock_1"), MagicMock(id="mock_2")]
 
     # when - then
-    NotifierDBManager()
+    NotifierDBManager().pool_metrics()
     assert NotifierDBManager.ENGINE.id == "mock_1"
 
-    NotifierDBManager()
+    NotifierDBManager().pool_metrics()
     assert NotifierDBManager.ENGINE.id == "mock_1"
+
+
+@patch("src.db.db_manager.create_engine")
+def test_db_engine_created_on_first_use(create_engine_mock):
+    # given
+    NotifierDBManager.ENGINE = None
+
+    # when
+    db_manager = NotifierDBManager()
+    engine_created_on_init = create_engine_mock.called
+    db_manager.pool_metrics()
+
+    # then
+    assert not engine_created_on_init
+    create_engine_mock.assert_called_once()
+
+
+@patch("src.db.db_manager.Session")
+@patch("src.db.db_manager.create_engine")
+def test_unit_of_work_shares_one_session(create_engine_mock, session_mock):
+    # given
+    NotifierDBManager.ENGINE = None
+    session = session_mock.return_value.__enter__.return_value
+    db_manager = NotifierDBManager()
+
+    # when
+    with db_manager.unit_of_work():
+        db_manager.insert_record(MagicMock())
+        db_manager.select_records(MagicMock())
+
+    # then
+    assert session_mock.call_count == 1
+    assert session.flush.call_count == 2
+    session.begin.assert_called_once()
+    session.commit.assert_not_called()
+
+
+@patch("src.db.db_manager.Session")
+@patch("src.db.db_manager.create_engine")
+def test_session_per_operation_outside_unit_of_work(create_engine_mock, session_mock):
+    # given
+    NotifierDBManager.ENGINE = None
+    session = session_mock.return_value.__enter__.return_value
+    db_manager = NotifierDBManager()
+
+    # when
+    db_manager.insert_record(MagicMock())
+    db_manager.delete_record(MagicMock())
+
+    # then
+    assert session_mock.call_count == 2
+    assert session.commit.call_count == 2
+    assert session_mock.return_value.__exit__.call_count == 2
+
+
+@patch("src.db.db_manager.Session")
+@patch("src.db.db_manager.create_engine")
+def test_outside_unit_of_work_uses_its_own_session(create_engine_mock, session_mock):
+    # given
+    NotifierDBManager.ENGINE = None
+    session = session_mock.return_value.__enter__.return_value
+    db_manager = NotifierDBManager()
+
+    # when
+    with db_manager.unit_of_work():
+        with db_manager.outside_unit_of_work():
+            db_manager.insert_record(MagicMock())
+            in_unit_of_work = db_manager.in_unit_of_work()
+        db_manager.select_records(MagicMock())
+
+    # then
+    assert not in_unit_of_work
+    assert session_mock.call_count == 2
+    assert session.commit.call_count == 1
+    assert session.flush.call_count == 1
@@ -0,0 +1,75 @@
+from unittest.mock import MagicMock, patch
+
+from events_collector import collect_live_events
+from src.entities import Event
+from src.utils.notifier_utils import TeamSubscriber
+
+
+def get_fixture_response(events: list) -> dict:
+    return {
+        "fixture": {"id": 1},
+        "teams": {
+            "home": {"id": 435, "name": "River Plate", "logo": ""},
+            "away": {"id": 451, "name": "Boca Juniors", "logo": ""},
+        },
+        "goals": {"home": 1, "away": 0},
+        "events": events,
+    }
+
+
+def get_event(event_type: str, detail: str) -> dict:
+    return {
+        "time": {"elapsed": 10},
+        "team": {"id": 435, "name": "River Plate", "logo": ""},
+        "player": {"id": 1, "name": "Enzo Perez"},
+        "assist": {"id": None, "name": None},
+        "type": event_type,
+        "detail": detail,
+    }
+
+
+@patch("events_collector.send_many_messages")
+@patch("events_collector.get_team_subscribers")
+@patch("events_collector.convert_fixtures_response_to_db")
+@patch("events_collector.FIXTURES_DB_MANAGER")
+@patch("events_collector.fetch_fixtures_responses")
+def test_collect_live_events_notifies_new_goals_and_red_cards(
+    fetch_fixtures_responses_mock,
+    fixtures_db_manager_mock,
+    convert_fixtures_response_to_db_mock,
+    get_team_subscribers_mock,
+    send_many_messages_mock,
+):
+    # given
+    fixtures_db_manager_mock.get_games_in_surrounding_n_hours.return_value = [
+        MagicMock(id=1, match_status="Second Half")
+    ]
+    fixtures_db_manager_mock.save_fixture_events.side_effect = (
+        lambda fixture_id, events: events
+    )
+    fetch_fixtures_responses_mock.return_value = [
+        get_fixture_response(
+            [get_event("Goal", "Normal Goal"), get_event("subst", "Substitution 1")]
+        )
+    ]
+    get_team_subscribers_mock.return_value = [
+        TeamSubscriber("1", 435, "es", {7}),
+        TeamSubscriber("1", 451, "es", {7}),
+        TeamSubscriber("2", 451, "en", {7}),
+    ]
+
+    # when
+    collect_live_events()
+
+    # then
+    messages = send_many_messages_mock.call_args.args[0]
+    saved_events = fixtures_db_manager_mock.save_fixture_events.call_args.args[1]
+
+    assert fetch_fixtures_responses_mock.call_args.args[0] == [[1]]
+    assert all(isinstance(event, Event) for event in saved_events)
+    assert [(message.chat_id, message.lang) for message in messages] == [
+        ("1", "es"),
+        ("2", "en"),
+    ]
+    assert "GOAL! - Enzo Perez" in messages[0].message
+    assert "Substitution" not in messages[0].message
@@ -1,3 +1,5 @@
+from dataclasses import replace
+
 import pytest
 
 from src.entities import Fixture, RemainingTime
@@ -5,7 +7,7 @@ from src.entities import Fixture, RemainingTime
 
 def test_fixture_post_init(fixture: Fixture):
     # given - when - then
-    assert fixture.line_up is None
+    assert fixture.events == []
     assert fixture.highlights == [
         "https://www.youtube.com/results?search_query=River Plate+vs+Boca Juniors"
     ]
@@ -24,8 +26,7 @@ def test_matched_played_str(fixture: Fixture):
 
 def test_one_line_telegram_repr_not_played(fixture: Fixture):
     # given
-    fixture.match_score.home_score = None
-    fixture.match_score.away_score = None
+    fixture.match_score = replace(fixture.match_score, home_score=None, away_score=None)
 
     # when - then
     print(f"Notification\n{fixture.one_line_telegram_repr()}\n\n")
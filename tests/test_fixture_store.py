@@ -0,0 +1,132 @@
+import time
+from datetime import datetime, timezone
+from threading import Thread
+from unittest.mock import MagicMock
+
+from freezegun import freeze_time
+
+from src.utils.fixture_store import FixtureStore
+
+
+def get_fixture_row(
+    fixture_id: int,
+    kickoff: datetime,
+    home_team: int,
+    away_team: int,
+    league: int = 128,
+    match_status: str = "Not Started",
+):
+    return (
+        fixture_id,
+        kickoff.isoformat(),
+        kickoff,
+        league,
+        "Regular Season - 1",
+        home_team,
+        away_team,
+        "Estadio Monumental",
+        match_status,
+        "",
+        None,
+        None,
+        None,
+        None,
+    )
+
+
+@freeze_time("2023-05-10 12:00:00")
+def test_fixture_store_next_and_last_fixtures_by_team_and_league():
+    # given
+    fixtures_db_manager = MagicMock()
+    fixtures_db_manager.get_fixtures_rows.return_value = [
+        get_fixture_row(1, datetime(2023, 5, 1, 20, tzinfo=timezone.utc), 435, 451),
+        get_fixture_row(2, datetime(2023, 5, 20, 20, tzinfo=timezone.utc), 451, 435),
+        get_fixture_row(3, datetime(2023, 5, 15, 20, tzinfo=timezone.utc), 435, 1, 13),
+        get_fixture_row(
+            4,
+            datetime(2023, 5, 12, 20, tzinfo=timezone.utc),
+            435,
+            460,
+            match_status="Match Postponed",
+        ),
+    ]
+    fixture_store = FixtureStore(fixtures_db_manager)
+
+    # when
+    next_fixtures = fixture_store.get_next_fixture(
+        team_id="435", number_of_fixtures=5, exclude_statuses=["Match Postponed"]
+    )
+    next_league_fixture = fixture_store.get_next_fixture(league_id=128)
+    last_fixture = fixture_store.get_last_fixture(team_id=451)
+
+    # then
+    assert [fixture.id for fixture in next_fixtures] == [3, 2]
+    assert [fixture.id for fixture in next_league_fixture] == [4]
+    assert [fixture.id for fixture in last_fixture] == [1]
+    assert fixtures_db_manager.get_fixtures_rows.call_count == 1
+
+
+def test_fixture_store_update_reads_changed_fixtures():
+    # given
+    fixtures_db_manager = MagicMock()
+    fixtures_db_manager.get_fixtures_rows.side_effect = [
+        [get_fixture_row(1, datetime(2023, 5, 12, 20, tzinfo=timezone.utc), 435, 451)],
+        [
+            get_fixture_row(
+                1, datetime(2023, 5, 13, 20, tzinfo=timezone.utc), 435, 460
+            ),
+            get_fixture_row(
+                2, datetime(2023, 5, 20, 20, tzinfo=timezone.utc), 451, 435
+            ),
+        ],
+    ]
+    fixture_store = FixtureStore(fixtures_db_manager)
+
+    with freeze_time("2023-05-10 12:00:00"):
+        fixture_store.load()
+
+    # when
+    with freeze_time("2023-05-10 12:01:00"):
+        fixture_store.update()
+
+    # then
+    assert fixtures_db_manager.get_fixtures_rows.call_args.kwargs[
+        "updated_from"
+    ] == datetime(2023, 5, 10, 11, 55, tzinfo=timezone.utc)
+    assert fixture_store._updated_from == datetime(
+        2023, 5, 10, 11, 56, tzinfo=timezone.utc
+    )
+
+    with freeze_time("2023-05-10 12:02:00"):
+        assert [
+            fixture.id for fixture in fixture_store.get_next_fixture(team_id=451)
+        ] == [2]
+        assert [
+            fixture.kickoff.day
+            for fixture in fixture_store.get_next_fixture(team_id=460)
+        ] == [13]
+
+
+def test_fixture_store_first_load_happens_once():
+    # given
+    fixtures_db_manager = MagicMock()
+
+    def get_fixtures_rows(*args, **kwargs):
+        time.sleep(0.05)
+        return []
+
+    fixtures_db_manager.get_fixtures_rows.side_effect = get_fixtures_rows
+    fixture_store = FixtureStore(fixtures_db_manager)
+
+    # when
+    threads = [
+        Thread(target=fixture_store.get_next_fixture, kwargs={"team_id": 435})
+        for _ in range(5)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    # then
+    assert fixtures_db_manager.get_fixtures_rows.call_count == 1
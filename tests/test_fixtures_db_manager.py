@@ -0,0 +1,397 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from unittest.mock import MagicMock, patch
+
+from freezegun import freeze_time
+from sqlalchemy.dialects import postgresql
+
+from src.db.fixtures_db_manager import (
+    USER_PREFERENCES_CACHE,
+    FixturesDBManager,
+    UpsertCounts,
+    get_fixture_transitions,
+)
+from src.db.notif_sql_models import Event as DBEvent
+from src.entities import Championship, Event, FixtureForDB, MatchScore, Team
+
+
+def get_fixture_for_db(fixture_id: int, home_team_id: int, away_team_id: int):
+    return FixtureForDB(
+        id=fixture_id,
+        utc_date="2023-05-01T20:00:00+00:00",
+        bsas_date="2023-05-01T17:00:00",
+        date_diff=0,
+        referee="Perluigi Colina",
+        match_status="Not Started",
+        championship=Championship(
+            league_id=128,
+            name="Liga Profesional Argentina",
+            country="Argentina",
+            logo="https://media.api-sports.io/football/leagues/128.png",
+        ),
+        round="Regular Season - 1",
+        home_team=Team(id=home_team_id, name=f"Team {home_team_id}", logo=""),
+        away_team=Team(id=away_team_id, name=f"Team {away_team_id}", logo=""),
+        match_score=MatchScore(home_score=None, away_score=None),
+        venue="Estadio Monumental",
+    )
+
+
+@patch("src.db.fixtures_db_manager.NotifierDBManager")
+def test_save_fixtures_upserts_each_table_in_one_statement(notifier_db_manager_mock):
+    # given
+    execute_statements = notifier_db_manager_mock.return_value.execute_statements
+    execute_statements.return_value = [
+        [MagicMock(inserted=False)],
+        [MagicMock(inserted=True), MagicMock(inserted=False), MagicMock(inserted=True)],
+        [MagicMock(inserted=True), MagicMock(inserted=False)],
+    ]
+    fixtures = [
+        get_fixture_for_db(1, home_team_id=435, away_team_id=451),
+        get_fixture_for_db(2, home_team_id=451, away_team_id=450),
+    ]
+
+    # when
+    upsert_counts = FixturesDBManager().save_fixtures(fixtures)
+
+    # then
+    statements = execute_statements.call_args.args[0]
+    compiled_statements = [
+        statement.compile(dialect=postgresql.dialect()) for statement in statements
+    ]
+
+    assert execute_statements.call_count == 1
+    assert all("ON CONFLICT (id) DO UPDATE" in str(sql) for sql in compiled_statements)
+    assert len([key for key in compiled_statements[0].params if "id_m" in key]) == 1
+    assert len([key for key in compiled_statements[1].params if "id_m" in key]) == 3
+    assert len([key for key in compiled_statements[2].params if "id_m" in key]) == 2
+    assert upsert_counts == {
+        "league": UpsertCounts(inserted=0, updated=1),
+        "team": UpsertCounts(inserted=2, updated=1),
+        "fixture": UpsertCounts(inserted=1, updated=1),
+    }
+
+
+@patch("src.db.fixtures_db_manager.NotifierDBManager")
+def test_save_fixtures_without_fixtures(notifier_db_manager_mock):
+    # when
+    upsert_counts = FixturesDBManager().save_fixtures([])
+
+    # then
+    assert upsert_counts == {}
+    notifier_db_manager_mock.return_value.execute_statements.assert_not_called()
+
+
+@patch("src.db.fixtures_db_manager.NotifierDBManager")
+def test_get_last_fixture_filters_by_kickoff_range(notifier_db_manager_mock):
+    # when
+    FixturesDBManager().get_last_fixture(team_id=435, number_of_fixtures=5, year="2023")
+
+    # then
+    statement = notifier_db_manager_mock.return_value.select_records.call_args.args[0]
+    compiled_statement = statement.compile(dialect=postgresql.dialect())
+
+    assert "fixture.utc_date" not in str(compiled_statement.statement.whereclause)
+    assert "ORDER BY fixture.kickoff DESC" in str(compiled_statement)
+    assert compiled_statement.params["kickoff_2"] == datetime(
+        2023, 1, 1, tzinfo=timezone.utc
+    )
+    assert compiled_statement.params["kickoff_3"] == datetime(
+        2024, 1, 1, tzinfo=timezone.utc
+    )
+    assert compiled_statement.params["param_1"] == 5
+
+
+@patch("src.db.fixtures_db_manager.NotifierDBManager")
+def test_fixtures_upsert_statement_sets_kickoff(notifier_db_manager_mock):
+    # when
+    FixturesDBManager().save_fixtures(
+        [get_fixture_for_db(1, home_team_id=435, away_team_id=451)]
+    )
+
+    # then
+    statements = (
+        notifier_db_manager_mock.return_value.execute_statements.call_args.args[0]
+    )
+    compiled_statement = statements[2].compile(dialect=postgresql.dialect())
+
+    assert compiled_statement.params["kickoff_m0"] == datetime(
+        2023, 5, 1, 20, tzinfo=timezone.utc
+    )
+
+
+@patch("src.db.fixtures_db_manager.NotifierDBManager")
+def test_user_preferences_cached_until_invalidated(notifier_db_manager_mock):
+    # given
+    USER_PREFERENCES_CACHE.clear()
+    USER_PREFERENCES_CACHE.enabled = True
+    select_records = notifier_db_manager_mock.return_value.select_records
+    select_records.return_value = []
+    fixtures_db_manager = FixturesDBManager()
+
+    # when
+    try:
+        fixtures_db_manager.get_user_preferences("123")
+        fixtures_db_manager.get_user_preferences(123)
+        queries_before_invalidation = select_records.call_count
+
+        fixtures_db_manager.insert_or_update_user_config_language(
+            lang_id=28, chat_id="123"
+        )
+        queries_after_update = select_records.call_count
+        fixtures_db_manager.get_user_preferences("123")
+    finally:
+        USER_PREFERENCES_CACHE.enabled = False
+
+    # then
+    assert queries_before_invalidation == 5
+    assert select_records.call_count - queries_after_update == 5
+
+
+@patch("src.db.fixtures_db_manager.NotifierDBManager")
+def test_user_preferences_not_cached_outside_the_bot(notifier_db_manager_mock):
+    # given
+    select_records = notifier_db_manager_mock.return_value.select_records
+    select_records.return_value = []
+    fixtures_db_manager = FixturesDBManager()
+
+    # when
+    fixtures_db_manager.get_user_preferences("123")
+    fixtures_db_manager.get_user_preferences("123")
+
+    # then
+    assert select_records.call_count == 10
+
+
+def test_get_fixture_transitions():
+    # given
+    kickoff = datetime(2023, 5, 1, 20, tzinfo=timezone.utc)
+    previous_fixtures = {
+        1: MagicMock(match_status="Not Started", kickoff=kickoff),
+        2: MagicMock(match_status="Second Half", kickoff=kickoff),
+        3: MagicMock(match_status="Not Started", kickoff=kickoff),
+        4: MagicMock(match_status="Match Finished", kickoff=kickoff),
+    }
+    fixtures = [
+        {"id": 1, "match_status": "First Half", "kickoff": kickoff},
+        {"id": 2, "match_status": "Match Finished", "kickoff": kickoff},
+        {"id": 3, "match_status": "Not Started", "kickoff": kickoff.replace(hour=22)},
+        {"id": 4, "match_status": "Match Finished", "kickoff": kickoff},
+        {"id": 5, "match_status": "Not Started", "kickoff": kickoff},
+    ]
+
+    # when
+    transitions = get_fixture_transitions(previous_fixtures, fixtures)
+
+    # then
+    assert [
+        (transition.fixture, transition.event_type) for transition in transitions
+    ] == [(2, "finished"), (3, "kickoff_changed")]
+    assert transitions[0].previous_status == "Second Half"
+    assert transitions[1].previous_kickoff == kickoff
+
+
+@patch("src.db.fixtures_db_manager.NotifierDBManager")
+def test_save_fixtures_inserts_transitions_in_same_unit_of_work(
+    notifier_db_manager_mock,
+):
+    # given
+    notifier_db_manager = notifier_db_manager_mock.return_value
+    notifier_db_manager.select_records.return_value = [
+        MagicMock(
+            id=1,
+            match_status="Second Half",
+            kickoff=datetime(2023, 5, 1, 20, tzinfo=timezone.utc),
+        )
+    ]
+    fixture = get_fixture_for_db(1, home_team_id=435, away_team_id=451)
+    fixture.match_status = "Match Finished"
+
+    # when
+    FixturesDBManager().save_fixtures([fixture])
+
+    # then
+    transitions = notifier_db_manager.insert_records.call_args.args[0]
+
+    assert notifier_db_manager.unit_of_work.call_count == 2
+    assert [transition.event_type for transition in transitions] == ["finished"]
+
+
+@patch("src.db.fixtures_db_manager.NotifierDBManager")
+def test_save_fixture_events_only_inserts_new_events(notifier_db_manager_mock):
+    # given
+    notifier_db_manager = notifier_db_manager_mock.return_value
+    notifier_db_manager.select_records.side_effect = [
+        [
+            DBEvent(
+                fixture=1,
+                time=10,
+                team=435,
+                player=None,
+                type="Goal",
+                detail="Own Goal",
+            )
+        ],
+        [MagicMock(match_status="Match Finished")],
+    ]
+    events = [
+        Event(
+            time={"elapsed": 10},
+            team={"id": 435, "name": "River Plate", "logo": ""},
+            player={"id": None, "name": None},
+            assist={"id": None, "name": None},
+            type="Goal",
+            detail="Own Goal",
+        ),
+        Event(
+            time={"elapsed": 30, "extra": 2},
+            team={"id": 451, "name": "Boca Juniors", "logo": ""},
+            player={"id": None, "name": None},
+            assist={"id": None, "name": None},
+            type="Card",
+            detail="Red Card",
+        ),
+    ]
+
+    # when
+    new_events = FixturesDBManager().save_fixture_events(1, events)
+
+    # then
+    assert new_events == [events[1]]
+    assert notifier_db_manager.insert_record.call_count == 1
+    outbox_transitions = notifier_db_manager.insert_records.call_args.args[0]
+    assert [transition.event_type for transition in outbox_transitions] == [
+        "events_collected"
+    ]
+
+
+@patch("src.db.fixtures_db_manager.NotifierDBManager")
+def test_save_fixture_events_updates_corrected_events(notifier_db_manager_mock):
+    # given
+    notifier_db_manager = notifier_db_manager_mock.return_value
+    notifier_db_manager.select_records.side_effect = [
+        [
+            DBEvent(
+                id=5,
+                fixture=1,
+                time=60,
+                team=435,
+                player=10,
+                type="subst",
+                detail="Substitution 1",
+            )
+        ],
+        [MagicMock(match_status="Second Half")],
+    ]
+    events = [
+        Event(
+            time={"elapsed": 60},
+            team={"id": 435, "name": "River Plate", "logo": ""},
+            player={"id": None, "name": None},
+            assist={"id": None, "name": None},
+            type="subst",
+            detail=f"Substitution {substitution}",
+        )
+        for substitution in [1, 2]
+    ]
+
+    # when
+    new_events = FixturesDBManager().save_fixture_events(1, events)
+
+    # then
+    assert new_events == [events[1]]
+    assert notifier_db_manager.insert_record.call_count == 1
+    update_statement = notifier_db_manager.execute_statements.call_args.args[0][0]
+    compiled_statement = update_statement.compile(dialect=postgresql.dialect())
+    assert compiled_statement.params["id_1"] == 5
+    assert compiled_statement.params["player"] is None
+
+
+@patch("src.db.fixtures_db_manager.NotifierDBManager")
+def test_get_surround_games_in_time_zone_queries_the_local_day(
+    notifier_db_manager_mock,
+):
+    # given
+    select_records = notifier_db_manager_mock.return_value.select_records
+    select_records.return_value = []
+
+    # when
+    with freeze_time("2023-05-02 01:00:00"):
+        FixturesDBManager().get_surround_games_in_time_zone(
+            "yesterday",
+            leagues=[128],
+            teams=[435, 451],
+            time_zone="America/Argentina/Buenos_Aires",
+            exclude_statuses=["Time to be defined"],
+        )
+
+    # then
+    select_records.assert_called_once()
+    compiled_statement = select_records.call_args.args[0].compile(
+        dialect=postgresql.dialect()
+    )
+    assert compiled_statement.params["kickoff_1"] == datetime(
+        2023, 4, 30, 3, tzinfo=timezone.utc
+    )
+    assert compiled_statement.params["kickoff_2"] == datetime(
+        2023, 5, 1, 3, tzinfo=timezone.utc
+    )
+    assert compiled_statement.params["league_1"] == [128]
+    assert compiled_statement.params["home_team_1"] == [435, 451]
+    assert compiled_statement.params["match_status_1"] == ["Time to be defined"]
+    assert "ORDER BY fixture.kickoff ASC" in str(compiled_statement)
+
+
+@patch("src.db.fixtures_db_manager.NotifierDBManager")
+def test_prune_fixtures_outbox_keeps_events_not_processed_by_every_consumer(
+    notifier_db_manager_mock,
+):
+    # given
+    execute_statements = notifier_db_manager_mock.return_value.execute_statements
+    execute_statements.return_value = [[(1,), (2,)]]
+
+    # when
+    pruned_events = FixturesDBManager().prune_fixtures_outbox()
+
+    # then
+    statement = str(
+        execute_statements.call_args.args[0][0].compile(dialect=postgresql.dialect())
+    )
+
+    assert pruned_events == 2
+    assert "DELETE FROM fixtureoutbox" in statement
+    assert "fixtureoutbox.id <= (SELECT min(outboxcursor.last_event_id)" in statement
+
+
+@patch("src.db.fixtures_db_manager.NotifierDBManager")
+def test_coalesced_reads_give_each_caller_its_own_list(notifier_db_manager_mock):
+    # given
+    notifier_db_manager_mock.in_unit_of_work.return_value = False
+    release_query = threading.Event()
+    all_started = threading.Barrier(2)
+    db_events = [DBEvent(fixture=1, time=10, team=435, type="Goal")]
+
+    def select_records(statement):
+        release_query.wait(timeout=5)
+        return db_events
+
+    notifier_db_manager_mock.return_value.select_records.side_effect = select_records
+    fixtures_db_manager = FixturesDBManager()
+
+    def get_fixture_events():
+        all_started.wait()
+        return fixtures_db_manager.get_fixture_events(1)
+
+    # when
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        futures = [executor.submit(get_fixture_events) for _ in range(2)]
+        time.sleep(0.2)
+        release_query.set()
+        results = [future.result() for future in futures]
+
+    # then
+    assert notifier_db_manager_mock.return_value.select_records.call_count == 1
+    assert results[0] == results[1] == db_events
+    assert results[0] is not results[1]
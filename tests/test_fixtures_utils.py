@@ -1,12 +1,25 @@
 import os
 from datetime import datetime
+from unittest.mock import patch
 
 import pytz
 from freezegun import freeze_time
 
+from src.db.notif_sql_models import Event as DBEvent
+from src.db.notif_sql_models import Fixture as DBFixture
+from src.db.notif_sql_models import League as DBLeague
+from src.db.notif_sql_models import LineUp as DBLineUp
+from src.db.notif_sql_models import Player as DBPlayer
+from src.db.notif_sql_models import Team as DBTeam
+from src.db.notif_sql_models import TimeZone as DBTimeZone
+from src.db.notif_sql_models import UserTimeZone
 from src.entities import FixtureForDB
 from src.utils.date_utils import get_date_spanish_text_format
-from src.utils.fixtures_utils import convert_fixtures_response_to_db, date_diff
+from src.utils.fixtures_utils import (
+    convert_db_fixtures,
+    convert_fixtures_response_to_db,
+    date_diff,
+)
 from tests.utils.sample_data_utils import get_sample_data_response
 
 TESTS_DIR = os.path.dirname(os.path.abspath(__file__))
@@ -67,3 +80,81 @@ def test_convert_fixtures_response_to_db():
     # then
     assert len(converted_fixtures) == 54
     assert all([isinstance(fixture, FixtureForDB) for fixture in converted_fixtures])
+
+
+@patch("src.utils.fixtures_utils.LINE_UPS_DB_MANAGER")
+@patch("src.utils.fixtures_utils.FIXTURES_DB_MANAGER")
+def test_convert_db_fixtures_preloads_related_records(
+    fixtures_db_manager_mock, line_ups_db_manager_mock
+):
+    # given
+    fixtures = [
+        DBFixture(
+            id=fixture_id,
+            utc_date="2023-05-01T20:00:00+00:00",
+            bsas_date="2023-05-01T17:00:00",
+            league=128,
+            round="Regular Season - 1",
+            home_team=home_team,
+            away_team=away_team,
+            venue="Estadio Monumental",
+            match_status="Match Finished",
+            referee="Perluigi Colina",
+            home_score=1,
+            away_score=0,
+        )
+        for fixture_id, home_team, away_team in [(1, 435, 451), (2, 450, 435)]
+    ]
+    fixtures_db_manager_mock.get_time_zones_by_ids.return_value = [
+        DBTimeZone(id=1, name="Europe/Amsterdam")
+    ]
+    fixtures_db_manager_mock.get_leagues_by_ids.return_value = [
+        DBLeague(
+            id=128,
+            name="Liga Profesional Argentina",
+            country="Argentina",
+            logo="",
+            daily_season_fixt_update="",
+        )
+    ]
+    fixtures_db_manager_mock.get_teams_by_ids.return_value = [
+        DBTeam(id=team_id, name=f"Team {team_id}", picture="", country=1)
+        for team_id in [435, 450, 451]
+    ]
+    fixtures_db_manager_mock.get_players_by_ids.return_value = [
+        DBPlayer(id=10, name="Player 10"),
+        DBPlayer(id=11, name="Player 11"),
+    ]
+    fixtures_db_manager_mock.get_fixtures_events.return_value = [
+        DBEvent(fixture=1, time=10, team=435, player=10, type="Goal", detail="")
+    ]
+    line_ups_db_manager_mock.get_fixtures_line_ups.return_value = [
+        DBLineUp(
+            fixture=2,
+            player=11,
+            team=450,
+            number=1,
+            pos="G",
+            grid="1:1",
+            formation="4-4-2",
+        )
+    ]
+
+    # when
+    converted_fixtures = convert_db_fixtures(
+        fixtures, [UserTimeZone(chat_id="1", time_zone=1, is_main_tz=True)]
+    )
+
+    # then
+    assert [fixture.id for fixture in converted_fixtures] == [1, 2]
+    assert converted_fixtures[0].main_time_zone.name == "Europe/Amsterdam"
+    assert converted_fixtures[0].events[0].player.name == "Player 10"
+    assert converted_fixtures[0].events[0].rival_team.id == 451
+    assert converted_fixtures[1].events == []
+    assert converted_fixtures[1].home_team_line_up.goalkeeper[0].name == "Player 11"
+    assert converted_fixtures[1].away_team_line_up is None
+    fixtures_db_manager_mock.get_teams_by_ids.assert_called_once()
+    fixtures_db_manager_mock.get_players_by_ids.assert_called_once()
+    fixtures_db_manager_mock.get_player.assert_not_called()
+    fixtures_db_manager_mock.get_team.assert_not_called()
+    fixtures_db_manager_mock.get_time_zones_by_name.assert_not_called()
@@ -0,0 +1,42 @@
+from unittest.mock import MagicMock, patch
+
+from freezegun import freeze_time
+
+from src.notifiers.ft_team_game_approaching import notify_ft_team_game_approaching
+
+
+@freeze_time("2023-05-10 12:00:00")
+@patch("src.notifiers.ft_team_game_approaching.notify_fixture_approaching")
+@patch("src.notifiers.ft_team_game_approaching.is_user_subscribed_to_notif")
+@patch("src.notifiers.ft_team_game_approaching.fixtures_db_manager")
+def test_notify_ft_team_game_approaching_claims_fixture_before_notifying(
+    fixtures_db_manager_mock,
+    is_user_subscribed_to_notif_mock,
+    notify_fixture_approaching_mock,
+):
+    # given
+    fixture = MagicMock(
+        id=1,
+        utc_date="2023-05-10T12:10:00+00:00",
+        home_team=435,
+        away_team=451,
+        approach_notified=False,
+        match_status="Not Started",
+    )
+    fixtures_db_manager_mock.get_fixture_transitions.return_value = []
+    fixtures_db_manager_mock.get_games_in_surrounding_n_hours.return_value = [fixture]
+    fixtures_db_manager_mock.get_favourite_teams_for_team.side_effect = [
+        [MagicMock(chat_id="1")],
+        [MagicMock(chat_id="2")],
+    ]
+    is_user_subscribed_to_notif_mock.return_value = True
+    notify_fixture_approaching_mock.side_effect = [Exception("Telegram is down"), None]
+
+    # when
+    notify_ft_team_game_approaching()
+
+    # then
+    fixtures_db_manager_mock.mark_fixtures_approach_notified.assert_called_once_with(
+        [1]
+    )
+    assert notify_fixture_approaching_mock.call_count == 2
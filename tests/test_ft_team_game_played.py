@@ -0,0 +1,125 @@
+from datetime import datetime, timedelta, timezone
+from unittest.mock import MagicMock, patch
+
+from src.db.notif_sql_models import TimeZone, UserTimeZone
+from src.entities import Championship, Fixture, MatchScore, Team
+from src.notifiers.ft_team_game_played import (
+    notify_fixture_played,
+    notify_ft_team_game_played,
+)
+from src.utils.notifier_utils import TeamSubscriber
+
+
+def get_fixture(utc_time_zone: TimeZone) -> Fixture:
+    utc_date = datetime(2023, 5, 1, 20)
+
+    return Fixture(
+        id=1,
+        utc_date=utc_date,
+        ams_date=utc_date,
+        bsas_date=utc_date,
+        date_diff=0,
+        referee="Perluigi Colina",
+        match_status="Match Finished",
+        championship=Championship(
+            league_id=128, name="Liga Profesional Argentina", country="", logo=""
+        ),
+        round="Regular Season - 1",
+        home_team=Team(id=435, name="River Plate", logo=""),
+        away_team=Team(id=451, name="Boca Juniors", logo=""),
+        match_score=MatchScore(home_score=3, away_score=0),
+        venue="Estadio Monumental",
+        additional_time_zones=[],
+        main_time_zone=utc_time_zone,
+        home_team_line_up=None,
+        away_team_line_up=None,
+    )
+
+
+@patch("src.notifiers.ft_team_game_played.send_telegram_message")
+@patch("src.notifiers.ft_team_game_played.translate_text")
+def test_notify_fixture_played_renders_once_per_language_and_time_zones(
+    translate_text_mock, send_telegram_message_mock
+):
+    # given
+    utc_time_zone = TimeZone(id=1, name="UTC")
+    time_zones = {2: TimeZone(id=2, name="America/Argentina/Buenos_Aires")}
+    bsas_main_time_zone = [UserTimeZone(chat_id="", time_zone=2, is_main_tz=True)]
+    subscribers = [
+        TeamSubscriber("1", 435, "es", {4}, bsas_main_time_zone),
+        TeamSubscriber("2", 435, "es", {4}, bsas_main_time_zone),
+        TeamSubscriber("3", 435, "es", {4}),
+        TeamSubscriber("4", 451, "en", {4}),
+    ]
+    translate_text_mock.return_value = "texto traducido"
+
+    # when
+    notify_fixture_played(
+        get_fixture(utc_time_zone), subscribers, time_zones, utc_time_zone
+    )
+
+    # then
+    assert translate_text_mock.call_count == 2
+    assert [
+        call.kwargs["chat_id"] for call in send_telegram_message_mock.call_args_list
+    ] == ["1", "2", "3", "4"]
+    assert send_telegram_message_mock.call_args_list[0].kwargs["message"] == (
+        "texto traducido"
+    )
+    assert "Boca Juniors</strong> just played" in (
+        send_telegram_message_mock.call_args_list[3].kwargs["message"]
+    )
+
+
+@patch("src.notifiers.ft_team_game_played.notify_fixture_played")
+@patch("src.notifiers.ft_team_game_played.convert_db_fixtures")
+@patch("src.notifiers.ft_team_game_played.collect_missing_events")
+@patch("src.notifiers.ft_team_game_played.get_team_subscribers")
+@patch("src.notifiers.ft_team_game_played.fixtures_db_manager")
+def test_notify_ft_team_game_played_claims_each_fixture_before_notifying(
+    fixtures_db_manager_mock,
+    get_team_subscribers_mock,
+    collect_missing_events_mock,
+    convert_db_fixtures_mock,
+    notify_fixture_played_mock,
+):
+    # given
+    kickoff = datetime.now(timezone.utc) - timedelta(hours=2)
+    db_fixtures = [
+        MagicMock(
+            id=fixture_id,
+            home_team=435,
+            away_team=451,
+            kickoff=kickoff,
+            played_notified=False,
+            match_status="Match Finished",
+        )
+        for fixture_id in [1, 2]
+    ]
+    fixtures_db_manager_mock.get_fixture_transitions.return_value = [
+        MagicMock(id=10, fixture=2),
+        MagicMock(id=11, fixture=1),
+        MagicMock(id=12, fixture=3),
+    ]
+    fixtures_db_manager_mock.get_fixtures_by_ids.return_value = db_fixtures
+    get_team_subscribers_mock.return_value = [TeamSubscriber("1", 435, "en", {4})]
+    convert_db_fixtures_mock.return_value = [
+        MagicMock(id=1, home_team=MagicMock(id=435), away_team=MagicMock(id=451)),
+        MagicMock(id=2, home_team=MagicMock(id=435), away_team=MagicMock(id=451)),
+    ]
+    notify_fixture_played_mock.side_effect = [Exception("Telegram is down"), None]
+
+    # when
+    notify_ft_team_game_played()
+
+    # then
+    assert [
+        call.args[0]
+        for call in fixtures_db_manager_mock.mark_fixtures_played_notified.call_args_list
+    ] == [[2], [1]]
+    assert [
+        call.args[1]
+        for call in fixtures_db_manager_mock.advance_outbox_cursor.call_args_list
+    ] == [10, 11, 12]
+    assert fixtures_db_manager_mock.unit_of_work.call_count == 2
+    assert notify_fixture_played_mock.call_count == 2
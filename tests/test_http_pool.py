@@ -0,0 +1,55 @@
+import httpx
+import pytest
+
+from src.api.fixtures_client import FixturesClient
+from src.api.http_pool import HTTPPool
+from src.api.players_client import PlayersClient
+
+
+def test_http_pool_reuses_one_client_per_host():
+    # given
+    http_pool = HTTPPool()
+
+    # when
+    fixtures_client = http_pool.get_client("https://api-football.p.rapidapi.com/v3")
+    players_client = http_pool.get_client("https://api-football.p.rapidapi.com/v3/p")
+    telegram_client = http_pool.get_client("https://api.telegram.org/bot")
+
+    # then
+    assert fixtures_client is players_client
+    assert fixtures_client is not telegram_client
+
+    http_pool.close()
+
+
+def handle_request(request: httpx.Request) -> httpx.Response:
+    if request.url.path == "/error":
+        raise httpx.ConnectError("Connection refused", request=request)
+
+    return httpx.Response(200, json={})
+
+
+def test_http_pool_request_metrics():
+    # given
+    http_pool = HTTPPool()
+    client = httpx.Client(transport=httpx.MockTransport(handle_request))
+
+    # when
+    http_pool.request("GET", "https://api.telegram.org/ok", client=client)
+    with pytest.raises(httpx.ConnectError):
+        http_pool.request("GET", "https://api.telegram.org/error", client=client)
+
+    # then
+    metrics = http_pool.metrics()["api.telegram.org"]
+
+    assert metrics["requests"] == 2
+    assert metrics["errors"] == 1
+
+
+def test_api_clients_share_pooled_client():
+    # when
+    fixtures_client = FixturesClient()
+    players_client = PlayersClient()
+
+    # then
+    assert fixtures_client.client is players_client.client
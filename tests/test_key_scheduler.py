@@ -0,0 +1,105 @@
+import pytest
+
+from src.api.key_scheduler import RapidAPIKeyScheduler, RapidAPIQuotaExhausted
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.now += seconds
+
+
+def get_headers(daily_remaining: int, minute_remaining: int) -> dict:
+    return {
+        "x-ratelimit-requests-remaining": str(daily_remaining),
+        "x-ratelimit-requests-reset": "3600",
+        "x-ratelimit-limit": "10",
+        "x-ratelimit-remaining": str(minute_remaining),
+    }
+
+
+def test_acquire_routes_to_key_with_most_headroom():
+    # given
+    clock = FakeClock()
+    key_scheduler = RapidAPIKeyScheduler(["key_a", "key_b"], clock, clock.sleep)
+    key_scheduler.release("key_a", get_headers(daily_remaining=20, minute_remaining=9))
+    key_scheduler.release("key_b", get_headers(daily_remaining=90, minute_remaining=9))
+
+    # when
+    acquired_keys = [key_scheduler.acquire() for _ in range(4)]
+
+    # then
+    assert acquired_keys == ["key_b"] * 4
+
+
+def test_acquire_waits_for_minute_quota_reset():
+    # given
+    clock = FakeClock()
+    key_scheduler = RapidAPIKeyScheduler(["key_a"], clock, clock.sleep)
+    key_scheduler.release("key_a", get_headers(daily_remaining=50, minute_remaining=0))
+
+    # when
+    acquired_key = key_scheduler.acquire()
+
+    # then
+    assert acquired_key == "key_a"
+    assert clock.now == 60
+
+
+def test_acquire_waits_for_minute_window_without_limit_header():
+    # given
+    clock = FakeClock()
+    key_scheduler = RapidAPIKeyScheduler(["key_a"], clock, clock.sleep)
+    key_scheduler.release("key_a", {"x-ratelimit-remaining": "0"})
+
+    # when
+    acquired_key = key_scheduler.acquire()
+
+    # then
+    assert acquired_key == "key_a"
+    assert clock.now == 60
+
+
+def test_acquire_blocks_rate_limited_key():
+    # given
+    clock = FakeClock()
+    key_scheduler = RapidAPIKeyScheduler(["key_a", "key_b"], clock, clock.sleep)
+    key_scheduler.release("key_a", {"retry-after": "30"}, status_code=429)
+
+    # when
+    acquired_keys = {key_scheduler.acquire() for _ in range(3)}
+
+    # then
+    assert acquired_keys == {"key_b"}
+
+
+def test_acquire_raises_when_daily_quota_exhausted():
+    # given
+    clock = FakeClock()
+    key_scheduler = RapidAPIKeyScheduler(["key_a"], clock, clock.sleep)
+    key_scheduler.release("key_a", get_headers(daily_remaining=0, minute_remaining=9))
+
+    # when - then
+    with pytest.raises(RapidAPIQuotaExhausted):
+        key_scheduler.acquire()
+
+
+def test_can_afford_keeps_reserve():
+    # given
+    clock = FakeClock()
+    key_scheduler = RapidAPIKeyScheduler(["key_a", "key_b"], clock, clock.sleep)
+
+    # when
+    affordable_before_responses = key_scheduler.can_afford(1000)
+    key_scheduler.release("key_a", get_headers(daily_remaining=40, minute_remaining=9))
+    key_scheduler.release("key_b", get_headers(daily_remaining=30, minute_remaining=9))
+
+    # then
+    assert affordable_before_responses
+    assert key_scheduler.can_afford(20)
+    assert not key_scheduler.can_afford(21)
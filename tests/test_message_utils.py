@@ -1,4 +1,13 @@
-from src.utils.message_utils import ignore_parts_of_string
+from unittest.mock import patch
+
+from src.utils.message_utils import (
+    TRANSLATIONS_CACHE,
+    get_segments_chunks,
+    ignore_parts_of_string,
+    translate_segment,
+    translate_text,
+    translate_texts,
+)
 
 
 def test_ignore_parts_of_string():
@@ -39,3 +48,109 @@ def test_ignore_parts_all_ignored():
     # then
     assert not_translate_matches == ["All this should be ignored!"]
     assert not_translate_split_list == ["", "All this should be ignored!", ""]
+
+
+@patch("deep_translator.GoogleTranslator")
+@patch("src.utils.message_utils.TRANSLATIONS_DB_MANAGER")
+def test_translate_segment_caches_new_translations(
+    translations_db_manager_mock, google_translator_mock
+):
+    # given
+    TRANSLATIONS_CACHE.clear()
+    translations_db_manager_mock.get_translations.return_value = {}
+    google_translator_mock.return_value.translate.return_value = "Hola!"
+
+    # when
+    translated_segments = [translate_segment("Hi!", "es") for _ in range(3)]
+
+    # then
+    assert translated_segments == ["Hola!", "Hola!", "Hola!"]
+    google_translator_mock.return_value.translate.assert_called_once_with("Hi!")
+    translations_db_manager_mock.get_translations.assert_called_once()
+    translations_db_manager_mock.insert_translations.assert_called_once_with(
+        {"Hi!": "Hola!"}, "es"
+    )
+
+
+@patch("deep_translator.GoogleTranslator")
+@patch("src.utils.message_utils.TRANSLATIONS_DB_MANAGER")
+def test_translate_text_uses_stored_translations(
+    translations_db_manager_mock, google_translator_mock
+):
+    # given
+    TRANSLATIONS_CACHE.clear()
+    translations_db_manager_mock.get_translations.return_value = {"Hi!": "Hola!"}
+
+    # when
+    translated_text = translate_text(
+        "Hi!<not_translate> River Plate</not_translate>", "es"
+    )
+
+    # then
+    assert translated_text == "Hola! River Plate"
+    google_translator_mock.assert_not_called()
+    translations_db_manager_mock.insert_translations.assert_not_called()
+
+
+@patch("deep_translator.GoogleTranslator")
+@patch("src.utils.message_utils.TRANSLATIONS_DB_MANAGER")
+def test_translate_texts_in_one_request(
+    translations_db_manager_mock, google_translator_mock
+):
+    # given
+    TRANSLATIONS_CACHE.clear()
+    translations_db_manager_mock.get_translations.return_value = {}
+    google_translator_mock.return_value.translate.return_value = (
+        "Gol\n| | |\nTarjeta roja \n|||\n Final"
+    )
+    texts = [
+        "Goal<not_translate> 10' </not_translate>Red card",
+        "Red card<not_translate> 20' </not_translate>Full time",
+    ]
+
+    # when
+    translated_texts = translate_texts(texts, "es")
+
+    # then
+    assert translated_texts == [
+        "Gol 10' Tarjeta roja",
+        "Tarjeta roja 20' Final",
+    ]
+    google_translator_mock.return_value.translate.assert_called_once_with(
+        "Goal\n|||\nRed card\n|||\nFull time"
+    )
+
+
+@patch("deep_translator.GoogleTranslator")
+@patch("src.utils.message_utils.TRANSLATIONS_DB_MANAGER")
+def test_translate_texts_falls_back_when_translation_cannot_be_split(
+    translations_db_manager_mock, google_translator_mock
+):
+    # given
+    TRANSLATIONS_CACHE.clear()
+    translations_db_manager_mock.get_translations.return_value = {}
+    google_translator_mock.return_value.translate.side_effect = [
+        "Gol Tarjeta roja",
+        "Gol",
+        "Tarjeta roja",
+    ]
+
+    # when
+    translated_texts = translate_texts(
+        ["Goal<not_translate> 10' </not_translate>Red card"], "es"
+    )
+
+    # then
+    assert translated_texts == ["Gol 10' Tarjeta roja"]
+    assert google_translator_mock.return_value.translate.call_count == 3
+
+
+def test_get_segments_chunks():
+    # given
+    segments = ["a" * 2000, "b" * 2000, "c" * 2000]
+
+    # when
+    chunks = get_segments_chunks(segments)
+
+    # then
+    assert chunks == [["a" * 2000, "b" * 2000], ["c" * 2000]]
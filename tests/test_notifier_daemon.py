@@ -0,0 +1,21 @@
+from notifier_daemon import build_scheduler
+
+
+def test_build_scheduler_jobs_never_overlap():
+    # when
+    scheduler = build_scheduler()
+
+    # then
+    jobs = scheduler.get_jobs()
+
+    assert {job.id for job in jobs} == {
+        "ft_team_game_approaching",
+        "ft_team_game_played",
+        "collect_fixtures_events",
+        "collect_live_events",
+        "collect_line_ups",
+        "refresh_fixtures",
+        "update_stats",
+        "prune_fixtures_outbox",
+    }
+    assert all(job.max_instances == 1 and job.coalesce for job in jobs)
@@ -1,8 +1,14 @@
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
+from unittest.mock import MagicMock, patch
 
 from dotenv import load_dotenv
 
-from partial_db_updater import get_fixture_update_lots
+from partial_db_updater import (
+    get_fixture_update_lots,
+    prioritize_fixtures,
+    update_fixtures,
+)
 
 current_path = Path(__file__).parent.absolute()
 env_file = current_path / ".." / "football_notifier.env"
@@ -54,3 +60,49 @@ def test_get_fixture_update_lots():
         [1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16, 17, 18, 19, 20],
         [1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11],
     ]
+
+
+def test_prioritize_fixtures_live_first_then_closest_kickoff():
+    # given
+    now = datetime(2023, 5, 6, 18, tzinfo=timezone.utc)
+    fixtures = [
+        MagicMock(id=1, match_status="Not Started", kickoff=now + timedelta(hours=2)),
+        MagicMock(id=2, match_status="Second Half", kickoff=now - timedelta(hours=1)),
+        MagicMock(
+            id=3, match_status="Match Finished", kickoff=now - timedelta(hours=3)
+        ),
+        MagicMock(
+            id=4, match_status="Not Started", kickoff=now + timedelta(minutes=10)
+        ),
+        MagicMock(id=5, match_status="Halftime", kickoff=now - timedelta(minutes=50)),
+    ]
+
+    # when
+    prioritized_fixtures = prioritize_fixtures(fixtures, now=now)
+
+    # then
+    assert [fixture.id for fixture in prioritized_fixtures] == [5, 2, 4, 1, 3]
+
+
+@patch("partial_db_updater.FIXTURES_DB_MANAGER")
+@patch("partial_db_updater.FIXTURES_CLIENT")
+@patch("partial_db_updater.get_all_fixtures_ids_to_update")
+def test_update_fixtures_fetches_lots_within_budget_and_saves_once(
+    get_all_fixtures_ids_to_update_mock, fixtures_client_mock, fixtures_db_manager_mock
+):
+    # given
+    get_all_fixtures_ids_to_update_mock.return_value = list(range(1, 51))
+    fixtures_client_mock.get_fixtures_by.return_value = MagicMock(
+        as_dict={"response": []}
+    )
+
+    # when
+    update_fixtures(concurrency=2, max_requests=2)
+
+    # then
+    requested_lots = [
+        call.kwargs["ids"]
+        for call in fixtures_client_mock.get_fixtures_by.call_args_list
+    ]
+    assert sorted(requested_lots) == [list(range(1, 21)), list(range(21, 41))]
+    fixtures_db_manager_mock.save_fixtures.assert_called_once_with([])
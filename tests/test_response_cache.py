@@ -0,0 +1,96 @@
+from datetime import datetime, timedelta, timezone
+from unittest.mock import MagicMock
+
+import httpx
+
+from src.api.response_cache import ResponseCache
+from src.db.notif_sql_models import ApiResponseCache
+
+URL = "https://api-football-v1.p.rapidapi.com/v3/teams"
+
+
+def get_cached_response(expires_in: timedelta, etag: str = None) -> ApiResponseCache:
+    now = datetime.now(timezone.utc)
+
+    return ApiResponseCache(
+        cache_key="key",
+        url=URL,
+        body='{"response": ["cached"]}',
+        etag=etag,
+        fetched_at=now,
+        expires_at=now + expires_in,
+    )
+
+
+def get_fetch(status_code: int, body: dict = None) -> MagicMock:
+    return MagicMock(
+        return_value=httpx.Response(
+            status_code,
+            json=body,
+            headers={"etag": '"v2"'},
+            request=httpx.Request("GET", URL, params={"id": 435}),
+        )
+    )
+
+
+def test_response_cache_miss_fetches_and_stores():
+    # given
+    cache_db_manager = MagicMock()
+    cache_db_manager.get_response.return_value = None
+    fetch = get_fetch(200, {"errors": [], "response": ["fresh"]})
+
+    # when
+    response = ResponseCache(cache_db_manager).get("GET", URL, {"id": 435}, 60, fetch)
+
+    # then
+    stored_response = cache_db_manager.save_response.call_args.args[0]
+
+    assert response.json()["response"] == ["fresh"]
+    assert stored_response.etag == '"v2"'
+    assert stored_response.url == URL
+
+
+def test_response_cache_hit_does_not_fetch():
+    # given
+    cache_db_manager = MagicMock()
+    cache_db_manager.get_response.return_value = get_cached_response(
+        timedelta(minutes=5)
+    )
+    fetch = get_fetch(200, {"errors": [], "response": ["fresh"]})
+
+    # when
+    response = ResponseCache(cache_db_manager).get("GET", URL, {"id": 435}, 60, fetch)
+
+    # then
+    assert response.json()["response"] == ["cached"]
+    fetch.assert_not_called()
+
+
+def test_response_cache_expired_response_revalidated_with_etag():
+    # given
+    cache_db_manager = MagicMock()
+    cache_db_manager.get_response.return_value = get_cached_response(
+        timedelta(days=-5), etag='"v1"'
+    )
+    fetch = get_fetch(304)
+
+    # when
+    response = ResponseCache(cache_db_manager).get("GET", URL, {"id": 435}, 60, fetch)
+
+    # then
+    assert response.json()["response"] == ["cached"]
+    assert fetch.call_args.args[0] == {"if-none-match": '"v1"'}
+    cache_db_manager.extend_response.assert_called_once()
+
+
+def test_response_cache_does_not_store_api_errors():
+    # given
+    cache_db_manager = MagicMock()
+    cache_db_manager.get_response.return_value = None
+    fetch = get_fetch(200, {"errors": {"requests": "limit reached"}, "response": []})
+
+    # when
+    ResponseCache(cache_db_manager).get("GET", URL, {"id": 435}, 60, fetch)
+
+    # then
+    cache_db_manager.save_response.assert_not_called()
@@ -0,0 +1,76 @@
+from unittest.mock import MagicMock
+
+from src.db.notif_sql_models import Country as DBCountry
+from src.db.notif_sql_models import Team as DBTeam
+from src.utils.search_index import CatalogSearch, SearchIndex, fold_text
+
+TEAMS = [
+    ("River Plate", []),
+    ("Boca Juniors", []),
+    ("Atlético Madrid", ["Atleti"]),
+    ("Atlético-MG", []),
+    ("Real Madrid", []),
+    ("Barcelona", []),
+    ("Internacional", []),
+    ("Inter", []),
+]
+
+
+def test_fold_text():
+    # when - then
+    assert fold_text("  Atlético-MG ") == "atletico mg"
+    assert fold_text("São Paulo") == "sao paulo"
+
+
+def test_search_ranks_exact_and_prefix_matches_first():
+    # given
+    search_index = SearchIndex((name, [name, *aliases]) for name, aliases in TEAMS)
+
+    # when - then
+    assert search_index.search("inter") == ["Inter", "Internacional"]
+    assert search_index.search("madrid") == ["Real Madrid", "Atlético Madrid"]
+    assert search_index.search("ATLETICO") == ["Atlético-MG", "Atlético Madrid"]
+    assert search_index.search("atleti") == [
+        "Atlético Madrid",
+        "Atlético-MG",
+    ]
+    assert search_index.search("ver pla") == ["River Plate"]
+
+
+def test_search_returns_the_best_ranked_results_up_to_the_limit():
+    # given
+    search_index = SearchIndex((name, [name, *aliases]) for name, aliases in TEAMS)
+
+    # when - then
+    assert search_index.search("atletico", limit=1) == ["Atlético-MG"]
+    assert search_index.search("madrid", limit=5) == ["Real Madrid", "Atlético Madrid"]
+
+
+def test_search_tolerates_typos():
+    # given
+    search_index = SearchIndex((name, [name, *aliases]) for name, aliases in TEAMS)
+
+    # when - then
+    assert search_index.search("barcelna") == ["Barcelona"]
+    assert search_index.search("boca juniros") == ["Boca Juniors"]
+    assert search_index.search("xyz") == []
+
+
+def test_catalog_search_joins_teams_country_names():
+    # given
+    fixtures_db_manager = MagicMock()
+    fixtures_db_manager.get_all_countries.return_value = [
+        DBCountry(id=1, name="Argentina")
+    ]
+    fixtures_db_manager.get_all_teams.return_value = [
+        DBTeam(id=435, name="River Plate", picture="", country=1, aliases=["CARP"])
+    ]
+    catalog_search = CatalogSearch(fixtures_db_manager)
+
+    # when
+    teams = catalog_search.search_teams("carp")
+    catalog_search.search_teams("river")
+
+    # then
+    assert [(team.id, team.country) for team in teams] == [(435, "Argentina")]
+    assert fixtures_db_manager.get_all_teams.call_count == 1
@@ -1,7 +1,45 @@
+from datetime import datetime, timezone
+from unittest.mock import patch
+
 import pytest
+from freezegun import freeze_time
 
+from src.db.notif_sql_models import Event as DBEvent
+from src.db.notif_sql_models import Fixture as DBFixture
+from src.db.notif_sql_models import Player as DBPlayer
 from src.emojis import Emojis
-from src.statistics.team_stats import TeamRecord
+from src.statistics.team_stats import TeamRecord, TeamStats, get_team_statistics
+
+
+def get_db_fixture(
+    fixture_id: int, kickoff: datetime, home_score: int, away_score: int
+) -> DBFixture:
+    return DBFixture(
+        id=fixture_id,
+        utc_date=kickoff.isoformat(),
+        bsas_date=kickoff.isoformat(),
+        kickoff=kickoff,
+        league=128,
+        round="Regular Season - 1",
+        home_team=435,
+        away_team=451,
+        venue="Estadio Monumental",
+        match_status="Match Finished",
+        referee="Perluigi Colina",
+        home_score=home_score,
+        away_score=away_score,
+    )
+
+
+def get_goal(fixture_id: int, team: int, player: int, detail="Normal Goal"):
+    return DBEvent(
+        fixture=fixture_id,
+        time=10,
+        team=team,
+        player=player,
+        type="Goal",
+        detail=detail,
+    )
 
 
 @pytest.mark.parametrize(
@@ -22,3 +60,113 @@ def test_team_record(
     )
 
     assert team_record.overall_emoji == expected_emoji.value
+
+
+def test_get_team_statistics():
+    # given
+    fixtures = [
+        get_db_fixture(3, datetime(2023, 5, 1, tzinfo=timezone.utc), 2, 1),
+        get_db_fixture(2, datetime(2023, 4, 1, tzinfo=timezone.utc), 1, 1),
+        get_db_fixture(1, datetime(2022, 12, 1, tzinfo=timezone.utc), 0, 3),
+    ]
+    fixtures[1].match_status = "Match Postponed"
+    fixtures_events = {
+        3: [
+            get_goal(3, 435, 1),
+            get_goal(3, 435, 1, detail="Penalty"),
+            get_goal(3, 451, 2, detail="Own Goal"),
+        ],
+        1: [get_goal(1, 451, 2), get_goal(1, 451, 2), get_goal(1, 451, 3)],
+    }
+    players = {
+        1: DBPlayer(id=1, name="Julián Álvarez"),
+        2: DBPlayer(id=2, name="Darío Benedetto"),
+    }
+
+    # when
+    team_statistics = get_team_statistics(
+        451, fixtures, fixtures_events, players, season=2023
+    )
+
+    # then
+    assert (
+        team_statistics.games_won,
+        team_statistics.games_drawn,
+        team_statistics.games_lost,
+    ) == (0, 0, 1)
+    assert (team_statistics.goals_scored, team_statistics.goals_received) == (1, 2)
+    assert team_statistics.top_scorers == []
+    assert team_statistics.last_matches == [
+        {"fixture": 3, "goals_scored": 1, "goals_received": 2, "scorers": {}},
+        {
+            "fixture": 1,
+            "goals_scored": 3,
+            "goals_received": 0,
+            "scorers": {"Darío Benedetto": 2},
+        },
+    ]
+
+
+@freeze_time("2023-05-10")
+@patch("src.statistics.team_stats.fixtures_db_manager")
+def test_team_stats_read_from_materialized_statistics(fixtures_db_manager_mock):
+    # given
+    fixtures_db_manager_mock.get_team_statistics.return_value = get_team_statistics(
+        435,
+        [
+            get_db_fixture(3, datetime(2023, 5, 1, tzinfo=timezone.utc), 2, 1),
+            get_db_fixture(1, datetime(2022, 12, 1, tzinfo=timezone.utc), 0, 3),
+        ],
+        {
+            3: [
+                get_goal(3, 435, 1),
+                get_goal(3, 435, 1, detail="Penalty"),
+                get_goal(3, 451, 2),
+            ]
+        },
+        {1: DBPlayer(id=1, name="Julián Álvarez")},
+        season=2023,
+    )
+    team_stats = TeamStats(435)
+
+    # when
+    last_matches_record = team_stats.team_record_in_last_n_matches(5)
+    season_record = team_stats.team_record_in_last_n_matches(100, year=2023)
+
+    # then
+    assert last_matches_record.games_played == 2
+    assert last_matches_record.all_record_matches_emojis == (
+        f"{Emojis.CHECK_MARK_BUTTON.value}{Emojis.CROSS_MARK.value}"
+    )
+    assert last_matches_record.top_scorers == {"Julián Álvarez": 2}
+    assert team_stats.number_of_goals(scored=True) == 2
+    assert team_stats.number_of_goals(scored=False) == 4
+    assert season_record.games_won == 1
+    assert season_record.games_played == 1
+    assert team_stats.number_of_goals(scored=False, year=2023) == 1
+    assert team_stats.team_record_in_last_n_matches(100, year=2022).games_played == 0
+    fixtures_db_manager_mock.get_team_statistics.assert_called_once_with(435)
+
+
+@freeze_time("2024-01-02")
+@patch("src.statistics.team_stats.refresh_teams_statistics")
+@patch("src.statistics.team_stats.fixtures_db_manager")
+def test_team_stats_refresh_statistics_from_previous_season(
+    fixtures_db_manager_mock, refresh_teams_statistics_mock
+):
+    # given
+    fixture = get_db_fixture(3, datetime(2024, 1, 1, tzinfo=timezone.utc), 2, 1)
+    fixtures_db_manager_mock.get_team_statistics.return_value = get_team_statistics(
+        435, [fixture], {}, {}, season=2023
+    )
+    refresh_teams_statistics_mock.return_value = [
+        get_team_statistics(435, [fixture], {}, {}, season=2024)
+    ]
+    team_stats = TeamStats(435)
+
+    # when
+    season_record = team_stats.team_record_in_last_n_matches(100, year=2024)
+
+    # then
+    assert season_record.games_played == 1
+    refresh_teams_statistics_mock.assert_called_once_with([435])
@@ -0,0 +1,100 @@
+import asyncio
+import json
+import time
+from unittest.mock import patch
+
+import httpx
+
+from src.senders.telegram_delivery import (
+    TelegramDeliveryEngine,
+    TelegramMessage,
+    TokenBucket,
+    translate_messages,
+)
+
+
+def test_token_bucket_limits_rate():
+    # given
+    token_bucket = TokenBucket(rate=20, capacity=1)
+
+    async def acquire_tokens():
+        for _ in range(5):
+            await token_bucket.acquire()
+
+    # when
+    start = time.monotonic()
+    asyncio.run(acquire_tokens())
+    elapsed = time.monotonic() - start
+
+    # then
+    assert elapsed >= 0.19
+
+
+def test_send_many_retries_after_flood_control():
+    # given
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(json.loads(request.content))
+        if len(requests) == 1:
+            return httpx.Response(
+                429,
+                json={"ok": False, "error_code": 429, "parameters": {"retry_after": 0}},
+            )
+        return httpx.Response(200, json={"ok": True})
+
+    messages = [
+        TelegramMessage(chat_id="1", message="<not_translate>Hi!</not_translate>"),
+        TelegramMessage(chat_id="2", message="Hi!", photo="https://photo.png"),
+    ]
+
+    async def deliver():
+        async with TelegramDeliveryEngine(
+            token="token",
+            global_rate=1000,
+            chat_rate=1000,
+            transport=httpx.MockTransport(handler),
+        ) as delivery_engine:
+            return await delivery_engine.send_many(messages)
+
+    # when
+    results = asyncio.run(deliver())
+
+    # then
+    assert [result.delivered for result in results] == [True, True]
+    assert sum(result.attempts for result in results) == 3
+    assert len(requests) == 3
+    assert {"chat_id": "1", "text": "Hi!", "parse_mode": "HTML"} in requests
+    assert {
+        "chat_id": "2",
+        "photo": "https://photo.png",
+        "caption": "Hi!",
+        "parse_mode": "HTML",
+    } in requests
+
+
+@patch("src.senders.telegram_delivery.translate_texts")
+def test_translate_messages_in_one_batch_per_language(translate_texts_mock):
+    # given
+    translate_texts_mock.side_effect = lambda texts, lang: [
+        f"{lang}: {text}" for text in texts
+    ]
+    messages = [
+        TelegramMessage(chat_id="1", message="Hi!", lang="es"),
+        TelegramMessage(chat_id="2", message="Hi!", lang="en"),
+        TelegramMessage(chat_id="3", message="Bye!", lang="es"),
+        TelegramMessage(chat_id="4", message="Hi!", lang="it", translate=False),
+    ]
+
+    # when
+    translated_messages = translate_messages(messages)
+
+    # then
+    translate_texts_mock.assert_called_once_with(["Hi!", "Bye!"], "es")
+    assert [message.message for message in translated_messages] == [
+        "es: Hi!",
+        "Hi!",
+        "es: Bye!",
+        "Hi!",
+    ]
+    assert not any(message.translate for message in translated_messages[:3:2])
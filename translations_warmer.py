@@ -0,0 +1,60 @@
+from typing import List
+
+from src.db.translations_db_manager import TranslationsDBManager
+from src.notifier_constants import END_COMMAND_MESSAGE, NOTIFICATION_TYPES
+from src.notifier_logger import get_logger
+from src.notifiers.user_messages import (
+    GAMES_EVENTS_KICK_OFF,
+    LANGUAGES_ENABLEMENT,
+    LINEUPS,
+    STATISTICS_KICK_OFF,
+    TIMELINES,
+)
+from src.utils.message_utils import ignore_parts_of_string, translate_segments
+
+logger = get_logger(__name__)
+
+# texts sent to users as they are, new ones have to be added here to be warmed.
+STATIC_TEXTS = [
+    END_COMMAND_MESSAGE,
+    GAMES_EVENTS_KICK_OFF,
+    LANGUAGES_ENABLEMENT,
+    LINEUPS,
+    STATISTICS_KICK_OFF,
+    TIMELINES,
+]
+
+
+def get_static_texts() -> List[str]:
+    static_texts = list(STATIC_TEXTS)
+
+    for notif_type in NOTIFICATION_TYPES:
+        static_texts += [notif_type["name"], notif_type["description"]]
+
+    return static_texts
+
+
+def pre_translate_static_texts() -> None:
+    languages = [
+        lang
+        for lang in TranslationsDBManager().get_configured_languages()
+        if lang != "en"
+    ]
+    segments = set()
+
+    for static_text in get_static_texts():
+        not_translate_matches, split_text = ignore_parts_of_string(static_text)
+        segments.update(
+            segment for segment in split_text if segment not in not_translate_matches
+        )
+
+    logger.info(
+        f"Pre-translating {len(segments)} static segments into {len(languages)} languages"
+    )
+
+    for lang in languages:
+        translate_segments(list(segments), lang)
+
+
+if __name__ == "__main__":
+    pre_translate_static_texts()